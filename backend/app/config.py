@@ -117,6 +117,56 @@ class Settings:
         "200"
     ))
 
+    # PostgreSQL 커넥션 풀 크기 (프로세스당)
+    db_pool_size: int = int(os.getenv(
+        "DB_POOL_SIZE",
+        "5"
+    ))
+
+    # Compass Score 일괄 계산 프로세스 수 (1 = 단일 프로세스, 최대 db_pool_size)
+    compass_batch_workers: int = int(os.getenv(
+        "COMPASS_BATCH_WORKERS",
+        "2"
+    ))
+
+    # 시나리오 파라미터 스윕 프로세스 수 (0 = CPU 코어 수, 1 = 단일 프로세스)
+    scenario_sweep_workers: int = int(os.getenv(
+        "SCENARIO_SWEEP_WORKERS",
+        "0"
+    ))
+
+    # 종목별 수익률/시세 프로세스 캐시 메모리 상한 (MB, 0 = 비활성)
+    returns_cache_max_mb: int = int(os.getenv(
+        "RETURNS_CACHE_MAX_MB",
+        "256"
+    ))
+
+    # 시뮬레이션 결과 프로세스 캐시 (항목 수 상한, 0 이면 비활성) / 항목 유효기간 (초)
+    simulation_memory_cache_size: int = int(os.getenv(
+        "SIMULATION_MEMORY_CACHE_SIZE",
+        "256"
+    ))
+    simulation_memory_ttl_seconds: int = int(os.getenv(
+        "SIMULATION_MEMORY_TTL_SECONDS",
+        "600"
+    ))
+
+    # 시뮬레이션 경로 저장 형식 (columnar = simulation_run.path_blob 압축 열, rows = simulation_path 행)
+    simulation_path_storage: str = os.getenv(
+        "SIMULATION_PATH_STORAGE",
+        "columnar"
+    ).lower()
+
+    # 데이터 적재 후 인기 시뮬레이션 선계산 — 적중 상위 요청 수 (0 = 비활성) / 스레드 수
+    simulation_prewarm_top_n: int = int(os.getenv(
+        "SIMULATION_PREWARM_TOP_N",
+        "20"
+    ))
+    simulation_prewarm_workers: int = int(os.getenv(
+        "SIMULATION_PREWARM_WORKERS",
+        "4"
+    ))
+
     # CORS
     allowed_origins: List[str] = []
     
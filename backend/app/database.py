@@ -12,7 +12,7 @@ elif "postgresql" in settings.database_url:
     engine = create_engine(
         settings.database_url,
         pool_pre_ping=True,
-        pool_size=5,
+        pool_size=settings.db_pool_size,
         max_overflow=10,
     )
 else:
@@ -29,6 +29,7 @@ from .real_data import (
     StockInfo, DataQualityLog,
     # Level 2
     FinancialStatement, DividendHistory, CorporateAction, InstitutionTrade, FdrStockListing,
+    IndicatorState,
 )
 # app/models.py의 모델들을 직접 import하지 않고 lazy import 허용
 
@@ -48,7 +49,7 @@ __all__ = ['User', 'Portfolio', 'PortfolioHistory', 'SimulationCache', 'Bookmark
            'DataSource', 'DataLoadBatch', 'StockPriceDaily', 'IndexPriceDaily',
            'StockInfo', 'DataQualityLog',
            'FinancialStatement', 'DividendHistory', 'CorporateAction', 'InstitutionTrade',
-           'FdrStockListing']
+           'FdrStockListing', 'IndicatorState']
 # models.py에서 추가 모델 import
 import sys
 import os
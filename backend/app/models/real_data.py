@@ -12,7 +12,7 @@ Phase 11: 실 데이터 적재용 ORM 모델
 
 from sqlalchemy import (
     Column, String, Integer, BigInteger, Boolean, DateTime, Date, Text,
-    ForeignKey, Index, UniqueConstraint, Numeric, CheckConstraint, Float
+    ForeignKey, Index, UniqueConstraint, Numeric, CheckConstraint, Float, JSON
 )
 from sqlalchemy.orm import relationship
 
@@ -476,6 +476,26 @@ class CorporateAction(Base):
         return f"<CorporateAction {self.ticker} {self.action_type} {self.effective_date}>"
 
 
+class IndicatorState(Base):
+    """종목별 기술 지표 증분 상태 (EMA/Wilder 평활값, OBV 누적, 롤링 윈도우 버퍼)"""
+    __tablename__ = "indicator_state"
+
+    ticker = Column(String(10), primary_key=True)
+    last_trade_date = Column(Date, nullable=False)  # 상태에 반영된 마지막 거래일
+    bar_count = Column(Integer, nullable=False, default=0)  # 반영된 전체 봉 수
+    state = Column(JSON, nullable=False)  # indicator_state.advance_state 상태 dict
+
+    rebuilt_at = Column(DateTime, default=kst_now)  # 마지막 전체 재계산 시각
+    updated_at = Column(DateTime, default=kst_now, onupdate=kst_now)
+
+    __table_args__ = (
+        Index('idx_indicator_state_date', 'last_trade_date'),
+    )
+
+    def __repr__(self):
+        return f"<IndicatorState {self.ticker} {self.last_trade_date} n={self.bar_count}>"
+
+
 # ============================================================================
 # Level 2: 시장 데이터 (KRX)
 # ============================================================================
@@ -51,6 +51,21 @@ class Stock(Base):
     created_at = Column(DateTime, default=kst_now)
 
 
+class CompassDirty(Base):
+    """Compass Score 재계산 대상 (입력 데이터 변경 추적)
+
+    적재기(pykrx_loader, real_data_loader)가 시세/재무/멀티플 변경 시 표시하고,
+    Compass 일괄 계산이 처리 후 삭제한다.
+    """
+    __tablename__ = "compass_dirty"
+
+    ticker = Column(String(10), primary_key=True)
+    prices_changed = Column(Boolean, nullable=False, default=False)       # 신규/정정 시세
+    financials_changed = Column(Boolean, nullable=False, default=False)   # 재무제표
+    valuation_changed = Column(Boolean, nullable=False, default=False)    # PER/PBR/배당수익률
+    marked_at = Column(DateTime, nullable=False, default=kst_now)         # 마지막 표시 시각
+
+
 class ETF(Base):
     """ETF"""
     __tablename__ = "etfs"
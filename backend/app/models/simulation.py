@@ -6,9 +6,9 @@ sim_run/sim_path/sim_summary 구조로 시뮬레이션 결과를 표준화하여
 
 from sqlalchemy import (
     Column, Integer, BigInteger, String, Float, DateTime, Date,
-    ForeignKey, Numeric, Text, Index, JSON
+    ForeignKey, Numeric, Text, Index, JSON, LargeBinary
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
 from app.utils.kst_now import kst_now
@@ -35,6 +35,7 @@ class SimulationRun(Base):
     rebalance_freq = Column(String(20), default='NONE')
     max_loss_limit_pct = Column(Numeric(5, 2), nullable=True)
     request_params = Column(JSON, nullable=True)  # 전체 요청 파라미터 백업
+    request_type = Column(String(50), nullable=True)  # scenario_simulation, backtest_simple 등 (선계산 재실행용)
 
     # 메타데이터
     engine_version = Column(String(20), nullable=False)
@@ -44,6 +45,18 @@ class SimulationRun(Base):
     created_at = Column(DateTime, default=kst_now)
     expires_at = Column(DateTime, nullable=True)  # TTL
 
+    # 캐시 적중 통계 (인기 요청 선계산 대상 선정)
+    hit_count = Column(Integer, default=0)
+    last_accessed_at = Column(DateTime, nullable=True)
+
+    # 열 기반 압축 경로 (path_codec) — 있으면 simulation_path 행 대신 사용
+    path_blob = deferred(Column(LargeBinary, nullable=True))
+    path_points = Column(Integer, nullable=True)  # path_blob 행 수 (NULL 이면 simulation_path 행 저장)
+
+    # 연장(extend) — 종료일만 다른 요청 묶음 키 / 마지막 거래일 이어 계산 상태 (NavResume)
+    series_hash = Column(String(64), nullable=True, index=True)
+    resume_state = Column(JSON, nullable=True)
+
     # 관계
     summary = relationship("SimulationSummary", back_populates="run", uselist=False, cascade="all, delete-orphan")
     paths = relationship("SimulationPath", back_populates="run", cascade="all, delete-orphan")
@@ -1417,6 +1417,40 @@ async def get_data_status(
         "total": stock_count + etf_count + bond_count + deposit_count + savings_count + annuity_count + mortgage_count + rent_loan_count + credit_loan_count
     }
 
+@router.get("/cache/returns")
+async def get_returns_cache_stats(
+    current_user: User = Depends(require_admin_permission("ADMIN_VIEW"))
+):
+    """종목별 수익률/시세 프로세스 캐시 통계 (적중/미스/메모리)"""
+    from app.services.returns_cache import returns_cache
+    return returns_cache.stats()
+
+@router.delete("/cache/returns")
+async def clear_returns_cache(
+    current_user: User = Depends(require_admin_permission("ADMIN_RUN"))
+):
+    """종목별 수익률/시세 프로세스 캐시 비우기"""
+    from app.services.returns_cache import returns_cache
+    returns_cache.clear()
+    return {"status": "success", "message": "Returns cache cleared"}
+
+@router.get("/cache/simulations")
+async def get_simulation_memory_stats(
+    current_user: User = Depends(require_admin_permission("ADMIN_VIEW"))
+):
+    """시뮬레이션 결과 프로세스 캐시 통계 (적중/미스/합류(coalesced))"""
+    from app.services.simulation_memory import simulation_memory
+    return simulation_memory.stats()
+
+@router.delete("/cache/simulations")
+async def clear_simulation_memory(
+    current_user: User = Depends(require_admin_permission("ADMIN_RUN"))
+):
+    """시뮬레이션 결과 프로세스 캐시 비우기 (DB 캐시는 유지)"""
+    from app.services.simulation_memory import simulation_memory
+    simulation_memory.clear()
+    return {"status": "success", "message": "Simulation memory cache cleared"}
+
 @router.get("/progress/{task_id}")
 async def get_progress(
     task_id: str,
@@ -2396,6 +2430,37 @@ async def get_technical_indicators(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/quant/technical/{symbol}/series")
+async def get_technical_indicator_series(
+    symbol: str,
+    days: int = 252,
+    indicators: Optional[str] = Query(None, description="쉼표 구분 지표 키 (예: close,rsi,macd)"),
+    db: Session = Depends(get_db)
+):
+    """
+    기술적 지표 전체 시계열 (차트 오버레이용)
+    - close, sma20/50/200, rsi, macd/macd_signal/macd_histogram
+    - bb_upper/bb_middle/bb_lower, stoch_k/stoch_d, atr, adx, plus_di/minus_di, obv
+    - 날짜 배열과 정렬된 컬럼 배열, 지표 미정의 구간은 null
+    """
+    from app.services.quant_analyzer import QuantAnalyzer
+
+    keys = [k.strip() for k in indicators.split(",") if k.strip()] if indicators else None
+
+    try:
+        result = QuantAnalyzer.calculate_indicator_series(db, symbol.upper(), days, keys)
+
+        if "error" in result:
+            raise HTTPException(status_code=404, detail=result["error"])
+
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Indicator series failed for {symbol}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/quant/risk/{symbol}")
 async def get_risk_metrics(
     symbol: str,
@@ -2958,10 +3023,13 @@ async def batch_compute_compass_scores(
     background_tasks: BackgroundTasks,
     market: Optional[str] = Query(None, description="시장 필터 (KOSPI, KOSDAQ)"),
     limit: int = Query(100, ge=1, le=3000, description="최대 종목 수"),
+    workers: Optional[int] = Query(None, ge=1, le=32, description="병렬 프로세스 수 (미지정 시 설정값)"),
+    full: bool = Query(False, description="전 종목 재계산 (기본: 입력 변경 종목만)"),
     current_user: User = Depends(require_admin_permission("ADMIN_RUN")),
 ):
     """Compass Score 일괄 계산 — 활성 종목의 compass 점수를 사전 계산하여 stocks 테이블에 저장"""
-    from app.services.scoring_engine import ScoringEngine
+    from app.services.compass_batch import run_compass_batch
+    from app.services.compass_dirty import clear_compass_dirty, select_dirty_tickers
     from app.models.securities import Stock
     from app.utils.kst_now import kst_now
 
@@ -2971,57 +3039,47 @@ async def batch_compute_compass_scores(
     def _batch_compute():
         db = SessionLocal()
         try:
-            query = db.query(Stock).filter(Stock.is_active == True)
+            query = db.query(Stock.ticker).filter(Stock.is_active == True)
             if market:
                 query = query.filter(Stock.market == market)
-            stocks = query.limit(limit).all()
-            total = len(stocks)
+            started_at = kst_now()
+            tickers = [row[0] for row in query.all()]
+            if not full:
+                tickers = select_dirty_tickers(db, tickers)
+            tickers = tickers[:limit]
+            total = len(tickers)
 
             progress_tracker.start_task(task_id, total, "Compass Score 일괄 계산")
             logger.info(f"[batch-compute] started: {total} stocks (operator={operator_id})")
 
-            success_count = 0
-            fail_count = 0
+            done = 0
 
-            for i, stock in enumerate(stocks):
-                try:
-                    result = ScoringEngine.calculate_compass_score(db, stock.ticker)
-                    if "error" not in result:
-                        stock.compass_score = result["compass_score"]
-                        stock.compass_grade = result["grade"]
-                        stock.compass_summary = result.get("summary", "")[:200]
-                        stock.compass_commentary = result.get("commentary", "")[:2000]
-                        cats = result.get("categories", {})
-                        stock.compass_financial_score = cats.get("financial", {}).get("score") if cats.get("financial") else None
-                        stock.compass_valuation_score = cats.get("valuation", {}).get("score") if cats.get("valuation") else None
-                        stock.compass_technical_score = cats.get("technical", {}).get("score") if cats.get("technical") else None
-                        stock.compass_risk_score = cats.get("risk", {}).get("score") if cats.get("risk") else None
-                        stock.compass_updated_at = kst_now()
-                        db.commit()
-                        success_count += 1
-                        progress_tracker.update_progress(
-                            task_id, i + 1,
-                            current_item=f"{stock.ticker} {stock.name}: {result['compass_score']}점 ({result['grade']})",
-                            success=True,
-                        )
-                    else:
-                        fail_count += 1
-                        progress_tracker.update_progress(
-                            task_id, i + 1,
-                            current_item=f"{stock.ticker} {stock.name}: {result['error']}",
-                            success=False,
-                        )
-                except Exception as e:
-                    db.rollback()
-                    fail_count += 1
+            def _on_partition_done(result):
+                # 워커 파티션 단위로 종목별 진행 이력 반영
+                nonlocal done
+                for row in result["rows"]:
+                    done += 1
                     progress_tracker.update_progress(
-                        task_id, i + 1,
-                        current_item=f"{stock.ticker}: {str(e)[:80]}",
+                        task_id, done,
+                        current_item=f"{row['ticker']}: {row['compass_score']}점 ({row['compass_grade']})",
+                        success=True,
+                    )
+                for ticker, reason in result["failed"]:
+                    done += 1
+                    progress_tracker.update_progress(
+                        task_id, done,
+                        current_item=f"{ticker}: {str(reason)[:80]}",
                         success=False,
                     )
 
+            batch = run_compass_batch(db, tickers, workers=workers, on_partition_done=_on_partition_done)
+            clear_compass_dirty(db, batch["written"], started_at)
+
             progress_tracker.complete_task(task_id, status="completed")
-            logger.info(f"[batch-compute] done: success={success_count}, fail={fail_count}")
+            logger.info(
+                f"[batch-compute] done: success={batch['success']}, fail={batch['failed']}, "
+                f"workers={len(batch['workers'])}"
+            )
         except Exception as e:
             logger.error(f"[batch-compute] fatal: {e}")
             progress_tracker.complete_task(task_id, status="failed")
@@ -3032,5 +3090,5 @@ async def batch_compute_compass_scores(
 
     return {
         "task_id": task_id,
-        "message": f"Compass Score 일괄 계산 시작 (market={market or '전체'}, limit={limit})",
+        "message": f"Compass Score 일괄 계산 시작 (market={market or '전체'}, limit={limit}, full={full})",
     }
@@ -2,10 +2,14 @@
 백테스팅 API 엔드포인트
 
 Phase 1: 시나리오 기반 포트폴리오 시뮬레이션 지원
+
+캐시 조회 / 계산은 run_in_threadpool 로 실행 — 계산과 동일 요청 대기(single-flight)가
+이벤트 루프를 막지 않아 동시 요청이 합류할 수 있음
 """
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, date
 from typing import Optional, List
@@ -20,11 +24,22 @@ from app.services.simulation_cache import get_or_compute, generate_request_hash,
 from app.services.simulation_store import (
     get_or_compute_simulation,
     generate_request_hash as generate_hash_v2,
-    get_engine_version as get_engine_version_v2
+    get_engine_version as get_engine_version_v2,
+    iter_simulation_path,
+    summarize_simulation_path
+)
+from app.services.downsampling import downsample_rows
+from app.services.path_stream import (
+    PATH_CHUNK_SIZE,
+    RESPONSE_FORMAT_PATTERN,
+    list_chunks,
+    ndjson_response
 )
 from app.services.scenario_simulation import (
+    extend_scenario_simulation,
     run_scenario_simulation,
-    run_scenario_simulation_fallback
+    run_scenario_simulation_fallback,
+    scenario_cache_params
 )
 from app.rate_limiter import limiter, RateLimits
 from app.config import settings
@@ -38,6 +53,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/backtest", tags=["Backtesting"])
 
+# 차트 경로 다운샘플링 (max_points) 허용 범위
+MIN_CHART_POINTS = 10
+MAX_CHART_POINTS = 10000
+
 
 class BacktestRequest(BaseModel):
     """백테스트 요청"""
@@ -48,6 +67,58 @@ class BacktestRequest(BaseModel):
     rebalance_frequency: str = Field("quarterly", description="리밸런싱 주기 (monthly, quarterly, yearly, none)")
 
 
+def _backtest_response(
+    db: Session,
+    result: dict,
+    request_hash: str,
+    cache_hit: bool,
+    engine_version: str,
+    message: str,
+    stream: bool,
+    max_points: Optional[int] = None
+):
+    """백테스트 응답 — stream 이면 daily_values 를 NDJSON 청크로 전송"""
+    if max_points and "daily_values" in result:
+        result = {
+            **result,
+            "daily_values": downsample_rows(result["daily_values"], max_points, "value", "date")
+        }
+
+    payload = {
+        "success": True,
+        "data": result,
+        "request_hash": request_hash,
+        "cache_hit": cache_hit,
+        "engine_version": engine_version,
+        "message": message
+    }
+    if not stream:
+        return payload
+
+    data = {k: v for k, v in result.items() if k not in ("daily_values", "run_id")}
+    if "run_id" in result:
+        chunks = iter_simulation_path(db, result["run_id"], scenario=False, chunk_size=PATH_CHUNK_SIZE)
+    else:
+        chunks = list_chunks(result.get("daily_values", []))
+    return ndjson_response({**payload, "data": data}, chunks)
+
+
+def _event_dates(result: dict) -> List[str]:
+    """다운샘플링 시 유지할 리밸런싱 일자"""
+    return [e["event_date"] for e in result.get("rebalancing_events") or [] if e.get("event_date")]
+
+
+def _path_point(p: dict) -> dict:
+    """시나리오 경로 항목 → 차트용 직렬화 형식"""
+    return {
+        "date": p["path_date"].isoformat() if isinstance(p["path_date"], date) else p["path_date"],
+        "nav": p["nav"],
+        "daily_return": p["daily_return"],
+        "cumulative_return": p["cumulative_return"],
+        "drawdown": p["drawdown"]
+    }
+
+
 class ComparePortfoliosRequest(BaseModel):
     """포트폴리오 비교 요청"""
     investment_types: list[str] = Field(..., description="비교할 투자 성향 리스트")
@@ -60,6 +131,8 @@ class ComparePortfoliosRequest(BaseModel):
 async def run_backtest(
     request: Request,
     backtest_request: BacktestRequest,
+    response_format: str = Query("json", alias="format", regex=RESPONSE_FORMAT_PATTERN, description="응답 형식 (json | ndjson)"),
+    max_points: Optional[int] = Query(None, ge=MIN_CHART_POINTS, le=MAX_CHART_POINTS, description="daily_values 최대 점 수 (LTTB 다운샘플링)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -74,7 +147,10 @@ async def run_backtest(
 
     **Rate Limit**: 시간당 5회
     **캐싱**: 동일 요청은 캐시된 결과 반환 (request_hash로 추적)
+    **format=ndjson**: 요약 헤더 후 daily_values 를 청크 단위 NDJSON 으로 스트리밍
+    **max_points**: 차트용 다운샘플링 (형태 보존, 낙폭 저점 유지 — 지표는 원본 기준)
     """
+    stream = response_format == "ndjson"
     try:
         # 포트폴리오 데이터 또는 투자 성향 중 하나는 필수
         if not backtest_request.portfolio and not backtest_request.investment_type:
@@ -136,17 +212,20 @@ async def run_backtest(
 
             # Phase 1: sim_* 구조 사용 (PostgreSQL)
             if USE_SIM_STORE:
-                result, request_hash, cache_hit, engine_version = get_or_compute_simulation(
+                result, request_hash, cache_hit, engine_version = await run_in_threadpool(
+                    get_or_compute_simulation,
                     db=db,
                     request_type="backtest_portfolio",
                     request_params=cache_params,
                     compute_fn=compute_portfolio_backtest,
                     user_id=current_user.id if current_user else None,
-                    ttl_days=7
+                    ttl_days=7,
+                    include_path=not stream or bool(max_points)
                 )
             else:
                 # Legacy: JSON 캐시 (SQLite)
-                result, request_hash, cache_hit, engine_version = get_or_compute(
+                result, request_hash, cache_hit, engine_version = await run_in_threadpool(
+                    get_or_compute,
                     db=db,
                     request_type="backtest_portfolio",
                     request_params=cache_params,
@@ -156,14 +235,11 @@ async def run_backtest(
 
             logger.info(f"Backtest portfolio - hash: {request_hash[:8]}..., cache_hit: {cache_hit}, engine: {engine_version}, store: {'sim' if USE_SIM_STORE else 'json'}")
 
-            return {
-                "success": True,
-                "data": result,
-                "request_hash": request_hash,
-                "cache_hit": cache_hit,
-                "engine_version": engine_version,
-                "message": f"사용자 포트폴리오 {backtest_request.period_years}년 백테스트 완료"
-            }
+            return _backtest_response(
+                db, result, request_hash, cache_hit, engine_version,
+                f"사용자 포트폴리오 {backtest_request.period_years}년 백테스트 완료",
+                stream, max_points
+            )
 
         # 간편 모드: 투자 성향으로 기본 포트폴리오 백테스트
         else:
@@ -184,17 +260,20 @@ async def run_backtest(
 
             # Phase 1: sim_* 구조 사용 (PostgreSQL)
             if USE_SIM_STORE:
-                result, request_hash, cache_hit, engine_version = get_or_compute_simulation(
+                result, request_hash, cache_hit, engine_version = await run_in_threadpool(
+                    get_or_compute_simulation,
                     db=db,
                     request_type="backtest_simple",
                     request_params=cache_params,
                     compute_fn=compute_simple_backtest,
                     user_id=current_user.id if current_user else None,
-                    ttl_days=7
+                    ttl_days=7,
+                    include_path=not stream or bool(max_points)
                 )
             else:
                 # Legacy: JSON 캐시 (SQLite)
-                result, request_hash, cache_hit, engine_version = get_or_compute(
+                result, request_hash, cache_hit, engine_version = await run_in_threadpool(
+                    get_or_compute,
                     db=db,
                     request_type="backtest_simple",
                     request_params=cache_params,
@@ -204,14 +283,11 @@ async def run_backtest(
 
             logger.info(f"Backtest simple - hash: {request_hash[:8]}..., cache_hit: {cache_hit}, engine: {engine_version}, store: {'sim' if USE_SIM_STORE else 'json'}")
 
-            return {
-                "success": True,
-                "data": result,
-                "request_hash": request_hash,
-                "cache_hit": cache_hit,
-                "engine_version": engine_version,
-                "message": f"{backtest_request.period_years}년 백테스트 완료"
-            }
+            return _backtest_response(
+                db, result, request_hash, cache_hit, engine_version,
+                f"{backtest_request.period_years}년 백테스트 완료",
+                stream, max_points
+            )
 
     except HTTPException:
         raise
@@ -291,7 +367,8 @@ async def compare_portfolios(
 
         # Note: compare는 단일 시뮬레이션이 아니므로 기존 JSON 캐시 사용
         # Phase 1에서는 개별 백테스트만 sim_* 구조로 저장
-        result, request_hash, cache_hit, engine_version = get_or_compute(
+        result, request_hash, cache_hit, engine_version = await run_in_threadpool(
+            get_or_compute,
             db=db,
             request_type="backtest_compare",
             request_params=cache_params,
@@ -392,6 +469,37 @@ class ScenarioSimulationRequest(BaseModel):
     )
 
 
+class ScenarioSweepRequest(BaseModel):
+    """시나리오 × 리밸런싱 규칙 일괄 시뮬레이션 요청"""
+    scenario_ids: List[str] = Field(..., min_items=1, description="시나리오 ID 목록 (MIN_VOL, DEFENSIVE, GROWTH)")
+    start_date: str = Field(..., description="시작일 (YYYY-MM-DD)")
+    end_date: str = Field(..., description="종료일 (YYYY-MM-DD)")
+    initial_amount: float = Field(1000000.0, ge=100000, description="초기 투자금액 (최소 10만원)")
+    rebalancing_rules: List[Optional[RebalancingRuleRequest]] = Field(
+        default_factory=lambda: [None],
+        description="리밸런싱 규칙 변형 목록 (null = 리밸런싱 없음, USE_REBALANCING=1 필요)"
+    )
+
+
+# 스윕 1회 최대 조합 수 (시나리오 수 × 규칙 수)
+MAX_SWEEP_COMBINATIONS = 100
+
+
+def _rebalancing_rule_dict(rule: Optional[RebalancingRuleRequest]) -> Optional[dict]:
+    """요청 규칙 → 엔진 rebalancing_rule dict (base_day_policy → periodic_timing)"""
+    if not rule:
+        return None
+    timing = "START" if rule.base_day_policy == "FIRST_TRADING_DAY" else "END"
+    return {
+        "rebalance_type": rule.rule_type,
+        "frequency": rule.frequency,
+        "periodic_timing": timing,
+        "drift_threshold": rule.drift_threshold,
+        "cost_rate": rule.cost_rate,
+        "rule_id": rule.rule_id,
+    }
+
+
 class ScenarioSimulationResponse(BaseModel):
     """시나리오 시뮬레이션 응답"""
     success: bool
@@ -420,6 +528,8 @@ class ScenarioSimulationResponse(BaseModel):
 async def run_scenario_backtest(
     request: Request,
     sim_request: ScenarioSimulationRequest,
+    response_format: str = Query("json", alias="format", regex=RESPONSE_FORMAT_PATTERN, description="응답 형식 (json | ndjson)"),
+    max_points: Optional[int] = Query(None, ge=MIN_CHART_POINTS, le=MAX_CHART_POINTS, description="스트리밍 경로 최대 점 수 (LTTB 다운샘플링)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -436,9 +546,12 @@ async def run_scenario_backtest(
 
     **Rate Limit**: 시간당 5회
     **캐싱**: 동일 요청은 캐시된 결과 반환
+    **format=ndjson**: 요약 헤더 후 전체 NAV 경로를 청크 단위 NDJSON 으로 스트리밍
+    **max_points**: 스트리밍 경로 다운샘플링 (낙폭 저점 / 리밸런싱일 유지)
 
     ⚠️ 본 시뮬레이션은 교육 목적이며, 미래 수익을 보장하지 않습니다.
     """
+    stream = response_format == "ndjson"
     try:
         # 날짜 파싱
         try:
@@ -466,28 +579,13 @@ async def run_scenario_backtest(
             )
 
         # 리밸런싱 규칙 변환 (Phase 2)
-        rebalancing_rule_dict = None
-        if sim_request.rebalancing_rule:
-            # base_day_policy를 엔진의 periodic_timing으로 변환
-            timing = "START" if sim_request.rebalancing_rule.base_day_policy == "FIRST_TRADING_DAY" else "END"
-            rebalancing_rule_dict = {
-                "rebalance_type": sim_request.rebalancing_rule.rule_type,
-                "frequency": sim_request.rebalancing_rule.frequency,
-                "periodic_timing": timing,
-                "drift_threshold": sim_request.rebalancing_rule.drift_threshold,
-                "cost_rate": sim_request.rebalancing_rule.cost_rate,
-                "rule_id": sim_request.rebalancing_rule.rule_id,
-            }
+        rebalancing_rule_dict = _rebalancing_rule_dict(sim_request.rebalancing_rule)
 
-        # 캐시 파라미터
-        cache_params = {
-            "scenario_id": scenario_id,
-            "start_date": sim_request.start_date,
-            "end_date": sim_request.end_date,
-            "initial_amount": sim_request.initial_amount,
-            # Phase 2: 리밸런싱 파라미터 포함 (request_hash에 반영)
-            "rebalancing_rule": rebalancing_rule_dict,
-        }
+        # 캐시 파라미터 (파싱한 날짜 기준 — 스윕 결과와 같은 request_hash)
+        # Phase 2: 리밸런싱 파라미터 포함 (request_hash에 반영)
+        cache_params = scenario_cache_params(
+            scenario_id, start_date, end_date, sim_request.initial_amount, rebalancing_rule_dict
+        )
 
         def compute_scenario_simulation():
             """시나리오 시뮬레이션 계산 함수"""
@@ -518,18 +616,30 @@ async def run_scenario_backtest(
                     initial_amount=sim_request.initial_amount
                 )
 
+        def extend_scenario(base_result, resume_state):
+            """종료일만 더 이른 캐시 결과에 새 거래일만 추가 (폴백 결과는 이어 계산 상태 없음)"""
+            if not USE_SCENARIO_DB:
+                return None
+            return extend_scenario_simulation(
+                db, base_result, resume_state, end_date, rebalancing_rule_dict
+            )
+
         # 캐시 조회 또는 계산
         if USE_SIM_STORE:
-            result, request_hash, cache_hit, engine_version = get_or_compute_simulation(
+            result, request_hash, cache_hit, engine_version = await run_in_threadpool(
+                get_or_compute_simulation,
                 db=db,
                 request_type="scenario_simulation",
                 request_params=cache_params,
                 compute_fn=compute_scenario_simulation,
                 user_id=current_user.id if current_user else None,
-                ttl_days=7
+                ttl_days=7,
+                include_path=not stream or bool(max_points),
+                extend_fn=extend_scenario
             )
         else:
-            result, request_hash, cache_hit, engine_version = get_or_compute(
+            result, request_hash, cache_hit, engine_version = await run_in_threadpool(
+                get_or_compute,
                 db=db,
                 request_type="scenario_simulation",
                 request_params=cache_params,
@@ -541,20 +651,23 @@ async def run_scenario_backtest(
 
         # 경로 요약 (전체 경로는 용량이 크므로 요약만 반환)
         path = result.get("path", [])
-        path_summary = {
-            "total_points": len(path),
-            "first_date": path[0]["path_date"].isoformat() if path else None,
-            "last_date": path[-1]["path_date"].isoformat() if path else None,
-            "first_nav": path[0]["nav"] if path else None,
-            "last_nav": path[-1]["nav"] if path else None,
-        }
+        if "run_id" in result:
+            path_summary = summarize_simulation_path(db, result["run_id"])
+        else:
+            path_summary = {
+                "total_points": len(path),
+                "first_date": path[0]["path_date"].isoformat() if path else None,
+                "last_date": path[-1]["path_date"].isoformat() if path else None,
+                "first_nav": path[0]["nav"] if path else None,
+                "last_nav": path[-1]["nav"] if path else None,
+            }
 
         # Phase 2: 리밸런싱 정보 추출
         rebalancing_enabled = result.get("rebalancing_enabled", False)
         rebalancing_events_count = result.get("rebalancing_events_count", 0)
         rebalancing_events = result.get("rebalancing_events") if rebalancing_enabled else None
 
-        return ScenarioSimulationResponse(
+        response = ScenarioSimulationResponse(
             success=True,
             scenario_id=scenario_id,
             start_date=sim_request.start_date,
@@ -575,6 +688,18 @@ async def run_scenario_backtest(
             rebalancing_events_count=rebalancing_events_count,
             rebalancing_events=rebalancing_events
         )
+        if not stream:
+            return response
+
+        if "run_id" in result:
+            chunks = (
+                [_path_point(p) for p in chunk]
+                for chunk in iter_simulation_path(db, result["run_id"], scenario=True, chunk_size=PATH_CHUNK_SIZE)
+            )
+        else:
+            path = downsample_rows(path, max_points, "nav", "path_date", _event_dates(result))
+            chunks = list_chunks(path, _path_point)
+        return ndjson_response(response.dict(), chunks)
 
     except HTTPException:
         raise
@@ -586,6 +711,98 @@ async def run_scenario_backtest(
         )
 
 
+@router.post("/scenario/sweep")
+@limiter.limit(RateLimits.AI_ANALYSIS)
+async def run_scenario_sweep_backtest(
+    request: Request,
+    sweep_request: ScenarioSweepRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    시나리오 × 리밸런싱 규칙 일괄 시뮬레이션 (파라미터 스윕)
+
+    시나리오 N개와 리밸런싱 규칙 M개의 모든 조합을 한 번에 계산합니다.
+    일간수익률은 종목 합집합 기준으로 1회만 조회하며, 조합별 결과는
+    단건 시나리오 API 와 같은 request_hash 로 저장됩니다.
+
+    **Rate Limit**: 시간당 5회
+    **최대 조합 수**: 100
+
+    ⚠️ 본 시뮬레이션은 교육 목적이며, 미래 수익을 보장하지 않습니다.
+    """
+    from app.services.scenario_sweep import run_scenario_sweep
+
+    try:
+        start_date = datetime.strptime(sweep_request.start_date, "%Y-%m-%d").date()
+        end_date = datetime.strptime(sweep_request.end_date, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요."
+        )
+
+    if end_date <= start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료일은 시작일보다 커야 합니다."
+        )
+
+    scenario_ids = [sid.upper() for sid in sweep_request.scenario_ids]
+    valid_scenarios = ["MIN_VOL", "DEFENSIVE", "GROWTH"]
+    invalid = [sid for sid in scenario_ids if sid not in valid_scenarios]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"유효하지 않은 시나리오입니다: {invalid}. 가능한 값: {valid_scenarios}"
+        )
+
+    rules = [_rebalancing_rule_dict(rule) for rule in sweep_request.rebalancing_rules]
+    combinations = len(set(scenario_ids)) * max(len(rules), 1)
+    if combinations > MAX_SWEEP_COMBINATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조합 수({combinations})가 최대 {MAX_SWEEP_COMBINATIONS}개를 초과합니다."
+        )
+
+    if not USE_SCENARIO_DB:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시나리오 DB 기능이 비활성화 상태입니다 (USE_SCENARIO_DB=0)."
+        )
+
+    try:
+        # 프로세스 풀 대기 동안 이벤트 루프를 막지 않도록 스레드에서 실행
+        sweep = await run_in_threadpool(
+            run_scenario_sweep,
+            db=db,
+            scenario_ids=scenario_ids,
+            rebalancing_rules=rules,
+            start_date=start_date,
+            end_date=end_date,
+            initial_amount=sweep_request.initial_amount,
+            user_id=current_user.id if current_user else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Scenario sweep failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"시뮬레이션 실패: {str(e)}"
+        )
+
+    failed = sum(1 for r in sweep["results"] if "error" in r)
+    return {
+        "success": True,
+        "start_date": sweep_request.start_date,
+        "end_date": sweep_request.end_date,
+        "initial_amount": sweep_request.initial_amount,
+        **sweep,
+        "message": f"{len(sweep['results'])}개 조합 시뮬레이션 완료" + (f" (실패 {failed}개)" if failed else ""),
+    }
+
+
 @router.get("/scenario/{scenario_id}/path")
 @limiter.limit(RateLimits.DATA_READ)
 async def get_scenario_path(
@@ -594,6 +811,8 @@ async def get_scenario_path(
     start_date: str = Query(..., description="시작일 (YYYY-MM-DD)"),
     end_date: str = Query(..., description="종료일 (YYYY-MM-DD)"),
     initial_amount: float = Query(1000000.0, ge=100000),
+    response_format: str = Query("json", alias="format", regex=RESPONSE_FORMAT_PATTERN, description="응답 형식 (json | ndjson)"),
+    max_points: Optional[int] = Query(None, ge=MIN_CHART_POINTS, le=MAX_CHART_POINTS, description="최대 점 수 (LTTB 다운샘플링)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -603,6 +822,8 @@ async def get_scenario_path(
     차트 렌더링용 데이터입니다.
 
     **Rate Limit**: 분당 30회
+    **format=ndjson**: 요약 헤더 후 경로를 청크 단위 NDJSON 으로 스트리밍
+    **max_points**: 차트용 다운샘플링 (형태 보존, 낙폭 저점 / 리밸런싱일 유지)
     """
     try:
         # 날짜 파싱
@@ -643,24 +864,23 @@ async def get_scenario_path(
                 initial_amount=initial_amount
             )
 
-        # 경로 데이터 직렬화
         path = result.get("path", [])
-        serialized_path = [
-            {
-                "date": p["path_date"].isoformat() if isinstance(p["path_date"], date) else p["path_date"],
-                "nav": p["nav"],
-                "daily_return": p["daily_return"],
-                "cumulative_return": p["cumulative_return"],
-                "drawdown": p["drawdown"]
-            }
-            for p in path
-        ]
+        trading_days = len(path)
+        path = downsample_rows(path, max_points, "nav", "path_date", _event_dates(result))
+        if response_format == "ndjson":
+            return ndjson_response(
+                {"success": True, "scenario_id": scenario_id, "trading_days": trading_days},
+                list_chunks(path, _path_point)
+            )
+
+        # 경로 데이터 직렬화
+        serialized_path = [_path_point(p) for p in path]
 
         return {
             "success": True,
             "scenario_id": scenario_id,
             "path": serialized_path,
-            "trading_days": len(serialized_path)
+            "trading_days": trading_days
         }
 
     except HTTPException:
@@ -2,7 +2,7 @@ from datetime import date
 import json
 import time
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
@@ -23,6 +23,7 @@ from app.schemas import (
 )
 from app.services.phase7_evaluation import (
     Phase7EvaluationError,
+    downsample_result,
     evaluate_phase7_portfolio,
     hash_result,
     serialize_result,
@@ -39,6 +40,10 @@ logger = get_structured_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/phase7/evaluations", tags=["Phase7 Evaluations"])
 
+# 차트 NAV 시계열 다운샘플링 (max_points) 허용 범위
+MIN_CHART_POINTS = 10
+MAX_CHART_POINTS = 10000
+
 
 @router.get("/available-period", response_model=Phase7AvailablePeriodResponse)
 def get_available_period(
@@ -142,6 +147,7 @@ def get_available_period(
 def create_phase7_evaluation(
     payload: Phase7EvaluationRequest,
     request: Request,
+    max_points: int | None = Query(None, ge=MIN_CHART_POINTS, le=MAX_CHART_POINTS),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -241,7 +247,7 @@ def create_phase7_evaluation(
             "evaluation_id": evaluation_run.evaluation_id,
         })
 
-        return Phase7EvaluationResponse(**result)
+        return Phase7EvaluationResponse(**downsample_result(result, max_points, payload.rebalance))
 
 
 @router.get("", response_model=Phase7EvaluationHistoryResponse)
@@ -288,6 +294,7 @@ def list_phase7_evaluations(
 @router.get("/{evaluation_id}", response_model=Phase7EvaluationDetailResponse)
 def get_phase7_evaluation(
     evaluation_id: int,
+    max_points: int | None = Query(None, ge=MIN_CHART_POINTS, le=MAX_CHART_POINTS),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -325,7 +332,7 @@ def get_phase7_evaluation(
             rebalance=evaluation.rebalance,
             created_at=evaluation.created_at.isoformat() if evaluation.created_at else None,
             result_hash=evaluation.result_hash,
-            result=Phase7EvaluationResponse(**result),
+            result=Phase7EvaluationResponse(**downsample_result(result, max_points, evaluation.rebalance)),
         )
 
 
@@ -9,7 +9,7 @@ import logging
 
 from app.database import get_db
 from app.models.securities import Stock
-from app.models.real_data import StockPriceDaily
+from app.services.price_matrix import load_price_matrix
 from app.auth import get_current_user, require_admin
 from app.models.user import User
 from app.exceptions import StockNotFoundError
@@ -44,30 +44,26 @@ def get_stock_detail(
     end_date = datetime.now().date()
     start_date = end_date - timedelta(days=days)
 
-    timeseries = db.query(StockPriceDaily).filter(
-        StockPriceDaily.ticker == ticker,
-        StockPriceDaily.trade_date >= start_date,
-        StockPriceDaily.trade_date <= end_date
-    ).order_by(StockPriceDaily.trade_date).all()
+    dates, ohlcv = load_price_matrix(
+        db, [ticker], start=start_date, end=end_date, use_cache=True
+    ).ohlcv(ticker)
+    _, highs, lows, closes, volumes = ohlcv.T
 
     # 3. 통계 계산
     stats = None
-    if timeseries:
-        closes = [float(ts.close_price) for ts in timeseries]
-        volumes = [ts.volume for ts in timeseries]
-
+    if dates:
         first_close = closes[0]
         last_close = closes[-1]
         period_return = ((last_close - first_close) / first_close) * 100 if first_close > 0 else 0
 
         stats = {
-            "period_days": len(timeseries),
-            "period_return": round(period_return, 2),
-            "high": float(max([ts.high_price for ts in timeseries])),
-            "low": float(min([ts.low_price for ts in timeseries])),
-            "avg_close": round(sum(closes) / len(closes), 2),
-            "avg_volume": int(sum(volumes) / len(volumes)),
-            "total_volume": sum(volumes)
+            "period_days": len(dates),
+            "period_return": round(float(period_return), 2),
+            "high": float(highs.max()),
+            "low": float(lows.min()),
+            "avg_close": round(float(closes.mean()), 2),
+            "avg_volume": int(volumes.mean()),
+            "total_volume": int(volumes.sum())
         }
 
     # 4. 응답 데이터 구성
@@ -103,17 +99,17 @@ def get_stock_detail(
         },
         "timeseries": {
             "period_days": days,
-            "data_count": len(timeseries),
+            "data_count": len(dates),
             "data": [
                 {
-                    "date": ts.trade_date.isoformat(),
-                    "open": float(ts.open_price),
-                    "high": float(ts.high_price),
-                    "low": float(ts.low_price),
-                    "close": float(ts.close_price),
-                    "volume": ts.volume
+                    "date": d.isoformat(),
+                    "open": o,
+                    "high": h,
+                    "low": l,
+                    "close": c,
+                    "volume": int(v)
                 }
-                for ts in timeseries
+                for d, (o, h, l, c, v) in zip(dates, ohlcv.tolist())
             ]
         },
         "statistics": stats
@@ -549,6 +549,8 @@ class Phase8Extensions(BaseModel):
     nav_series: Optional[List[Phase8NAVPoint]] = None
     rolling_returns: Optional[Dict[str, List[Phase8RollingPoint]]]
     rolling_volatility: Optional[Dict[str, List[Phase8RollingPoint]]]
+    rolling_sharpe: Optional[Dict[str, List[Phase8RollingPoint]]] = None
+    rolling_drawdown: Optional[Dict[str, List[Phase8RollingPoint]]] = None
     yearly_returns: Optional[List[Phase8YearlyReturn]]
     contributions: Optional[List[Phase8Contribution]]
     drawdown_segments: Optional[List[Phase8DrawdownSegment]]
@@ -18,6 +18,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 from app.models.analysis import AnalysisResult
+from app.models.simulation import SimulationRun
 
 logger = logging.getLogger(__name__)
 from app.services.performance_analyzer import (
@@ -25,6 +26,7 @@ from app.services.performance_analyzer import (
     PerformanceMetrics,
     compare_metrics,
 )
+from app.services.simulation_store import load_simulation_path
 
 
 # ============================================================================
@@ -169,6 +171,14 @@ def get_nav_path_by_run_id(db: Session, simulation_run_id: int) -> List[Dict]:
     Returns:
         [{"path_date": date, "nav": float}, ...]
     """
+    run = db.get(SimulationRun, simulation_run_id)
+    if run is not None and run.path_points is not None:
+        # 열 기반 압축 경로 (simulation_path 행 없음)
+        return [
+            {"path_date": p.path_date, "nav": p.nav}
+            for p in load_simulation_path(db, run)
+        ]
+
     sql = text("""
         SELECT path_date, nav
         FROM simulation_path
@@ -7,11 +7,22 @@ Phase 7 입력과 NAV 시계열을 그대로 사용하며,
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import Dict, List
+from datetime import date
+from typing import List
 
-from app.services.performance_analyzer import NAVPoint, calculate_daily_returns, calculate_volatility
+import numpy as np
+
+from app.services.drawdown_engine import drawdown_episodes
+from app.services.performance_analyzer import NAVSeriesLike, as_nav_columns
+from app.services.rolling_stats import (
+    rolling_drawdown,
+    rolling_return,
+    rolling_sharpe,
+    rolling_volatility,
+    window_starts,
+)
 
 
 @dataclass
@@ -20,6 +31,8 @@ class ExtensionData:
     rolling_returns_3y: List[dict]
     rolling_returns_5y: List[dict]
     rolling_volatility_3y: List[dict]
+    rolling_sharpe_3y: List[dict]
+    rolling_drawdown_3y: List[dict]
     yearly_returns: List[dict]
     contributions: List[dict]
     drawdown_segments: List[dict]
@@ -34,6 +47,12 @@ class ExtensionData:
             "rolling_volatility": {
                 "window_3y": self.rolling_volatility_3y,
             },
+            "rolling_sharpe": {
+                "window_3y": self.rolling_sharpe_3y,
+            },
+            "rolling_drawdown": {
+                "window_3y": self.rolling_drawdown_3y,
+            },
             "yearly_returns": self.yearly_returns,
             "contributions": self.contributions,
             "drawdown_segments": self.drawdown_segments,
@@ -41,91 +60,67 @@ class ExtensionData:
 
 
 def build_extensions(
-    nav_series: List[NAVPoint],
-    item_series: List[Dict[date, float]],
+    nav_series: NAVSeriesLike,
+    item_prices: np.ndarray,
     weights: List[float],
     items: List[dict],
 ) -> ExtensionData:
+    columns = as_nav_columns(nav_series)
+    dates = columns.date_list()
+    nav = columns.nav
     nav_points = [
         {
-            "date": point.nav_date.isoformat(),
-            "nav": round(point.nav, 6),
+            "date": day.isoformat(),
+            "nav": round(value, 6),
         }
-        for point in nav_series
+        for day, value in zip(dates, nav.tolist())
     ]
-    rolling_returns_3y = _calculate_rolling_returns(nav_series, years=3)
-    rolling_returns_5y = _calculate_rolling_returns(nav_series, years=5)
-    rolling_volatility_3y = _calculate_rolling_volatility(nav_series, years=3)
-    yearly_returns = _calculate_yearly_returns(nav_series)
-    contributions = _calculate_contributions(nav_series, item_series, weights, items)
-    drawdown_segments = _calculate_drawdown_segments(nav_series)
+    starts_3y = window_starts(columns.dates, 3 * 365)
+    starts_5y = window_starts(columns.dates, 5 * 365)
+
+    rolling_returns_3y = _rolling_points(dates, rolling_return(nav, starts_3y))
+    rolling_returns_5y = _rolling_points(dates, rolling_return(nav, starts_5y))
+    rolling_volatility_3y = _rolling_points(dates, rolling_volatility(nav, starts_3y))
+    rolling_sharpe_3y = _rolling_points(dates, rolling_sharpe(nav, starts_3y))
+    rolling_drawdown_3y = _rolling_points(dates, rolling_drawdown(nav, starts_3y))
+    yearly_returns = _calculate_yearly_returns(columns.dates, nav)
+    contributions = _calculate_contributions(item_prices, weights, items)
+    drawdown_segments = _calculate_drawdown_segments(dates, nav)
 
     return ExtensionData(
         nav_series=nav_points,
         rolling_returns_3y=rolling_returns_3y,
         rolling_returns_5y=rolling_returns_5y,
         rolling_volatility_3y=rolling_volatility_3y,
+        rolling_sharpe_3y=rolling_sharpe_3y,
+        rolling_drawdown_3y=rolling_drawdown_3y,
         yearly_returns=yearly_returns,
         contributions=contributions,
         drawdown_segments=drawdown_segments,
     )
 
 
-def _calculate_rolling_returns(nav_series: List[NAVPoint], years: int) -> List[dict]:
-    window_days = years * 365
-    results = []
-    for idx, point in enumerate(nav_series):
-        target_date = point.nav_date - timedelta(days=window_days)
-        start_idx = _find_start_index(nav_series, target_date)
-        if start_idx is None or start_idx >= idx:
-            continue
-        start_nav = nav_series[start_idx].nav
-        end_nav = point.nav
-        if start_nav <= 0:
-            continue
-        results.append(
-            {
-                "end_date": point.nav_date.isoformat(),
-                "value": round((end_nav / start_nav) - 1, 6),
-            }
-        )
-    return results
-
-
-def _calculate_rolling_volatility(nav_series: List[NAVPoint], years: int) -> List[dict]:
-    window_days = years * 365
-    results = []
-    for idx, point in enumerate(nav_series):
-        target_date = point.nav_date - timedelta(days=window_days)
-        start_idx = _find_start_index(nav_series, target_date)
-        if start_idx is None or start_idx >= idx:
-            continue
-        window_nav = nav_series[start_idx : idx + 1]
-        daily_returns = calculate_daily_returns(window_nav)
-        if len(daily_returns) < 2:
-            continue
-        volatility = calculate_volatility(daily_returns)
-        results.append(
-            {
-                "end_date": point.nav_date.isoformat(),
-                "value": round(volatility, 6),
-            }
-        )
-    return results
+def _rolling_points(dates: List[date], values: np.ndarray) -> List[dict]:
+    """롤링 지표 배열 → 정의된 시점만 {end_date, value}"""
+    return [
+        {"end_date": day.isoformat(), "value": round(value, 6)}
+        for day, value in zip(dates, values.tolist())
+        if not math.isnan(value)
+    ]
 
 
-def _calculate_yearly_returns(nav_series: List[NAVPoint]) -> List[dict]:
-    if not nav_series:
+def _calculate_yearly_returns(dates: np.ndarray, nav: np.ndarray) -> List[dict]:
+    """연도별 수익률 (해당 연도 첫 / 마지막 NAV 기준)"""
+    if not len(nav):
         return []
-    by_year: Dict[int, List[NAVPoint]] = {}
-    for point in nav_series:
-        by_year.setdefault(point.nav_date.year, []).append(point)
+    years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    firsts = np.flatnonzero(np.diff(years, prepend=years[0] - 1))
+    lasts = np.append(firsts[1:] - 1, len(nav) - 1)
 
     results = []
-    for year in sorted(by_year.keys()):
-        year_series = by_year[year]
-        start_nav = year_series[0].nav
-        end_nav = year_series[-1].nav
+    for year, start_nav, end_nav in zip(
+        years[firsts].tolist(), nav[firsts].tolist(), nav[lasts].tolist()
+    ):
         if start_nav <= 0:
             continue
         results.append(
@@ -138,20 +133,19 @@ def _calculate_yearly_returns(nav_series: List[NAVPoint]) -> List[dict]:
 
 
 def _calculate_contributions(
-    nav_series: List[NAVPoint],
-    item_series: List[Dict[date, float]],
+    item_prices: np.ndarray,
     weights: List[float],
     items: List[dict],
 ) -> List[dict]:
-    if not nav_series:
+    """항목별 기간 수익률 × 비중 (item_prices: NAV 일자에 정렬된 (T, 항목 수) 가격)"""
+    item_prices = np.asarray(item_prices, dtype=np.float64)
+    if item_prices.ndim != 2 or not item_prices.size:
         return []
-    start_date = nav_series[0].nav_date
-    end_date = nav_series[-1].nav_date
     results = []
-    for idx, series in enumerate(item_series):
-        start_price = series.get(start_date)
-        end_price = series.get(end_date)
-        if start_price is None or end_price is None or start_price <= 0:
+    for idx, (start_price, end_price) in enumerate(
+        zip(item_prices[0].tolist(), item_prices[-1].tolist())
+    ):
+        if math.isnan(start_price) or math.isnan(end_price) or start_price <= 0:
             continue
         item_return = (end_price / start_price) - 1
         item_meta = items[idx] if idx < len(items) else {}
@@ -165,56 +159,13 @@ def _calculate_contributions(
     return results
 
 
-def _calculate_drawdown_segments(nav_series: List[NAVPoint]) -> List[dict]:
-    segments = []
-    if len(nav_series) < 2:
-        return segments
-
-    peak_nav = nav_series[0].nav
-    peak_date = nav_series[0].nav_date
-    in_drawdown = False
-    trough_nav = peak_nav
-    trough_date = peak_date
-
-    for point in nav_series[1:]:
-        if point.nav >= peak_nav:
-            if in_drawdown:
-                segments.append(
-                    {
-                        "start": peak_date.isoformat(),
-                        "end": point.nav_date.isoformat(),
-                        "drawdown": round((trough_nav / peak_nav) - 1, 6),
-                    }
-                )
-                in_drawdown = False
-            peak_nav = point.nav
-            peak_date = point.nav_date
-            trough_nav = peak_nav
-            trough_date = peak_date
-            continue
-
-        drawdown = (point.nav / peak_nav) - 1
-        if not in_drawdown:
-            in_drawdown = True
-            trough_nav = point.nav
-            trough_date = point.nav_date
-        elif drawdown < (trough_nav / peak_nav) - 1:
-            trough_nav = point.nav
-            trough_date = point.nav_date
-
-    if in_drawdown:
-        segments.append(
-            {
-                "start": peak_date.isoformat(),
-                "end": nav_series[-1].nav_date.isoformat(),
-                "drawdown": round((trough_nav / peak_nav) - 1, 6),
-            }
-        )
-    return segments
-
-
-def _find_start_index(nav_series: List[NAVPoint], target_date: date) -> int | None:
-    for idx, point in enumerate(nav_series):
-        if point.nav_date >= target_date:
-            return idx
-    return None
+def _calculate_drawdown_segments(dates: List[date], nav: np.ndarray) -> List[dict]:
+    """낙폭 구간 (고점일 → 회복일, 미회복이면 마지막 일자)"""
+    return [
+        {
+            "start": dates[episode.peak].isoformat(),
+            "end": dates[episode.recovery if episode.recovered else -1].isoformat(),
+            "drawdown": round(episode.depth, 6),
+        }
+        for episode in drawdown_episodes(nav)
+    ]
@@ -4,24 +4,56 @@
 과거 데이터를 기반으로 포트폴리오의 성과를 시뮬레이션하고 검증합니다.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 import math
+import random
+
+import numpy as np
 
 from app.models.alpha_vantage import AlphaVantageTimeSeries
-from app.models.securities import Stock, ETF
-from app.models.real_data import StockPriceDaily
+from app.models.securities import ETF
+from app.services.price_matrix import PriceMatrix, load_price_matrix
+from app.services.trading_calendar import trade_dates_between
+
+# 종목별 시세: (정렬된 datetime64[D] 날짜 배열, 종가 배열)
+PriceSeries = Tuple[np.ndarray, np.ndarray]
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _to_datetime64(dates: List[date]) -> np.ndarray:
+    """date 리스트 → datetime64[D] 배열 (서수 변환, 객체 파싱 회피)"""
+    ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
 
 
 class BacktestingEngine:
     """백테스팅 엔진"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        price_matrix: Optional[PriceMatrix] = None,
+        shared_prices: Optional[Dict[str, PriceSeries]] = None,
+        shared_trade_days: Optional[np.ndarray] = None,
+    ):
         self.db = db
+        # 여러 백테스트가 공유하는 유니버스 가격 행렬 (없으면 실행마다 조회)
+        self._price_matrix = price_matrix
+        # 비교 실행에서 미리 적재된 종목별 시세 (있으면 DB 조회 없이 사용, 읽기 전용)
+        self._shared_prices = shared_prices
+        # 비교 실행에서 미리 조회한 거래일 캘린더 (있으면 DB 조회 없이 사용, 읽기 전용)
+        self._shared_trade_days = shared_trade_days
         self._backtest_start_date: Optional[datetime] = None
-        self._price_cache: Dict[str, Dict[date, float]] = {}  # ticker -> {date -> price}
+        self._price_cache: Dict[str, PriceSeries] = {}  # ticker -> (날짜, 종가)
+        # 실행 단위 거래일 캘린더 및 캘린더 정렬 가격 (ticker, initial_price) -> 배열
+        self._calendar: List[datetime] = []
+        self._calendar_days: np.ndarray = np.empty(0, dtype="datetime64[D]")
+        self._aligned_prices: Dict[Tuple[str, float], np.ndarray] = {}
 
     def run_backtest(
         self,
@@ -63,31 +95,30 @@ class BacktestingEngine:
         # 가격 데이터 일괄 프리로드 (성능 최적화)
         self._preload_prices(current_portfolio, start_date, end_date)
 
-        # 일별 시뮬레이션
-        daily_values = []
-        current_date = start_date
+        # 거래일 단위 시뮬레이션 (리밸런싱 사이 구간은 배열로 평가)
+        calendar = self._build_calendar(start_date, end_date)
+        values = np.empty(len(calendar), dtype=np.float64)
+        segment_start = 0
         last_rebalance_date = start_date
 
-        while current_date <= end_date:
-            # 일별 포트폴리오 가치 계산
-            daily_value = self._calculate_portfolio_value(
-                current_portfolio, current_date
-            )
-
-            daily_values.append({
-                "date": current_date.isoformat(),
-                "value": daily_value,
-                "return": ((daily_value - initial_investment) / initial_investment) * 100
-            })
-
-            # 리밸런싱 체크
+        for i, current_date in enumerate(calendar):
             if self._should_rebalance(current_date, last_rebalance_date, rebalance_frequency):
+                values[segment_start:i + 1] = self._value_segment(current_portfolio, segment_start, i + 1)
                 current_portfolio = self._rebalance_portfolio(
-                    portfolio, daily_value, current_date
+                    portfolio, float(values[i]), current_date
                 )
                 last_rebalance_date = current_date
+                segment_start = i + 1
+        values[segment_start:] = self._value_segment(current_portfolio, segment_start, len(calendar))
 
-            current_date += timedelta(days=1)
+        daily_values = [
+            {
+                "date": current_date.isoformat(),
+                "value": value,
+                "return": ((value - initial_investment) / initial_investment) * 100
+            }
+            for current_date, value in zip(calendar, values.tolist())
+        ]
 
         # 성과 지표 계산
         metrics = self._calculate_metrics(
@@ -179,8 +210,7 @@ class BacktestingEngine:
 
         for key, holding in portfolio.items():
             if holding["type"] in ["stock", "etf"]:
-                # 주식/ETF: 현재가 × 주식 수
-                # 실제로는 과거 가격 데이터 필요 (여기서는 시뮬레이션)
+                # 주식/ETF: 해당일(직전 거래일) 종가 × 주식 수
                 price = self._get_historical_price(
                     holding["ticker"],
                     holding["type"],
@@ -201,6 +231,85 @@ class BacktestingEngine:
 
         return total_value
 
+    def _build_calendar(self, start_date: datetime, end_date: datetime) -> List[datetime]:
+        """
+        시뮬레이션 거래일 캘린더 (stock_price_daily 거래일 캘린더의 [start, end] 구간)
+        - 보유 종목 시세가 늦게 시작해도 기간 전체를 평가 (시세 이전 구간은 시뮬레이션 가격)
+        - 캘린더가 비어 있으면 보유 종목 시세 일자의 합집합, 그것도 없으면 평일 기준
+        """
+        start_d = start_date.date() if isinstance(start_date, datetime) else start_date
+        end_d = end_date.date() if isinstance(end_date, datetime) else end_date
+
+        days = self._trade_days(start_d, end_d)
+        if len(days) == 0 and self._price_cache:
+            days = np.unique(np.concatenate([dates for dates, _ in self._price_cache.values()]))
+            days = days[(days >= np.datetime64(start_d)) & (days <= np.datetime64(end_d))]
+        if len(days) == 0:
+            days = np.arange(np.datetime64(start_d), np.datetime64(end_d) + 1, dtype="datetime64[D]")
+            days = days[np.is_busday(days)]
+
+        self._calendar_days = days
+        self._aligned_prices = {}
+        if isinstance(start_date, datetime):
+            self._calendar = [
+                datetime.combine(d, start_date.time(), tzinfo=start_date.tzinfo)
+                for d in days.tolist()
+            ]
+        else:
+            self._calendar = days.tolist()
+        return self._calendar
+
+    def _trade_days(self, start_d: date, end_d: date) -> np.ndarray:
+        """stock_price_daily 거래일 캘린더의 [start, end] 구간 (공유 캘린더가 있으면 그대로 사용)"""
+        if self._shared_trade_days is not None:
+            return self._shared_trade_days
+        return _to_datetime64(trade_dates_between(self.db, start_d, end_d, source="stock_price_daily"))
+
+    def _value_segment(self, portfolio: Dict, lo: int, hi: int) -> np.ndarray:
+        """캘린더 [lo, hi) 구간의 일별 포트폴리오 가치 (배열 연산)"""
+        total = np.zeros(hi - lo, dtype=np.float64)
+        if hi <= lo:
+            return total
+
+        days_held = None
+        for holding in portfolio.values():
+            if holding["type"] in ["stock", "etf"]:
+                prices = self._calendar_prices(holding["ticker"], holding["initial_price"])
+                total += prices[lo:hi] * holding["shares"]
+
+            elif holding["type"] in ["bond", "deposit"]:
+                if days_held is None:
+                    start = self._backtest_start_date
+                    start_d = np.datetime64(start.date() if isinstance(start, datetime) else start)
+                    days_held = np.maximum(
+                        (self._calendar_days[lo:hi] - start_d).astype(np.int64), 0
+                    ).astype(np.float64)
+                daily_rate = holding["annual_rate"] / 365 / 100
+                total += holding["amount"] + holding["amount"] * daily_rate * days_held
+
+        return total
+
+    def _calendar_prices(self, ticker: str, initial_price: float) -> np.ndarray:
+        """캘린더 정렬 가격 — 직전 거래일 종가 as-of (이진 탐색), 시세 이전 구간은 시뮬레이션"""
+        key = (ticker, initial_price)
+        prices = self._aligned_prices.get(key)
+        if prices is not None:
+            return prices
+
+        prices = np.full(len(self._calendar_days), np.nan)
+        series = self._price_cache.get(ticker)
+        if series is not None:
+            dates, closes = series
+            pos = np.searchsorted(dates, self._calendar_days, side="right") - 1
+            found = pos >= 0
+            prices[found] = closes[pos[found]]
+
+        for i in np.flatnonzero(np.isnan(prices)).tolist():
+            prices[i] = self._simulated_price(ticker, self._calendar[i], initial_price)
+
+        self._aligned_prices[key] = prices
+        return prices
+
     def _preload_prices(self, portfolio: Dict, start_date: datetime, end_date: datetime):
         """백테스트 기간의 모든 가격 데이터를 일괄 로드하여 캐시"""
         self._price_cache = {}
@@ -215,25 +324,25 @@ class BacktestingEngine:
         if not tickers:
             return
 
+        if self._shared_prices is not None:
+            self._price_cache = {t: self._shared_prices[t] for t in tickers if t in self._shared_prices}
+            return
+
         # KRX 종목 (6자리 숫자) 일괄 로드
         krx_tickers = [t for t in tickers if t.isdigit() and len(t) == 6]
         if krx_tickers:
-            rows = self.db.query(
-                StockPriceDaily.ticker,
-                StockPriceDaily.trade_date,
-                StockPriceDaily.close_price
-            ).filter(
-                and_(
-                    StockPriceDaily.ticker.in_(krx_tickers),
-                    StockPriceDaily.trade_date >= start_d,
-                    StockPriceDaily.trade_date <= end_d
+            matrix = self._price_matrix
+            if matrix is None:
+                matrix = load_price_matrix(
+                    self.db, krx_tickers, start=start_d, end=end_d, use_cache=True
                 )
-            ).all()
-
-            for ticker, trade_date, close_price in rows:
-                if ticker not in self._price_cache:
-                    self._price_cache[ticker] = {}
-                self._price_cache[ticker][trade_date] = float(close_price)
+            window = matrix.window(start_d, end_d, tickers=krx_tickers)
+            days = _to_datetime64(window.dates)
+            closes = window.close
+            for col, ticker in enumerate(window.tickers):
+                valid = ~np.isnan(closes[:, col])
+                if valid.any():
+                    self._price_cache[ticker] = (days[valid], closes[valid, col])
 
         # 미국 종목 일괄 로드
         us_tickers = [t for t in tickers if not (t.isdigit() and len(t) == 6)]
@@ -251,10 +360,15 @@ class BacktestingEngine:
                 )
             ).all()
 
+            by_symbol: Dict[str, Dict[date, float]] = {}
             for symbol, d, adj_close, close in rows:
-                if symbol not in self._price_cache:
-                    self._price_cache[symbol] = {}
-                self._price_cache[symbol][d] = adj_close or close
+                by_symbol.setdefault(symbol, {})[d] = adj_close or close
+            for symbol, series in by_symbol.items():
+                dates = sorted(series)
+                self._price_cache[symbol] = (
+                    _to_datetime64(dates),
+                    np.array([series[d] for d in dates], dtype=np.float64),
+                )
 
     def _get_historical_price(
         self, ticker: str, security_type: str, target_date: datetime, initial_price: float
@@ -262,32 +376,31 @@ class BacktestingEngine:
         """
         과거 가격 데이터 조회 (캐시 우선)
 
-        1순위: 프리로드된 캐시
-        2순위: 캐시 내 가장 가까운 과거 날짜
-        3순위: 현재가 기반 시뮬레이션
+        1순위: 프리로드된 캐시 내 해당일 이전 가장 최근 거래일 종가
+        2순위: 현재가 기반 시뮬레이션
         """
         query_date = target_date.date() if isinstance(target_date, datetime) else target_date
 
-        # 1. 캐시에서 정확한 날짜 조회
-        if ticker in self._price_cache:
-            cache = self._price_cache[ticker]
-            if query_date in cache:
-                return cache[query_date]
-
-            # 가장 가까운 과거 날짜 찾기 (주말/공휴일 대비)
-            past_dates = [d for d in cache if d <= query_date]
-            if past_dates:
-                nearest = max(past_dates)
-                return cache[nearest]
+        # 1. 캐시에서 해당일 이전 가장 최근 거래일 종가 (주말/공휴일 대비, 이진 탐색)
+        series = self._price_cache.get(ticker)
+        if series is not None:
+            dates, closes = series
+            pos = int(np.searchsorted(dates, np.datetime64(query_date), side="right")) - 1
+            if pos >= 0:
+                return float(closes[pos])
 
         # 2. Fallback: 시뮬레이션 (캐시에 데이터 없는 경우)
+        return self._simulated_price(ticker, target_date, initial_price)
+
+    def _simulated_price(self, ticker: str, target_date: datetime, initial_price: float) -> float:
+        """시세 없는 종목/일자의 현재가 기반 시뮬레이션 가격 (날짜별 고정 시드)"""
         days_from_now = (datetime.now() - target_date).days
         if days_from_now <= 0:
             return initial_price
 
-        import random
-        random.seed(f"{ticker}_{target_date.isoformat()}")
-        daily_change = random.uniform(-0.005, 0.005)
+        # 전역 시드 대신 호출별 생성기 (비교 실행의 동시 시뮬레이션 간 간섭 방지)
+        rng = random.Random(f"{ticker}_{target_date.isoformat()}")
+        daily_change = rng.uniform(-0.005, 0.005)
         cumulative_change = 1 + (daily_change * days_from_now * 0.1)
 
         return initial_price * cumulative_change
@@ -424,7 +537,8 @@ class BacktestingEngine:
         portfolios: List[Dict],
         start_date: datetime,
         end_date: datetime,
-        initial_investment: int
+        initial_investment: int,
+        shared_preload: bool = True
     ) -> Dict:
         """
         여러 포트폴리오 비교
@@ -434,22 +548,29 @@ class BacktestingEngine:
             start_date: 시작 날짜
             end_date: 종료 날짜
             initial_investment: 초기 투자 금액
+            shared_preload: 보유 종목 합집합을 1회 프리로드하고 포트폴리오별 시뮬레이션을 동시 실행
 
         Returns:
             각 포트폴리오의 백테스트 결과 및 비교 지표
         """
-        results = []
-
-        for i, portfolio in enumerate(portfolios):
-            backtest_result = self.run_backtest(
-                portfolio,
-                start_date,
-                end_date,
-                initial_investment,
-                rebalance_frequency="quarterly"
+        if shared_preload and len(portfolios) > 1:
+            results = self._run_shared_backtests(
+                portfolios, start_date, end_date, initial_investment
             )
+        else:
+            results = [
+                self.run_backtest(
+                    portfolio,
+                    start_date,
+                    end_date,
+                    initial_investment,
+                    rebalance_frequency="quarterly"
+                )
+                for portfolio in portfolios
+            ]
+
+        for i, (portfolio, backtest_result) in enumerate(zip(portfolios, results)):
             backtest_result["portfolio_name"] = portfolio.get("name", f"Portfolio {i+1}")
-            results.append(backtest_result)
 
         # 최고 성과 포트폴리오 찾기
         best_return = max(results, key=lambda x: x["total_return"])
@@ -463,6 +584,45 @@ class BacktestingEngine:
             "lowest_risk": lowest_risk["portfolio_name"]
         }
 
+    def _run_shared_backtests(
+        self,
+        portfolios: List[Dict],
+        start_date: datetime,
+        end_date: datetime,
+        initial_investment: int
+    ) -> List[Dict]:
+        """
+        종목 합집합 시세·거래일 캘린더 1회 프리로드 → 공유 배열 위에서 포트폴리오별 백테스트 동시 실행
+        - 세션(self.db)은 스레드 안전하지 않으므로 DB 조회는 모두 호출 스레드에서 끝냄
+        """
+        union: Dict = {}
+        for portfolio in portfolios:
+            union.update(self._initialize_portfolio(portfolio, initial_investment))
+        self._preload_prices(union, start_date, end_date)
+        shared_prices = self._price_cache
+        start_d = start_date.date() if isinstance(start_date, datetime) else start_date
+        end_d = end_date.date() if isinstance(end_date, datetime) else end_date
+        shared_trade_days = self._trade_days(start_d, end_d)
+
+        def run(portfolio: Dict) -> Dict:
+            engine = BacktestingEngine(
+                self.db,
+                price_matrix=self._price_matrix,
+                shared_prices=shared_prices,
+                shared_trade_days=shared_trade_days,
+            )
+            return engine.run_backtest(
+                portfolio,
+                start_date,
+                end_date,
+                initial_investment,
+                rebalance_frequency="quarterly"
+            )
+
+        # 시세·캘린더를 공유 배열로 넘겨 스레드 내 시뮬레이션은 DB 를 조회하지 않음
+        with ThreadPoolExecutor(max_workers=len(portfolios)) as pool:
+            return list(pool.map(run, portfolios))
+
 
 def run_simple_backtest(
     investment_type: str,
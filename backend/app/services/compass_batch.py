@@ -0,0 +1,203 @@
+# backend/app/services/compass_batch.py
+
+"""
+Compass Score 병렬 일괄 계산
+
+- 유니버스를 프로세스 수만큼 분할, 워커별 자체 세션 사용
+- 워커는 파티션 가격 행렬 + 벤치마크 시세 + 지표 상태를 1회 적재 후 종목별 점수 계산
+- 결과는 메인 프로세스에서 stocks.compass_* 일괄 UPDATE 1회로 반영
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.securities import Stock
+from app.services.indicator_state import IndicatorStateService
+from app.services.price_matrix import load_price_matrix
+from app.services.quant_analyzer import QuantAnalyzer
+from app.services.scoring_engine import ScoringEngine
+from app.utils.kst_now import kst_now
+
+logger = logging.getLogger(__name__)
+
+# comprehensive_quant_analysis 기본 조회 기간과 동일
+QUANT_DAYS = 252
+MARKET_SYMBOL = "SPY"
+
+
+def compass_columns(result: Dict) -> Dict:
+    """calculate_compass_score 결과 → stocks.compass_* 컬럼 값"""
+    cats = result.get("categories", {})
+
+    def _score(key):
+        return cats.get(key, {}).get("score") if cats.get(key) else None
+
+    return {
+        "compass_score": result["compass_score"],
+        "compass_grade": result["grade"],
+        "compass_summary": result.get("summary", "")[:200],
+        "compass_commentary": result.get("commentary", "")[:2000],
+        "compass_financial_score": _score("financial"),
+        "compass_valuation_score": _score("valuation"),
+        "compass_technical_score": _score("technical"),
+        "compass_risk_score": _score("risk"),
+    }
+
+
+def partition_tickers(tickers: Sequence[str], parts: int) -> List[List[str]]:
+    """라운드로빈 분할 (시장/코드 순 정렬된 입력에서도 파티션 부하 균등)"""
+    parts = max(1, min(parts, len(tickers)))
+    return [list(tickers[i::parts]) for i in range(parts)]
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """
+    워커 수 결정 — 0/None 이면 설정값
+    - 워커마다 DB 커넥션을 점유하므로 커넥션 풀 크기로 상한
+    """
+    workers = workers or settings.compass_batch_workers or 1
+    return max(1, min(workers, settings.db_pool_size))
+
+
+def score_partition(tickers: List[str], worker_id: int = 0, db: Optional[Session] = None) -> Dict:
+    """
+    워커 실행 단위 — 파티션 종목 점수 계산 (DB 쓰기 없음)
+    - db 미지정 시 자체 세션 생성 (프로세스 풀 워커)
+    - 반환: {worker, count, rows, failed: [(ticker, 사유)], elapsed_seconds}
+    """
+    from app.database import SessionLocal
+
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+
+    started = time.perf_counter()
+    rows: List[Dict] = []
+    failed: List[tuple] = []
+    try:
+        cutoff = (datetime.now() - timedelta(days=QUANT_DAYS)).date()
+        matrix = load_price_matrix(db, tickers, start=cutoff)
+        market_prices = QuantAnalyzer.get_price_data(db, MARKET_SYMBOL, QUANT_DAYS)
+        indicator_states = IndicatorStateService.load_current_states(db, tickers)
+
+        for ticker in tickers:
+            try:
+                result = ScoringEngine.calculate_compass_score(
+                    db, ticker, price_matrix=matrix, market_prices=market_prices,
+                    indicator_states=indicator_states,
+                )
+            except Exception as e:
+                db.rollback()
+                failed.append((ticker, str(e)[:100]))
+                continue
+
+            if "error" in result:
+                failed.append((ticker, result["error"]))
+            else:
+                rows.append({"ticker": ticker, **compass_columns(result)})
+    finally:
+        if own_session:
+            db.close()
+
+    return {
+        "worker": worker_id,
+        "count": len(tickers),
+        "rows": rows,
+        "failed": failed,
+        "elapsed_seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def write_compass_scores(db: Session, rows: List[Dict]) -> int:
+    """stocks.compass_* 일괄 UPDATE (PK 기준 executemany 1회) → 갱신 건수"""
+    if not rows:
+        return 0
+    now = kst_now()
+    db.execute(update(Stock), [{**row, "compass_updated_at": now} for row in rows])
+    db.commit()
+    return len(rows)
+
+
+def run_compass_batch(
+    db: Session,
+    tickers: Sequence[str],
+    workers: Optional[int] = None,
+    on_partition_done: Optional[Callable[[Dict], None]] = None,
+) -> Dict:
+    """
+    Compass Score 일괄 계산 + 일괄 반영
+    - workers=1 이면 호출 세션으로 현재 프로세스에서 실행
+    - on_partition_done: 파티션 완료 시 워커 결과로 호출 (진행률 갱신용)
+    - 반환: {success, failed, total, workers: [워커별 통계], written: [반영된 종목]}
+    """
+    tickers = list(tickers)
+    partitions = partition_tickers(tickers, resolve_workers(workers)) if tickers else []
+    results: List[Dict] = []
+
+    if len(partitions) <= 1:
+        for part in partitions:
+            results.append(score_partition(part, 0, db=db))
+            if on_partition_done:
+                on_partition_done(results[-1])
+    else:
+        # fork 시 부모의 커넥션 풀이 복제되므로 spawn 사용
+        with ProcessPoolExecutor(max_workers=len(partitions), mp_context=get_context("spawn")) as pool:
+            futures = {
+                pool.submit(score_partition, part, worker_id): (worker_id, part)
+                for worker_id, part in enumerate(partitions)
+            }
+            for future in as_completed(futures):
+                worker_id, part = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error("[compass_batch] worker %d 실패: %s", worker_id, e)
+                    result = {
+                        "worker": worker_id,
+                        "count": len(part),
+                        "rows": [],
+                        "failed": [(ticker, str(e)[:100]) for ticker in part],
+                        "elapsed_seconds": None,
+                    }
+                results.append(result)
+                if on_partition_done:
+                    on_partition_done(result)
+
+    rows = [row for result in results for row in result["rows"]]
+    try:
+        success = write_compass_scores(db, rows)
+    except Exception:
+        db.rollback()
+        raise
+
+    worker_stats = sorted(
+        (
+            {
+                "worker": r["worker"],
+                "count": r["count"],
+                "success": len(r["rows"]),
+                "failed": len(r["failed"]),
+                "elapsed_seconds": r["elapsed_seconds"],
+            }
+            for r in results
+        ),
+        key=lambda s: s["worker"],
+    )
+    for ticker, reason in (f for r in results for f in r["failed"]):
+        logger.debug("[compass_batch] %s 실패: %s", ticker, reason)
+
+    return {
+        "success": success,
+        "failed": sum(s["failed"] for s in worker_stats),
+        "total": len(tickers),
+        "workers": worker_stats,
+        "written": [row["ticker"] for row in rows],
+    }
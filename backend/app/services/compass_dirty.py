@@ -0,0 +1,160 @@
+# backend/app/services/compass_dirty.py
+
+"""
+Compass Score 증분 재계산 (dirty set)
+
+- 적재기: 시세/재무/멀티플 변경 종목을 compass_dirty 에 표시 (mark_compass_dirty)
+- 일괄 계산: 표시된 종목 중 실질 변경분만 재계산 (select_dirty_tickers)
+  · 재무/멀티플 변경 또는 미계산 종목 → 항상 재계산
+  · 시세만 변경 → 마지막 계산 이후 종가 변동률이 임계치 이상이거나 점수가 오래된 경우
+- 채점 엔진 버전이 바뀌면 전 종목 재계산 (requires_full_recompute)
+"""
+
+import logging
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Sequence
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.securities import CompassDirty, Stock
+from app.services.indicator_kernel import CLOSE
+from app.services.price_matrix import load_price_matrix
+from app.services.scoring_engine import ScoringEngine
+from app.utils.kst_now import kst_now
+
+logger = logging.getLogger(__name__)
+
+DIRTY_COLUMNS = {
+    "prices": "prices_changed",
+    "financials": "financials_changed",
+    "valuation": "valuation_changed",
+}
+
+# 시세만 바뀐 종목: 마지막 계산 이후 종가 변동률 임계치 / 최대 점수 보관 기간
+PRICE_MOVE_THRESHOLD = 0.02
+MAX_SCORE_AGE_DAYS = 7
+
+
+def _now() -> datetime:
+    """KST 벽시계 (naive) — DateTime 컬럼 비교용"""
+    return kst_now().replace(tzinfo=None)
+
+
+def mark_compass_dirty(db: Session, tickers: Iterable[str], reason: str) -> None:
+    """
+    재계산 대상 표시 (ticker 단위 upsert, 기존 플래그 유지)
+    - commit 은 호출측 적재 트랜잭션에서 수행
+    - 표시 실패가 적재를 중단시키지 않도록 SAVEPOINT 로 격리
+    """
+    column = DIRTY_COLUMNS[reason]
+    rows = [
+        {"ticker": ticker, column: True, "marked_at": _now()}
+        for ticker in sorted(set(tickers))
+    ]
+    if not rows:
+        return
+
+    insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = insert(CompassDirty.__table__).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["ticker"],
+        set_={column: True, "marked_at": stmt.excluded.marked_at},
+    )
+    try:
+        with db.begin_nested():
+            db.execute(stmt)
+    except Exception as e:
+        logger.warning("compass_dirty 표시 실패 (%s, %d종목): %s", reason, len(rows), e)
+
+
+def select_dirty_tickers(db: Session, tickers: Sequence[str]) -> List[str]:
+    """후보 종목 중 재계산이 필요한 종목 (입력 순서 유지)"""
+    tickers = list(tickers)
+    if not tickers:
+        return []
+
+    rows = (
+        db.query(
+            Stock.ticker,
+            Stock.compass_updated_at,
+            CompassDirty.prices_changed,
+            CompassDirty.financials_changed,
+            CompassDirty.valuation_changed,
+        )
+        .outerjoin(CompassDirty, CompassDirty.ticker == Stock.ticker)
+        .filter(Stock.ticker.in_(tickers))
+        .all()
+    )
+
+    stale_before = _now() - timedelta(days=MAX_SCORE_AGE_DAYS)
+    selected = set()
+    price_only: Dict[str, date] = {}
+    for ticker, scored_at, prices, financials, valuation in rows:
+        if scored_at is None or financials or valuation:
+            selected.add(ticker)
+        elif prices:
+            if scored_at.replace(tzinfo=None) < stale_before:
+                selected.add(ticker)
+            else:
+                price_only[ticker] = scored_at.date()
+
+    selected.update(_material_price_moves(db, price_only))
+    return [ticker for ticker in tickers if ticker in selected]
+
+
+def _material_price_moves(db: Session, scored_on: Dict[str, date]) -> List[str]:
+    """마지막 계산일 종가 대비 최신 종가 변동률이 임계치 이상인 종목"""
+    if not scored_on:
+        return []
+
+    # 계산일 직전 거래일 종가를 찾도록 여유 구간 포함
+    start = min(scored_on.values()) - timedelta(days=10)
+    matrix = load_price_matrix(db, list(scored_on), start=start)
+
+    moved = []
+    for ticker, day in scored_on.items():
+        dates, ohlcv = matrix.ohlcv(ticker)
+        if not dates:
+            continue
+        base_idx = bisect_right(dates, day) - 1
+        base = ohlcv[base_idx, CLOSE] if base_idx >= 0 else 0.0
+        if base <= 0 or abs(ohlcv[-1, CLOSE] / base - 1) >= PRICE_MOVE_THRESHOLD:
+            moved.append(ticker)
+    return moved
+
+
+def clear_compass_dirty(db: Session, tickers: Sequence[str], marked_before: datetime) -> int:
+    """처리한 종목의 표시 삭제 — 계산 중 새로 표시된 건은 유지"""
+    if not tickers:
+        return 0
+    deleted = (
+        db.query(CompassDirty)
+        .filter(
+            CompassDirty.ticker.in_(list(tickers)),
+            CompassDirty.marked_at <= marked_before.replace(tzinfo=None),
+        )
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def requires_full_recompute(db: Session) -> bool:
+    """마지막 완료된 일괄 계산의 엔진 버전이 현재와 다르면 전 종목 재계산"""
+    from app.models.ops import DataCollectionLog
+
+    last = (
+        db.query(DataCollectionLog.detail)
+        .filter(
+            DataCollectionLog.job_name == "compass_batch",
+            DataCollectionLog.status == "completed",
+        )
+        .order_by(DataCollectionLog.started_at.desc())
+        .first()
+    )
+    if not last or not last[0]:
+        return True
+    return last[0].get("engine_version") != ScoringEngine.ENGINE_VERSION
@@ -283,6 +283,7 @@ class DataQualityValidator:
         table_name: str,
         issues: List[QualityIssue],
         record_id: Optional[int] = None,
+        commit: bool = True,
     ) -> None:
         """
         품질 이슈 DB 로깅
@@ -292,6 +293,7 @@ class DataQualityValidator:
             table_name: 대상 테이블명
             issues: 품질 이슈 목록
             record_id: 관련 레코드 ID
+            commit: False면 caller의 적재 청크 commit에 포함
         """
         for issue in issues:
             log_entry = DataQualityLog(
@@ -308,7 +310,8 @@ class DataQualityValidator:
             self.db.add(log_entry)
 
         if issues:
-            self.db.commit()
+            if commit:
+                self.db.commit()
             logger.debug(
                 "품질 이슈 로깅 완료",
                 {"batch_id": batch_id, "issue_count": len(issues)},
@@ -338,9 +341,10 @@ class DataQualityValidator:
                 "outlier_ratio": Decimal("0"),
             }
 
-        # NULL 비율 (전체 필드 기준)
+        # NULL 비율 (전체 필드 기준, 집계 필드가 없으면 0)
         total_null = sum(null_counts.values())
-        null_ratio = Decimal(str(total_null / (total_records * len(null_counts))))
+        total_fields = total_records * len(null_counts)
+        null_ratio = Decimal(str(total_null / total_fields)) if total_fields else Decimal("0")
 
         # 이상치 비율
         outlier_ratio = Decimal(str(outlier_count / total_records))
@@ -0,0 +1,115 @@
+# backend/app/services/downsampling.py
+
+"""
+차트용 NAV 경로 다운샘플링 (Largest-Triangle-Three-Buckets)
+
+- 거래일 인덱스를 x 축으로 사용 (거래일 간격 균일 가정)
+- 첫 / 마지막 점, 깊은 낙폭 구간의 저점, 호출측 지정 일자(리밸런싱 등)는 항상 유지
+- 응답 직렬화 직전에만 적용 — 저장 결과와 지표 계산은 원본 경로 기준
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.drawdown_engine import drawdown_episodes
+
+# 저점 유지 개수 = max_points 의 1/10 (최소 1개 — 최대 낙폭 저점)
+_TROUGH_SHARE = 10
+
+
+def lttb_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """LTTB 로 선택한 인덱스 (정렬, 첫/마지막 포함)"""
+    n = len(values)
+    if max_points >= n or n <= 2:
+        return np.arange(n)
+    if max_points <= 2:
+        return np.array([0, n - 1])
+
+    y = np.asarray(values, dtype=np.float64)
+    x = np.arange(n, dtype=np.float64)
+    every = (n - 2) / (max_points - 2)
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(max_points - 2):
+        # 다음 버킷 평균점
+        avg_start = int(np.floor((i + 1) * every)) + 1
+        avg_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        # 현재 버킷에서 (직전 선택점, 후보, 다음 평균점) 삼각형 면적 최대 후보
+        lo = int(np.floor(i * every)) + 1
+        hi = int(np.floor((i + 1) * every)) + 1
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    selected[-1] = n - 1
+    return selected
+
+
+def drawdown_trough_indices(nav: np.ndarray, limit: int) -> List[int]:
+    """낙폭 구간(고점 → 고점 회복)별 저점 중 깊은 순 limit 개"""
+    if limit <= 0:
+        return []
+    episodes = sorted(drawdown_episodes(nav), key=lambda episode: episode.depth)
+    return [episode.trough for episode in episodes[:limit]]
+
+
+def downsample_indices(
+    values: np.ndarray,
+    max_points: int,
+    keep: Iterable[int] = (),
+) -> np.ndarray:
+    """
+    LTTB + 필수 인덱스(낙폭 저점, keep) 합집합
+
+    필수 인덱스가 예산을 초과하면 max_points 보다 많을 수 있음 (필수 우선)
+    """
+    n = len(values)
+    if max_points >= n:
+        return np.arange(n)
+
+    forced = set(drawdown_trough_indices(values, max(1, max_points // _TROUGH_SHARE)))
+    forced.update(i for i in keep if 0 <= i < n)
+    forced.update((0, n - 1))
+
+    budget = max_points - (len(forced) - 2)
+    base = lttb_indices(values, budget) if budget >= 3 else np.array([0, n - 1])
+    return np.union1d(base, np.fromiter(forced, dtype=np.int64))
+
+
+def _day_key(value: Any) -> str:
+    return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+
+def downsample_rows(
+    rows: Sequence[Dict[str, Any]],
+    max_points: Optional[int],
+    value_key: str,
+    date_key: str,
+    keep_dates: Iterable[Any] = (),
+) -> List[Dict[str, Any]]:
+    """
+    경로 행 리스트 다운샘플링 (max_points 가 없거나 행이 적으면 그대로)
+
+    Args:
+        value_key: 형태 보존 기준 값 (nav / value)
+        date_key: 일자 키 (keep_dates 매칭용, date 또는 ISO 문자열)
+        keep_dates: 항상 유지할 일자 (리밸런싱일 등)
+    """
+    if not max_points or len(rows) <= max_points:
+        return list(rows)
+
+    values = np.fromiter((row[value_key] for row in rows), dtype=np.float64, count=len(rows))
+    wanted = {_day_key(d) for d in keep_dates}
+    keep = [i for i, row in enumerate(rows) if _day_key(row[date_key]) in wanted] if wanted else []
+
+    return [rows[i] for i in downsample_indices(values, max_points, keep).tolist()]
@@ -0,0 +1,123 @@
+# backend/app/services/drawdown_engine.py
+
+"""
+낙폭(Drawdown) 배열 엔진
+
+- 고점: 누적 최대 (np.maximum.accumulate)
+- 낙폭 구간(episode): 고점 아래 연속 구간 — 고점일, 첫 하락일, 저점일, 회복일, 깊이
+- 최악 N일 수익률: 지연 N 슬라이딩 창 수익률의 최소값
+
+performance_analyzer / analytics_engine_v3 / scenario_simulation / QuantAnalyzer 가
+같은 정의를 공유하도록 인덱스 기준 결과만 반환 (날짜 / 단위 변환은 호출측)
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class DrawdownEpisode:
+    """
+    낙폭 구간 (인덱스 기준)
+
+    - peak: 하락 직전 고점 인덱스 (같은 고점이 이어지면 마지막 날)
+    - start: 고점 아래로 내려간 첫 인덱스
+    - trough: 구간 내 최저점 (동률이면 첫 인덱스)
+    - recovery: 고점 이상으로 회복한 첫 인덱스 (미회복이면 None)
+    - depth: 저점 / 고점 - 1 (음수)
+    """
+    peak: int
+    start: int
+    trough: int
+    recovery: Optional[int]
+    depth: float
+
+    @property
+    def recovered(self) -> bool:
+        return self.recovery is not None
+
+    @property
+    def duration(self) -> Optional[int]:
+        """첫 하락일 → 회복일 거래일 수 (미회복이면 None)"""
+        return None if self.recovery is None else self.recovery - self.start
+
+
+def _as_array(values: Sequence[float]) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def running_peak(nav: np.ndarray) -> np.ndarray:
+    """누적 고점"""
+    nav = _as_array(nav)
+    return np.maximum.accumulate(nav) if len(nav) else nav
+
+
+def drawdown_series(nav: np.ndarray, peak: Optional[np.ndarray] = None) -> np.ndarray:
+    """시점별 고점 대비 낙폭 (고점 <= 0 이면 0)"""
+    nav = _as_array(nav)
+    if peak is None:
+        peak = running_peak(nav)
+    out = np.zeros(len(nav))
+    np.divide(nav, peak, out=out, where=peak > 0)
+    out[peak > 0] -= 1.0
+    return out
+
+
+def drawdown_episodes(nav: np.ndarray) -> List[DrawdownEpisode]:
+    """고점 아래 연속 구간 목록 (시간순)"""
+    nav = _as_array(nav)
+    if len(nav) < 2:
+        return []
+
+    peak = running_peak(nav)
+    underwater = nav < peak
+    if not underwater.any():
+        return []
+
+    edges = np.diff(np.concatenate(([0], underwater.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    depth = drawdown_series(nav, peak)
+
+    episodes = []
+    n = len(nav)
+    for s, e in zip(starts.tolist(), ends.tolist()):
+        trough = s + int(np.argmin(nav[s:e]))
+        episodes.append(
+            DrawdownEpisode(
+                peak=s - 1,
+                start=s,
+                trough=trough,
+                recovery=e if e < n else None,
+                depth=float(depth[trough]),
+            )
+        )
+    return episodes
+
+
+def max_drawdown_episode(episodes: Sequence[DrawdownEpisode]) -> Optional[DrawdownEpisode]:
+    """가장 깊은 구간 (동률이면 먼저 발생한 구간)"""
+    worst = None
+    for episode in episodes:
+        if worst is None or episode.depth < worst.depth:
+            worst = episode
+    return worst
+
+
+def worst_period_return(nav: np.ndarray, period: int) -> Optional[float]:
+    """
+    최악 N거래일 수익률 nav[t] / nav[t-N] - 1 의 최소값
+
+    Returns:
+        구간이 하나도 없으면 None
+    """
+    nav = _as_array(nav)
+    if period <= 0 or len(nav) <= period:
+        return None
+    base = nav[:-period]
+    valid = base != 0
+    if not valid.any():
+        return None
+    return float(np.min(nav[period:][valid] / base[valid] - 1.0))
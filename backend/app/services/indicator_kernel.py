@@ -0,0 +1,555 @@
+# backend/app/services/indicator_kernel.py
+
+"""
+기술 지표 벡터 커널 (NumPy)
+
+- 종목당 하나의 연속 OHLCV ndarray (shape = (N, 5), float64)를 입력으로 받아
+  QuantAnalyzer의 기술 지표를 NumPy 배열 연산 한 번의 흐름으로 계산한다.
+- 계산식/판정 기준/반환 포맷은 QuantAnalyzer.calculate_* 와 동일하다.
+- 재귀식(EMA, Wilder 평활)은 블록 단위 닫힌형으로 계산해 Python 루프를 제거한다.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# OHLCV 배열 컬럼 인덱스
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+# 블록 닫힌형 재귀 계산 시 허용하는 최소 감쇠 계수 (d^k 언더플로/정밀도 보호)
+_MIN_BLOCK_DECAY = 1e-8
+
+
+# ============================================================
+# 입력 변환
+# ============================================================
+
+def ohlcv_to_array(ohlcv: Sequence[Dict]) -> np.ndarray:
+    """[{open, high, low, close, volume}, ...] → (N, 5) float64 연속 배열"""
+    if not ohlcv:
+        return np.empty((0, 5), dtype=np.float64)
+    return np.array(
+        [[row[f] for f in OHLCV_FIELDS] for row in ohlcv],
+        dtype=np.float64,
+    )
+
+
+def closes_to_array(prices: Sequence[Tuple]) -> np.ndarray:
+    """
+    [(날짜, 종가)] → (N, 5) 배열
+    - 종가만 있는 데이터(AlphaVantage)용: OHLC는 종가로 채우고 거래량은 0
+    """
+    data = np.zeros((len(prices), 5), dtype=np.float64)
+    if prices:
+        close = np.fromiter((p[1] for p in prices), dtype=np.float64, count=len(prices))
+        data[:, OPEN] = close
+        data[:, HIGH] = close
+        data[:, LOW] = close
+        data[:, CLOSE] = close
+    return data
+
+
+# ============================================================
+# 배열 기본 연산
+# ============================================================
+
+def _linear_recurrence(x: np.ndarray, decay: float, gain: float, seed: float) -> np.ndarray:
+    """
+    y[t] = decay * y[t-1] + gain * x[t]  (y[-1] = seed)
+    - 블록마다 y[t] = d^t * (seed + gain * Σ x[i] / d^i) 닫힌형으로 계산
+    - d^t 가 _MIN_BLOCK_DECAY 아래로 내려가기 전에 블록을 나눠 정밀도 유지
+    """
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    if decay <= 0:
+        out[:] = gain * x
+        return out
+
+    block = max(1, int(np.log(_MIN_BLOCK_DECAY) / np.log(decay))) if decay < 1 else n
+    powers = decay ** np.arange(1, min(block, n) + 1, dtype=np.float64)
+
+    prev = seed
+    for start in range(0, n, block):
+        chunk = x[start:start + block]
+        p = powers[:len(chunk)]
+        y = p * (prev + gain * np.cumsum(chunk / p))
+        out[start:start + len(chunk)] = y
+        prev = y[-1]
+    return out
+
+
+def _ema(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA (첫 값은 단순 평균) — 길이 len(values) - period + 1"""
+    multiplier = 2 / (period + 1)
+    seed = values[:period].mean()
+    tail = _linear_recurrence(values[period:], 1 - multiplier, multiplier, seed)
+    return np.concatenate(([seed], tail))
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """단순 이동평균 — 길이 len(values) - period + 1"""
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    return (csum[period:] - csum[:-period]) / period
+
+
+def _pad(values: np.ndarray, n: int) -> np.ndarray:
+    """지표 배열을 입력 길이 n에 맞춰 앞쪽을 NaN으로 채움 (마지막 값 정렬)"""
+    out = np.full(n, np.nan, dtype=np.float64)
+    if len(values):
+        out[n - len(values):] = values
+    return out
+
+
+# ============================================================
+# 전체 시계열 계산
+# ============================================================
+
+def compute_indicator_series(data: np.ndarray, ohlc: bool = True) -> Dict[str, np.ndarray]:
+    """
+    OHLCV 배열 → 지표별 전체 시계열 (입력 행과 정렬, 미정의 구간은 NaN)
+    - ohlc=False: 종가 기반 지표만 계산 (Stochastic/ATR/ADX/OBV 제외)
+    """
+    n = len(data)
+    close = np.ascontiguousarray(data[:, CLOSE])
+    series: Dict[str, np.ndarray] = {"close": close}
+
+    # 이동평균
+    for period in (20, 50, 200):
+        if n >= period:
+            series[f"sma{period}"] = _pad(_rolling_mean(close, period), n)
+
+    # 가격 변화 (RSI/OBV 공통)
+    changes = np.diff(close)
+
+    # RSI (최근 period 구간 단순 평균)
+    period = 14
+    if n >= period + 1:
+        gains = np.where(changes > 0, changes, 0.0)
+        losses = np.where(changes < 0, -changes, 0.0)
+        avg_gain = _rolling_mean(gains, period)
+        avg_loss = _rolling_mean(losses, period)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        series["rsi"] = _pad(rsi, n)
+
+    # 볼린저 밴드 (모표준편차)
+    period = 20
+    if n >= period:
+        windows = sliding_window_view(close, period)
+        middle = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        series["bb_middle"] = _pad(middle, n)
+        series["bb_upper"] = _pad(middle + 2.0 * std, n)
+        series["bb_lower"] = _pad(middle - 2.0 * std, n)
+
+    # MACD (12, 26, 9)
+    fast, slow, signal = 12, 26, 9
+    if n >= slow + signal - 1:
+        ema_fast = _ema(close, fast)
+        ema_slow = _ema(close, slow)
+        macd_line = ema_fast[slow - fast:] - ema_slow
+        signal_line = _ema(macd_line, signal)
+        series["macd"] = _pad(macd_line, n)
+        series["macd_signal"] = _pad(signal_line, n)
+        series["macd_histogram"] = _pad(macd_line[signal - 1:] - signal_line, n)
+
+    if not ohlc:
+        return series
+
+    high = data[:, HIGH]
+    low = data[:, LOW]
+    volume = data[:, VOLUME]
+
+    # Stochastic (14, 3)
+    k_period, d_period = 14, 3
+    if n >= k_period:
+        highest = sliding_window_view(high, k_period).max(axis=1)
+        lowest = sliding_window_view(low, k_period).min(axis=1)
+        span = highest - lowest
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k_values = np.where(span == 0, 50.0, (close[k_period - 1:] - lowest) / span * 100)
+        series["stoch_k"] = _pad(k_values, n)
+        if len(k_values) >= d_period:
+            series["stoch_d"] = _pad(_rolling_mean(k_values, d_period), n)
+
+    # True Range (ATR/ADX 공통)
+    prev_close = close[:-1]
+    tr = np.maximum.reduce([
+        high[1:] - low[1:],
+        np.abs(high[1:] - prev_close),
+        np.abs(low[1:] - prev_close),
+    ])
+
+    # ATR (EMA of TR)
+    period = 14
+    if n >= period + 1:
+        series["atr"] = _pad(_ema(tr, period), n)
+
+    # ADX (Wilder 평활)
+    if n >= period * 2:
+        up_move = high[1:] - high[:-1]
+        down_move = low[:-1] - low[1:]
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+        def wilder_smooth(values):
+            seed = values[:period].sum()
+            tail = _linear_recurrence(values[period:], 1 - 1 / period, 1.0, seed)
+            return np.concatenate(([seed], tail))
+
+        smooth_tr = wilder_smooth(tr)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plus_di = np.where(smooth_tr == 0, 0.0, wilder_smooth(plus_dm) / smooth_tr * 100)
+            minus_di = np.where(smooth_tr == 0, 0.0, wilder_smooth(minus_dm) / smooth_tr * 100)
+            di_sum = plus_di + minus_di
+            dx = np.where(di_sum == 0, 0.0, np.abs(plus_di - minus_di) / di_sum * 100)
+
+        series["plus_di"] = _pad(plus_di, n)
+        series["minus_di"] = _pad(minus_di, n)
+        if len(dx) >= period:
+            seed = dx[:period].mean()
+            adx = _linear_recurrence(dx[period:], (period - 1) / period, 1 / period, seed)
+            series["adx"] = _pad(np.concatenate(([seed], adx)), n)
+
+    # OBV
+    if n >= 1:
+        signed_volume = np.sign(changes) * volume[1:]
+        series["obv"] = np.concatenate(([0.0], np.cumsum(signed_volume)))
+
+    return series
+
+
+def to_columnar(series: Dict[str, np.ndarray], decimals: int = 4, keys: Optional[Sequence[str]] = None) -> Dict[str, list]:
+    """
+    지표 시계열 → JSON 직렬화용 컬럼 배열
+    - NaN(지표 미정의 구간)은 None 으로 변환
+    - keys 지정 시 해당 지표만 포함
+    """
+    columns = {}
+    for key, values in series.items():
+        if keys is not None and key not in keys:
+            continue
+        rounded = np.round(values, decimals).astype(object)
+        rounded[np.isnan(values)] = None
+        columns[key] = rounded.tolist()
+    return columns
+
+
+# ============================================================
+# 최신값 요약 (QuantAnalyzer.calculate_* 와 동일 포맷)
+# ============================================================
+
+def _last(series: Dict[str, np.ndarray], key: str, offset: int = 1) -> float:
+    return float(series[key][-offset])
+
+
+def _summarize_moving_averages(series: Dict[str, np.ndarray], n: int) -> Dict:
+    if n == 0:
+        return {"error": "가격 데이터 없음"}
+
+    current_price = _last(series, "close")
+    result = {"current_price": current_price, "moving_averages": {}}
+    for period in (20, 50, 200):
+        if n >= period:
+            ma = _last(series, f"sma{period}")
+            result["moving_averages"][f"MA{period}"] = {
+                "value": round(ma, 2),
+                "distance": round(((current_price - ma) / ma) * 100, 2),
+            }
+
+    if n >= 201:
+        ma50 = result["moving_averages"]["MA50"]["value"]
+        ma200 = result["moving_averages"]["MA200"]["value"]
+        prev_ma50 = _last(series, "sma50", 2)
+        prev_ma200 = _last(series, "sma200", 2)
+
+        if ma50 > ma200 and prev_ma50 <= prev_ma200:
+            result["signal"] = "골든크로스 발생 (상승 추세)"
+        elif ma50 < ma200 and prev_ma50 >= prev_ma200:
+            result["signal"] = "데드크로스 발생 (하락 추세)"
+        elif ma50 > ma200:
+            result["signal"] = "상승 추세 (MA50 > MA200)"
+        else:
+            result["signal"] = "하락 추세 (MA50 < MA200)"
+
+    return result
+
+
+def _summarize_rsi(series: Dict[str, np.ndarray]) -> Dict:
+    if "rsi" not in series:
+        return {"error": "데이터 부족"}
+
+    rsi = _last(series, "rsi")
+    if rsi >= 70:
+        status = "과매수 구간"
+    elif rsi <= 30:
+        status = "과매도 구간"
+    else:
+        status = "중립"
+
+    return {"rsi": round(rsi, 2), "status": status, "period": 14}
+
+
+def _summarize_bollinger(series: Dict[str, np.ndarray]) -> Dict:
+    if "bb_middle" not in series:
+        return {"error": "데이터 부족"}
+
+    current_price = _last(series, "close")
+    upper_band = _last(series, "bb_upper")
+    middle_band = _last(series, "bb_middle")
+    lower_band = _last(series, "bb_lower")
+
+    bandwidth = ((upper_band - lower_band) / middle_band) * 100
+    # 밴드 폭이 0(가격 불변)이면 밴드 중앙으로 간주
+    if upper_band == lower_band:
+        percent_b = 0.5
+    else:
+        percent_b = (current_price - lower_band) / (upper_band - lower_band)
+
+    if current_price > upper_band:
+        status = "상단 밴드 돌파"
+    elif current_price < lower_band:
+        status = "하단 밴드 이탈"
+    elif percent_b > 0.8:
+        status = "상단 밴드 근접"
+    elif percent_b < 0.2:
+        status = "하단 밴드 근접"
+    else:
+        status = "중립 (밴드 내부)"
+
+    return {
+        "current_price": round(current_price, 2),
+        "upper_band": round(upper_band, 2),
+        "middle_band": round(middle_band, 2),
+        "lower_band": round(lower_band, 2),
+        "bandwidth": round(bandwidth, 2),
+        "percent_b": round(percent_b, 2),
+        "status": status,
+    }
+
+
+def _summarize_macd(series: Dict[str, np.ndarray], n: int) -> Dict:
+    if n < 26 + 9 or "macd" not in series:
+        return {"error": "데이터 부족"}
+
+    current_histogram = _last(series, "macd_histogram")
+    prev_histogram = _last(series, "macd_histogram", 2)
+    if current_histogram > 0 and prev_histogram <= 0:
+        status = "골든크로스 (상승 추세)"
+    elif current_histogram < 0 and prev_histogram >= 0:
+        status = "데드크로스 (하락 추세)"
+    elif current_histogram > 0:
+        status = "상승 추세"
+    else:
+        status = "하락 추세"
+
+    return {
+        "macd": round(_last(series, "macd"), 2),
+        "signal": round(_last(series, "macd_signal"), 2),
+        "histogram": round(current_histogram, 2),
+        "status": status,
+    }
+
+
+def _summarize_stochastic(series: Dict[str, np.ndarray], n: int) -> Dict:
+    if n < 14 + 3 or "stoch_d" not in series:
+        return {"error": "데이터 부족"}
+
+    current_k = _last(series, "stoch_k")
+    current_d = _last(series, "stoch_d")
+    if current_k > 80:
+        status = "과매수 구간"
+    elif current_k < 20:
+        status = "과매도 구간"
+    elif current_k > current_d:
+        status = "상승 전환 가능"
+    else:
+        status = "중립"
+
+    return {
+        "k": round(current_k, 2),
+        "d": round(current_d, 2),
+        "k_period": 14,
+        "d_period": 3,
+        "status": status,
+    }
+
+
+def _summarize_atr(series: Dict[str, np.ndarray]) -> Dict:
+    if "atr" not in series:
+        return {"error": "데이터 부족"}
+
+    atr = _last(series, "atr")
+    current_price = _last(series, "close")
+    atr_ratio = (atr / current_price) * 100 if current_price > 0 else 0
+
+    if atr_ratio > 5:
+        interpretation = "매우 높은 변동성"
+    elif atr_ratio > 3:
+        interpretation = "높은 변동성"
+    elif atr_ratio > 1.5:
+        interpretation = "보통 변동성"
+    else:
+        interpretation = "낮은 변동성"
+
+    return {
+        "atr": round(atr, 2),
+        "atr_ratio": round(atr_ratio, 2),
+        "period": 14,
+        "interpretation": interpretation,
+    }
+
+
+def _summarize_adx(series: Dict[str, np.ndarray], n: int) -> Dict:
+    if n < 14 * 2 + 1 or "adx" not in series:
+        return {"error": "데이터 부족"}
+
+    adx = _last(series, "adx")
+    current_plus_di = _last(series, "plus_di")
+    current_minus_di = _last(series, "minus_di")
+
+    if adx > 40:
+        trend_strength = "매우 강한 추세"
+    elif adx > 25:
+        trend_strength = "강한 추세"
+    elif adx > 20:
+        trend_strength = "약한 추세"
+    else:
+        trend_strength = "추세 없음 (횡보)"
+
+    direction = "상승 추세" if current_plus_di > current_minus_di else "하락 추세"
+
+    return {
+        "adx": round(adx, 2),
+        "plus_di": round(current_plus_di, 2),
+        "minus_di": round(current_minus_di, 2),
+        "trend_strength": trend_strength,
+        "direction": direction,
+        "period": 14,
+    }
+
+
+def _summarize_obv(series: Dict[str, np.ndarray], n: int) -> Dict:
+    if n < 10:
+        return {"error": "데이터 부족"}
+
+    obv = series["obv"]
+    close = series["close"]
+    current_obv = int(obv[-1])
+
+    obv_ma5 = obv[-5:].mean()
+    obv_ma5_prev = obv[-6:-1].mean()
+    if current_obv > obv_ma5 and obv_ma5 > obv_ma5_prev:
+        trend = "상승 (매집 추정)"
+    elif current_obv < obv_ma5 and obv_ma5 < obv_ma5_prev:
+        trend = "하락 (분산 추정)"
+    else:
+        trend = "중립"
+
+    result = {"obv": current_obv, "trend": trend}
+
+    if n >= 20:
+        price_up = close[-1] > close[-20]
+        obv_up = obv[-1] > obv[-20]
+        if price_up and not obv_up:
+            result["divergence"] = "약세 다이버전스 (가격↑ OBV↓)"
+        elif not price_up and obv_up:
+            result["divergence"] = "강세 다이버전스 (가격↓ OBV↑)"
+
+    return result
+
+
+def _summarize_ma_alignment(series: Dict[str, np.ndarray], n: int) -> Dict:
+    if n < 200:
+        return {"error": "데이터 부족 (200일 이상 필요)"}
+
+    sma20 = _last(series, "sma20")
+    sma50 = _last(series, "sma50")
+    sma200 = _last(series, "sma200")
+
+    if sma20 > sma50 > sma200:
+        alignment, status = "정배열", "강한 상승 추세"
+    elif sma20 < sma50 < sma200:
+        alignment, status = "역배열", "강한 하락 추세"
+    else:
+        alignment, status = "혼조", "방향성 불분명"
+
+    return {
+        "alignment": alignment,
+        "sma20": round(sma20, 2),
+        "sma50": round(sma50, 2),
+        "sma200": round(sma200, 2),
+        "status": status,
+    }
+
+
+def _summarize_52week_position(series: Dict[str, np.ndarray], n: int) -> Dict:
+    if n < 20:
+        return {"error": "데이터 부족"}
+
+    close = series["close"]
+    high_52w = float(close.max())
+    low_52w = float(close.min())
+    current = float(close[-1])
+
+    if high_52w == low_52w:
+        position = 50.0
+    else:
+        position = ((current - low_52w) / (high_52w - low_52w)) * 100
+
+    if position >= 80:
+        status = "52주 고점 근접"
+    elif position <= 20:
+        status = "52주 저점 근접"
+    elif position >= 60:
+        status = "중상위"
+    elif position <= 40:
+        status = "중하위"
+    else:
+        status = "중간"
+
+    return {
+        "position": round(position, 2),
+        "high_52w": round(high_52w, 2),
+        "low_52w": round(low_52w, 2),
+        "current_price": round(current, 2),
+        "status": status,
+    }
+
+
+def summarize_indicators(series: Dict[str, np.ndarray], n: int, ohlc: bool = True) -> Dict:
+    """
+    지표 시계열(최소 마지막 구간) → technical_indicators 블록
+    - n: 전체 입력 행 수 (데이터 부족 판정 기준)
+    """
+    result = {
+        "moving_averages": _summarize_moving_averages(series, n),
+        "rsi": _summarize_rsi(series),
+        "bollinger_bands": _summarize_bollinger(series),
+        "macd": _summarize_macd(series, n),
+    }
+
+    if ohlc:
+        result["stochastic"] = _summarize_stochastic(series, n)
+        result["atr"] = _summarize_atr(series)
+        result["adx"] = _summarize_adx(series, n)
+        result["obv"] = _summarize_obv(series, n)
+
+    result["ma_alignment"] = _summarize_ma_alignment(series, n)
+    result["week52_position"] = _summarize_52week_position(series, n)
+
+    return result
+
+
+def compute_technical_indicators(data: np.ndarray, ohlc: bool = True) -> Dict:
+    """
+    OHLCV 배열 → technical_indicators 블록
+    - 반환 키/값은 comprehensive_quant_analysis 의 기존 출력과 동일
+    - ohlc=False: 종가 기반 지표만 (미국 종목 폴백)
+    """
+    series = compute_indicator_series(data, ohlc=ohlc)
+    return summarize_indicators(series, len(data), ohlc=ohlc)
@@ -0,0 +1,458 @@
+# backend/app/services/indicator_state.py
+
+"""
+기술 지표 증분 상태 저장소
+
+- 종목별로 EMA(MACD), Wilder 평활(ATR/ADX), OBV 누적값과
+  롤링 윈도우 버퍼(종가 252개, 고가/저가 14개 등)를 indicator_state 에 보관
+- 일별 증분 적재로 새 봉이 추가되면 봉당 O(1)로 상태를 전진
+- 기업 액션 등록, 과거 구간 백필/수정이 감지되면 전체 재계산으로 폴백
+- 계산식은 indicator_kernel 과 동일 (같은 봉 구간이면 같은 결과)
+"""
+
+import copy
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import logging
+import numpy as np
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.models.real_data import CorporateAction, IndicatorState, StockPriceDaily
+from app.services.indicator_kernel import summarize_indicators
+from app.utils.kst_now import kst_now
+
+logger = logging.getLogger(__name__)
+
+# 전체 재계산 시 조회 기간 (달력일) — 거래일 250봉 이내(종가 252봉 버퍼 안) + EMA/Wilder 수렴 구간
+# - quant_analyzer 커널 폴백도 같은 구간을 사용 (상태 유무와 무관하게 같은 봉 구간 → 같은 결과)
+REBUILD_HISTORY_DAYS = 350
+
+# 지표 파라미터 (indicator_kernel 과 동일)
+_FAST, _SLOW, _SIGNAL = 12, 26, 9
+_PERIOD = 14  # RSI / Stochastic %K / ATR / ADX
+_D_PERIOD = 3
+_CLOSE_WINDOW = 252  # 52주 고저 + 이동평균(최대 200+1)
+_OBV_WINDOW = 20
+
+
+# ============================================================
+# 상태 전진 (순수 함수)
+# ============================================================
+
+def new_state() -> Dict:
+    """빈 지표 상태"""
+    return {
+        "n": 0,
+        "last_date": None,
+        "closes": [],
+        "highs": [],
+        "lows": [],
+        "changes": [],
+        "k_values": [],
+        "obvs": [],
+        "obv": 0.0,
+        "ema_fast": None,
+        "ema_slow": None,
+        "macd": None,
+        "macd_buf": [],
+        "macd_signal": None,
+        "histograms": [],
+        "trs": [],
+        "atr": None,
+        "pdms": [],
+        "mdms": [],
+        "s_tr": None,
+        "s_pdm": None,
+        "s_mdm": None,
+        "plus_di": None,
+        "minus_di": None,
+        "dxs": [],
+        "adx": None,
+    }
+
+
+def _push(buf: List[float], value: float, maxlen: int) -> None:
+    buf.append(value)
+    if len(buf) > maxlen:
+        del buf[0]
+
+
+def _ema_step(prev: float, value: float, period: int) -> float:
+    multiplier = 2 / (period + 1)
+    return (value - prev) * multiplier + prev
+
+
+def advance_state(state: Dict, bar_date: date, o: float, h: float, l: float, c: float, v: float) -> Dict:
+    """
+    봉 하나를 상태에 반영 (in-place, 봉당 O(1))
+    - 워밍업 구간에서는 첫 period 개 값의 평균/합으로 시드 (indicator_kernel 과 동일)
+    """
+    n = state["n"] + 1
+    state["n"] = n
+    state["last_date"] = bar_date.isoformat()
+
+    if n > 1:
+        prev_c = state["closes"][-1]
+        prev_h = state["highs"][-1]
+        prev_l = state["lows"][-1]
+
+        change = c - prev_c
+        _push(state["changes"], change, _PERIOD)
+
+        # OBV
+        if change > 0:
+            state["obv"] += v
+        elif change < 0:
+            state["obv"] -= v
+
+        # True Range / Directional Movement
+        tr = max(h - l, abs(h - prev_c), abs(l - prev_c))
+        up_move = h - prev_h
+        down_move = prev_l - l
+        pdm = up_move if (up_move > down_move and up_move > 0) else 0.0
+        mdm = down_move if (down_move > up_move and down_move > 0) else 0.0
+
+        # ATR (EMA of TR, 첫 값은 SMA)
+        if state["atr"] is None:
+            state["trs"].append(tr)
+            if len(state["trs"]) == _PERIOD:
+                state["atr"] = sum(state["trs"]) / _PERIOD
+        else:
+            state["atr"] = _ema_step(state["atr"], tr, _PERIOD)
+
+        # ADX (Wilder 평활, 첫 값은 합계)
+        if state["s_tr"] is None:
+            state["pdms"].append(pdm)
+            state["mdms"].append(mdm)
+            if len(state["pdms"]) == _PERIOD:
+                state["s_tr"] = sum(state["trs"][:_PERIOD])
+                state["s_pdm"] = sum(state["pdms"])
+                state["s_mdm"] = sum(state["mdms"])
+                state["pdms"], state["mdms"] = [], []
+        else:
+            decay = 1 - 1 / _PERIOD
+            state["s_tr"] = state["s_tr"] * decay + tr
+            state["s_pdm"] = state["s_pdm"] * decay + pdm
+            state["s_mdm"] = state["s_mdm"] * decay + mdm
+
+        if state["s_tr"] is not None:
+            if state["s_tr"] == 0:
+                plus_di = minus_di = 0.0
+            else:
+                plus_di = state["s_pdm"] / state["s_tr"] * 100
+                minus_di = state["s_mdm"] / state["s_tr"] * 100
+            di_sum = plus_di + minus_di
+            dx = 0.0 if di_sum == 0 else abs(plus_di - minus_di) / di_sum * 100
+            state["plus_di"], state["minus_di"] = plus_di, minus_di
+
+            if state["adx"] is None:
+                state["dxs"].append(dx)
+                if len(state["dxs"]) == _PERIOD:
+                    state["adx"] = sum(state["dxs"]) / _PERIOD
+                    state["dxs"] = []
+            else:
+                state["adx"] = state["adx"] * (_PERIOD - 1) / _PERIOD + dx / _PERIOD
+
+        if state["atr"] is not None and state["s_tr"] is not None:
+            state["trs"] = []
+
+    _push(state["closes"], c, _CLOSE_WINDOW)
+    _push(state["highs"], h, _PERIOD)
+    _push(state["lows"], l, _PERIOD)
+    _push(state["obvs"], state["obv"], _OBV_WINDOW)
+
+    # Stochastic %K
+    if n >= _PERIOD:
+        highest = max(state["highs"])
+        lowest = min(state["lows"])
+        k = 50.0 if highest == lowest else (c - lowest) / (highest - lowest) * 100
+        _push(state["k_values"], k, _D_PERIOD)
+
+    # MACD
+    closes = state["closes"]
+    if n == _FAST:
+        state["ema_fast"] = sum(closes[-_FAST:]) / _FAST
+    elif n > _FAST:
+        state["ema_fast"] = _ema_step(state["ema_fast"], c, _FAST)
+
+    if n == _SLOW:
+        state["ema_slow"] = sum(closes[-_SLOW:]) / _SLOW
+    elif n > _SLOW:
+        state["ema_slow"] = _ema_step(state["ema_slow"], c, _SLOW)
+
+    if state["ema_slow"] is not None:
+        macd = state["ema_fast"] - state["ema_slow"]
+        state["macd"] = macd
+        if state["macd_signal"] is None:
+            state["macd_buf"].append(macd)
+            if len(state["macd_buf"]) == _SIGNAL:
+                state["macd_signal"] = sum(state["macd_buf"]) / _SIGNAL
+                state["macd_buf"] = []
+        else:
+            state["macd_signal"] = _ema_step(state["macd_signal"], macd, _SIGNAL)
+
+        if state["macd_signal"] is not None:
+            _push(state["histograms"], macd - state["macd_signal"], 2)
+
+    return state
+
+
+def build_state(bars: Iterable[Tuple]) -> Dict:
+    """(날짜, open, high, low, close, volume) 시간순 봉 목록 → 전체 재계산 상태"""
+    state = new_state()
+    for bar_date, o, h, l, c, v in bars:
+        advance_state(state, bar_date, float(o), float(h), float(l), float(c), float(v))
+    return state
+
+
+def state_to_series(state: Dict) -> Dict[str, np.ndarray]:
+    """
+    상태 → indicator_kernel.summarize_indicators 입력 (마지막 구간 시계열)
+    - 52주 고저는 최근 252봉 기준
+    """
+    closes = np.array(state["closes"], dtype=np.float64)
+    series: Dict[str, np.ndarray] = {"close": closes}
+
+    for period in (20, 50, 200):
+        if len(closes) >= period:
+            cur = closes[-period:].mean()
+            prev = closes[-period - 1:-1].mean() if len(closes) > period else np.nan
+            series[f"sma{period}"] = np.array([prev, cur])
+
+    changes = np.array(state["changes"], dtype=np.float64)
+    if len(changes) == _PERIOD:
+        avg_gain = changes[changes > 0].sum() / _PERIOD
+        avg_loss = -changes[changes < 0].sum() / _PERIOD
+        rsi = 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+        series["rsi"] = np.array([rsi])
+
+    if len(closes) >= 20:
+        window = closes[-20:]
+        middle, std = window.mean(), window.std()
+        series["bb_middle"] = np.array([middle])
+        series["bb_upper"] = np.array([middle + 2.0 * std])
+        series["bb_lower"] = np.array([middle - 2.0 * std])
+
+    if state["macd_signal"] is not None:
+        histograms = state["histograms"]
+        series["macd"] = np.array([state["macd"]])
+        series["macd_signal"] = np.array([state["macd_signal"]])
+        series["macd_histogram"] = np.array(([np.nan] + histograms)[-2:], dtype=np.float64)
+
+    if state["k_values"]:
+        series["stoch_k"] = np.array(state["k_values"][-1:])
+        if len(state["k_values"]) == _D_PERIOD:
+            series["stoch_d"] = np.array([sum(state["k_values"]) / _D_PERIOD])
+
+    if state["atr"] is not None:
+        series["atr"] = np.array([state["atr"]])
+
+    if state["adx"] is not None:
+        series["adx"] = np.array([state["adx"]])
+        series["plus_di"] = np.array([state["plus_di"]])
+        series["minus_di"] = np.array([state["minus_di"]])
+
+    series["obv"] = np.array(state["obvs"], dtype=np.float64)
+
+    return series
+
+
+def summarize_state(state: Dict) -> Dict:
+    """상태 → technical_indicators 블록 (comprehensive_quant_analysis 와 동일 포맷)"""
+    return summarize_indicators(state_to_series(state), state["n"])
+
+
+# ============================================================
+# DB 연동
+# ============================================================
+
+class IndicatorStateService:
+    """indicator_state 저장/갱신 서비스"""
+
+    @staticmethod
+    def _load_bars(db: Session, ticker: str, start: Optional[date] = None) -> List[Tuple]:
+        query = db.query(
+            StockPriceDaily.trade_date,
+            StockPriceDaily.open_price,
+            StockPriceDaily.high_price,
+            StockPriceDaily.low_price,
+            StockPriceDaily.close_price,
+            StockPriceDaily.volume,
+        ).filter(StockPriceDaily.ticker == ticker)
+        if start:
+            query = query.filter(StockPriceDaily.trade_date >= start)
+        return query.order_by(StockPriceDaily.trade_date).all()
+
+    @staticmethod
+    def rebuild(db: Session, ticker: str, commit: bool = True) -> Optional[IndicatorState]:
+        """전체 재계산 (최근 REBUILD_HISTORY_DAYS 구간) — 데이터 없으면 상태 삭제"""
+        start = date.today() - timedelta(days=REBUILD_HISTORY_DAYS)
+        bars = IndicatorStateService._load_bars(db, ticker, start)
+
+        row = db.query(IndicatorState).filter(IndicatorState.ticker == ticker).first()
+        if not bars:
+            if row:
+                db.delete(row)
+            if commit:
+                db.commit()
+            return None
+
+        state = build_state(bars)
+        now = kst_now()
+        if row is None:
+            row = IndicatorState(ticker=ticker)
+            db.add(row)
+        row.state = state
+        row.bar_count = state["n"]
+        row.last_trade_date = bars[-1][0]
+        row.rebuilt_at = now
+        row.updated_at = now
+
+        if commit:
+            db.commit()
+        return row
+
+    @staticmethod
+    def find_invalidated(db: Session, tickers: Optional[List[str]] = None) -> set:
+        """
+        전체 재계산이 필요한 종목
+        - 상태 갱신 이후 등록된 기업 액션
+        - 상태에 이미 반영된 거래일 구간의 시세가 신규 적재(백필)되거나 수정됨
+        """
+        action_query = db.query(CorporateAction.ticker).join(
+            IndicatorState, IndicatorState.ticker == CorporateAction.ticker
+        ).filter(CorporateAction.created_at > IndicatorState.updated_at)
+
+        price_query = db.query(StockPriceDaily.ticker).join(
+            IndicatorState, IndicatorState.ticker == StockPriceDaily.ticker
+        ).filter(
+            StockPriceDaily.trade_date <= IndicatorState.last_trade_date,
+            StockPriceDaily.trade_date >= date.today() - timedelta(days=REBUILD_HISTORY_DAYS),
+            or_(
+                StockPriceDaily.created_at > IndicatorState.updated_at,
+                StockPriceDaily.updated_at > IndicatorState.updated_at,
+            ),
+        )
+
+        if tickers is not None:
+            action_query = action_query.filter(CorporateAction.ticker.in_(tickers))
+            price_query = price_query.filter(StockPriceDaily.ticker.in_(tickers))
+
+        invalidated = {r[0] for r in action_query.distinct().all()}
+        invalidated |= {r[0] for r in price_query.distinct().all()}
+        return invalidated
+
+    @staticmethod
+    def refresh_all(db: Session, tickers: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        증분 적재 후 지표 상태 갱신
+        - 상태 있음 + 정상: 새 봉만 O(1) 전진
+        - 상태 없음 / 무효화: 전체 재계산
+        - tickers 미지정 시 활성 종목 전체
+        """
+        if tickers is None:
+            from app.models.securities import Stock
+            tickers = [r[0] for r in db.query(Stock.ticker).filter(Stock.is_active == True).all()]
+
+        stats = {"advanced": 0, "rebuilt": 0, "unchanged": 0, "failed": 0, "total": len(tickers)}
+        if not tickers:
+            return stats
+
+        states = {
+            row.ticker: row
+            for row in db.query(IndicatorState).filter(IndicatorState.ticker.in_(tickers)).all()
+        }
+        invalidated = IndicatorStateService.find_invalidated(db, tickers) if states else set()
+
+        # 새 봉 조회 — 마지막 거래일이 같은 종목끼리 묶어 각자 마지막 거래일 이후만
+        # (갱신이 밀린 종목 하나 때문에 전체 종목의 과거 구간을 읽지 않도록)
+        by_last_date: Dict[date, List[str]] = {}
+        for ticker, row in states.items():
+            if ticker not in invalidated:
+                by_last_date.setdefault(row.last_trade_date, []).append(ticker)
+
+        new_bars: Dict[str, List[Tuple]] = {}
+        for since, group in by_last_date.items():
+            rows = db.query(
+                StockPriceDaily.ticker,
+                StockPriceDaily.trade_date,
+                StockPriceDaily.open_price,
+                StockPriceDaily.high_price,
+                StockPriceDaily.low_price,
+                StockPriceDaily.close_price,
+                StockPriceDaily.volume,
+            ).filter(
+                StockPriceDaily.ticker.in_(group),
+                StockPriceDaily.trade_date > since,
+            ).order_by(StockPriceDaily.ticker, StockPriceDaily.trade_date).all()
+            for r in rows:
+                new_bars.setdefault(r[0], []).append(tuple(r[1:]))
+
+        for ticker in tickers:
+            try:
+                row = states.get(ticker)
+                if row is None or ticker in invalidated:
+                    if IndicatorStateService.rebuild(db, ticker, commit=False):
+                        stats["rebuilt"] += 1
+                    else:
+                        stats["unchanged"] += 1
+                    continue
+
+                bars = [b for b in new_bars.get(ticker, []) if b[0] > row.last_trade_date]
+                if not bars:
+                    stats["unchanged"] += 1
+                    continue
+
+                state = copy.deepcopy(row.state)
+                for bar_date, o, h, l, c, v in bars:
+                    advance_state(state, bar_date, float(o), float(h), float(l), float(c), float(v))
+                row.state = state
+                row.bar_count = state["n"]
+                row.last_trade_date = bars[-1][0]
+                row.updated_at = kst_now()
+                stats["advanced"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                logger.warning("Indicator state refresh failed for %s: %s", ticker, str(e)[:100])
+
+        db.commit()
+        logger.info(
+            "Indicator state refresh — advanced=%d, rebuilt=%d, unchanged=%d, failed=%d",
+            stats["advanced"], stats["rebuilt"], stats["unchanged"], stats["failed"],
+        )
+        return stats
+
+    @staticmethod
+    def load_current_states(db: Session, tickers: List[str]) -> Dict[str, IndicatorState]:
+        """사용 가능한 상태 일괄 조회 (무효화된 종목 제외)"""
+        if not tickers:
+            return {}
+        rows = db.query(IndicatorState).filter(IndicatorState.ticker.in_(tickers)).all()
+        if not rows:
+            return {}
+        invalidated = IndicatorStateService.find_invalidated(db, [row.ticker for row in rows])
+        return {row.ticker: row for row in rows if row.ticker not in invalidated}
+
+    @staticmethod
+    def get_technical_indicators(
+        db: Session,
+        ticker: str,
+        last_trade_date: Optional[date] = None,
+        states: Optional[Dict[str, IndicatorState]] = None,
+    ) -> Optional[Dict]:
+        """
+        저장된 상태 기준 최신 기술 지표
+
+        - 상태 없음 / 무효화 / last_trade_date(시세 최신 거래일)와 불일치 → None (호출측 커널 재계산)
+        - states: load_current_states 로 미리 조회한 상태 (일괄 계산 시 종목별 조회 생략)
+        """
+        if states is None:
+            states = IndicatorStateService.load_current_states(db, [ticker])
+        row = states.get(ticker)
+        if row is None:
+            return None
+        if last_trade_date is not None and row.last_trade_date != last_trade_date:
+            return None
+        return summarize_state(row.state)
@@ -0,0 +1,195 @@
+"""
+포트폴리오 NAV 벡터 엔진
+
+- 종목별 일간수익률 → 거래일 × 종목 수익률 행렬 (1회 구성, 결측 0)
+- 가중 수익률 / NAV / 고점 / 낙폭 / 누적수익률을 배열 연산으로 계산
+- API 응답용 경로 형식(list of dict)은 to_path() 에서만 생성
+- NavResume: 직전 거래일 종료 상태에서 이어 계산 (캐시된 경로에 새 거래일만 추가)
+
+⚠️ 교육 목적: 과거 데이터 기반 시뮬레이션이며, 미래 수익을 보장하지 않습니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+def build_return_matrix(
+    returns_by_instrument: Dict[int, List[Dict]],
+    instrument_ids: Sequence[int],
+    trade_dates: Sequence[date],
+) -> np.ndarray:
+    """
+    일간수익률 → (T, N) 행렬
+    - 열 순서는 instrument_ids, 행은 trade_dates
+    - 거래일 목록에 없는 날짜의 수익률은 무시, 수익률이 없는 셀은 0
+    """
+    row_of = {d: i for i, d in enumerate(trade_dates)}
+    matrix = np.zeros((len(row_of), len(instrument_ids)), dtype=np.float64)
+
+    for col, inst_id in enumerate(instrument_ids):
+        returns = returns_by_instrument.get(inst_id)
+        if not returns:
+            continue
+        count = len(returns)
+        rows = np.fromiter((row_of.get(r["trade_date"], -1) for r in returns), np.int64, count)
+        values = np.fromiter((r["daily_return"] for r in returns), np.float64, count)
+        hit = rows >= 0
+        matrix[rows[hit], col] = values[hit]
+
+    return matrix
+
+
+@dataclass
+class NavResume:
+    """
+    이어 계산 시작 상태 (마지막 거래일 종료 시점, 반올림 전 값)
+
+    - class_values: 리밸런싱 자산군별 평가금액 (고정 비중이면 None)
+    - event_count: 지금까지의 리밸런싱 이벤트 수 (event_order 이어 매김)
+    """
+    last_date: date
+    nav: float
+    high_water_mark: float
+    class_values: Optional[Dict[str, float]] = None
+    event_count: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "last_date": self.last_date.isoformat(),
+            "nav": self.nav,
+            "high_water_mark": self.high_water_mark,
+            "class_values": self.class_values,
+            "event_count": self.event_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NavResume":
+        return cls(
+            last_date=date.fromisoformat(data["last_date"]),
+            nav=float(data["nav"]),
+            high_water_mark=float(data["high_water_mark"]),
+            class_values=data.get("class_values"),
+            event_count=int(data.get("event_count") or 0),
+        )
+
+
+@dataclass
+class NavSeries:
+    """NAV 경로 (거래일 정렬 배열)"""
+    dates: List[date]
+    nav: np.ndarray
+    daily_return: np.ndarray
+    cumulative_return: np.ndarray
+    drawdown: np.ndarray
+    high_water_mark: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def to_path(self) -> List[Dict]:
+        """기존 경로 형식으로 변환 (API 경계 전용)"""
+        return [
+            {
+                "path_date": d,
+                "nav": round(nav, 4),
+                "daily_return": round(ret, 8),
+                "cumulative_return": round(cum, 8),
+                "drawdown": round(dd, 8),
+                "high_water_mark": round(hwm, 4),
+            }
+            for d, nav, ret, cum, dd, hwm in zip(
+                self.dates,
+                self.nav.tolist(),
+                self.daily_return.tolist(),
+                self.cumulative_return.tolist(),
+                self.drawdown.tolist(),
+                self.high_water_mark.tolist(),
+            )
+        ]
+
+    def resume_state(
+        self,
+        class_values: Optional[Dict[str, float]] = None,
+        event_count: int = 0,
+    ) -> NavResume:
+        """마지막 거래일 종료 상태 (빈 경로면 호출 불가)"""
+        return NavResume(
+            last_date=self.dates[-1],
+            nav=float(self.nav[-1]),
+            high_water_mark=float(self.high_water_mark[-1]),
+            class_values=class_values,
+            event_count=event_count,
+        )
+
+
+def nav_from_returns(
+    trade_dates: Sequence[date],
+    portfolio_returns: np.ndarray,
+    initial_amount: float,
+    resume: Optional[NavResume] = None,
+) -> NavSeries:
+    """포트폴리오 일간수익률 → NAV / 고점 / 낙폭 / 누적수익률 (resume 이 있으면 그 NAV 에서 이어 계산)"""
+    # 시작 NAV 부터 누적곱 (순차 갱신 nav = prev_nav * (1 + r) 과 동일한 연산 순서)
+    start_nav = resume.nav if resume is not None else float(initial_amount)
+    nav = np.cumprod(np.concatenate(([start_nav], 1.0 + portfolio_returns)))[1:]
+    return series_from_nav(
+        trade_dates, nav, portfolio_returns, initial_amount,
+        resume.high_water_mark if resume is not None else None,
+    )
+
+
+def series_from_nav(
+    trade_dates: Sequence[date],
+    nav: np.ndarray,
+    daily_return: np.ndarray,
+    initial_amount: float,
+    prior_peak: Optional[float] = None,
+) -> NavSeries:
+    """
+    NAV 배열 → 고점 / 낙폭 / 누적수익률 (일간수익률은 호출측 계산값 사용)
+
+    prior_peak: 이어 계산 시 직전까지의 고점 (초기금액과 함께 고점 하한)
+    """
+    floor = initial_amount if prior_peak is None else max(prior_peak, initial_amount)
+    high_water_mark = np.maximum(np.maximum.accumulate(nav), floor)
+
+    drawdown = np.zeros_like(nav)
+    positive = high_water_mark > 0
+    drawdown[positive] = (nav[positive] - high_water_mark[positive]) / high_water_mark[positive]
+
+    if initial_amount > 0:
+        cumulative_return = (nav - initial_amount) / initial_amount
+    else:
+        cumulative_return = np.zeros_like(nav)
+
+    return NavSeries(
+        dates=list(trade_dates),
+        nav=nav,
+        daily_return=daily_return,
+        cumulative_return=cumulative_return,
+        drawdown=drawdown,
+        high_water_mark=high_water_mark,
+    )
+
+
+def compute_portfolio_nav(
+    weights: np.ndarray,
+    return_matrix: np.ndarray,
+    trade_dates: Sequence[date],
+    initial_amount: float = 1000000.0,
+    resume: Optional[NavResume] = None,
+) -> NavSeries:
+    """
+    고정 비중 포트폴리오 NAV (매 거래일 목표 비중 적용)
+    - 비중 합이 1에서 0.001 이상 벗어나면 합으로 정규화
+    - resume 이 있으면 해당 상태 다음 거래일부터 이어 계산
+    """
+    total_weight = float(weights.sum())
+    portfolio_returns = return_matrix @ weights
+    if total_weight > 0 and abs(total_weight - 1.0) > 0.001:
+        portfolio_returns = portfolio_returns / total_weight
+
+    return nav_from_returns(trade_dates, portfolio_returns, initial_amount, resume)
@@ -0,0 +1,109 @@
+# backend/app/services/path_codec.py
+
+"""
+시뮬레이션 경로 열 기반 압축 형식 (SimulationRun.path_blob)
+
+레이아웃:
+- 헤더 (압축 안 함): 매직 b"SPC1" | 행 수 uint32 | 기준일 ordinal int32
+- 본문 (zlib): 일자 오프셋 int32 × n | PATH_COLUMNS 순서의 float64 × n 열
+  - 각 배열은 바이트 셔플(바이트 위치별 전치) 후 압축 — 인접 값의 상위 바이트가 모여 압축률 향상
+  - 값이 없으면 NaN
+
+저장 정밀도는 SimulationPath Numeric 컬럼 소수 자릿수와 같게 반올림
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+PATH_COLUMNS = ("nav", "daily_return", "cumulative_return", "drawdown", "high_water_mark")
+
+# SimulationPath Numeric 소수 자릿수
+_SCALES = {"nav": 4, "daily_return": 8, "cumulative_return": 8, "drawdown": 8, "high_water_mark": 4}
+
+_MAGIC = b"SPC1"
+_HEADER = struct.Struct("<4sIi")
+
+
+@dataclass
+class ColumnarPath:
+    """디코딩된 경로 (일자 오름차순)"""
+    dates: List[date]
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def _shuffle(array: np.ndarray) -> bytes:
+    raw = np.ascontiguousarray(array).view(np.uint8).reshape(-1, array.itemsize)
+    return raw.T.tobytes()
+
+
+def _unshuffle(buffer: bytes, dtype: np.dtype, count: int) -> np.ndarray:
+    itemsize = np.dtype(dtype).itemsize
+    raw = np.frombuffer(buffer, dtype=np.uint8).reshape(itemsize, count)
+    return np.ascontiguousarray(raw.T).view(dtype).reshape(count)
+
+
+def encode_path(dates: Sequence[date], columns: Dict[str, Sequence[Optional[float]]]) -> bytes:
+    """
+    경로 → 압축 blob
+
+    Args:
+        dates: 오름차순 일자
+        columns: PATH_COLUMNS 키별 값 시퀀스 (None 허용, 누락 열은 전부 NaN)
+    """
+    n = len(dates)
+    ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=n)
+    base = int(ordinals[0]) if n else 0
+
+    parts = [_shuffle((ordinals - base).astype(np.int32))]
+    for name in PATH_COLUMNS:
+        values = columns.get(name)
+        if values is None:
+            array = np.full(n, np.nan)
+        else:
+            array = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            array = np.round(array, _SCALES[name])
+        parts.append(_shuffle(array))
+
+    return _HEADER.pack(_MAGIC, n, base) + zlib.compress(b"".join(parts), 6)
+
+
+def path_length(blob: bytes) -> int:
+    """헤더만 읽어 행 수 반환"""
+    magic, n, _ = _HEADER.unpack_from(blob)
+    if magic != _MAGIC:
+        raise ValueError("알 수 없는 경로 blob 형식")
+    return n
+
+
+def decode_path(
+    blob: bytes,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> ColumnarPath:
+    """압축 blob → [start, end] 구간 경로 (일자 오프셋 searchsorted 슬라이스)"""
+    magic, n, base = _HEADER.unpack_from(blob)
+    if magic != _MAGIC:
+        raise ValueError("알 수 없는 경로 blob 형식")
+
+    body = zlib.decompress(blob[_HEADER.size:])
+    offsets = _unshuffle(body[:4 * n], np.int32, n)
+
+    lo = int(np.searchsorted(offsets, start.toordinal() - base, side="left")) if start else 0
+    hi = int(np.searchsorted(offsets, end.toordinal() - base, side="right")) if end else n
+
+    columns = {}
+    position = 4 * n
+    for name in PATH_COLUMNS:
+        columns[name] = _unshuffle(body[position:position + 8 * n], np.float64, n)[lo:hi]
+        position += 8 * n
+
+    dates = [date.fromordinal(base + int(o)) for o in offsets[lo:hi].tolist()]
+    return ColumnarPath(dates=dates, columns=columns)
@@ -0,0 +1,66 @@
+# backend/app/services/path_stream.py
+
+"""
+시뮬레이션 경로 NDJSON 스트리밍
+
+응답 형식 (application/x-ndjson, 한 줄 = JSON 객체 1개):
+- 1행: {"type": "summary", ...}  — 경로를 제외한 요약 (기존 JSON 응답과 같은 키)
+- 이후: {"type": "path", "rows": [...]}  — 경로 청크 (PATH_CHUNK_SIZE 행 단위)
+- 마지막: {"type": "end", "total_points": N}  — 누락 없이 수신했는지 확인용
+
+경로는 메모리 리스트 또는 SimulationPath 행(iter_simulation_path)에서 청크 단위로
+직렬화하므로 전체 JSON 문서를 한 번에 만들지 않음
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+PATH_CHUNK_SIZE = 500
+
+# 라우트 쿼리 파라미터 (format=json|ndjson)
+RESPONSE_FORMAT_PATTERN = "^(json|ndjson)$"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(value).__name__}")
+
+
+def _line(obj: Dict[str, Any]) -> bytes:
+    return (
+        json.dumps(obj, default=_json_default, ensure_ascii=False, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
+
+
+def list_chunks(
+    rows: Sequence[Dict[str, Any]],
+    transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    chunk_size: int = PATH_CHUNK_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """메모리 경로 리스트 → 청크 (transform 은 청크 생성 시점에 적용)"""
+    for lo in range(0, len(rows), chunk_size):
+        chunk = rows[lo:lo + chunk_size]
+        yield [transform(row) for row in chunk] if transform else list(chunk)
+
+
+def ndjson_lines(header: Dict[str, Any], chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """요약 헤더 → 경로 청크 → 종료 행"""
+    yield _line({"type": "summary", **header})
+    total = 0
+    for rows in chunks:
+        total += len(rows)
+        yield _line({"type": "path", "rows": rows})
+    yield _line({"type": "end", "total_points": total})
+
+
+def ndjson_response(header: Dict[str, Any], chunks: Iterable[List[Dict[str, Any]]]) -> StreamingResponse:
+    """NDJSON 스트리밍 응답"""
+    return StreamingResponse(ndjson_lines(header, chunks), media_type=NDJSON_MEDIA_TYPE)
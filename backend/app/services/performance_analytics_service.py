@@ -11,6 +11,7 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 
 from app.models.performance import PerformanceResult, PerformanceBasis
+from app.services.drawdown_engine import drawdown_series
 
 
 @dataclass
@@ -41,16 +42,7 @@ class PerformanceAnalyticsService:
     def _max_drawdown(self, values: List[float]) -> Optional[float]:
         if not values:
             return None
-        peak = values[0]
-        max_dd = 0.0
-        for v in values:
-            if v > peak:
-                peak = v
-            if peak > 0:
-                dd = (v / peak) - 1.0
-                if dd < max_dd:
-                    max_dd = dd
-        return max_dd
+        return min(float(drawdown_series(values).min()), 0.0)
 
     def calculate_metrics(
         self,
@@ -17,9 +17,13 @@ Phase 2 Epic D: 성과 분석 엔진 (Performance Analyzer)
 
 import math
 from datetime import date
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from app.services.drawdown_engine import drawdown_episodes, max_drawdown_episode
+
 
 # ============================================================================
 # 데이터 구조
@@ -32,6 +36,84 @@ class NAVPoint:
     nav: float
 
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _day_array(dates: Sequence[date]) -> np.ndarray:
+    """date 시퀀스 → datetime64[D] 배열 (ordinal 변환)"""
+    ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+@dataclass(frozen=True, eq=False)
+class NAVColumns:
+    """
+    NAV 시계열 (열 기반)
+
+    - dates: datetime64[D] 배열 (오름차순), nav: float64 배열
+    - 슬라이싱은 두 배열의 뷰를 공유 (복사 없음)
+    - List[NAVPoint] 와는 from_points / to_points 로 상호 변환
+    """
+    dates: np.ndarray
+    nav: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, dates: Sequence[date], nav: Sequence[float]) -> "NAVColumns":
+        if isinstance(dates, np.ndarray) and dates.dtype.kind == "M":
+            day_array = dates.astype("datetime64[D]", copy=False)
+        else:
+            day_array = _day_array(dates)
+        return cls(dates=day_array, nav=np.asarray(nav, dtype=np.float64))
+
+    @classmethod
+    def from_points(cls, points: Sequence[NAVPoint]) -> "NAVColumns":
+        nav = np.fromiter((p.nav for p in points), dtype=np.float64, count=len(points))
+        return cls(dates=_day_array([p.nav_date for p in points]), nav=nav)
+
+    def __len__(self) -> int:
+        return len(self.nav)
+
+    def __getitem__(self, key: slice) -> "NAVColumns":
+        if not isinstance(key, slice):
+            raise TypeError("NAVColumns 는 슬라이스만 지원합니다 (단일 시점은 date_at / nav[i])")
+        return NAVColumns(dates=self.dates[key], nav=self.nav[key])
+
+    def date_at(self, index: int) -> date:
+        return self.dates[index].item()
+
+    def date_list(self) -> List[date]:
+        return self.dates.tolist()
+
+    def to_points(self) -> List[NAVPoint]:
+        return [
+            NAVPoint(nav_date=d, nav=v)
+            for d, v in zip(self.date_list(), self.nav.tolist())
+        ]
+
+
+# 분석 함수 입력 — 열 기반 시계열 또는 기존 NAVPoint 리스트
+NAVSeriesLike = Union[NAVColumns, Sequence[NAVPoint]]
+
+
+def as_nav_columns(nav_series: NAVSeriesLike) -> NAVColumns:
+    """NAVPoint 리스트 어댑터 (이미 NAVColumns 면 그대로)"""
+    if isinstance(nav_series, NAVColumns):
+        return nav_series
+    return NAVColumns.from_points(nav_series)
+
+
+def _nav_values(nav_series: NAVSeriesLike) -> np.ndarray:
+    if isinstance(nav_series, NAVColumns):
+        return nav_series.nav
+    return np.fromiter((p.nav for p in nav_series), dtype=np.float64, count=len(nav_series))
+
+
+def _endpoint_navs(nav_series: NAVSeriesLike) -> Tuple[float, float]:
+    if isinstance(nav_series, NAVColumns):
+        return float(nav_series.nav[0]), float(nav_series.nav[-1])
+    return nav_series[0].nav, nav_series[-1].nav
+
+
 @dataclass
 class DrawdownInfo:
     """Drawdown 정보"""
@@ -112,7 +194,15 @@ class PerformanceMetrics:
 # KPI 계산 함수
 # ============================================================================
 
-def calculate_daily_returns(nav_series: List[NAVPoint]) -> List[float]:
+def daily_return_array(nav: np.ndarray) -> np.ndarray:
+    """NAV 배열 → 일간 수익률 배열 (직전 NAV <= 0 인 날은 제외)"""
+    nav = np.asarray(nav, dtype=np.float64)
+    prev, curr = nav[:-1], nav[1:]
+    valid = prev > 0
+    return (curr[valid] - prev[valid]) / prev[valid]
+
+
+def calculate_daily_returns(nav_series: NAVSeriesLike) -> List[float]:
     """
     NAV 시계열에서 일간 수익률 계산
 
@@ -125,19 +215,10 @@ def calculate_daily_returns(nav_series: List[NAVPoint]) -> List[float]:
     if len(nav_series) < 2:
         return []
 
-    daily_returns = []
-    for i in range(1, len(nav_series)):
-        prev_nav = nav_series[i - 1].nav
-        curr_nav = nav_series[i].nav
+    return daily_return_array(_nav_values(nav_series)).tolist()
 
-        if prev_nav > 0:
-            daily_return = (curr_nav - prev_nav) / prev_nav
-            daily_returns.append(daily_return)
 
-    return daily_returns
-
-
-def calculate_total_return(nav_series: List[NAVPoint]) -> float:
+def calculate_total_return(nav_series: NAVSeriesLike) -> float:
     """
     총 수익률 계산
 
@@ -150,8 +231,7 @@ def calculate_total_return(nav_series: List[NAVPoint]) -> float:
     if len(nav_series) < 2:
         return 0.0
 
-    initial_nav = nav_series[0].nav
-    final_nav = nav_series[-1].nav
+    initial_nav, final_nav = _endpoint_navs(nav_series)
 
     if initial_nav <= 0:
         return 0.0
@@ -160,7 +240,7 @@ def calculate_total_return(nav_series: List[NAVPoint]) -> float:
 
 
 def calculate_cagr(
-    nav_series: List[NAVPoint],
+    nav_series: NAVSeriesLike,
     annualization_factor: int = 252
 ) -> float:
     """
@@ -178,8 +258,7 @@ def calculate_cagr(
     if len(nav_series) < 2:
         return 0.0
 
-    initial_nav = nav_series[0].nav
-    final_nav = nav_series[-1].nav
+    initial_nav, final_nav = _endpoint_navs(nav_series)
     trading_days = len(nav_series) - 1  # 수익률 개수 기준
 
     if initial_nav <= 0 or trading_days <= 0:
@@ -199,7 +278,7 @@ def calculate_cagr(
 
 
 def calculate_volatility(
-    daily_returns: List[float],
+    daily_returns: Union[Sequence[float], np.ndarray],
     annualization_factor: int = 252
 ) -> float:
     """
@@ -217,12 +296,8 @@ def calculate_volatility(
     if len(daily_returns) < 2:
         return 0.0
 
-    n = len(daily_returns)
-    mean = sum(daily_returns) / n
-
-    # 표본 분산 (n-1로 나눔)
-    variance = sum((r - mean) ** 2 for r in daily_returns) / (n - 1)
-    std_dev = math.sqrt(variance)
+    # 표본 표준편차 (n-1로 나눔)
+    std_dev = float(np.std(np.asarray(daily_returns, dtype=np.float64), ddof=1))
 
     # 연율화
     return std_dev * math.sqrt(annualization_factor)
@@ -253,7 +328,7 @@ def calculate_sharpe_ratio(
     return (cagr - rf_annual) / volatility
 
 
-def calculate_drawdown(nav_series: List[NAVPoint]) -> DrawdownInfo:
+def calculate_drawdown(nav_series: NAVSeriesLike) -> DrawdownInfo:
     """
     Maximum Drawdown (MDD) 계산
 
@@ -268,65 +343,26 @@ def calculate_drawdown(nav_series: List[NAVPoint]) -> DrawdownInfo:
     if len(nav_series) < 2:
         return DrawdownInfo(mdd=0.0)
 
-    peak = nav_series[0].nav
-    peak_date = nav_series[0].nav_date
-    peak_nav = peak
-
-    mdd = 0.0
-    mdd_peak_date = None
-    mdd_trough_date = None
-    mdd_peak_nav = None
-    mdd_trough_nav = None
-
-    # 현재 최저점 추적 (recovery 계산용)
-    current_trough_date = None
-    current_trough_nav = None
-
-    for point in nav_series:
-        if point.nav > peak:
-            # 새로운 고점 갱신
-            peak = point.nav
-            peak_date = point.nav_date
-            peak_nav = peak
-            current_trough_date = None
-            current_trough_nav = None
-        else:
-            # Drawdown 계산
-            if peak > 0:
-                drawdown = (point.nav - peak) / peak  # 음수
-
-                if drawdown < mdd:
-                    mdd = drawdown
-                    mdd_peak_date = peak_date
-                    mdd_peak_nav = peak_nav
-                    mdd_trough_date = point.nav_date
-                    mdd_trough_nav = point.nav
-
-    # Recovery 계산 (MDD 이후 고점 회복까지 일수)
+    columns = as_nav_columns(nav_series)
+    worst = max_drawdown_episode(drawdown_episodes(columns.nav))
+    if worst is None or worst.depth >= 0:
+        return DrawdownInfo(mdd=0.0)
+
+    trough_date = columns.date_at(worst.trough)
+
+    # Recovery (MDD 저점 이후 고점 회복까지 일수)
     recovery_date = None
     recovery_days = None
-
-    if mdd_trough_date and mdd_peak_nav:
-        # MDD trough 이후 데이터에서 peak 회복 시점 찾기
-        trough_idx = None
-        for i, point in enumerate(nav_series):
-            if point.nav_date == mdd_trough_date:
-                trough_idx = i
-                break
-
-        if trough_idx is not None:
-            for i in range(trough_idx + 1, len(nav_series)):
-                if nav_series[i].nav >= mdd_peak_nav:
-                    recovery_date = nav_series[i].nav_date
-                    recovery_days = (recovery_date - mdd_trough_date).days
-                    break
+    if worst.recovered:
+        recovery_date = columns.date_at(worst.recovery)
+        recovery_days = (recovery_date - trough_date).days
 
     return DrawdownInfo(
-        mdd=mdd,
-        peak_date=mdd_peak_date,
-        trough_date=mdd_trough_date,
-        peak_nav=mdd_peak_nav,
-        trough_nav=mdd_trough_nav,
+        mdd=worst.depth,
+        peak_date=columns.date_at(worst.peak),
+        trough_date=trough_date,
+        peak_nav=float(columns.nav[worst.peak]),
+        trough_nav=float(columns.nav[worst.trough]),
         recovery_date=recovery_date,
         recovery_days=recovery_days,
     )
@@ -337,7 +373,7 @@ def calculate_drawdown(nav_series: List[NAVPoint]) -> DrawdownInfo:
 # ============================================================================
 
 def analyze_performance(
-    nav_series: List[NAVPoint],
+    nav_series: NAVSeriesLike,
     rf_annual: float = 0.0,
     annualization_factor: int = 252
 ) -> PerformanceMetrics:
@@ -345,17 +381,19 @@ def analyze_performance(
     NAV 시계열에 대한 종합 성과 분석
 
     Args:
-        nav_series: NAV 시계열 (날짜 오름차순 정렬)
+        nav_series: NAV 시계열 (NAVColumns 또는 NAVPoint 리스트, 날짜 오름차순 정렬)
         rf_annual: 무위험 수익률 (연율, 기본 0)
         annualization_factor: 연율화 계수 (기본 252)
 
     Returns:
         PerformanceMetrics 객체
     """
+    nav_series = as_nav_columns(nav_series)
+
     if len(nav_series) < 2:
         # 데이터 부족
-        start_date = nav_series[0].nav_date if nav_series else None
-        end_date = nav_series[0].nav_date if nav_series else None
+        start_date = nav_series.date_at(0) if len(nav_series) else None
+        end_date = start_date
         return PerformanceMetrics(
             period_start=start_date,
             period_end=end_date,
@@ -370,12 +408,12 @@ def analyze_performance(
         )
 
     # 기본 정보
-    period_start = nav_series[0].nav_date
-    period_end = nav_series[-1].nav_date
+    period_start = nav_series.date_at(0)
+    period_end = nav_series.date_at(-1)
     trading_days = len(nav_series)
 
     # 일간 수익률 계산
-    daily_returns = calculate_daily_returns(nav_series)
+    daily_returns = daily_return_array(nav_series.nav)
 
     # KPI 계산
     total_return = calculate_total_return(nav_series)
@@ -417,8 +455,9 @@ def analyze_from_nav_list(
     Returns:
         PerformanceMetrics 객체
     """
-    # NAVPoint 리스트로 변환
-    nav_series = []
+    # 열 기반 시계열로 변환
+    dates = []
+    navs = []
     for item in nav_data:
         nav_date = item.get("path_date") or item.get("nav_date") or item.get("date")
         nav_value = item.get("nav") or item.get("value") or item.get("nav_value")
@@ -428,10 +467,13 @@ def analyze_from_nav_list(
             if isinstance(nav_date, str):
                 nav_date = date.fromisoformat(nav_date)
 
-            nav_series.append(NAVPoint(nav_date=nav_date, nav=float(nav_value)))
+            dates.append(nav_date)
+            navs.append(float(nav_value))
 
-    # 날짜순 정렬
-    nav_series.sort(key=lambda x: x.nav_date)
+    # 날짜순 정렬 (안정 정렬 — 같은 날짜는 입력 순서 유지)
+    nav_series = NAVColumns.from_arrays(dates, navs)
+    order = np.argsort(nav_series.dates, kind="stable")
+    nav_series = NAVColumns(dates=nav_series.dates[order], nav=nav_series.nav[order])
 
     return analyze_performance(nav_series, rf_annual, annualization_factor)
 
@@ -11,13 +11,15 @@ import json
 from datetime import date
 from typing import Dict, List, Tuple
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from app.models.phase7_portfolio import Phase7Portfolio
 from app.models.securities import Stock
-from app.models.real_data import StockPriceDaily
-from app.services.performance_analyzer import NAVPoint, analyze_performance
+from app.services.price_matrix import load_price_matrix
+from app.services.performance_analyzer import NAVColumns, analyze_performance
 from app.services.analytics_engine_v3 import build_extensions
+from app.services.downsampling import downsample_rows
 from app.services.engine_input_adapter_v3 import build_input_context
 from app.services.phase7_errors import Phase7EvaluationError
 from app.utils.structured_logging import get_structured_logger
@@ -38,24 +40,22 @@ def evaluate_phase7_portfolio(
     if not items:
         raise Phase7EvaluationError("데이터가 일부 누락되어 계산이 제한됩니다.")
 
-    item_series = []
-    for item in items:
-        series = _load_item_series(
-            db=db,
-            portfolio_type=portfolio.portfolio_type,
-            item_key=item.item_key,
-            period_start=period_start,
-            period_end=period_end,
-        )
-        item_series.append(series)
-
-    common_dates = _intersect_dates(item_series)
-    if len(common_dates) < 2:
+    dates, item_prices = _load_item_prices(
+        db=db,
+        portfolio_type=portfolio.portfolio_type,
+        item_keys=[item.item_key for item in items],
+        period_start=period_start,
+        period_end=period_end,
+    )
+
+    common = _common_rows(item_prices)
+    if len(common) < 2:
         raise Phase7EvaluationError("선택한 기간의 과거 데이터를 불러올 수 없습니다.")
+    item_prices = item_prices[common]
 
     nav_series = _build_nav_series(
-        common_dates=common_dates,
-        item_series=item_series,
+        common_dates=dates[common],
+        item_prices=item_prices,
         weights=[float(item.weight) for item in items],
         rebalance=rebalance,
     )
@@ -64,8 +64,8 @@ def evaluate_phase7_portfolio(
 
     result = {
         "period": {
-            "start": common_dates[0].isoformat(),
-            "end": common_dates[-1].isoformat(),
+            "start": nav_series.date_at(0).isoformat(),
+            "end": nav_series.date_at(-1).isoformat(),
         },
         "metrics": {
             "cumulative_return": round(metrics.total_return, 6),
@@ -78,7 +78,7 @@ def evaluate_phase7_portfolio(
 
     extensions = build_extensions(
         nav_series,
-        item_series,
+        item_prices,
         [float(item.weight) for item in items],
         [{"id": item.item_key, "name": item.item_name} for item in items],
     )
@@ -88,6 +88,27 @@ def evaluate_phase7_portfolio(
     return result
 
 
+def downsample_result(result: dict, max_points: int | None, rebalance: str) -> dict:
+    """응답용 사본 — extensions.nav_series 를 max_points 로 축소 (낙폭 저점 / 리밸런싱일 유지)"""
+    extensions = result.get("extensions") or {}
+    nav_series = extensions.get("nav_series") or []
+    if not max_points or len(nav_series) <= max_points:
+        return result
+
+    dates = [date.fromisoformat(point["date"]) for point in nav_series]
+    rebalance_dates = [
+        current for prev, current in zip(dates, dates[1:])
+        if _should_rebalance(prev, current, rebalance)
+    ]
+    return {
+        **result,
+        "extensions": {
+            **extensions,
+            "nav_series": downsample_rows(nav_series, max_points, "nav", "date", rebalance_dates),
+        },
+    }
+
+
 def serialize_result(result: dict) -> str:
     return json.dumps(result, ensure_ascii=False)
 
@@ -96,125 +117,111 @@ def hash_result(serialized_result: str) -> str:
     return hashlib.sha256(serialized_result.encode("utf-8")).hexdigest()
 
 
-def _load_item_series(
+def _load_item_prices(
     db: Session,
     portfolio_type: str,
-    item_key: str,
+    item_keys: List[str],
     period_start: date,
     period_end: date,
-) -> Dict[date, float]:
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    항목별 일자 가격 → (거래일 datetime64[D] 배열, (T, 항목 수) 가격 행렬)
+
+    - SECURITY: 종목 종가, SECTOR: 섹터 활성 종목 종가 단순 평균 (시세 없는 종목 제외)
+    - 모든 항목의 구성 종목을 가격 행렬 1회로 조회, 시세 없는 셀은 NaN
+    """
     if portfolio_type == "SECURITY":
-        return _load_security_series(db, item_key, period_start, period_end)
-    if portfolio_type == "SECTOR":
-        return _load_sector_series(db, item_key, period_start, period_end)
-    raise Phase7EvaluationError("데이터가 일부 누락되어 계산이 제한됩니다.")
+        members = {key: [key] for key in item_keys}
+    elif portfolio_type == "SECTOR":
+        members = _sector_members(db, item_keys)
+    else:
+        raise Phase7EvaluationError("데이터가 일부 누락되어 계산이 제한됩니다.")
 
+    tickers = sorted({ticker for group in members.values() for ticker in group})
+    if not tickers:
+        raise Phase7EvaluationError("조회기간에 해당하는 시계열 데이터가 없습니다.")
 
-def _load_security_series(
-    db: Session,
-    ticker: str,
-    period_start: date,
-    period_end: date,
-) -> Dict[date, float]:
-    rows = (
-        db.query(StockPriceDaily)
-        .filter(
-            StockPriceDaily.ticker == ticker,
-            StockPriceDaily.trade_date >= period_start,
-            StockPriceDaily.trade_date <= period_end,
-        )
-        .order_by(StockPriceDaily.trade_date.asc())
-        .all()
-    )
-    if not rows:
+    matrix = load_price_matrix(db, tickers, start=period_start, end=period_end, use_cache=True)
+    if not len(matrix):
         raise Phase7EvaluationError("조회기간에 해당하는 시계열 데이터가 없습니다.")
 
-    return {row.trade_date: float(row.close_price) for row in rows}
+    close = matrix.close
+    column_of = {ticker: idx for idx, ticker in enumerate(matrix.tickers)}
+    prices = np.full((len(matrix), len(item_keys)), np.nan)
 
+    for col, key in enumerate(item_keys):
+        cols = [column_of[t] for t in members.get(key, ()) if t in column_of]
+        if not cols:
+            raise Phase7EvaluationError("조회기간에 해당하는 시계열 데이터가 없습니다.")
+        block = close[:, cols]
+        present = ~np.isnan(block)
+        counts = present.sum(axis=1)
+        totals = np.where(present, block, 0.0).sum(axis=1)
+        np.divide(totals, counts, out=prices[:, col], where=counts > 0)
 
-def _load_sector_series(
-    db: Session,
-    sector: str,
-    period_start: date,
-    period_end: date,
-) -> Dict[date, float]:
-    tickers = [
-        row[0]
-        for row in db.query(Stock.ticker)
-        .filter(Stock.sector == sector, Stock.is_active == True)
-        .all()
-    ]
-    if not tickers:
-        raise Phase7EvaluationError("조회기간에 해당하는 시계열 데이터가 없습니다.")
+    dates = np.array(matrix.dates, dtype="datetime64[D]")
+    return dates, prices
 
+
+def _sector_members(db: Session, sectors: List[str]) -> Dict[str, List[str]]:
+    """섹터별 활성 종목 (쿼리 1회)"""
+    members: Dict[str, List[str]] = {sector: [] for sector in sectors}
     rows = (
-        db.query(StockPriceDaily)
-        .filter(
-            StockPriceDaily.ticker.in_(tickers),
-            StockPriceDaily.trade_date >= period_start,
-            StockPriceDaily.trade_date <= period_end,
-        )
-        .order_by(StockPriceDaily.trade_date.asc())
+        db.query(Stock.sector, Stock.ticker)
+        .filter(Stock.sector.in_(sectors), Stock.is_active == True)
         .all()
     )
-    if not rows:
-        raise Phase7EvaluationError("조회기간에 해당하는 시계열 데이터가 없습니다.")
+    for sector, ticker in rows:
+        members[sector].append(ticker)
+    return members
 
-    sums: Dict[date, float] = {}
-    counts: Dict[date, int] = {}
-    for row in rows:
-        sums[row.trade_date] = sums.get(row.trade_date, 0.0) + float(row.close_price)
-        counts[row.trade_date] = counts.get(row.trade_date, 0) + 1
 
-    return {day: sums[day] / counts[day] for day in sums}
+def _common_rows(item_prices: np.ndarray) -> np.ndarray:
+    """모든 항목 가격이 있는 거래일 행 인덱스 (오름차순)"""
+    return np.flatnonzero(~np.isnan(item_prices).any(axis=1))
 
 
-def _intersect_dates(series_list: List[Dict[date, float]]) -> List[date]:
-    common = None
-    for series in series_list:
-        keys = set(series.keys())
-        common = keys if common is None else common.intersection(keys)
-    if not common:
-        return []
-    return sorted(common)
+def _rebalance_starts(dates: np.ndarray, rebalance: str) -> np.ndarray:
+    """리밸런싱 구간 시작 행 (첫 행 포함, 월 / 분기 경계 — _should_rebalance 와 같은 기준)"""
+    months = dates.astype("datetime64[M]").astype(np.int64)
+    if rebalance == "MONTHLY":
+        keys = months
+    elif rebalance == "QUARTERLY":
+        keys = months // 3
+    else:
+        return np.array([0])
+    return np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
 
 
 def _build_nav_series(
-    common_dates: List[date],
-    item_series: List[Dict[date, float]],
+    common_dates: np.ndarray,
+    item_prices: np.ndarray,
     weights: List[float],
     rebalance: str,
-) -> List[NAVPoint]:
-    prices = [
-        [series[day] for day in common_dates]
-        for series in item_series
-    ]
-
-    if any(prices[i][0] <= 0 for i in range(len(prices))):
+) -> NAVColumns:
+    """
+    (T, 항목 수) 가격 → NAV (초기 1.0)
+
+    리밸런싱 구간마다 직전 보유 수량의 평가액을 목표 비중으로 재배분하고,
+    구간 내 NAV 는 가격 행렬 × 보유 수량 행렬곱으로 계산
+    """
+    weight_array = np.asarray(weights, dtype=np.float64)
+    starts = _rebalance_starts(common_dates, rebalance)
+    if (item_prices[starts] <= 0).any():
         raise Phase7EvaluationError("데이터가 일부 누락되어 계산이 제한됩니다.")
 
+    bounds = np.append(starts, len(item_prices))
+    nav = np.empty(len(item_prices))
     total_value = 1.0
-    units = [
-        (weights[i] * total_value) / prices[i][0]
-        for i in range(len(prices))
-    ]
-
-    nav_series = []
-    prev_date = common_dates[0]
-
-    for idx, current_date in enumerate(common_dates):
-        if idx > 0 and _should_rebalance(prev_date, current_date, rebalance):
-            total_value = sum(units[i] * prices[i][idx] for i in range(len(prices)))
-            units = [
-                (weights[i] * total_value) / prices[i][idx]
-                for i in range(len(prices))
-            ]
+    units = None
 
-        total_value = sum(units[i] * prices[i][idx] for i in range(len(prices)))
-        nav_series.append(NAVPoint(nav_date=current_date, nav=total_value))
-        prev_date = current_date
+    for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        if units is not None:
+            total_value = float(item_prices[lo] @ units)
+        units = weight_array * total_value / item_prices[lo]
+        nav[lo:hi] = item_prices[lo:hi] @ units
 
-    return nav_series
+    return NAVColumns.from_arrays(common_dates, nav)
 
 
 def _should_rebalance(prev_date: date, current_date: date, rebalance: str) -> bool:
@@ -0,0 +1,216 @@
+# backend/app/services/price_matrix.py
+
+"""
+유니버스 가격 행렬 로더 (stock_price_daily)
+
+- 전체 유니버스 또는 임의 종목 집합의 기간 시세를 쿼리 1회로 조회해
+  거래일 × 종목 컬럼 행렬(open/high/low/close/volume)로 적재
+- ORM 객체 대신 컬럼 튜플만 조회하고, 행렬 채우기는 NumPy 인덱싱으로 처리
+- 소비자(QuantAnalyzer, BacktestingEngine, Phase 7, 종목 상세)는
+  기간/종목 슬라이스를 복사 없이 뷰로 가져다 쓴다
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Float, cast
+from sqlalchemy.orm import Session
+
+from app.models.real_data import StockPriceDaily
+from app.services.indicator_kernel import OHLCV_FIELDS
+
+
+class PriceMatrix:
+    """
+    거래일 × 종목 가격 행렬
+    - values: shape (T, N, 5) float64, 마지막 축은 OHLCV (indicator_kernel 컬럼 순서)
+    - 해당 일자에 시세가 없는 셀은 NaN
+    - dates: 정렬된 거래일 리스트 (bisect 조회용)
+    """
+
+    def __init__(self, dates: List[date], tickers: List[str], values: np.ndarray):
+        self.dates = dates
+        self.tickers = tickers
+        self.values = values
+        self._columns = {ticker: idx for idx, ticker in enumerate(tickers)}
+
+    @classmethod
+    def empty(cls, tickers: Sequence[str] = ()) -> "PriceMatrix":
+        return cls([], list(tickers), np.full((0, len(tickers), 5), np.nan))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._columns
+
+    # ── 축별 뷰 ──
+
+    def field(self, name: str) -> np.ndarray:
+        """(T, N) 필드 행렬 뷰 (예: 'close')"""
+        return self.values[:, :, OHLCV_FIELDS.index(name)]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.field("close")
+
+    def row_slice(self, start: Optional[date] = None, end: Optional[date] = None) -> slice:
+        """[start, end] 거래일 구간의 행 슬라이스 (bisect)"""
+        lo = bisect_left(self.dates, start) if start else 0
+        hi = bisect_right(self.dates, end) if end else len(self.dates)
+        return slice(lo, hi)
+
+    def window(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        tickers: Optional[Sequence[str]] = None,
+    ) -> "PriceMatrix":
+        """기간(및 종목) 부분 행렬 — 기간만 지정하면 복사 없는 뷰"""
+        rows = self.row_slice(start, end)
+        if tickers is None:
+            return PriceMatrix(self.dates[rows], self.tickers, self.values[rows])
+        cols = [self._columns[t] for t in tickers if t in self._columns]
+        return PriceMatrix(
+            self.dates[rows],
+            [self.tickers[c] for c in cols],
+            self.values[rows][:, cols],
+        )
+
+    # ── 종목 단위 조회 ──
+
+    def ohlcv(
+        self,
+        ticker: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Tuple[List[date], np.ndarray]:
+        """
+        종목 OHLCV → ([날짜], (n, 5) 배열)
+        - 시세가 없는 거래일은 제외 (모두 있으면 복사 없는 뷰)
+        """
+        col = self._columns.get(ticker)
+        if col is None:
+            return [], np.empty((0, 5), dtype=np.float64)
+
+        rows = self.row_slice(start, end)
+        data = self.values[rows, col, :]
+        dates = self.dates[rows]
+        valid = ~np.isnan(data[:, OHLCV_FIELDS.index("close")])
+        if valid.all():
+            return dates, data
+        return [d for d, ok in zip(dates, valid) if ok], data[valid]
+
+    def close_series(
+        self,
+        ticker: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Dict[date, float]:
+        """종목 종가 → {날짜: 종가} (시세 있는 거래일만)"""
+        dates, data = self.ohlcv(ticker, start, end)
+        return dict(zip(dates, data[:, OHLCV_FIELDS.index("close")].tolist()))
+
+
+def load_price_matrix(
+    db: Session,
+    tickers: Optional[Sequence[str]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    use_cache: bool = False,
+) -> PriceMatrix:
+    """
+    stock_price_daily → PriceMatrix (쿼리 1회)
+    - tickers=None 이면 기간 내 전체 유니버스
+    - 가격은 DB에서 float 로 캐스팅해 Decimal 변환 비용 제거
+    - use_cache: 종목별 시계열 프로세스 캐시 사용 (tickers 지정 시, 미스 종목만 조회)
+    """
+    if tickers is not None and not tickers:
+        return PriceMatrix.empty()
+
+    if use_cache and tickers is not None:
+        from app.services.returns_cache import cached_series
+
+        series = cached_series(
+            db, "stock_price_daily", tickers, start, end,
+            lambda missing, s, e: _split_by_ticker(_query_rows(db, missing, s, e), missing),
+        )
+        return _matrix_from_series(series, tickers)
+
+    rows = _query_rows(db, tickers, start, end)
+    if not rows:
+        return PriceMatrix.empty(tickers or ())
+
+    row_tickers, row_dates, *fields = zip(*rows)
+
+    all_dates, date_idx = np.unique(np.array(row_dates, dtype="datetime64[D]"), return_inverse=True)
+    all_tickers, ticker_idx = np.unique(np.array(row_tickers, dtype=object), return_inverse=True)
+
+    values = np.full((len(all_dates), len(all_tickers), 5), np.nan, dtype=np.float64)
+    values[date_idx, ticker_idx, :] = np.array(fields, dtype=np.float64).T
+
+    return PriceMatrix(all_dates.astype(date).tolist(), list(all_tickers), values)
+
+
+def _query_rows(
+    db: Session,
+    tickers: Optional[Sequence[str]],
+    start: Optional[date],
+    end: Optional[date],
+) -> List[tuple]:
+    """(ticker, trade_date, open, high, low, close, volume) 튜플 목록"""
+    query = db.query(
+        StockPriceDaily.ticker,
+        StockPriceDaily.trade_date,
+        cast(StockPriceDaily.open_price, Float),
+        cast(StockPriceDaily.high_price, Float),
+        cast(StockPriceDaily.low_price, Float),
+        cast(StockPriceDaily.close_price, Float),
+        StockPriceDaily.volume,
+    )
+    if tickers is not None:
+        query = query.filter(StockPriceDaily.ticker.in_(list(tickers)))
+    if start:
+        query = query.filter(StockPriceDaily.trade_date >= start)
+    if end:
+        query = query.filter(StockPriceDaily.trade_date <= end)
+    return list(query.all())
+
+
+def _split_by_ticker(
+    rows: List[tuple],
+    tickers: Sequence[str],
+) -> Dict[str, Tuple[List[date], np.ndarray]]:
+    """조회 결과 → 종목별 (정렬된 날짜, (n, 5) OHLCV) — 시세 없는 종목은 빈 배열"""
+    grouped: Dict[str, List[tuple]] = {ticker: [] for ticker in tickers}
+    for row in rows:
+        grouped.setdefault(row[0], []).append(row)
+
+    series = {}
+    for ticker, ticker_rows in grouped.items():
+        ticker_rows.sort(key=lambda r: r[1])
+        values = np.array([r[2:] for r in ticker_rows], dtype=np.float64).reshape(-1, 5)
+        series[ticker] = ([r[1] for r in ticker_rows], values)
+    return series
+
+
+def _matrix_from_series(
+    series: Dict[str, Tuple[List[date], np.ndarray]],
+    tickers: Sequence[str],
+) -> PriceMatrix:
+    """종목별 시계열 → PriceMatrix (종목 정렬, 시세 없는 종목 제외 — 쿼리 경로와 동일 형태)"""
+    present = sorted(ticker for ticker in set(tickers) if series.get(ticker, ([],))[0])
+    if not present:
+        return PriceMatrix.empty(tickers)
+
+    all_dates = sorted(set().union(*(series[ticker][0] for ticker in present)))
+    row_of = {d: i for i, d in enumerate(all_dates)}
+
+    values = np.full((len(all_dates), len(present), 5), np.nan, dtype=np.float64)
+    for col, ticker in enumerate(present):
+        dates, data = series[ticker]
+        rows = np.fromiter((row_of[d] for d in dates), np.int64, len(dates))
+        values[rows, col, :] = data
+    return PriceMatrix(all_dates, present, values)
@@ -10,6 +10,8 @@ from sqlalchemy import MetaData, Table, func
 from app.models.securities import Stock, ETF, StockFinancials
 from app.models.real_data import StockPriceDaily
 from app.progress_tracker import progress_tracker
+from app.services.compass_dirty import mark_compass_dirty
+from app.services.returns_cache import invalidate_returns_cache
 from app.database import SessionLocal
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
@@ -227,6 +229,8 @@ class PyKrxDataLoader:
 
             if existing:
                 # 업데이트
+                if (existing.pe_ratio, existing.pb_ratio, existing.dividend_yield) != (per, pbr, dividend_yield):
+                    mark_compass_dirty(db, [ticker], "valuation")
                 existing.name = name
                 existing.market = market
                 existing.sector = sector
@@ -724,6 +728,7 @@ class PyKrxDataLoader:
                     existing.roa = roa
                     existing.debt_to_equity = debt_to_equity
                     existing.last_updated = datetime.utcnow()
+                    mark_compass_dirty(db, [ticker], "financials")
 
                     db.commit()
                     logger.info(f"Updated financial data for {ticker} - {fiscal_date}")
@@ -749,6 +754,7 @@ class PyKrxDataLoader:
                         debt_to_equity=debt_to_equity
                     )
                     db.add(financial)
+                    mark_compass_dirty(db, [ticker], "financials")
                     db.commit()
                     logger.info(f"Saved new financial data for {ticker} - {fiscal_date}")
 
@@ -944,7 +950,11 @@ class PyKrxDataLoader:
                     db.add(new_record)
                     inserted += 1
 
+            if inserted or updated:
+                mark_compass_dirty(db, [ticker], "prices")
             db.commit()
+            if inserted or updated:
+                invalidate_returns_cache("stock_price_daily", [ticker], db=db)
 
             logger.info(f"Loaded {inserted} new, {updated} updated records for {ticker}")
             return {
@@ -1068,7 +1078,9 @@ class PyKrxDataLoader:
                 db.execute(stmt)
                 total_records += len(chunk)
 
+            mark_compass_dirty(db, [ticker], "prices")
             db.commit()
+            invalidate_returns_cache("stock_price_daily", [ticker], db=db)
 
             logger.info(f"[BATCH] Loaded {total_records} records for {ticker}")
             return {
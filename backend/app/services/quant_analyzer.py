@@ -16,10 +16,22 @@ import numpy as np
 from decimal import Decimal
 
 from app.models.alpha_vantage import AlphaVantageTimeSeries
-from app.models.real_data import StockPriceDaily
+from app.services.drawdown_engine import drawdown_episodes, max_drawdown_episode
+from app.services.indicator_kernel import (
+    CLOSE,
+    closes_to_array,
+    compute_indicator_series,
+    compute_technical_indicators,
+    to_columnar,
+)
+from app.services.indicator_state import REBUILD_HISTORY_DAYS, IndicatorStateService
+from app.services.price_matrix import PriceMatrix, load_price_matrix
 
 logger = logging.getLogger(__name__)
 
+# 기술 지표를 indicator_state 저장 상태로 대체하는 분석 기간 (comprehensive_quant_analysis 기본값)
+STATE_INDICATOR_DAYS = 252
+
 
 def to_date(dt):
     """datetime 또는 date 객체를 date 객체로 변환"""
@@ -51,35 +63,43 @@ class QuantAnalyzer:
         return [(ts.date, float(ts.close)) for ts in time_series]
 
     @staticmethod
-    def get_ohlcv_data(db: Session, ticker: str, days: int = 252) -> List[Dict]:
+    def get_ohlcv_data(
+        db: Session, ticker: str, days: int = 252, matrix: Optional[PriceMatrix] = None
+    ) -> List[Dict]:
         """
         한국 주식 OHLCV 데이터 조회 (StockPriceDaily)
         - ticker: 종목코드 (예: '005930')
         - days: 조회 기간 (기본 252일 = 1년)
+        - matrix: 미리 적재한 유니버스 가격 행렬 (있으면 DB 재조회 없음)
         - 반환: [{date, open, high, low, close, volume}, ...] (시간순 정렬)
         """
-        cutoff_date = (datetime.now() - timedelta(days=days)).date()
-
-        records = db.query(StockPriceDaily).filter(
-            StockPriceDaily.ticker == ticker,
-            StockPriceDaily.trade_date >= cutoff_date
-        ).order_by(StockPriceDaily.trade_date).all()
-
-        if not records:
-            return []
-
+        dates, data = QuantAnalyzer.get_ohlcv_array(db, ticker, days, matrix=matrix)
         return [
             {
-                "date": r.trade_date,
-                "open": float(r.open_price),
-                "high": float(r.high_price),
-                "low": float(r.low_price),
-                "close": float(r.close_price),
-                "volume": int(r.volume),
+                "date": d,
+                "open": row[0],
+                "high": row[1],
+                "low": row[2],
+                "close": row[3],
+                "volume": int(row[4]),
             }
-            for r in records
+            for d, row in zip(dates, data.tolist())
         ]
 
+    @staticmethod
+    def get_ohlcv_array(
+        db: Session, ticker: str, days: int = 252, matrix: Optional[PriceMatrix] = None
+    ) -> Tuple[List[date], np.ndarray]:
+        """
+        한국 주식 OHLCV 배열 조회 (StockPriceDaily)
+        - matrix 미지정 시 해당 종목만 가격 행렬 로더로 조회
+        - 반환: ([날짜], ndarray[open, high, low, close, volume]) (시간순 정렬)
+        """
+        cutoff_date = (datetime.now() - timedelta(days=days)).date()
+        if matrix is None:
+            matrix = load_price_matrix(db, [ticker], start=cutoff_date)
+        return matrix.ohlcv(ticker, start=cutoff_date)
+
     @staticmethod
     def calculate_returns(prices: List[Tuple[datetime, float]]) -> List[Tuple[datetime, float]]:
         """
@@ -645,6 +665,44 @@ class QuantAnalyzer:
             "status": status,
         }
 
+    @staticmethod
+    def calculate_indicator_series(
+        db: Session,
+        symbol: str,
+        days: int = 252,
+        indicators: Optional[List[str]] = None,
+    ) -> Dict:
+        """
+        지표 전체 시계열 (차트 오버레이용)
+        - KRX 종목: OHLCV 기반 전체 지표 / 미국 종목: 종가 기반 지표만
+        - 반환: 날짜 배열 + 지표별 컬럼 배열 (미정의 구간은 None)
+        - indicators: 포함할 지표 키 목록 (None이면 전체)
+        """
+        dates, ohlcv = QuantAnalyzer.get_ohlcv_array(db, symbol, days)
+        has_ohlcv = len(dates) > 0
+
+        if has_ohlcv:
+            data_source = "KRX (StockPriceDaily)"
+        else:
+            prices = QuantAnalyzer.get_price_data(db, symbol, days)
+            dates = [to_date(p[0]) for p in prices]
+            ohlcv = closes_to_array(prices)
+            data_source = "AlphaVantage"
+
+        if not dates:
+            return {"error": f"{symbol} 데이터 없음"}
+
+        series = compute_indicator_series(ohlcv, ohlc=has_ohlcv)
+
+        return {
+            "symbol": symbol.upper(),
+            "period_days": days,
+            "data_points": len(dates),
+            "data_source": data_source,
+            "dates": [d.isoformat() for d in dates],
+            "series": to_columnar(series, keys=indicators),
+        }
+
     # ============================================================
     # 리스크 지표 (Risk Metrics)
     # ============================================================
@@ -678,22 +736,16 @@ class QuantAnalyzer:
         if len(prices) < 2:
             return {"error": "데이터 부족"}
 
-        price_values = [p[1] for p in prices]
+        price_values = np.array([p[1] for p in prices], dtype=np.float64)
 
-        max_dd = 0
-        peak = price_values[0]
-        peak_date = prices[0][0]
-        trough_date = prices[0][0]
+        # 고점: 기간 최고가 (최초 도달일), 저점: MDD 구간의 최저점
+        peak_idx = int(np.argmax(price_values))
+        peak = float(price_values[peak_idx])
+        peak_date = prices[peak_idx][0]
 
-        for i, price in enumerate(price_values):
-            if price > peak:
-                peak = price
-                peak_date = prices[i][0]
-
-            dd = ((price - peak) / peak) * 100
-            if dd < max_dd:
-                max_dd = dd
-                trough_date = prices[i][0]
+        worst = max_drawdown_episode(drawdown_episodes(price_values))
+        max_dd = min(worst.depth, 0.0) * 100 if worst else 0
+        trough_date = prices[worst.trough][0] if worst else prices[0][0]
 
         return {
             "max_drawdown": round(max_dd, 2),
@@ -922,30 +974,38 @@ class QuantAnalyzer:
         db: Session,
         symbol: str,
         market_symbol: str = "SPY",
-        days: int = 252
+        days: int = 252,
+        matrix: Optional[PriceMatrix] = None,
+        market_prices: Optional[List[Tuple[datetime, float]]] = None,
+        indicator_states: Optional[Dict] = None,
     ) -> Dict:
         """
         종합 퀀트 분석
         - 기술적 지표 + 리스크 지표 통합
         - KRX 종목: StockPriceDaily OHLCV → 11개 기술 지표
+          (기본 기간이면 indicator_state 저장 상태 우선, 없거나 무효화되면 같은 봉 구간으로 커널 재계산)
         - 미국 종목: AlphaVantageTimeSeries → 기존 5개 기술 지표
+        - matrix / market_prices / indicator_states: 배치 실행 시 미리 적재한 입력 (종목별 재조회 생략)
         """
         # KRX OHLCV 데이터 시도 (한국 주식)
-        ohlcv = QuantAnalyzer.get_ohlcv_data(db, symbol, days)
+        dates, ohlcv = QuantAnalyzer.get_ohlcv_array(db, symbol, days, matrix=matrix)
+        has_ohlcv = len(dates) > 0
 
-        if ohlcv:
+        if has_ohlcv:
             # KRX 모드: OHLCV 기반 분석
-            stock_prices = [(d["date"], d["close"]) for d in ohlcv]
+            stock_prices = list(zip(dates, ohlcv[:, CLOSE].tolist()))
             data_source = "KRX (StockPriceDaily)"
         else:
             # 폴백: AlphaVantage (미국 주식)
             stock_prices = QuantAnalyzer.get_price_data(db, symbol, days)
+            ohlcv = closes_to_array(stock_prices)
             data_source = "AlphaVantage"
 
         if not stock_prices:
             return {"error": f"{symbol} 데이터 없음"}
 
-        market_prices = QuantAnalyzer.get_price_data(db, market_symbol, days)
+        if market_prices is None:
+            market_prices = QuantAnalyzer.get_price_data(db, market_symbol, days)
 
         # 수익률 계산
         stock_returns = QuantAnalyzer.calculate_returns(stock_prices)
@@ -961,24 +1021,22 @@ class QuantAnalyzer:
             "end_date": stock_prices[-1][0].strftime("%Y-%m-%d") if hasattr(stock_prices[-1][0], 'strftime') else str(stock_prices[-1][0]),
         }
 
-        # 기술적 지표 (기존 5개)
-        result["technical_indicators"] = {
-            "moving_averages": QuantAnalyzer.calculate_moving_averages(stock_prices),
-            "rsi": QuantAnalyzer.calculate_rsi(stock_prices),
-            "bollinger_bands": QuantAnalyzer.calculate_bollinger_bands(stock_prices),
-            "macd": QuantAnalyzer.calculate_macd(stock_prices)
-        }
-
-        # Tier 1 신규 지표 (OHLCV 필요 지표)
-        if ohlcv:
-            result["technical_indicators"]["stochastic"] = QuantAnalyzer.calculate_stochastic(ohlcv)
-            result["technical_indicators"]["atr"] = QuantAnalyzer.calculate_atr(ohlcv)
-            result["technical_indicators"]["adx"] = QuantAnalyzer.calculate_adx(ohlcv)
-            result["technical_indicators"]["obv"] = QuantAnalyzer.calculate_obv(ohlcv)
-
-        # close 데이터만으로 가능한 지표 (KRX/미국 공통)
-        result["technical_indicators"]["ma_alignment"] = QuantAnalyzer.calculate_ma_alignment(stock_prices)
-        result["technical_indicators"]["week52_position"] = QuantAnalyzer.calculate_52week_position(stock_prices)
+        # 기술적 지표
+        # - KRX 기본 기간: 증분 상태 저장소 (최신 봉까지 반영된 경우만)
+        #   상태 없음 / 뒤처짐 / 무효화 → 상태 재계산과 같은 봉 구간(REBUILD_HISTORY_DAYS)으로 커널 계산
+        #   (배치 가격 행렬은 분석 기간만 담으므로 종목별 조회)
+        # - 그 외: 벡터 커널 단일 패스 (KRX: OHLCV 전체 지표, 미국: 종가 기반 지표만)
+        technical = None
+        if has_ohlcv and days == STATE_INDICATOR_DAYS:
+            technical = IndicatorStateService.get_technical_indicators(
+                db, symbol, last_trade_date=dates[-1], states=indicator_states
+            )
+            if technical is None:
+                _, state_ohlcv = QuantAnalyzer.get_ohlcv_array(db, symbol, REBUILD_HISTORY_DAYS)
+                technical = compute_technical_indicators(state_ohlcv)
+        if technical is None:
+            technical = compute_technical_indicators(ohlcv, ohlc=has_ohlcv)
+        result["technical_indicators"] = technical
 
         # 리스크 지표
         result["risk_metrics"] = {
@@ -30,6 +30,8 @@ from app.models.real_data import (
     FinancialStatement,
 )
 from app.services.batch_manager import BatchManager, BatchStats, BatchType
+from app.services.compass_dirty import mark_compass_dirty
+from app.services.returns_cache import invalidate_returns_cache
 from app.services.data_quality_validator import (
     DataQualityValidator,
     Severity,
@@ -96,6 +98,9 @@ class RealDataLoader:
     # 기본 데이터 소스
     DEFAULT_SOURCE_ID = "PYKRX"
 
+    # 시세 적재 청크 크기 (INSERT ... ON CONFLICT 1회 + commit 1회 단위, 행 수)
+    PRICE_CHUNK_SIZE = 1000
+
     def __init__(self, db: Session):
         self.db = db
         self.fetcher = PykrxFetcher()
@@ -198,6 +203,7 @@ class RealDataLoader:
         stats = BatchStats()
         null_counts: Dict[str, int] = {}
         outlier_count = 0
+        buffer: List[Dict] = []
 
         try:
             for ticker in tickers:
@@ -220,11 +226,12 @@ class RealDataLoader:
                         validation = self.validator.validate_ohlcv(record)
 
                         if not validation.is_valid:
-                            # ERROR: 스킵
+                            # ERROR: 스킵 (이슈 로그는 다음 청크와 함께 commit)
                             self.validator.log_quality_issues(
                                 batch.batch_id,
                                 "stock_price_daily",
                                 validation.issues,
+                                commit=False,
                             )
                             stats.failed_records += 1
                             continue
@@ -234,12 +241,17 @@ class RealDataLoader:
                                 batch.batch_id,
                                 "stock_price_daily",
                                 [i for i in validation.issues if i.severity == Severity.WARNING],
+                                commit=False,
                             )
                             outlier_count += 1
 
-                        # 5. DB 적재
-                        self._insert_stock_price(record, batch.batch_id, as_of_date, validation.quality_flag)
+                        # 5. 버퍼링 후 청크 단위 적재
+                        buffer.append(
+                            self._stock_price_row(record, batch.batch_id, as_of_date, validation.quality_flag)
+                        )
                         stats.success_records += 1
+                        if len(buffer) >= self.PRICE_CHUNK_SIZE:
+                            self._flush_stock_prices(buffer)
 
                 except PykrxFetchError as e:
                     logger.warning(
@@ -248,6 +260,9 @@ class RealDataLoader:
                     )
                     stats.failed_records += 1
 
+            # 남은 버퍼 / 품질 이슈 로그 적재
+            self._flush_stock_prices(buffer)
+
             # 6. 품질 메트릭 계산
             if stats.total_records > 0:
                 metrics = self.validator.calculate_quality_metrics(
@@ -338,6 +353,7 @@ class RealDataLoader:
 
         stats = BatchStats()
         outlier_count = 0
+        buffer: List[Dict] = []
 
         try:
             for index_code in index_codes:
@@ -361,6 +377,7 @@ class RealDataLoader:
                                 batch.batch_id,
                                 "index_price_daily",
                                 validation.issues,
+                                commit=False,
                             )
                             stats.failed_records += 1
                             continue
@@ -370,11 +387,16 @@ class RealDataLoader:
                                 batch.batch_id,
                                 "index_price_daily",
                                 [i for i in validation.issues if i.severity == Severity.WARNING],
+                                commit=False,
                             )
                             outlier_count += 1
 
-                        self._insert_index_price(record, batch.batch_id, as_of_date, validation.quality_flag)
+                        buffer.append(
+                            self._index_price_row(record, batch.batch_id, as_of_date, validation.quality_flag)
+                        )
                         stats.success_records += 1
+                        if len(buffer) >= self.PRICE_CHUNK_SIZE:
+                            self._flush_index_prices(buffer)
 
                 except PykrxFetchError as e:
                     logger.warning(
@@ -383,6 +405,8 @@ class RealDataLoader:
                     )
                     stats.failed_records += 1
 
+            self._flush_index_prices(buffer)
+
             if stats.total_records > 0:
                 metrics = self.validator.calculate_quality_metrics(
                     stats.total_records, {}, outlier_count
@@ -1332,6 +1356,11 @@ class RealDataLoader:
         existing = self.db.query(Stock).filter(Stock.ticker == ticker).first()
 
         if existing:
+            if any(
+                data.get(key) is not None and data.get(key) != getattr(existing, key)
+                for key in ("pe_ratio", "pb_ratio", "dividend_yield")
+            ):
+                mark_compass_dirty(self.db, [ticker], "valuation")
             existing.current_price = data.get("current_price")
             existing.market_cap = data.get("market_cap")
             if data.get("pe_ratio") is not None:
@@ -1716,6 +1745,7 @@ class RealDataLoader:
                 dart_rcept_no=record.get("dart_rcept_no"),
             )
             self.db.add(stmt)
+        mark_compass_dirty(self.db, [ticker], "financials")
 
         # 2. PER / PBR 계산 + stocks 업데이트
         stock = self.db.query(Stock).filter(Stock.ticker == ticker).first()
@@ -1725,49 +1755,71 @@ class RealDataLoader:
 
         return True
 
-    def _insert_stock_price(
+    def _stock_price_row(
         self,
         record: OHLCVRecord,
         batch_id: int,
         as_of_date: date,
         quality_flag: str,
-    ) -> None:
-        """주식 시세 레코드 삽입 (중복 시 스킵)"""
-        price_data = StockPriceDaily(
-            ticker=record.ticker,
-            trade_date=record.trade_date,
-            open_price=record.open_price,
-            high_price=record.high_price,
-            low_price=record.low_price,
-            close_price=record.close_price,
+    ) -> Dict:
+        """주식 시세 레코드 → stock_price_daily 행"""
+        return {
+            "ticker": record.ticker,
+            "trade_date": record.trade_date,
+            "open_price": record.open_price,
+            "high_price": record.high_price,
+            "low_price": record.low_price,
+            "close_price": record.close_price,
             # KRX 기본 소스는 수정종가가 없으므로 종가를 기본값으로 사용
-            adj_close_price=record.adj_close_price or record.close_price,
-            volume=record.volume,
-            trading_value=record.trading_value,
-            market_cap=record.market_cap,
-            shares_outstanding=record.shares_outstanding,
-            change_rate=record.change_rate,
-            source_id=self.DEFAULT_SOURCE_ID,
-            batch_id=batch_id,
-            as_of_date=as_of_date,
-            is_verified=False,
-            quality_flag=quality_flag,
-        )
+            "adj_close_price": record.adj_close_price or record.close_price,
+            "volume": record.volume,
+            "trading_value": record.trading_value,
+            "market_cap": record.market_cap,
+            "shares_outstanding": record.shares_outstanding,
+            "change_rate": record.change_rate,
+            "source_id": self.DEFAULT_SOURCE_ID,
+            "batch_id": batch_id,
+            "as_of_date": as_of_date,
+            "is_verified": False,
+            "quality_flag": quality_flag,
+        }
 
-        # 중복 체크 (ticker, trade_date, source_id)
-        existing = (
-            self.db.query(StockPriceDaily)
-            .filter(
-                StockPriceDaily.ticker == record.ticker,
-                StockPriceDaily.trade_date == record.trade_date,
-                StockPriceDaily.source_id == self.DEFAULT_SOURCE_ID,
-            )
-            .first()
+    def _insert_ignore(self, model, conflict_columns: List[str], rows: List[Dict], key_column: str) -> List[str]:
+        """
+        INSERT ... ON CONFLICT DO NOTHING 1회 (commit은 caller에서 수행)
+
+        Returns:
+            새 행이 들어간 key_column 값 (중복 스킵분 제외)
+        """
+        if not rows:
+            return []
+
+        insert = sqlite_insert if self.db.get_bind().dialect.name == "sqlite" else pg_insert
+        table = model.__table__
+        stmt = (
+            insert(table)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+            .returning(table.c[key_column])
         )
+        return sorted({row[0] for row in self.db.execute(stmt)})
 
-        if not existing:
-            self.db.add(price_data)
+    def _flush_stock_prices(self, buffer: List[Dict]) -> None:
+        """버퍼링된 주식 시세 청크 적재 (중복 시 스킵, commit 1회) 후 버퍼 비움"""
+        try:
+            tickers = self._insert_ignore(
+                StockPriceDaily, ["ticker", "trade_date", "source_id"], buffer, "ticker"
+            )
+            if tickers:
+                mark_compass_dirty(self.db, tickers, "prices")
             self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        if tickers:
+            invalidate_returns_cache("stock_price_daily", tickers, db=self.db)
+        buffer.clear()
 
     def _insert_dividend_history(
         self,
@@ -2028,44 +2080,42 @@ class RealDataLoader:
         self.db.commit()
         return True
 
-    def _insert_index_price(
+    def _index_price_row(
         self,
         record: IndexOHLCVRecord,
         batch_id: int,
         as_of_date: date,
         quality_flag: str,
-    ) -> None:
-        """지수 시세 레코드 삽입 (중복 시 스킵)"""
-        price_data = IndexPriceDaily(
-            index_code=record.index_code,
-            trade_date=record.trade_date,
-            open_price=record.open_price,
-            high_price=record.high_price,
-            low_price=record.low_price,
-            close_price=record.close_price,
-            volume=record.volume,
-            trading_value=record.trading_value,
-            change_rate=record.change_rate,
-            source_id=self.DEFAULT_SOURCE_ID,
-            batch_id=batch_id,
-            as_of_date=as_of_date,
-            is_verified=False,
-            quality_flag=quality_flag,
-        )
+    ) -> Dict:
+        """지수 시세 레코드 → index_price_daily 행"""
+        return {
+            "index_code": record.index_code,
+            "trade_date": record.trade_date,
+            "open_price": record.open_price,
+            "high_price": record.high_price,
+            "low_price": record.low_price,
+            "close_price": record.close_price,
+            "volume": record.volume,
+            "trading_value": record.trading_value,
+            "change_rate": record.change_rate,
+            "source_id": self.DEFAULT_SOURCE_ID,
+            "batch_id": batch_id,
+            "as_of_date": as_of_date,
+            "is_verified": False,
+            "quality_flag": quality_flag,
+        }
 
-        existing = (
-            self.db.query(IndexPriceDaily)
-            .filter(
-                IndexPriceDaily.index_code == record.index_code,
-                IndexPriceDaily.trade_date == record.trade_date,
-                IndexPriceDaily.source_id == self.DEFAULT_SOURCE_ID,
+    def _flush_index_prices(self, buffer: List[Dict]) -> None:
+        """버퍼링된 지수 시세 청크 적재 (중복 시 스킵, commit 1회) 후 버퍼 비움"""
+        try:
+            self._insert_ignore(
+                IndexPriceDaily, ["index_code", "trade_date", "source_id"], buffer, "index_code"
             )
-            .first()
-        )
-
-        if not existing:
-            self.db.add(price_data)
             self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        buffer.clear()
 
     def _insert_stock_info(
         self,
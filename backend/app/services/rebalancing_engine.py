@@ -12,12 +12,16 @@ Phase 2 리밸런싱 엔진 (Epic B)
 ⚠️ 교육 목적: 과거 데이터 기반 시뮬레이션이며, 미래 수익을 보장하지 않습니다.
 """
 
+from bisect import bisect_left
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import math
 
+import numpy as np
+
 from app.config import settings
+from app.services.nav_engine import NavResume, NavSeries, build_return_matrix, series_from_nav
 
 
 # ============================================================================
@@ -72,6 +76,15 @@ class RebalancingConfig:
         """Drift 기반 리밸런싱 여부"""
         return self.rebalance_type in ("DRIFT", "HYBRID")
 
+    def is_resumable(self) -> bool:
+        """
+        이어 계산 가능 여부
+
+        END 시점 정기 리밸런싱은 경로 마지막 거래일을 항상 월말/분기말로 간주하므로
+        기간을 늘리면 기존 마지막 날의 트리거가 달라짐 → 전체 재계산 필요
+        """
+        return not (self.is_enabled() and self.is_periodic() and self.periodic_timing == "END")
+
 
 @dataclass
 class RebalancingEvent:
@@ -152,14 +165,9 @@ def is_first_trading_day_of_month(
     """해당 월의 첫 거래일인지 확인"""
     month_start = get_month_start(trade_date)
 
-    # 현재 날짜가 해당 월의 첫 번째 거래일인지 확인
-    for d in trade_dates:
-        if d.year == month_start.year and d.month == month_start.month:
-            return d == trade_date
-        if d > trade_date:
-            break
-
-    return False
+    # 해당 월 이후 첫 거래일이 현재 날짜인지 확인 (trade_dates 는 정렬 상태)
+    idx = bisect_left(trade_dates, month_start)
+    return idx < len(trade_dates) and trade_dates[idx] == trade_date
 
 
 def is_last_trading_day_of_month(
@@ -209,6 +217,36 @@ def is_last_trading_day_of_quarter(
     return is_last_trading_day_of_month(trade_date, trade_dates, trade_date_idx)
 
 
+def periodic_trigger_mask(
+    trade_dates: List[date],
+    frequency: Optional[str],
+    timing: str = "START"
+) -> np.ndarray:
+    """
+    정기 리밸런싱 거래일 마스크 (거래일 목록에서 1회 계산)
+
+    is_first/last_trading_day_of_month/quarter 를 전체 거래일에 적용한 결과와 동일
+    """
+    n = len(trade_dates)
+    if n == 0 or frequency not in ("MONTHLY", "QUARTERLY"):
+        return np.zeros(n, dtype=bool)
+
+    months = np.fromiter((d.month for d in trade_dates), np.int64, n)
+    month_keys = np.fromiter((d.year * 12 + d.month for d in trade_dates), np.int64, n)
+    changed = month_keys[1:] != month_keys[:-1]
+
+    if timing == "START":
+        mask = np.concatenate(([True], changed))
+        quarter_months = (1, 4, 7, 10)
+    else:  # END
+        mask = np.concatenate((changed, [True]))
+        quarter_months = (3, 6, 9, 12)
+
+    if frequency == "QUARTERLY":
+        mask &= np.isin(months, quarter_months)
+    return mask
+
+
 # ============================================================================
 # 리밸런싱 엔진
 # ============================================================================
@@ -269,6 +307,14 @@ class RebalancingEngine:
 
         return None
 
+    def periodic_mask(self, trade_dates: List[date]) -> np.ndarray:
+        """거래일별 PERIODIC 트리거 여부 (정기 리밸런싱이 아니면 전부 False)"""
+        if not (self.config.is_enabled() and self.config.is_periodic()):
+            return np.zeros(len(trade_dates), dtype=bool)
+        return periodic_trigger_mask(
+            trade_dates, self.config.frequency, self.config.periodic_timing
+        )
+
     def _check_periodic_trigger(
         self,
         trade_date: date,
@@ -422,6 +468,9 @@ def calculate_nav_with_rebalancing(
     """
     리밸런싱을 적용한 NAV 경로 계산
 
+    자산군 평가금액을 배열로 유지하고, 정기 트리거는 거래일 마스크로 1회 계산,
+    Drift 는 구간 단위 배열 비교로 평가합니다. (이벤트/비용 회계는 RebalancingEngine)
+
     Args:
         allocations: 포트폴리오 구성비 [{"instrument_id", "ticker", "weight", "asset_class"}, ...]
         returns_by_instrument: 종목별 일간수익률 {instrument_id: [{"trade_date", "daily_return"}, ...]}
@@ -435,87 +484,187 @@ def calculate_nav_with_rebalancing(
     if not allocations or not trade_dates:
         return [], []
 
-    # 종목별 수익률을 날짜 인덱스로 변환
-    returns_lookup: Dict[int, Dict[date, float]] = {}
-    for inst_id, returns in returns_by_instrument.items():
-        returns_lookup[inst_id] = {
-            r["trade_date"]: r["daily_return"]
-            for r in returns
-        }
+    return_matrix = build_return_matrix(
+        returns_by_instrument, [a["instrument_id"] for a in allocations], trade_dates
+    )
+    return calculate_rebalanced_nav(
+        allocations, return_matrix, trade_dates, initial_amount, rebalancing_config
+    )
 
-    # 자산군별 종목 그룹핑 및 목표 비중 계산
-    asset_class_instruments: Dict[str, List[Dict]] = {}
-    target_weights: Dict[str, float] = {}
 
+def calculate_rebalanced_nav(
+    allocations: List[Dict],
+    return_matrix: np.ndarray,
+    trade_dates: List[date],
+    initial_amount: float,
+    rebalancing_config: RebalancingConfig
+) -> Tuple[List[Dict], List[RebalancingEvent]]:
+    """
+    리밸런싱 적용 NAV 경로 계산 (수익률 행렬 입력)
+
+    Args:
+        return_matrix: 거래일 × 종목 일간수익률 (열 순서 = allocations 순서)
+        (그 외 calculate_nav_with_rebalancing 과 동일)
+    """
+    if not allocations or not trade_dates:
+        return [], []
+
+    series, events, _ = simulate_rebalanced_series(
+        allocations, return_matrix, trade_dates, initial_amount, rebalancing_config
+    )
+    return series.to_path(), events
+
+
+def simulate_rebalanced_series(
+    allocations: List[Dict],
+    return_matrix: np.ndarray,
+    trade_dates: List[date],
+    initial_amount: float,
+    rebalancing_config: RebalancingConfig,
+    resume: Optional[NavResume] = None,
+) -> Tuple[NavSeries, List[RebalancingEvent], Dict[str, float]]:
+    """
+    리밸런싱 적용 NAV 배열 + 마지막 거래일 자산군 평가금액
+
+    resume 이 있으면 그 상태(자산군 평가금액 / 고점 / 이벤트 순번)에서 이어 계산
+    (정기 트리거는 resume.last_date 를 직전 거래일로 포함해 판정)
+
+    Raises:
+        ValueError: resume 자산군이 구성비 자산군과 다르거나 이어 계산 불가 설정
+    """
+    # 자산군별 목표 비중 및 자산군 내 종목 비중 (1회 계산)
+    target_weights: Dict[str, float] = {}
     for alloc in allocations:
         asset_class = alloc.get("asset_class") or "OTHER"
-        if asset_class not in asset_class_instruments:
-            asset_class_instruments[asset_class] = []
-            target_weights[asset_class] = 0.0
-        asset_class_instruments[asset_class].append(alloc)
-        target_weights[asset_class] += alloc["weight"]
-
-    # 초기 포지션 설정
-    position = PositionState(
-        values={ac: initial_amount * w for ac, w in target_weights.items()},
-        target_weights=target_weights
-    )
+        target_weights[asset_class] = target_weights.get(asset_class, 0.0) + alloc["weight"]
+
+    asset_classes = list(target_weights)
+    class_index = {ac: i for i, ac in enumerate(asset_classes)}
+
+    # 거래일 × 자산군 일간수익률 (자산군 내 종목 순서대로 누적)
+    class_returns = np.zeros((len(trade_dates), len(asset_classes)), dtype=np.float64)
+    for col, alloc in enumerate(allocations):
+        asset_class = alloc.get("asset_class") or "OTHER"
+        class_total = target_weights[asset_class]
+        inst_weight = alloc["weight"] / class_total if class_total > 0 else 0.0
+        class_returns[:, class_index[asset_class]] += inst_weight * return_matrix[:, col]
 
-    # 리밸런싱 엔진 초기화
     engine = RebalancingEngine(rebalancing_config)
+    periodic = None
+    if resume is None:
+        values = np.array([initial_amount * target_weights[ac] for ac in asset_classes])
+        first_prev_nav = initial_amount
+    else:
+        if not rebalancing_config.is_resumable():
+            raise ValueError("END 시점 정기 리밸런싱은 이어 계산할 수 없습니다.")
+        if set(resume.class_values or {}) != set(asset_classes):
+            raise ValueError("이어 계산 상태의 자산군이 구성비와 다릅니다.")
+        values = np.array([resume.class_values[ac] for ac in asset_classes])
+        first_prev_nav = round(resume.nav, 4)
+        engine._event_order = resume.event_count
+        periodic = engine.periodic_mask([resume.last_date] + list(trade_dates))[1:]
+
+    nav, values = _simulate_positions(
+        engine,
+        trade_dates,
+        class_returns,
+        asset_classes,
+        target_weights,
+        values,
+        periodic,
+    )
+
+    # 일간수익률은 직전일 경로 NAV (반올림 값) 기준
+    prev_nav = np.array([first_prev_nav] + [round(v, 4) for v in nav[:-1].tolist()])
+    daily_return = np.zeros_like(nav)
+    positive = prev_nav > 0
+    daily_return[positive] = (nav[positive] - prev_nav[positive]) / prev_nav[positive]
+
+    series = series_from_nav(
+        trade_dates, nav, daily_return, initial_amount,
+        resume.high_water_mark if resume is not None else None,
+    )
+    return series, engine.get_events(), dict(zip(asset_classes, values.tolist()))
 
-    # 거래일 집합 (빠른 조회용)
-    trade_date_set = set(trade_dates)
 
-    # NAV 경로 계산
-    path = []
-    high_water_mark = initial_amount
+# 드리프트 평가 구간 길이 (거래일) — 트리거가 없으면 다음 구간으로 이어서 계산
+_SIMULATION_WINDOW = 64
 
-    for idx, trade_date in enumerate(trade_dates):
-        # 1. 일간 수익률 반영
-        for asset_class, instruments in asset_class_instruments.items():
-            asset_return = 0.0
-            total_weight_in_class = sum(a["weight"] for a in instruments)
 
-            for alloc in instruments:
-                inst_id = alloc["instrument_id"]
-                inst_weight = alloc["weight"] / total_weight_in_class if total_weight_in_class > 0 else 0.0
-                inst_return = returns_lookup.get(inst_id, {}).get(trade_date, 0.0)
-                asset_return += inst_weight * inst_return
+def _row_totals(values: np.ndarray) -> np.ndarray:
+    """행별 평가금액 합계 (자산군 순서대로 누적)"""
+    totals = values[:, 0].copy()
+    for col in range(1, values.shape[1]):
+        totals += values[:, col]
+    return totals
 
-            # 자산군 평가금액 업데이트
-            position.values[asset_class] *= (1 + asset_return)
 
-        # 2. 리밸런싱 트리거 체크
-        trigger = engine.check_trigger(
-            trade_date, idx, trade_dates, trade_date_set, position
+def _simulate_positions(
+    engine: RebalancingEngine,
+    trade_dates: List[date],
+    class_returns: np.ndarray,
+    asset_classes: List[str],
+    target_weights: Dict[str, float],
+    values: np.ndarray,
+    periodic: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    자산군 평가금액 배열 시뮬레이션 → (거래일별 NAV, 마지막 거래일 자산군 평가금액)
+
+    - 구간 단위로 평가금액 누적곱 → 비중 / 최대 Drift 를 배열 비교로 평가
+    - 첫 트리거일(PERIODIC 우선)에서만 execute_rebalance 로 이벤트/비용 반영 후 재개
+    - periodic: 정기 트리거 마스크 (None 이면 trade_dates 로 계산)
+    """
+    config = engine.config
+    if periodic is None:
+        periodic = engine.periodic_mask(trade_dates)
+    threshold = config.drift_threshold
+    check_drift = config.is_enabled() and config.is_drift_based() and threshold is not None
+    targets = np.array([target_weights[ac] for ac in asset_classes])
+
+    n_days = len(trade_dates)
+    nav = np.empty(n_days, dtype=np.float64)
+    t = 0
+    while t < n_days:
+        end = min(n_days, t + _SIMULATION_WINDOW)
+
+        # values 를 시작값으로 한 누적곱 (일별 values *= 1 + r 과 동일한 연산 순서)
+        segment = np.cumprod(np.vstack((values, 1.0 + class_returns[t:end])), axis=0)[1:]
+        totals = _row_totals(segment)
+
+        triggered = periodic[t:end].copy()
+        if check_drift:
+            weights = np.zeros_like(segment)
+            positive = totals > 0
+            weights[positive] = segment[positive] / totals[positive, None]
+            triggered |= np.abs(weights - targets).max(axis=1) >= threshold
+
+        hits = np.flatnonzero(triggered)
+        if hits.size == 0:
+            nav[t:end] = totals
+            values = segment[-1]
+            t = end
+            continue
+
+        k = int(hits[0])
+        nav[t:t + k] = totals[:k]
+        day = t + k
+
+        position = PositionState(
+            values=dict(zip(asset_classes, segment[k].tolist())),
+            target_weights=target_weights,
         )
+        if periodic[day]:
+            trigger_type, trigger_detail = "PERIODIC", config.frequency
+        else:
+            trigger_type, trigger_detail = engine._check_drift_trigger(position)
+        engine.execute_rebalance(trade_dates[day], trigger_type, trigger_detail, position)
+
+        nav[day] = position.get_total_value()
+        values = np.array([position.values[ac] for ac in asset_classes])
+        t = day + 1
 
-        # 3. 리밸런싱 실행
-        if trigger:
-            trigger_type, trigger_detail = trigger
-            engine.execute_rebalance(trade_date, trigger_type, trigger_detail, position)
-
-        # 4. NAV 및 지표 계산
-        nav = position.get_total_value()
-        prev_nav = path[-1]["nav"] if path else initial_amount
-        daily_return = (nav - prev_nav) / prev_nav if prev_nav > 0 else 0.0
-
-        if nav > high_water_mark:
-            high_water_mark = nav
-        drawdown = (nav - high_water_mark) / high_water_mark if high_water_mark > 0 else 0.0
-        cumulative_return = (nav - initial_amount) / initial_amount if initial_amount > 0 else 0.0
-
-        path.append({
-            "path_date": trade_date,
-            "nav": round(nav, 4),
-            "daily_return": round(daily_return, 8),
-            "cumulative_return": round(cumulative_return, 8),
-            "drawdown": round(drawdown, 8),
-            "high_water_mark": round(high_water_mark, 4),
-        })
-
-    return path, engine.get_events()
+    return nav, values
 
 
 def create_rebalancing_config_for_hash(config: RebalancingConfig) -> Dict:
@@ -0,0 +1,237 @@
+# backend/app/services/returns_cache.py
+
+"""
+프로세스 내 종목별 시계열 캐시 (daily_return 수익률 / stock_price_daily OHLCV)
+
+- 키: (DB, 원천 테이블, 종목) + 원천별 데이터 버전 — 적재 완료 훅이 버전을 올려 무효화
+- 항목은 조회 구간(커버리지)과 정렬된 날짜 / 값 배열 보관, 포함 구간 요청은 bisect 슬라이스
+- 메모리 상한(RETURNS_CACHE_MAX_MB) 초과 시 LRU 축출, 0 이면 캐시 비활성
+- 다른 프로세스 / 외부 배치 적재분은 거래일 캘린더 최신일 확인(check_latest)으로 무효화
+"""
+
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 날짜 1개 보관 비용 추정 (리스트 슬롯 + date 객체)
+_DATE_BYTES = 40
+
+Series = Tuple[List[date], np.ndarray]
+
+
+@dataclass
+class SeriesEntry:
+    """캐시 항목 — [start, end] 구간의 원천 데이터 전부"""
+    start: date
+    end: date
+    dates: List[date]
+    values: np.ndarray
+    version: int
+    nbytes: int
+
+
+class ReturnsCache:
+    """바이트 상한 LRU 시계열 캐시 (스레드 안전)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str, Hashable], SeriesEntry]" = OrderedDict()
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def version(self, scope: str, source: str) -> int:
+        return self._versions.get((scope, source), 0)
+
+    def get(self, scope: str, source: str, instrument: Hashable, start: date, end: date) -> Optional[Series]:
+        """구간을 포함하는 유효 항목이 있으면 슬라이스 반환"""
+        key = (scope, source, instrument)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry.version != self.version(scope, source)
+                or start < entry.start
+                or end > entry.end
+            ):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        lo = bisect_left(entry.dates, start)
+        hi = bisect_right(entry.dates, end)
+        return entry.dates[lo:hi], entry.values[lo:hi]
+
+    def put(
+        self,
+        scope: str,
+        source: str,
+        instrument: Hashable,
+        start: date,
+        end: date,
+        series: Series,
+        version: int,
+    ) -> None:
+        """항목 저장 — 조회 중 무효화됐거나 상한보다 큰 항목은 저장하지 않음"""
+        dates, values = series
+        nbytes = int(values.nbytes) + _DATE_BYTES * len(dates)
+        if nbytes > self.max_bytes:
+            return
+
+        key = (scope, source, instrument)
+        with self._lock:
+            if version != self.version(scope, source):
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = SeriesEntry(start, end, list(dates), values, version, nbytes)
+            self._bytes += nbytes
+
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def invalidate(
+        self,
+        source: str,
+        instruments: Optional[Iterable[Hashable]] = None,
+        scope: Optional[str] = None,
+    ) -> int:
+        """
+        무효화 → 삭제 항목 수
+        - instruments=None: 원천 전체 (데이터 버전 증가 — 조회 중이던 결과도 저장 안 됨)
+        - scope=None: 모든 DB
+        """
+        targets = None if instruments is None else set(instruments)
+        with self._lock:
+            self.invalidations += 1
+            if targets is None:
+                scopes = {s for s, src in self._versions if src == source}
+                scopes.update(k[0] for k in self._entries if k[1] == source)
+                for s in scopes:
+                    if scope is None or s == scope:
+                        self._versions[(s, source)] = self.version(s, source) + 1
+
+            removed = [
+                key for key in self._entries
+                if key[1] == source
+                and (scope is None or key[0] == scope)
+                and (targets is None or key[2] in targets)
+            ]
+            for key in removed:
+                self._bytes -= self._entries.pop(key).nbytes
+        return len(removed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            by_source: Dict[str, int] = {}
+            for _, source, _ in self._entries:
+                by_source[source] = by_source.get(source, 0) + 1
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "entries_by_source": by_source,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+returns_cache = ReturnsCache(settings.returns_cache_max_mb * 1024 * 1024)
+
+
+def _scope(db: Session) -> str:
+    return str(db.get_bind().url)
+
+
+def invalidate_returns_cache(
+    source: str,
+    instruments: Optional[Iterable[Hashable]] = None,
+    db: Optional[Session] = None,
+) -> None:
+    """적재기 훅 — 배치 완료 후 해당 원천(및 종목) 캐시 무효화"""
+    removed = returns_cache.invalidate(
+        source, instruments, scope=_scope(db) if db is not None else None
+    )
+    logger.debug("[returns_cache] %s 무효화 — %d항목", source, removed)
+
+
+def cached_series(
+    db: Session,
+    source: str,
+    instruments: Sequence[Hashable],
+    start: Optional[date],
+    end: Optional[date],
+    fetch: Callable[[List[Hashable], Optional[date], Optional[date]], Dict[Hashable, Series]],
+) -> Dict[Hashable, Series]:
+    """
+    종목별 시계열 조회 (캐시 우선, 미스 종목만 fetch 1회)
+
+    Args:
+        source: 원천 테이블 (trading_calendar.CALENDAR_SOURCES)
+        fetch: (미스 종목, start, end) → {종목: (정렬된 날짜, 값 배열)} — 요청 종목 전부 포함
+
+    Returns:
+        {종목: (날짜, 값 배열)} — 캐시 항목의 슬라이스이므로 수정 금지
+    """
+    instruments = list(dict.fromkeys(instruments))
+    if not returns_cache.enabled or not instruments:
+        return fetch(instruments, start, end)
+
+    from app.services.trading_calendar import check_latest
+
+    # 다른 프로세스 / 외부 배치 적재 반영 (확인 주기 제한)
+    check_latest(db, source)
+
+    scope = _scope(db)
+    version = returns_cache.version(scope, source)
+    lo, hi = start or date.min, end or date.max
+
+    result: Dict[Hashable, Series] = {}
+    missing = []
+    for instrument in instruments:
+        hit = returns_cache.get(scope, source, instrument, lo, hi)
+        if hit is None:
+            missing.append(instrument)
+        else:
+            result[instrument] = hit
+
+    if missing:
+        fetched = fetch(missing, start, end)
+        for instrument in missing:
+            series = fetched[instrument]
+            returns_cache.put(scope, source, instrument, lo, hi, series, version)
+            result[instrument] = series
+    return result
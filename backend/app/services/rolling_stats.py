@@ -0,0 +1,127 @@
+# backend/app/services/rolling_stats.py
+
+"""
+달력 기간 롤링 지표 (선형 시간)
+
+- 창 시작: 각 시점 t 에 대해 날짜 >= (t - window_days) 인 첫 인덱스 (searchsorted, 단조 증가)
+- 수익률 / 변동성: 일간수익률 및 제곱의 누적합 차이로 창별 합계 계산
+- 낙폭: 단조 덱 슬라이딩 최대로 창 내 고점 계산
+- 정의되지 않는 시점은 NaN (창 시작 >= 현재, 수익률 2개 미만, 변동성 0 등)
+
+performance_analyzer 의 정의(표본 분산, 252 연율화, CAGR 기반 Sharpe)와 같은 값을 계산
+"""
+
+from collections import deque
+from datetime import date
+from typing import Sequence, Union
+
+import numpy as np
+
+ANNUALIZATION_FACTOR = 252
+
+
+def window_starts(dates: Union[Sequence[date], np.ndarray], window_days: int) -> np.ndarray:
+    """각 시점의 창 시작 인덱스 (날짜 >= 시점 - window_days 인 첫 인덱스, datetime64 배열 허용)"""
+    if isinstance(dates, np.ndarray) and dates.dtype.kind == "M":
+        ordinals = dates.astype("datetime64[D]").astype(np.int64)
+    else:
+        ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+    return np.searchsorted(ordinals, ordinals - window_days, side="left")
+
+
+def _prefix_returns(nav: np.ndarray):
+    """
+    일간수익률 누적합 (인덱스 j = j-1 → j 수익률까지)
+    - 직전 NAV <= 0 인 수익률은 제외 (calculate_daily_returns 와 동일)
+    - 전체 평균을 뺀 값으로 누적해 분산 계산의 자리수 손실 완화
+    """
+    prev, curr = nav[:-1], nav[1:]
+    valid = prev > 0
+    returns = np.zeros(len(prev))
+    np.divide(curr - prev, prev, out=returns, where=valid)
+
+    shift = returns[valid].mean() if valid.any() else 0.0
+    shifted = np.where(valid, returns - shift, 0.0)
+
+    count = np.concatenate(([0], np.cumsum(valid)))
+    total = np.concatenate(([0.0], np.cumsum(shifted)))
+    squares = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+    return count, total, squares
+
+
+def rolling_return(nav: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """창 수익률 nav[t] / nav[start] - 1"""
+    nav = np.asarray(nav, dtype=np.float64)
+    idx = np.arange(len(nav))
+    base = nav[starts]
+    ok = (starts < idx) & (base > 0)
+    out = np.full(len(nav), np.nan)
+    out[ok] = nav[ok] / base[ok] - 1
+    return out
+
+
+def rolling_volatility(
+    nav: np.ndarray,
+    starts: np.ndarray,
+    annualization_factor: int = ANNUALIZATION_FACTOR,
+) -> np.ndarray:
+    """창 내 일간수익률의 연율화 표본 표준편차"""
+    nav = np.asarray(nav, dtype=np.float64)
+    out = np.full(len(nav), np.nan)
+    if len(nav) < 3:
+        return out
+
+    count, total, squares = _prefix_returns(nav)
+    idx = np.arange(len(nav))
+    n = count[idx] - count[starts]
+    s = total[idx] - total[starts]
+    q = squares[idx] - squares[starts]
+
+    ok = (starts < idx) & (n >= 2)
+    m = n[ok].astype(np.float64)
+    variance = np.maximum((q[ok] - s[ok] * s[ok] / m) / (m - 1), 0.0)
+    out[ok] = np.sqrt(variance) * np.sqrt(annualization_factor)
+    return out
+
+
+def rolling_sharpe(
+    nav: np.ndarray,
+    starts: np.ndarray,
+    rf_annual: float = 0.0,
+    annualization_factor: int = ANNUALIZATION_FACTOR,
+) -> np.ndarray:
+    """창 Sharpe = (창 CAGR - rf) / 창 변동성 (변동성 0 이면 NaN)"""
+    nav = np.asarray(nav, dtype=np.float64)
+    idx = np.arange(len(nav))
+    volatility = rolling_volatility(nav, starts, annualization_factor)
+    base = nav[starts]
+
+    ok = ~np.isnan(volatility) & (volatility >= 1e-10) & (base > 0)
+    days = (idx - starts)[ok]
+    ratio = nav[ok] / base[ok]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        cagr = np.where(ratio > 0, np.power(ratio, annualization_factor / days) - 1, -1.0)
+
+    out = np.full(len(nav), np.nan)
+    out[ok] = (cagr - rf_annual) / volatility[ok]
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+def rolling_drawdown(nav: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """창 내 고점 대비 낙폭 nav[t] / max(nav[start..t]) - 1 (단조 덱)"""
+    nav = np.asarray(nav, dtype=np.float64)
+    out = np.full(len(nav), np.nan)
+    values = nav.tolist()
+    window: deque = deque()
+
+    for t, (value, start) in enumerate(zip(values, starts.tolist())):
+        while window and values[window[-1]] <= value:
+            window.pop()
+        window.append(t)
+        while window[0] < start:
+            window.popleft()
+        peak = values[window[0]]
+        if start < t and peak > 0:
+            out[t] = value / peak - 1
+    return out
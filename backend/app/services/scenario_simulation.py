@@ -13,6 +13,7 @@ Phase 2에서 리밸런싱 엔진 통합:
 """
 
 import math
+import numpy as np
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
@@ -21,12 +22,19 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text, and_, or_
 
 from app.config import settings
+from app.services.drawdown_engine import drawdown_episodes, worst_period_return
+from app.services.nav_engine import NavResume, NavSeries, build_return_matrix, compute_portfolio_nav
 
 
 # ============================================================================
 # 데이터 로딩 함수
 # ============================================================================
 
+# 시뮬레이션 대상 데이터 품질 (캐시 배열에는 코드로 보관)
+DATA_QUALITY_CODES = ("OK", "MISSING")
+_RETURN_DTYPE = np.dtype([("daily_return", np.float64), ("data_quality", np.int8)])
+
+
 def get_portfolio_allocation(
     db: Session,
     scenario_id: str,
@@ -83,7 +91,7 @@ def get_daily_returns(
     end_date: date
 ) -> Dict[int, List[Dict]]:
     """
-    복수 종목의 일간수익률 조회
+    복수 종목의 일간수익률 조회 (종목별 시계열 프로세스 캐시 경유)
 
     Args:
         db: DB 세션
@@ -97,6 +105,35 @@ def get_daily_returns(
     if not instrument_ids:
         return {}
 
+    from app.services.returns_cache import cached_series
+
+    series = cached_series(
+        db, "daily_return", instrument_ids, start_date, end_date,
+        lambda missing, s, e: _fetch_daily_returns(db, missing, s, e),
+    )
+
+    # 종목별로 그룹핑 (수익률 없는 종목 제외)
+    return {
+        inst_id: [
+            {
+                "trade_date": d,
+                "daily_return": r,
+                "data_quality": DATA_QUALITY_CODES[q],
+            }
+            for d, r, q in zip(dates, values["daily_return"].tolist(), values["data_quality"].tolist())
+        ]
+        for inst_id, (dates, values) in series.items()
+        if dates
+    }
+
+
+def _fetch_daily_returns(
+    db: Session,
+    instrument_ids: List[int],
+    start_date: date,
+    end_date: date
+) -> Dict[int, Tuple[List[date], np.ndarray]]:
+    """daily_return 조회 → 종목별 (날짜, [(daily_return, data_quality 코드)]) — 요청 종목 전부 포함"""
     sql = text("""
         SELECT
             instrument_id,
@@ -117,19 +154,24 @@ def get_daily_returns(
         "end_date": end_date
     }).fetchall()
 
-    # 종목별로 그룹핑
-    returns_by_instrument: Dict[int, List[Dict]] = {}
+    grouped: Dict[int, List] = {inst_id: [] for inst_id in instrument_ids}
     for row in result:
-        inst_id = row[0]
-        if inst_id not in returns_by_instrument:
-            returns_by_instrument[inst_id] = []
-        returns_by_instrument[inst_id].append({
-            "trade_date": row[1],
-            "daily_return": float(row[2]) if row[2] is not None else 0.0,
-            "data_quality": row[3]
-        })
+        grouped.setdefault(row[0], []).append(row)
 
-    return returns_by_instrument
+    quality_code = {q: i for i, q in enumerate(DATA_QUALITY_CODES)}
+    return {
+        inst_id: (
+            [row[1] for row in rows],
+            np.array(
+                [
+                    (float(row[2]) if row[2] is not None else 0.0, quality_code[row[3]])
+                    for row in rows
+                ],
+                dtype=_RETURN_DTYPE,
+            ),
+        )
+        for inst_id, rows in grouped.items()
+    }
 
 
 def get_trade_dates(
@@ -138,7 +180,7 @@ def get_trade_dates(
     end_date: date
 ) -> List[date]:
     """
-    거래일 목록 조회 (daily_return 기준)
+    거래일 목록 조회 (daily_return 기준, 프로세스 공용 거래일 캘린더 사용)
 
     Args:
         db: DB 세션
@@ -148,20 +190,9 @@ def get_trade_dates(
     Returns:
         거래일 목록
     """
-    sql = text("""
-        SELECT DISTINCT trade_date
-        FROM daily_return
-        WHERE trade_date >= :start_date
-          AND trade_date <= :end_date
-        ORDER BY trade_date
-    """)
-
-    result = db.execute(sql, {
-        "start_date": start_date,
-        "end_date": end_date
-    }).fetchall()
+    from app.services.trading_calendar import trade_dates_between
 
-    return [row[0] for row in result]
+    return trade_dates_between(db, start_date, end_date, source="daily_return")
 
 
 # ============================================================================
@@ -190,61 +221,27 @@ def calculate_portfolio_nav(
     if not allocations or not trade_dates:
         return []
 
-    # 종목별 수익률을 날짜 인덱스로 변환
-    returns_lookup: Dict[int, Dict[date, float]] = {}
-    for inst_id, returns in returns_by_instrument.items():
-        returns_lookup[inst_id] = {
-            r["trade_date"]: r["daily_return"]
-            for r in returns
-        }
-
-    # NAV 경로 계산
-    path = []
-    nav = initial_amount
-    high_water_mark = initial_amount
-    prev_nav = initial_amount
-
-    for trade_date in trade_dates:
-        # 포트폴리오 가중 수익률 계산
-        portfolio_return = 0.0
-        total_weight = 0.0
-
-        for alloc in allocations:
-            inst_id = alloc["instrument_id"]
-            weight = alloc["weight"]
-
-            # 해당 종목의 해당 날짜 수익률
-            inst_return = returns_lookup.get(inst_id, {}).get(trade_date, 0.0)
-            portfolio_return += weight * inst_return
-            total_weight += weight
+    return calculate_portfolio_nav_series(
+        allocations, returns_by_instrument, trade_dates, initial_amount
+    ).to_path()
 
-        # 가중치 합이 1이 아닌 경우 정규화
-        if total_weight > 0 and abs(total_weight - 1.0) > 0.001:
-            portfolio_return = portfolio_return / total_weight
 
-        # NAV 갱신
-        nav = prev_nav * (1 + portfolio_return)
-
-        # 고점 및 낙폭 계산
-        if nav > high_water_mark:
-            high_water_mark = nav
-        drawdown = (nav - high_water_mark) / high_water_mark if high_water_mark > 0 else 0.0
-
-        # 누적 수익률
-        cumulative_return = (nav - initial_amount) / initial_amount if initial_amount > 0 else 0.0
-
-        path.append({
-            "path_date": trade_date,
-            "nav": round(nav, 4),
-            "daily_return": round(portfolio_return, 8),
-            "cumulative_return": round(cumulative_return, 8),
-            "drawdown": round(drawdown, 8),
-            "high_water_mark": round(high_water_mark, 4)
-        })
-
-        prev_nav = nav
+def calculate_portfolio_nav_series(
+    allocations: List[Dict],
+    returns_by_instrument: Dict[int, List[Dict]],
+    trade_dates: List[date],
+    initial_amount: float = 1000000.0
+) -> NavSeries:
+    """
+    포트폴리오 NAV 배열 계산 (거래일 × 종목 수익률 행렬 1회 구성)
 
-    return path
+    Returns:
+        NavSeries (경로 형식 변환은 to_path())
+    """
+    instrument_ids = [a["instrument_id"] for a in allocations]
+    weights = np.array([a["weight"] for a in allocations], dtype=np.float64)
+    return_matrix = build_return_matrix(returns_by_instrument, instrument_ids, trade_dates)
+    return compute_portfolio_nav(weights, return_matrix, trade_dates, initial_amount)
 
 
 # ============================================================================
@@ -362,56 +359,50 @@ def calculate_risk_metrics(
 
 
 def calculate_max_recovery_days(nav_path: List[Dict]) -> Optional[int]:
-    """최대 회복 기간 계산"""
+    """최대 회복 기간 계산 (첫 하락일 → 고점 회복일 거래일 수, 회복된 구간만)"""
     if not nav_path:
         return None
 
-    max_recovery = 0
-    in_drawdown = False
-    drawdown_start_idx = 0
-    high_water_mark = nav_path[0]["nav"]
-
-    for i, p in enumerate(nav_path):
-        nav = p["nav"]
-
-        if nav >= high_water_mark:
-            # 신고가 도달 - 회복 완료
-            if in_drawdown:
-                recovery_days = i - drawdown_start_idx
-                if recovery_days > max_recovery:
-                    max_recovery = recovery_days
-                in_drawdown = False
-            high_water_mark = nav
-        else:
-            # 낙폭 중
-            if not in_drawdown:
-                in_drawdown = True
-                drawdown_start_idx = i
-
-    return max_recovery if max_recovery > 0 else None
+    durations = [
+        episode.duration
+        for episode in drawdown_episodes([p["nav"] for p in nav_path])
+        if episode.recovered
+    ]
+    return max(durations) if durations else None
 
 
 def calculate_worst_period_return(nav_path: List[Dict], period_days: int) -> Optional[float]:
-    """특정 기간의 최악 수익률 계산"""
-    if len(nav_path) < period_days:
+    """특정 기간의 최악 수익률 계산 (%, 손실 구간이 없으면 None)"""
+    worst = worst_period_return([p["nav"] for p in nav_path], period_days)
+    if worst is None or worst >= 0:
         return None
-
-    worst_return = 0.0
-
-    for i in range(period_days, len(nav_path)):
-        start_nav = nav_path[i - period_days]["nav"]
-        end_nav = nav_path[i]["nav"]
-        period_return = (end_nav - start_nav) / start_nav * 100
-        if period_return < worst_return:
-            worst_return = period_return
-
-    return worst_return if worst_return < 0 else None
+    return worst * 100
 
 
 # ============================================================================
 # 통합 시뮬레이션 함수
 # ============================================================================
 
+def scenario_cache_params(
+    scenario_id: str,
+    start_date: date,
+    end_date: date,
+    initial_amount: float,
+    rebalancing_rule: Optional[Dict]
+) -> Dict:
+    """
+    시나리오 시뮬레이션 캐시 파라미터 (request_hash 입력)
+    - 날짜는 파싱한 date 의 ISO 형식으로 정규화 (단건 / 스윕 요청이 같은 해시를 공유)
+    """
+    return {
+        "scenario_id": scenario_id,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "initial_amount": initial_amount,
+        "rebalancing_rule": rebalancing_rule,
+    }
+
+
 def run_scenario_simulation(
     db: Session,
     scenario_id: str,
@@ -463,10 +454,37 @@ def run_scenario_simulation(
     if not trade_dates:
         raise ValueError(f"기간 {start_date} ~ {end_date}의 거래일 데이터가 없습니다.")
 
-    # 3. 종목별 일간수익률 조회
+    # 3. 종목별 일간수익률 조회 → 거래일 × 종목 수익률 행렬
     instrument_ids = [a["instrument_id"] for a in allocations]
     returns_by_instrument = get_daily_returns(db, instrument_ids, start_date, end_date)
+    return_matrix = build_return_matrix(returns_by_instrument, instrument_ids, trade_dates)
+
+    return simulate_scenario(
+        scenario_id, start_date, end_date, initial_amount,
+        allocations, return_matrix, trade_dates, rebalancing_rule
+    )
+
+
+def simulate_scenario(
+    scenario_id: str,
+    start_date: date,
+    end_date: date,
+    initial_amount: float,
+    allocations: List[Dict],
+    return_matrix: np.ndarray,
+    trade_dates: List[date],
+    rebalancing_rule: Optional[Dict] = None
+) -> Dict:
+    """
+    적재된 구성비 / 수익률 행렬로 시나리오 시뮬레이션 (DB 조회 없음)
+
+    Args:
+        return_matrix: 거래일 × 종목 일간수익률 (열 순서 = allocations 순서)
+        (그 외 run_scenario_simulation 과 동일)
 
+    Returns:
+        run_scenario_simulation 과 동일한 결과 dict
+    """
     # 4. 리밸런싱 처리 (Phase 2)
     rebalancing_enabled = False
     rebalancing_events = []
@@ -474,32 +492,18 @@ def run_scenario_simulation(
     if settings.use_rebalancing and rebalancing_rule:
         # USE_REBALANCING=1 이고 rule이 있을 때만 리밸런싱 적용
         from app.services.rebalancing_engine import (
-            RebalancingConfig, calculate_nav_with_rebalancing
+            RebalancingConfig, simulate_rebalanced_series
         )
 
         config = RebalancingConfig.from_dict(rebalancing_rule)
         if config.is_enabled():
             rebalancing_enabled = True
-            nav_path, events = calculate_nav_with_rebalancing(
-                allocations, returns_by_instrument, trade_dates,
+            series, events, class_values = simulate_rebalanced_series(
+                allocations, return_matrix, trade_dates,
                 initial_amount, config
             )
-            rebalancing_events = [
-                {
-                    "event_date": e.event_date.isoformat(),
-                    "event_order": e.event_order,
-                    "trigger_type": e.trigger_type,
-                    "trigger_detail": e.trigger_detail,
-                    "before_weights": e.before_weights,
-                    "after_weights": e.after_weights,
-                    "turnover": round(e.turnover, 6),
-                    "cost_rate": e.cost_rate,
-                    "cost_factor": round(e.cost_factor, 8),
-                    "nav_before": round(e.nav_before, 4),
-                    "nav_after": round(e.nav_after, 4),
-                }
-                for e in events
-            ]
+            rebalancing_events = [_event_dict(e) for e in events]
+            resume = series.resume_state(class_values, len(events)) if len(series) else None
 
     elif rebalancing_rule and not settings.use_rebalancing:
         # USE_REBALANCING=0 인데 rule 파라미터가 왔으면 에러 (상세 설계 섹션 13)
@@ -510,13 +514,152 @@ def run_scenario_simulation(
 
     # 5. 리밸런싱 OFF 또는 미적용 시 기존 로직
     if not rebalancing_enabled:
-        nav_path = calculate_portfolio_nav(
-            allocations, returns_by_instrument, trade_dates, initial_amount
+        weights = np.array([a["weight"] for a in allocations], dtype=np.float64)
+        series = compute_portfolio_nav(
+            weights, return_matrix, trade_dates, initial_amount
+        )
+        resume = series.resume_state() if len(series) else None
+
+    # 6~7. 지표 계산 / 결과 조합
+    return _scenario_result(
+        scenario_id, start_date, end_date, initial_amount, allocations,
+        series.to_path(), rebalancing_enabled, rebalancing_events,
+        len(rebalancing_events), resume
+    )
+
+
+def extend_scenario_simulation(
+    db: Session,
+    base_result: Dict,
+    resume_state: Optional[Dict],
+    end_date: date,
+    rebalancing_rule: Optional[Dict] = None
+) -> Optional[Dict]:
+    """
+    캐시된 시나리오 결과를 end_date 까지 연장 (마지막 거래일 다음 날부터만 계산)
+
+    NAV / 고점 / 리밸런싱 자산군 평가금액은 resume_state 에서 이어받으므로
+    전체 재계산과 같은 경로가 되며, 일간수익률은 새 거래일 구간만 조회
+
+    Args:
+        db: DB 세션
+        base_result: 캐시된 결과 (path 포함, simulation_store 재구성 형식)
+        resume_state: 캐시된 실행의 NavResume dict
+        end_date: 새 종료일
+        rebalancing_rule: 원 요청과 같은 리밸런싱 규칙
+
+    Returns:
+        run_scenario_simulation 과 같은 형식 (rebalancing_events 는 resume_state 에 보관된
+        기존 이벤트 + 연장 구간 이벤트) — 이어 계산할 수 없으면 None
+    """
+    path = base_result.get("path") or []
+    if not resume_state or not path:
+        return None
+
+    resume = NavResume.from_dict(resume_state)
+    if path[-1]["path_date"] != resume.last_date or end_date <= resume.last_date:
+        return None
+
+    config = None
+    if rebalancing_rule:
+        if not settings.use_rebalancing:
+            return None
+        from app.services.rebalancing_engine import (
+            RebalancingConfig, simulate_rebalanced_series
         )
 
+        config = RebalancingConfig.from_dict(rebalancing_rule)
+        if not config.is_enabled():
+            config = None
+        elif not config.is_resumable():
+            return None
+    if (config is None) != (resume.class_values is None):
+        return None
+
+    # 리밸런싱 이벤트 목록은 기존 이벤트를 이어 붙임 (보관 이벤트가 없는 이전 run 은 재계산)
+    base_events = []
+    if config is not None:
+        base_events = resume_state.get("rebalancing_events")
+        if base_events is None or len(base_events) != resume.event_count:
+            return None
+
+    scenario_id = base_result["scenario_id"]
+    start_date = date.fromisoformat(str(base_result["start_date"])[:10])
+    initial_amount = base_result["initial_amount"]
+
+    allocations = get_portfolio_allocation(db, scenario_id, start_date)
+    if not allocations:
+        return None
+
+    # 새 거래일 구간만 조회 / 계산
+    first_new_date = resume.last_date + timedelta(days=1)
+    trade_dates = get_trade_dates(db, first_new_date, end_date)
+    instrument_ids = [a["instrument_id"] for a in allocations]
+    returns_by_instrument = get_daily_returns(db, instrument_ids, first_new_date, end_date)
+    return_matrix = build_return_matrix(returns_by_instrument, instrument_ids, trade_dates)
+
+    new_events = []
+    if not trade_dates:
+        new_path, next_resume = [], resume
+    elif config is None:
+        weights = np.array([a["weight"] for a in allocations], dtype=np.float64)
+        series = compute_portfolio_nav(weights, return_matrix, trade_dates, initial_amount, resume)
+        new_path, next_resume = series.to_path(), series.resume_state()
+    else:
+        series, events, class_values = simulate_rebalanced_series(
+            allocations, return_matrix, trade_dates, initial_amount, config, resume
+        )
+        new_events = [_event_dict(e) for e in events]
+        new_path = series.to_path()
+        next_resume = series.resume_state(class_values, resume.event_count + len(events))
+
+    return _scenario_result(
+        scenario_id, start_date, end_date, initial_amount, allocations,
+        list(path) + new_path, config is not None, list(base_events) + new_events,
+        next_resume.event_count, next_resume
+    )
+
+
+def _event_dict(e) -> Dict:
+    """RebalancingEvent → 결과 dict"""
+    return {
+        "event_date": e.event_date.isoformat(),
+        "event_order": e.event_order,
+        "trigger_type": e.trigger_type,
+        "trigger_detail": e.trigger_detail,
+        "before_weights": e.before_weights,
+        "after_weights": e.after_weights,
+        "turnover": round(e.turnover, 6),
+        "cost_rate": e.cost_rate,
+        "cost_factor": round(e.cost_factor, 8),
+        "nav_before": round(e.nav_before, 4),
+        "nav_after": round(e.nav_after, 4),
+    }
+
+
+def _scenario_result(
+    scenario_id: str,
+    start_date: date,
+    end_date: date,
+    initial_amount: float,
+    allocations: List[Dict],
+    nav_path: List[Dict],
+    rebalancing_enabled: bool,
+    rebalancing_events: List[Dict],
+    rebalancing_events_count: int,
+    resume: Optional[NavResume]
+) -> Dict:
+    """
+    NAV 경로 → 지표 계산 + 결과 dict
+    - resume_state: 다음 연장용 마지막 거래일 상태 (리밸런싱 시 지금까지의 이벤트 목록 포함)
+    """
     # 6. 지표 계산
     metrics = calculate_risk_metrics(nav_path, initial_amount)
 
+    resume_state = resume.to_dict() if resume is not None else None
+    if resume_state is not None and rebalancing_enabled:
+        resume_state["rebalancing_events"] = rebalancing_events
+
     # 7. 결과 조합
     result = {
         "scenario_id": scenario_id,
@@ -542,7 +685,8 @@ def run_scenario_simulation(
         "trading_days": metrics["trading_days"],
         # Phase 2 리밸런싱 정보
         "rebalancing_enabled": rebalancing_enabled,
-        "rebalancing_events_count": len(rebalancing_events),
+        "rebalancing_events_count": rebalancing_events_count,
+        "resume_state": resume_state,
     }
 
     # 리밸런싱 이벤트 상세 (활성화 시에만)
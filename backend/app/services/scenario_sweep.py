@@ -0,0 +1,246 @@
+# backend/app/services/scenario_sweep.py
+
+"""
+시나리오 × 리밸런싱 규칙 일괄 시뮬레이션 (파라미터 스윕)
+
+- 시나리오별 구성비 조회 후, 종목 합집합의 일간수익률을 1회 조회 → 공유 수익률 행렬
+- 조합별 평가는 공유 행렬의 열 부분집합으로 수행 (조합이 많으면 프로세스 병렬)
+- 조합별 결과는 단건 /backtest/scenario 와 같은 request_hash 로 simulation_store 에 저장
+  (이미 저장된 조합은 계산 전에 제외, 저장 결과 요약 사용)
+
+⚠️ 교육 목적: 과거 데이터 기반 시뮬레이션이며, 미래 수익을 보장하지 않습니다.
+"""
+
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from multiprocessing import get_context
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.services.nav_engine import build_return_matrix
+from app.services.scenario_simulation import (
+    get_daily_returns,
+    get_portfolio_allocation,
+    get_trade_dates,
+    scenario_cache_params,
+    simulate_scenario,
+)
+from app.services.simulation_store import (
+    generate_request_hash,
+    get_engine_version,
+    peek_simulation,
+    save_simulation_result,
+)
+
+logger = logging.getLogger(__name__)
+
+# 단건 시나리오 API 와 같은 캐시 네임스페이스
+REQUEST_TYPE = "scenario_simulation"
+
+# 워커 1개당 최소 조합 수 (프로세스 기동 비용 대비)
+MIN_COMBINATIONS_PER_WORKER = 8
+
+
+def resolve_workers(workers: Optional[int], combinations: int) -> int:
+    """워커 수 — 0/None 이면 설정값, 설정도 0이면 CPU 코어 수 (조합 수에 비례해 상한)"""
+    workers = workers or settings.scenario_sweep_workers
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    return max(1, min(workers, math.ceil(combinations / MIN_COMBINATIONS_PER_WORKER)))
+
+
+def evaluate_combinations(job: Dict) -> List[Dict]:
+    """
+    워커 실행 단위 — 공유 행렬로 조합별 시뮬레이션 (DB 접근 없음)
+    - job: {start_date, end_date, initial_amount, trade_dates, return_matrix,
+            columns: {scenario_id: [열 인덱스]}, allocations: {scenario_id: [...]},
+            combinations: [(index, scenario_id, rebalancing_rule)]}
+    - 반환: [{index, result | error}]
+    """
+    outputs = []
+    for index, scenario_id, rule in job["combinations"]:
+        try:
+            result = simulate_scenario(
+                scenario_id,
+                job["start_date"],
+                job["end_date"],
+                job["initial_amount"],
+                job["allocations"][scenario_id],
+                job["return_matrix"][:, job["columns"][scenario_id]],
+                job["trade_dates"],
+                rule,
+            )
+            outputs.append({"index": index, "result": result})
+        except Exception as e:
+            outputs.append({"index": index, "error": str(e)})
+    return outputs
+
+
+def _stored_summary(stored: Dict, rebalancing_rule: Optional[Dict]) -> Dict:
+    """저장 결과(peek_simulation) → 계산 결과와 같은 요약 키"""
+    from app.services.rebalancing_engine import RebalancingConfig
+
+    return {
+        "final_value": stored["final_value"],
+        "trading_days": stored["trading_days"],
+        "risk_metrics": stored["risk_metrics"],
+        "historical_observation": stored["historical_observation"],
+        "rebalancing_enabled": bool(rebalancing_rule) and RebalancingConfig.from_dict(rebalancing_rule).is_enabled(),
+        "rebalancing_events_count": stored["number_of_rebalances"],
+    }
+
+
+def run_scenario_sweep(
+    db: Session,
+    scenario_ids: Sequence[str],
+    rebalancing_rules: Sequence[Optional[Dict]],
+    start_date: date,
+    end_date: date,
+    initial_amount: float = 1000000.0,
+    user_id: Optional[int] = None,
+    workers: Optional[int] = None,
+    ttl_days: Optional[int] = 7,
+) -> Dict:
+    """
+    시나리오 N개 × 리밸런싱 규칙 M개 일괄 시뮬레이션
+
+    Args:
+        rebalancing_rules: run_scenario_simulation 의 rebalancing_rule 형식 (None = 리밸런싱 없음)
+        workers: 프로세스 수 (None/0 = 설정값, 1 = 현재 프로세스)
+
+    Returns:
+        {engine_version, trade_days, instruments (계산한 종목 수), workers (0 = 전부 저장 결과),
+         results: [{scenario_id, rebalancing_rule, request_hash, cache_hit, ...요약 | error}]}
+    """
+    scenario_ids = list(dict.fromkeys(scenario_ids))
+    rebalancing_rules = list(rebalancing_rules) or [None]
+
+    if any(rebalancing_rules) and not settings.use_rebalancing:
+        raise ValueError(
+            "리밸런싱 기능이 비활성화 상태입니다. "
+            "USE_REBALANCING=1로 설정하거나 rebalancing_rule 파라미터를 제거하세요."
+        )
+
+    trade_dates = get_trade_dates(db, start_date, end_date)
+    if not trade_dates:
+        raise ValueError(f"기간 {start_date} ~ {end_date}의 거래일 데이터가 없습니다.")
+
+    # 1. 조합 구성 — 저장된 조합은 계산에서 제외 (구성비 없는 시나리오는 오류로 기록)
+    allocations = {sid: get_portfolio_allocation(db, sid, start_date) for sid in scenario_ids}
+    combinations = [
+        (sid, rule) for sid in scenario_ids for rule in rebalancing_rules
+    ]
+    cache_params = [
+        scenario_cache_params(sid, start_date, end_date, initial_amount, rule)
+        for sid, rule in combinations
+    ]
+    request_hashes = [generate_request_hash(REQUEST_TYPE, params) for params in cache_params]
+
+    outputs: Dict[int, Dict] = {}
+    pending = []
+    for index, (sid, rule) in enumerate(combinations):
+        if not allocations[sid]:
+            outputs[index] = {"index": index, "error": f"시나리오 '{sid}'의 포트폴리오 구성비가 없습니다."}
+            continue
+        stored = peek_simulation(db, request_hashes[index])
+        if stored is not None:
+            outputs[index] = {"index": index, "result": _stored_summary(stored, rule), "cache_hit": True}
+        else:
+            pending.append((index, sid, rule))
+
+    # 2. 계산할 시나리오의 종목 합집합 수익률 1회 조회
+    pending_ids = {sid for _, sid, _ in pending}
+    instrument_ids = list(dict.fromkeys(
+        a["instrument_id"] for sid in scenario_ids if sid in pending_ids for a in allocations[sid]
+    ))
+    column_of = {inst_id: col for col, inst_id in enumerate(instrument_ids)}
+    columns = {
+        sid: [column_of[a["instrument_id"]] for a in allocations[sid]]
+        for sid in pending_ids
+    }
+    return_matrix = None
+    if pending:
+        returns_by_instrument = get_daily_returns(db, instrument_ids, start_date, end_date)
+        return_matrix = build_return_matrix(returns_by_instrument, instrument_ids, trade_dates)
+
+    # 3. 조합 평가 (라운드로빈 분할)
+    parts = resolve_workers(workers, len(pending)) if pending else 0
+    jobs = [
+        {
+            "start_date": start_date,
+            "end_date": end_date,
+            "initial_amount": initial_amount,
+            "trade_dates": trade_dates,
+            "return_matrix": return_matrix,
+            "columns": columns,
+            "allocations": allocations,
+            "combinations": pending[i::parts],
+        }
+        for i in range(parts)
+    ]
+    if parts <= 1:
+        evaluated = [evaluate_combinations(job) for job in jobs]
+    else:
+        # fork 시 부모의 커넥션 풀이 복제되므로 spawn 사용
+        with ProcessPoolExecutor(max_workers=parts, mp_context=get_context("spawn")) as pool:
+            evaluated = list(pool.map(evaluate_combinations, jobs))
+    for batch in evaluated:
+        for output in batch:
+            outputs[output["index"]] = output
+
+    # 4. 새로 계산한 조합 저장 + 요약
+    engine_version = get_engine_version()
+    results = []
+    for index, (sid, rule) in enumerate(combinations):
+        request_hash = request_hashes[index]
+        output = outputs[index]
+        entry = {"scenario_id": sid, "rebalancing_rule": rule, "request_hash": request_hash}
+
+        if "error" in output:
+            results.append({**entry, "error": output["error"]})
+            continue
+
+        result = output["result"]
+        cache_hit = output.get("cache_hit", False)
+        if not cache_hit:
+            try:
+                save_simulation_result(
+                    db=db,
+                    request_hash=request_hash,
+                    request_type=REQUEST_TYPE,
+                    request_params=cache_params[index],
+                    backtest_result=result,
+                    engine_version=engine_version,
+                    user_id=user_id,
+                    ttl_days=ttl_days,
+                )
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Failed to save sweep result {request_hash[:8]}...: {e}")
+
+        results.append({
+            **entry,
+            "cache_hit": cache_hit,
+            "final_value": result["final_value"],
+            "trading_days": result["trading_days"],
+            "risk_metrics": result["risk_metrics"],
+            "historical_observation": result["historical_observation"],
+            "rebalancing_enabled": result["rebalancing_enabled"],
+            "rebalancing_events_count": result["rebalancing_events_count"],
+        })
+
+    logger.info(
+        f"Scenario sweep - scenarios: {len(scenario_ids)}, rules: {len(rebalancing_rules)}, "
+        f"instruments: {len(instrument_ids)}, workers: {parts}"
+    )
+    return {
+        "engine_version": engine_version,
+        "trade_days": len(trade_dates),
+        "instruments": len(instrument_ids),
+        "workers": parts,
+        "results": results,
+    }
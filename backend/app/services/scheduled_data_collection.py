@@ -140,6 +140,8 @@ def _validate_after_collection(db, job_name: str, result_counts: dict = None) ->
             success = (result_counts or {}).get("success", 0)
             total = (result_counts or {}).get("total", 0)
             failed = (result_counts or {}).get("failed", 0)
+            if total == 0:
+                return "pass", {"message": "재계산 대상 없음", "success": 0, "total": 0}
             if success == 0:
                 return "fail", {"message": "갱신 0건", "success": success, "total": total}
             if total > 0 and (failed / total) > 0.3:
@@ -292,13 +294,40 @@ async def scheduled_incremental_load():
             task_name, success, failed, skipped,
         )
 
+        # 기술 지표 증분 상태 갱신 (새 봉만 반영, 기업 액션/백필 종목은 재계산)
+        indicator_stats = None
+        try:
+            from app.services.indicator_state import IndicatorStateService
+            indicator_stats = IndicatorStateService.refresh_all(db)
+        except Exception as e:
+            db.rollback()
+            logger.warning("[%s] 지표 상태 갱신 실패: %s", task_name, str(e)[:200])
+
+        # 거래일 캘린더 재적재 (신규 거래일 반영)
+        from app.services.trading_calendar import refresh_trading_calendars
+        refresh_trading_calendars(db)
+
+        # 인기 시뮬레이션 캐시 선계산 (새 데이터 기준, 첫 사용자 콜드 계산 방지)
+        prewarm_stats = None
+        try:
+            from app.services.simulation_prewarm import prewarm_popular_simulations
+            prewarm_stats = prewarm_popular_simulations(db)
+        except Exception as e:
+            db.rollback()
+            logger.warning("[%s] 시뮬레이션 선계산 실패: %s", task_name, str(e)[:200])
+
         # 정합성 검증
         v_status, v_detail = _validate_after_collection(db, task_name)
 
         # 이력 기록
         _log_collection_complete(
             db, log_id, success, failed, total,
-            detail={"skipped": skipped, "date": str(date.today())},
+            detail={
+                "skipped": skipped,
+                "date": str(date.today()),
+                "indicator_state": indicator_stats,
+                "simulation_prewarm": prewarm_stats,
+            },
             validation_status=v_status,
             validation_detail=v_detail,
         )
@@ -343,39 +372,31 @@ async def scheduled_compass_batch_compute():
     db = SessionLocal()
     log_id = _log_collection_start(db, task_name, JOB_LABELS[task_name])
     try:
+        from app.services.compass_batch import run_compass_batch
+        from app.services.compass_dirty import (
+            clear_compass_dirty,
+            requires_full_recompute,
+            select_dirty_tickers,
+        )
         from app.services.scoring_engine import ScoringEngine
         from app.models.securities import Stock
 
-        stocks = db.query(Stock).filter(Stock.is_active == True).all()
-        total = len(stocks)
+        universe = [row[0] for row in db.query(Stock.ticker).filter(Stock.is_active == True).all()]
 
-        logger.info("[%s] 시작 — %d종목", task_name, total)
+        # 엔진 버전 변경 시 전 종목, 평소에는 입력이 바뀐 종목만
+        started_at = kst_now()
+        full = requires_full_recompute(db)
+        tickers = universe if full else select_dirty_tickers(db, universe)
+        total = len(tickers)
 
-        success_count = 0
-        fail_count = 0
+        logger.info("[%s] 시작 — %d/%d종목 (%s)", task_name, total, len(universe), "full" if full else "dirty")
 
-        for stock in stocks:
-            try:
-                result = ScoringEngine.calculate_compass_score(db, stock.ticker)
-                if "error" not in result:
-                    stock.compass_score = result["compass_score"]
-                    stock.compass_grade = result["grade"]
-                    stock.compass_summary = result.get("summary", "")[:200]
-                    stock.compass_commentary = result.get("commentary", "")[:2000]
-                    cats = result.get("categories", {})
-                    stock.compass_financial_score = cats.get("financial", {}).get("score") if cats.get("financial") else None
-                    stock.compass_valuation_score = cats.get("valuation", {}).get("score") if cats.get("valuation") else None
-                    stock.compass_technical_score = cats.get("technical", {}).get("score") if cats.get("technical") else None
-                    stock.compass_risk_score = cats.get("risk", {}).get("score") if cats.get("risk") else None
-                    stock.compass_updated_at = kst_now()
-                    db.commit()
-                    success_count += 1
-                else:
-                    fail_count += 1
-            except Exception as e:
-                db.rollback()
-                fail_count += 1
-                logger.warning("[%s] %s 실패: %s", task_name, stock.ticker, str(e)[:100])
+        # 프로세스 병렬 계산 → compass_* 일괄 UPDATE
+        batch = run_compass_batch(db, tickers)
+        success_count = batch["success"]
+        fail_count = batch["failed"]
+        # 실패 종목은 표시를 남겨 다음 실행에서 재시도
+        clear_compass_dirty(db, batch["written"], started_at)
 
         logger.info("[%s] 완료 — success=%d, fail=%d / total=%d", task_name, success_count, fail_count, total)
 
@@ -388,7 +409,13 @@ async def scheduled_compass_batch_compute():
         # 이력 기록
         _log_collection_complete(
             db, log_id, success_count, fail_count, total,
-            detail={"date": str(date.today())},
+            detail={
+                "date": str(date.today()),
+                "mode": "full" if full else "dirty",
+                "engine_version": ScoringEngine.ENGINE_VERSION,
+                "universe": len(universe),
+                "workers": batch["workers"],
+            },
             validation_status=v_status,
             validation_detail=v_detail,
         )
@@ -18,6 +18,7 @@ import logging
 from app.services.financial_analyzer import FinancialAnalyzer
 from app.services.valuation import ValuationAnalyzer
 from app.services.quant_analyzer import QuantAnalyzer
+from app.services.price_matrix import PriceMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,9 @@ GRADE_TABLE = [
 class ScoringEngine:
     """Foresto Compass Score — 종합 투자 학습 점수 (0-100)"""
 
+    # 채점 로직/가중치 변경 시 올림 → 다음 일괄 계산이 전 종목 재계산
+    ENGINE_VERSION = "1"
+
     WEIGHTS = {
         "financial": 0.30,
         "valuation": 0.20,
@@ -51,8 +55,17 @@ class ScoringEngine:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def calculate_compass_score(db: Session, ticker: str) -> Dict:
-        """메인 진입점 — 4개 카테고리 점수를 집계하여 종합 점수 반환"""
+    def calculate_compass_score(
+        db: Session,
+        ticker: str,
+        price_matrix: Optional[PriceMatrix] = None,
+        market_prices: Optional[List] = None,
+        indicator_states: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        메인 진입점 — 4개 카테고리 점수를 집계하여 종합 점수 반환
+        - price_matrix / market_prices / indicator_states: 일괄 계산 시 미리 적재한 입력 (종목별 재조회 생략)
+        """
         try:
             # ── 1. 3개 분석기 호출 ──
             financial_result = None
@@ -72,7 +85,10 @@ class ScoringEngine:
                 logger.warning(f"Valuation analysis failed for {ticker}: {e}")
 
             try:
-                quant_result = QuantAnalyzer.comprehensive_quant_analysis(db, ticker)
+                quant_result = QuantAnalyzer.comprehensive_quant_analysis(
+                    db, ticker, matrix=price_matrix, market_prices=market_prices,
+                    indicator_states=indicator_states,
+                )
                 if "error" in quant_result:
                     quant_result = None
             except Exception as e:
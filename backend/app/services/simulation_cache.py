@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.models.portfolio import SimulationCache
 from app.config import settings
+from app.services.simulation_memory import flush_memory_hits, memory_key, simulation_memory
 
 logger = logging.getLogger(__name__)
 
@@ -86,9 +87,11 @@ def get_cached_result(
             logger.info(f"Cache expired for hash {request_hash[:8]}...")
             db.delete(cache_entry)
             db.commit()
+            simulation_memory.invalidate(request_hash)
             return None
 
-        # 히트 카운트 증가 및 접근 시간 갱신
+        # 히트 카운트 증가 (버퍼된 메모리 적중 포함) 및 접근 시간 갱신
+        flush_memory_hits(db)
         cache_entry.hit_count += 1
         cache_entry.last_accessed_at = datetime.utcnow()
         db.commit()
@@ -124,6 +127,9 @@ def save_to_cache(
     Returns:
         생성된 캐시 엔트리
     """
+    # 버퍼된 메모리 적중 수를 이번 커밋에 함께 반영
+    flush_memory_hits(db)
+
     expires_at = None
     if ttl_days:
         expires_at = datetime.utcnow() + timedelta(days=ttl_days)
@@ -155,6 +161,10 @@ def get_or_compute(
     """
     캐시에서 결과를 조회하거나, 없으면 계산 후 캐시에 저장
 
+    조회 순서: 프로세스 캐시(simulation_memory) → SimulationCache → 계산
+    (프로세스 캐시는 SimulationCache 적중 결과로 채움)
+    같은 request_hash 의 동시 미스 요청은 1건만 조회 / 계산하고 나머지는 결과를 공유 (cache_hit=True)
+
     Args:
         db: DB 세션
         request_type: 요청 유형
@@ -167,24 +177,35 @@ def get_or_compute(
     """
     request_hash = generate_request_hash(request_type, request_params)
     current_engine_version = get_engine_version()
+    key = memory_key(db, "simulation_cache", request_hash)
+
+    hit = simulation_memory.get(key)
+    if hit is not None:
+        result, engine_version = hit
+        return result, request_hash, True, engine_version
+
+    def load_or_compute() -> tuple[Dict[str, Any], bool, str]:
+        # 캐시 조회
+        cached = get_cached_result(db, request_hash)
+        if cached is not None:
+            cached_result, cached_engine_version = cached
+            simulation_memory.put(key, cached_result, cached_engine_version)
+            return cached_result, True, cached_engine_version
 
-    # 캐시 조회
-    cached = get_cached_result(db, request_hash)
-    if cached is not None:
-        cached_result, cached_engine_version = cached
-        return cached_result, request_hash, True, cached_engine_version
+        # 결과 계산
+        result = compute_fn()
 
-    # 결과 계산
-    result = compute_fn()
+        # 캐시에 저장
+        try:
+            save_to_cache(db, request_hash, request_type, request_params, result, current_engine_version, ttl_days)
+        except Exception as e:
+            # 중복 해시 등 예외 발생 시 로깅만 하고 진행
+            logger.warning(f"Failed to cache result: {e}")
 
-    # 캐시에 저장
-    try:
-        save_to_cache(db, request_hash, request_type, request_params, result, current_engine_version, ttl_days)
-    except Exception as e:
-        # 중복 해시 등 예외 발생 시 로깅만 하고 진행
-        logger.warning(f"Failed to cache result: {e}")
+        return result, False, current_engine_version
 
-    return result, request_hash, False, current_engine_version
+    (result, cache_hit, engine_version), coalesced = simulation_memory.run_once(key, load_or_compute)
+    return result, request_hash, cache_hit or coalesced, engine_version
 
 
 def cleanup_expired_cache(db: Session) -> int:
@@ -198,6 +219,7 @@ def cleanup_expired_cache(db: Session) -> int:
         SimulationCache.expires_at < datetime.utcnow()
     ).delete()
     db.commit()
+    simulation_memory.invalidate()
 
     if deleted > 0:
         logger.info(f"Cleaned up {deleted} expired cache entries")
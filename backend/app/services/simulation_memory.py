@@ -0,0 +1,241 @@
+# backend/app/services/simulation_memory.py
+
+"""
+시뮬레이션 결과 프로세스 내 캐시 (DB 캐시 앞단 1차 계층) + 요청 단일 실행(single-flight)
+
+- 키: (DB, 저장소, request_hash) — 저장소는 simulation_cache(JSON) / simulation_run(sim_*)
+- LRU 최대 항목 수 SIMULATION_MEMORY_CACHE_SIZE (0 이면 1차 계층 비활성, single-flight 는 유지)
+- 항목 유효기간: DB 만료 시각과 SIMULATION_MEMORY_TTL_SECONDS 중 이른 시각
+- 항목은 DB 캐시 적중 시 재구성한 결과만 저장 (적중 응답 형식을 DB 경로와 동일하게 유지)
+- 같은 키의 동시 미스 요청은 선행 요청 1건만 DB 조회 / 계산하고 나머지는 결과를 기다림 (coalesced)
+- 결과 dict 는 여러 요청이 공유하므로 수정 금지 (라우트는 사본으로 응답 구성)
+- 메모리 적중 / 합류 응답은 키별로 버퍼링했다가 다음 DB 쓰기 때 저장소 hit_count 에 반영 (flush_memory_hits)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+MemoryKey = Tuple[str, str, str]
+
+# 경로 키 (시나리오 path / 백테스트 daily_values)
+_PATH_KEYS = ("path", "daily_values")
+
+
+@dataclass
+class MemoryEntry:
+    """캐시 항목 — has_path=False 면 경로 대신 run_id 만 포함된 결과"""
+    result: Dict[str, Any]
+    engine_version: str
+    has_path: bool
+    deadline: float
+    expires_at: Optional[datetime] = None
+    run_id: Optional[int] = None
+
+
+@dataclass
+class _Flight:
+    """진행 중인 조회 / 계산 1건"""
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class SimulationMemoryCache:
+    """항목 수 상한 LRU + 키별 single-flight (스레드 안전)"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[MemoryKey, MemoryEntry]" = OrderedDict()
+        self._flights: Dict[MemoryKey, _Flight] = {}
+        # DB hit_count 에 아직 반영하지 않은 적중 수
+        self._pending_hits: Dict[MemoryKey, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: MemoryKey, need_path: bool = True) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        유효 항목이 있으면 (결과, engine_version)
+
+        need_path=False 이고 run_id 를 아는 경로 포함 항목이면 경로를 뺀 사본 + run_id 반환
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None or (need_path and not entry.has_path):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+
+        result = entry.result
+        if not need_path and entry.has_path and entry.run_id is not None:
+            result = {k: v for k, v in result.items() if k not in _PATH_KEYS}
+            result["run_id"] = entry.run_id
+        return result, entry.engine_version
+
+    def put(
+        self,
+        key: MemoryKey,
+        result: Dict[str, Any],
+        engine_version: str,
+        has_path: bool = True,
+        expires_at: Optional[datetime] = None,
+        run_id: Optional[int] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        entry = MemoryEntry(
+            result=result,
+            engine_version=engine_version,
+            has_path=has_path,
+            deadline=time.monotonic() + self.ttl_seconds,
+            expires_at=expires_at,
+            run_id=run_id,
+        )
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current.has_path and not has_path:
+                # 경로 포함 항목을 경로 없는 결과로 덮어쓰지 않음
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def run_once(self, key: MemoryKey, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        같은 키의 동시 호출 중 1건만 fn 실행
+
+        Returns:
+            (fn 결과, coalesced) — coalesced=True 면 다른 요청의 실행 결과를 받은 것
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+                self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            flight.value = fn()
+            return flight.value, False
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def invalidate(self, request_hash: Optional[str] = None) -> int:
+        """request_hash 항목 삭제 (None 이면 전체) → 삭제 항목 수"""
+        with self._lock:
+            if request_hash is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if key[2] == request_hash]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pending_hits.clear()
+
+    def take_hits(self, db_url: str) -> Dict[MemoryKey, int]:
+        """db_url 키의 버퍼된 적중 수를 꺼냄 (버퍼에서 제거)"""
+        with self._lock:
+            keys = [key for key in self._pending_hits if key[0] == db_url]
+            return {key: self._pending_hits.pop(key) for key in keys}
+
+    def restore_hits(self, hits: Dict[MemoryKey, int]) -> None:
+        """반영 실패한 적중 수를 버퍼에 되돌림"""
+        with self._lock:
+            for key, count in hits.items():
+                self._pending_hits[key] = self._pending_hits.get(key, 0) + count
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "in_flight": len(self._flights),
+                "pending_hits": sum(self._pending_hits.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+            }
+
+    def _expired(self, entry: MemoryEntry) -> bool:
+        if time.monotonic() >= entry.deadline:
+            return True
+        return entry.expires_at is not None and entry.expires_at < datetime.utcnow()
+
+
+simulation_memory = SimulationMemoryCache(
+    settings.simulation_memory_cache_size,
+    settings.simulation_memory_ttl_seconds,
+)
+
+
+def memory_key(db: Session, store: str, request_hash: str) -> MemoryKey:
+    return str(db.get_bind().url), store, request_hash
+
+
+def flush_memory_hits(db: Session) -> int:
+    """
+    버퍼된 메모리 계층 적중 수를 저장소 hit_count 에 더함 → 반영한 적중 수
+    - 커밋은 호출 측 (다음 DB 쓰기와 같은 트랜잭션), 세션에 로드된 행은 갱신 값으로 동기화
+    """
+    from app.models.portfolio import SimulationCache
+    from app.models.simulation import SimulationRun
+
+    models = {"simulation_run": SimulationRun, "simulation_cache": SimulationCache}
+    hits = simulation_memory.take_hits(str(db.get_bind().url))
+    try:
+        for (_, store, request_hash), count in hits.items():
+            model = models[store]
+            db.query(model).filter(model.request_hash == request_hash).update(
+                {model.hit_count: func.coalesce(model.hit_count, 0) + count},
+                synchronize_session="fetch",
+            )
+    except Exception:
+        simulation_memory.restore_hits(hits)
+        raise
+    return sum(hits.values())
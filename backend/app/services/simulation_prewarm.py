@@ -0,0 +1,294 @@
+# backend/app/services/simulation_prewarm.py
+
+"""
+데이터 적재 직후 인기 시뮬레이션 캐시 선계산 (prewarm)
+
+- 대상: 활성 저장소(USE_SIM_STORE → SimulationRun, 아니면 SimulationCache)의 hit_count 상위 N개 요청
+- 요청 유형별 재실행:
+  - backtest_simple / backtest_portfolio: 기간이 실행 시점 기준이라 해시가 같아도 새 데이터로 재계산 후 교체
+    (적중 통계는 새 결과로 이어받음)
+  - scenario_simulation: 요청 당일까지를 종료일로 했던 파라미터는 종료일을 오늘로 옮겨 계산 (연장 모드),
+    과거 고정 기간은 캐시가 있으면 건너뜀
+- 요청별 별도 세션으로 스레드 풀 병렬 (SIMULATION_PREWARM_WORKERS)
+- 결과: 소요 시간, 대상 / 계산 / 교체 / 건너뜀 / 실패 수, 적중 수 기준 커버리지
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.portfolio import SimulationCache
+from app.models.simulation import SimulationRun
+from app.services.simulation_memory import flush_memory_hits, simulation_memory
+from app.services import simulation_cache, simulation_store
+from app.utils.kst_now import kst_now
+
+logger = logging.getLogger(__name__)
+
+# 실행 시점 기준 기간이라 매 적재 후 재계산이 필요한 요청 유형
+_ROLLING_TYPES = ("backtest_simple", "backtest_portfolio")
+
+
+@dataclass
+class PrewarmTarget:
+    """선계산 대상 요청"""
+    request_type: str
+    request_params: Dict[str, Any]
+    hit_count: int
+    created_at: Optional[datetime] = None
+
+
+def popular_requests(db: Session, limit: int) -> List[PrewarmTarget]:
+    """활성 저장소의 만료 전 요청 중 hit_count 상위 limit 개 (버퍼된 메모리 적중 반영 후)"""
+    if flush_memory_hits(db):
+        db.commit()
+    model = SimulationRun if settings.use_sim_store else SimulationCache
+    rows = db.query(
+        model.request_type, model.request_params, model.hit_count, model.created_at
+    ).filter(
+        model.request_type.in_(list(_REPLAYERS)),
+        model.request_params.isnot(None),
+        (model.expires_at.is_(None)) | (model.expires_at >= datetime.utcnow())
+    ).order_by(model.hit_count.desc(), model.created_at.desc()).limit(limit).all()
+
+    return [
+        PrewarmTarget(request_type, dict(params), hit_count or 0, created_at)
+        for request_type, params, hit_count, created_at in rows
+    ]
+
+
+def _total_hits(db: Session) -> int:
+    model = SimulationRun if settings.use_sim_store else SimulationCache
+    return db.query(func.coalesce(func.sum(model.hit_count), 0)).filter(
+        (model.expires_at.is_(None)) | (model.expires_at >= datetime.utcnow())
+    ).scalar() or 0
+
+
+def _stored(db: Session, model, request_hash: str):
+    """만료 전 저장 결과 (적중 통계를 올리지 않는 조회)"""
+    return db.query(model).filter(
+        model.request_hash == request_hash,
+        (model.expires_at.is_(None)) | (model.expires_at >= datetime.utcnow())
+    ).first()
+
+
+def replay_params(target: PrewarmTarget, today: date) -> Dict[str, Any]:
+    """재실행 파라미터 — 당일까지 요청했던 시나리오는 종료일을 today 로 이동"""
+    params = dict(target.request_params)
+    if target.request_type != "scenario_simulation" or target.created_at is None:
+        return params
+
+    end_date = params.get("end_date")
+    if isinstance(end_date, str) and end_date >= target.created_at.date().isoformat():
+        params["end_date"] = max(end_date, today.isoformat())
+    return params
+
+
+# ----------------------------------------------------------------------------
+# 요청 유형별 계산 (routes/backtesting 의 compute 함수와 같은 입력)
+# ----------------------------------------------------------------------------
+
+def _scenario(db: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+    from app.services.scenario_simulation import (
+        run_scenario_simulation,
+        run_scenario_simulation_fallback,
+    )
+
+    start_date = date.fromisoformat(params["start_date"])
+    end_date = date.fromisoformat(params["end_date"])
+    if settings.use_scenario_db:
+        try:
+            return run_scenario_simulation(
+                db=db,
+                scenario_id=params["scenario_id"],
+                start_date=start_date,
+                end_date=end_date,
+                initial_amount=params["initial_amount"],
+                rebalancing_rule=params.get("rebalancing_rule"),
+            )
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"DB 시뮬레이션 실패, 폴백 사용: {e}")
+    return run_scenario_simulation_fallback(
+        scenario_id=params["scenario_id"],
+        start_date=start_date,
+        end_date=end_date,
+        initial_amount=params["initial_amount"],
+    )
+
+
+def _backtest_simple(db: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+    from app.services.backtesting import run_simple_backtest
+
+    return run_simple_backtest(
+        investment_type=params["investment_type"],
+        investment_amount=params["investment_amount"],
+        period_years=params["period_years"],
+        db=db,
+    )
+
+
+def _backtest_portfolio(db: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+    from app.services.backtesting import BacktestingEngine
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=params["period_years"] * 365)
+    return BacktestingEngine(db).run_backtest(
+        portfolio=params["portfolio"],
+        start_date=start_date,
+        end_date=end_date,
+        initial_investment=params["investment_amount"],
+        rebalance_frequency=params["rebalance_frequency"],
+    )
+
+
+_REPLAYERS: Dict[str, Callable[[Session, Dict[str, Any]], Dict[str, Any]]] = {
+    "scenario_simulation": _scenario,
+    "backtest_simple": _backtest_simple,
+    "backtest_portfolio": _backtest_portfolio,
+}
+
+
+# ----------------------------------------------------------------------------
+# 실행
+# ----------------------------------------------------------------------------
+
+def _extend_fn(db: Session, params: Dict[str, Any]):
+    from app.services.scenario_simulation import extend_scenario_simulation
+
+    end_date = date.fromisoformat(params["end_date"])
+
+    def extend(base_result, resume_state):
+        if not settings.use_scenario_db:
+            return None
+        return extend_scenario_simulation(
+            db, base_result, resume_state, end_date, params.get("rebalancing_rule")
+        )
+    return extend
+
+
+def _warm_sim_store(db: Session, request_type: str, params: Dict[str, Any], refresh: bool) -> str:
+    compute = partial(_REPLAYERS[request_type], db, params)
+    scenario_id = params.get("scenario_id") if request_type == "scenario_simulation" else None
+    request_hash = simulation_store.generate_request_hash(request_type, params)
+    old = _stored(db, SimulationRun, request_hash)
+
+    if old is None:
+        simulation_store.get_or_compute_simulation(
+            db, request_type, params, compute, scenario_id=scenario_id, include_path=False,
+            extend_fn=_extend_fn(db, params) if request_type == "scenario_simulation" else None,
+        )
+        return "warmed"
+    if not refresh:
+        return "skipped"
+
+    # 계산 후 기존 결과와 한 트랜잭션으로 교체 (적중 통계 유지)
+    result = compute()
+    hits = old.hit_count
+    db.delete(old)
+    db.flush()
+    run = simulation_store.save_simulation_result(
+        db, request_hash, request_type, params, result,
+        simulation_store.get_engine_version(), scenario_id=scenario_id
+    )
+    run.hit_count = hits
+    db.commit()
+    simulation_memory.invalidate(request_hash)
+    return "refreshed"
+
+
+def _warm_json_store(db: Session, request_type: str, params: Dict[str, Any], refresh: bool) -> str:
+    compute = partial(_REPLAYERS[request_type], db, params)
+    request_hash = simulation_cache.generate_request_hash(request_type, params)
+    old = _stored(db, SimulationCache, request_hash)
+
+    if old is None:
+        simulation_cache.get_or_compute(db, request_type, params, compute)
+        return "warmed"
+    if not refresh:
+        return "skipped"
+
+    result = compute()
+    hits = old.hit_count
+    db.delete(old)
+    db.flush()
+    entry = simulation_cache.save_to_cache(
+        db, request_hash, request_type, params, result, simulation_cache.get_engine_version()
+    )
+    entry.hit_count = hits
+    db.commit()
+    simulation_memory.invalidate(request_hash)
+    return "refreshed"
+
+
+def _warm_one(bind, request_type: str, params: Dict[str, Any]) -> str:
+    """요청 1건 선계산 (스레드별 세션) → warmed | refreshed | skipped | failed"""
+    session = Session(bind=bind)
+    try:
+        warm = _warm_sim_store if settings.use_sim_store else _warm_json_store
+        return warm(session, request_type, params, request_type in _ROLLING_TYPES)
+    except Exception as e:
+        session.rollback()
+        logger.warning(f"Prewarm failed ({request_type} {params}): {e}")
+        return "failed"
+    finally:
+        session.close()
+
+
+def prewarm_popular_simulations(
+    db: Session,
+    top_n: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    인기 요청 상위 top_n 개 선계산
+
+    Args:
+        top_n: 대상 수 (None = SIMULATION_PREWARM_TOP_N, 0 이면 실행 안 함)
+        workers: 스레드 수 (None = SIMULATION_PREWARM_WORKERS)
+
+    Returns:
+        {targets, warmed, refreshed, skipped, failed, coverage, duration_sec}
+        coverage: 대상 요청 적중 수 / 만료 전 전체 적중 수 (적중 기록이 없으면 None)
+    """
+    top_n = settings.simulation_prewarm_top_n if top_n is None else top_n
+    workers = workers or settings.simulation_prewarm_workers
+    started = time.monotonic()
+    stats = {"targets": 0, "warmed": 0, "refreshed": 0, "skipped": 0, "failed": 0}
+    if top_n <= 0:
+        return {**stats, "coverage": None, "duration_sec": 0.0}
+
+    targets = popular_requests(db, top_n)
+    total_hits = _total_hits(db)
+
+    # 종료일 이동 후 같은 요청이 되는 대상은 1회만
+    today = kst_now().date()
+    jobs: Dict[str, tuple] = {}
+    for target in targets:
+        params = replay_params(target, today)
+        key = f"{target.request_type}:{simulation_store.canonicalize_request(params)}"
+        jobs.setdefault(key, (target.request_type, params))
+    stats["targets"] = len(jobs)
+
+    bind = db.get_bind()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs) or 1))) as pool:
+        outcomes = list(pool.map(lambda job: _warm_one(bind, *job), jobs.values()))
+    for outcome in outcomes:
+        stats[outcome] += 1
+
+    covered = sum(target.hit_count for target in targets)
+    result = {
+        **stats,
+        "coverage": round(covered / total_hits, 4) if total_hits else None,
+        "duration_sec": round(time.monotonic() - started, 2),
+    }
+    logger.info(f"Simulation prewarm: {result}")
+    return result
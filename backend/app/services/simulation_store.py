@@ -8,17 +8,25 @@ sim_run/sim_path/sim_summary 구조로 결과를 저장하고 조회
 import hashlib
 import json
 import logging
+import math
+from collections import namedtuple
 from datetime import datetime, timedelta, date
 from decimal import Decimal
-from typing import Optional, Any, Dict, List, Tuple
+from typing import Optional, Any, Callable, Dict, Iterator, List, Tuple
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.simulation import SimulationRun, SimulationPath, SimulationSummary
 from app.config import settings
+from app.services.path_codec import PATH_COLUMNS, ColumnarPath, decode_path, encode_path
+from app.services.simulation_memory import flush_memory_hits, memory_key, simulation_memory
 
 logger = logging.getLogger(__name__)
 
+# 저장 형식과 무관한 경로 한 점 (SimulationPath 와 같은 속성명)
+PathPoint = namedtuple("PathPoint", ("path_date",) + PATH_COLUMNS)
+
 
 def get_engine_version() -> str:
     """현재 시뮬레이션 엔진 버전 반환"""
@@ -65,6 +73,19 @@ def generate_request_hash(request_type: str, request_data: Dict[str, Any]) -> st
     return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()
 
 
+def generate_series_hash(request_type: str, request_data: Dict[str, Any]) -> Optional[str]:
+    """
+    종료일(end_date)을 제외한 요청 해시 — 같은 조건으로 기간만 늘어난 요청 묶음 키
+
+    Returns:
+        end_date 가 없는 요청이면 None (연장 대상 아님)
+    """
+    if "end_date" not in request_data:
+        return None
+    base = {k: v for k, v in request_data.items() if k != "end_date"}
+    return generate_request_hash(f"{request_type}:series", base)
+
+
 def get_cached_simulation(
     db: Session,
     request_hash: str
@@ -92,6 +113,7 @@ def get_cached_simulation(
         logger.info(f"Cache expired for hash {request_hash[:8]}...")
         db.delete(run)  # cascade로 summary, paths도 삭제됨
         db.commit()
+        simulation_memory.invalidate(request_hash)
         return None
 
     # 요약 지표 조회
@@ -100,10 +122,54 @@ def get_cached_simulation(
         logger.warning(f"No summary found for run {run.run_id}")
         return None
 
-    logger.info(f"Cache HIT for hash {request_hash[:8]}... (engine: {run.engine_version})")
+    # 히트 카운트 증가 (버퍼된 메모리 적중 포함) 및 접근 시간 갱신
+    flush_memory_hits(db)
+    run.hit_count = (run.hit_count or 0) + 1
+    run.last_accessed_at = datetime.utcnow()
+    db.commit()
+
+    logger.info(f"Cache HIT for hash {request_hash[:8]}... (hits: {run.hit_count}, engine: {run.engine_version})")
     return run, summary
 
 
+def peek_simulation(db: Session, request_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    만료 전 저장 결과 (경로 제외, run_id 포함) — 적중 통계 / 접근 시각을 갱신하지 않는 조회
+    (일괄 계산에서 이미 저장된 조합을 건너뛸 때 사용)
+    """
+    run = db.query(SimulationRun).filter(
+        SimulationRun.request_hash == request_hash,
+        (SimulationRun.expires_at.is_(None)) | (SimulationRun.expires_at >= datetime.utcnow())
+    ).first()
+    if run is None or run.summary is None:
+        return None
+    return _reconstruct_result(db, run, run.summary, include_path=False)
+
+
+def find_extendable_run(
+    db: Session,
+    series_hash: str,
+    end_date: date,
+    engine_version: str
+) -> Optional[Tuple[SimulationRun, SimulationSummary]]:
+    """
+    연장 기준 run 조회 — 같은 조건(series_hash) / 엔진 버전, end_date 이전 종료, 이어 계산 상태 보유,
+    만료 전인 run 중 종료일이 가장 늦은 것
+    """
+    run = db.query(SimulationRun).filter(
+        SimulationRun.series_hash == series_hash,
+        SimulationRun.engine_version == engine_version,
+        SimulationRun.run_status == "COMPLETED",
+        SimulationRun.end_date < end_date,
+        SimulationRun.resume_state.isnot(None),
+        (SimulationRun.expires_at.is_(None)) | (SimulationRun.expires_at >= datetime.utcnow())
+    ).order_by(SimulationRun.end_date.desc()).first()
+
+    if run is None or run.summary is None:
+        return None
+    return run, run.summary
+
+
 def save_simulation_result(
     db: Session,
     request_hash: str,
@@ -136,6 +202,9 @@ def save_simulation_result(
     Returns:
         생성된 SimulationRun
     """
+    # 버퍼된 메모리 적중 수를 이번 커밋에 함께 반영
+    flush_memory_hits(db)
+
     expires_at = None
     if ttl_days:
         expires_at = datetime.utcnow() + timedelta(days=ttl_days)
@@ -150,6 +219,10 @@ def save_simulation_result(
     # 초기 투자금액 (두 가지 키 지원)
     initial_amount = backtest_result.get("initial_investment") or backtest_result.get("initial_amount", 0)
 
+    # 일별 경로 — 두 가지 형식 지원: daily_values (기존) 또는 path (시나리오 시뮬레이션)
+    points = _result_path_points(backtest_result, initial_amount)
+    columnar = bool(points) and settings.simulation_path_storage == "columnar"
+
     # 1. SimulationRun 생성
     run = SimulationRun(
         request_hash=request_hash,
@@ -160,9 +233,14 @@ def save_simulation_result(
         initial_amount=Decimal(str(initial_amount)),
         rebalance_freq=backtest_result.get("rebalance_frequency", "NONE").upper(),
         request_params=request_params,
+        request_type=request_type,
         engine_version=engine_version,
         run_status="COMPLETED",
-        expires_at=expires_at
+        expires_at=expires_at,
+        series_hash=generate_series_hash(request_type, request_params),
+        resume_state=backtest_result.get("resume_state"),
+        path_blob=_encode_points(points) if columnar else None,
+        path_points=len(points) if columnar else None
     )
     db.add(run)
     db.flush()  # run_id 확보
@@ -203,76 +281,156 @@ def save_simulation_result(
         # 기타
         final_value=_to_decimal(backtest_result.get("final_value")),
         trading_days=trading_days,
-        rebalance_count=backtest_result.get("number_of_rebalances", 0)
+        # 시나리오 결과는 rebalancing_events_count 키 사용
+        rebalance_count=backtest_result.get(
+            "number_of_rebalances", backtest_result.get("rebalancing_events_count", 0)
+        )
     )
     db.add(summary)
 
-    # 3. SimulationPath 생성 (일별 경로)
-    # 두 가지 형식 지원: daily_values (기존) 또는 path (시나리오 시뮬레이션)
+    # 3. SimulationPath 생성 (행 저장 형식)
+    if points and not columnar:
+        db.bulk_save_objects([
+            SimulationPath(
+                run_id=run.run_id,
+                path_date=p.path_date,
+                nav=Decimal(str(p.nav)),
+                daily_return=_to_decimal(p.daily_return),
+                cumulative_return=_to_decimal(p.cumulative_return),
+                drawdown=_to_decimal(p.drawdown),
+                high_water_mark=_to_decimal(p.high_water_mark)
+            )
+            for p in points
+        ])
+
+    db.commit()
+    db.refresh(run)
+
+    logger.info(f"Saved simulation run={run.run_id} hash={request_hash[:8]}... "
+                f"scenario={result_scenario_id} paths={len(points)}{' (columnar)' if columnar else ''} "
+                f"MDD={max_drawdown}% recovery={max_recovery_days}days")
+    return run
+
+
+def _result_path_points(backtest_result: Dict[str, Any], initial_amount: float) -> List[PathPoint]:
+    """시뮬레이션 결과의 path / daily_values → 경로 점 목록"""
     daily_values = backtest_result.get("daily_values", [])
     scenario_path = backtest_result.get("path", [])
 
-    paths = []
-
     if scenario_path:
         # 시나리오 시뮬레이션 형식 (path 키)
-        for p in scenario_path:
-            path_date = _parse_date(p.get("path_date"))
-            path = SimulationPath(
-                run_id=run.run_id,
-                path_date=path_date,
-                nav=Decimal(str(p.get("nav", 0))),
-                daily_return=_to_decimal(p.get("daily_return")),
-                cumulative_return=_to_decimal(p.get("cumulative_return")),
-                drawdown=_to_decimal(p.get("drawdown")),
-                high_water_mark=_to_decimal(p.get("high_water_mark"))
+        return [
+            PathPoint(
+                path_date=_parse_date(p.get("path_date")),
+                nav=p.get("nav", 0),
+                daily_return=p.get("daily_return"),
+                cumulative_return=p.get("cumulative_return"),
+                drawdown=p.get("drawdown"),
+                high_water_mark=p.get("high_water_mark")
             )
-            paths.append(path)
+            for p in scenario_path
+        ]
 
-    elif daily_values:
-        # 기존 백테스트 형식 (daily_values 키)
-        high_water_mark = initial_amount
-        prev_value = initial_amount
+    # 기존 백테스트 형식 (daily_values 키)
+    points = []
+    high_water_mark = initial_amount
+    prev_value = initial_amount
+
+    for i, dv in enumerate(daily_values):
+        nav = dv.get("value", 0)
+
+        # 일간 수익률
+        daily_return = None
+        if i > 0 and prev_value > 0:
+            daily_return = (nav - prev_value) / prev_value
+
+        # 누적 수익률
+        cumulative_return = (nav - initial_amount) / initial_amount if initial_amount > 0 else 0
+
+        # 고점 및 낙폭
+        if nav > high_water_mark:
+            high_water_mark = nav
+        drawdown = (nav - high_water_mark) / high_water_mark if high_water_mark > 0 else 0
+
+        points.append(PathPoint(
+            path_date=_parse_date(dv.get("date")),
+            nav=nav,
+            daily_return=daily_return,
+            cumulative_return=cumulative_return,
+            drawdown=drawdown,
+            high_water_mark=high_water_mark
+        ))
+        prev_value = nav
+
+    return points
+
+
+def _encode_points(points: List[PathPoint]) -> bytes:
+    """경로 점 → path_blob"""
+    dates = [p.path_date for p in points]
+    columns = {
+        name: [None if v is None else float(v) for v in values]
+        for name, values in zip(PATH_COLUMNS, list(zip(*points))[1:])
+    }
+    return encode_path(dates, columns)
 
-        for i, dv in enumerate(daily_values):
-            nav = dv.get("value", 0)
-            path_date = _parse_date(dv.get("date"))
 
-            # 일간 수익률
-            daily_return = None
-            if i > 0 and prev_value > 0:
-                daily_return = (nav - prev_value) / prev_value
+def _columnar_points(path: ColumnarPath) -> List[PathPoint]:
+    """디코딩된 path_blob → 경로 점 목록 (NaN 은 None)"""
+    columns = [
+        [None if math.isnan(v) else v for v in path.columns[name].tolist()]
+        for name in PATH_COLUMNS
+    ]
+    return [PathPoint(d, *values) for d, *values in zip(path.dates, *columns)]
 
-            # 누적 수익률
-            cumulative_return = (nav - initial_amount) / initial_amount if initial_amount > 0 else 0
 
-            # 고점 및 낙폭
-            if nav > high_water_mark:
-                high_water_mark = nav
-            drawdown = (nav - high_water_mark) / high_water_mark if high_water_mark > 0 else 0
+def load_simulation_path(
+    db: Session,
+    run: SimulationRun,
+    start: Optional[date] = None,
+    end: Optional[date] = None
+) -> List[Any]:
+    """
+    저장 형식(path_blob / simulation_path 행)과 무관하게 [start, end] 구간 경로 조회
 
-            path = SimulationPath(
-                run_id=run.run_id,
-                path_date=path_date,
-                nav=Decimal(str(nav)),
-                daily_return=_to_decimal(daily_return),
-                cumulative_return=_to_decimal(cumulative_return),
-                drawdown=_to_decimal(drawdown),
-                high_water_mark=Decimal(str(high_water_mark))
-            )
-            paths.append(path)
-            prev_value = nav
+    Returns:
+        일자 오름차순 PathPoint 또는 SimulationPath 목록 (속성명 동일)
+    """
+    if run.path_points is not None:
+        return _columnar_points(decode_path(run.path_blob, start, end))
 
-    if paths:
-        db.bulk_save_objects(paths)
+    query = db.query(SimulationPath).filter(SimulationPath.run_id == run.run_id)
+    if start is not None:
+        query = query.filter(SimulationPath.path_date >= start)
+    if end is not None:
+        query = query.filter(SimulationPath.path_date <= end)
+    return query.order_by(SimulationPath.path_date).all()
 
-    db.commit()
-    db.refresh(run)
 
-    logger.info(f"Saved simulation run={run.run_id} hash={request_hash[:8]}... "
-                f"scenario={result_scenario_id} paths={len(paths)} "
-                f"MDD={max_drawdown}% recovery={max_recovery_days}days")
-    return run
+def convert_path_to_columnar(db: Session, run: SimulationRun, delete_rows: bool = True) -> int:
+    """
+    simulation_path 행 → path_blob 변환 (커밋은 호출측)
+
+    Returns:
+        변환한 행 수 (이미 변환됐거나 행이 없으면 0)
+    """
+    if run.path_points is not None:
+        return 0
+
+    rows = load_simulation_path(db, run)
+    if not rows:
+        return 0
+
+    run.path_blob = _encode_points([
+        PathPoint(r.path_date, *(getattr(r, name) for name in PATH_COLUMNS))
+        for r in rows
+    ])
+    run.path_points = len(rows)
+    if delete_rows:
+        db.query(SimulationPath).filter(
+            SimulationPath.run_id == run.run_id
+        ).delete(synchronize_session=False)
+    return len(rows)
 
 
 def get_or_compute_simulation(
@@ -282,11 +440,17 @@ def get_or_compute_simulation(
     compute_fn: callable,
     scenario_id: Optional[str] = None,
     user_id: Optional[int] = None,
-    ttl_days: Optional[int] = 7
+    ttl_days: Optional[int] = 7,
+    include_path: bool = True,
+    extend_fn: Optional[Callable[[Dict[str, Any], Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]] = None
 ) -> Tuple[Dict[str, Any], str, bool, str]:
     """
     캐시에서 결과를 조회하거나, 없으면 계산 후 저장
 
+    조회 순서: 프로세스 캐시(simulation_memory) → SimulationRun → 연장(extend_fn) → 계산
+    - 프로세스 캐시는 SimulationRun 적중 시 재구성한 결과로 채움 (계산 직후 결과는 저장 안 함)
+    - 같은 request_hash 의 동시 미스 요청은 1건만 조회 / 계산하고 나머지는 결과를 공유 (cache_hit=True)
+
     Args:
         db: DB 세션
         request_type: 요청 유형
@@ -295,59 +459,128 @@ def get_or_compute_simulation(
         scenario_id: 시나리오 ID
         user_id: 사용자 ID
         ttl_days: 캐시 유효 기간
+        include_path: False 면 캐시 적중 시 경로를 읽지 않고 run_id 만 포함
+            (스트리밍 응답에서 iter_simulation_path 로 지연 조회)
+        extend_fn: 연장 모드 — (기준 결과, resume_state) → 결과 | None
+            종료일만 더 이른 캐시 run 이 있으면 전체 계산 대신 호출 (None 이면 compute_fn)
 
     Returns:
         (결과 데이터, request_hash, cache_hit 여부, engine_version) 튜플
     """
     request_hash = generate_request_hash(request_type, request_params)
     current_engine_version = get_engine_version()
+    key = memory_key(db, "simulation_run", request_hash)
+
+    hit = simulation_memory.get(key, need_path=include_path)
+    if hit is not None:
+        result, engine_version = hit
+        return result, request_hash, True, engine_version
+
+    def load_or_compute() -> Tuple[Dict[str, Any], bool, str]:
+        # 캐시 조회
+        cached = get_cached_simulation(db, request_hash)
+        if cached is not None:
+            run, summary = cached
+            # DB에서 결과를 재구성하여 반환
+            result = _reconstruct_result(db, run, summary, include_path=include_path)
+            simulation_memory.put(
+                key, result, run.engine_version, include_path, run.expires_at, run.run_id
+            )
+            return result, True, run.engine_version
 
-    # 캐시 조회
-    cached = get_cached_simulation(db, request_hash)
-    if cached is not None:
-        run, summary = cached
-        # DB에서 결과를 재구성하여 반환
-        result = _reconstruct_result(db, run, summary)
-        return result, request_hash, True, run.engine_version
+        # 결과 계산 (연장 가능하면 새 거래일만 계산)
+        result = None
+        if extend_fn is not None:
+            result = _extend_cached_simulation(
+                db, request_type, request_params, current_engine_version, extend_fn
+            )
+        if result is None:
+            result = compute_fn()
+
+        # sim_* 구조로 저장
+        try:
+            save_simulation_result(
+                db=db,
+                request_hash=request_hash,
+                request_type=request_type,
+                request_params=request_params,
+                backtest_result=result,
+                engine_version=current_engine_version,
+                scenario_id=scenario_id,
+                user_id=user_id,
+                ttl_days=ttl_days
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save simulation result: {e}")
+
+        return result, False, current_engine_version
+
+    (result, cache_hit, engine_version), coalesced = simulation_memory.run_once(key, load_or_compute)
+
+    if include_path and "run_id" in result:
+        # 경로 없이 조회한 요청에 합류한 경우 — 경로 포함 결과를 직접 조회
+        cached = get_cached_simulation(db, request_hash)
+        if cached is not None:
+            run, summary = cached
+            result = _reconstruct_result(db, run, summary)
+            simulation_memory.put(key, result, run.engine_version, True, run.expires_at, run.run_id)
+
+    return result, request_hash, cache_hit or coalesced, engine_version
+
+
+def _extend_cached_simulation(
+    db: Session,
+    request_type: str,
+    request_params: Dict[str, Any],
+    engine_version: str,
+    extend_fn: Callable[[Dict[str, Any], Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """종료일만 더 이른 캐시 run 을 기준으로 extend_fn 실행 (기준 run 이 없거나 실패하면 None)"""
+    series_hash = generate_series_hash(request_type, request_params)
+    end_date = _parse_date(request_params.get("end_date"))
+    if series_hash is None or end_date is None:
+        return None
 
-    # 결과 계산
-    result = compute_fn()
+    base = find_extendable_run(db, series_hash, end_date, engine_version)
+    if base is None:
+        return None
 
-    # sim_* 구조로 저장
+    run, summary = base
     try:
-        save_simulation_result(
-            db=db,
-            request_hash=request_hash,
-            request_type=request_type,
-            request_params=request_params,
-            backtest_result=result,
-            engine_version=current_engine_version,
-            scenario_id=scenario_id,
-            user_id=user_id,
-            ttl_days=ttl_days
-        )
+        result = extend_fn(_reconstruct_result(db, run, summary), run.resume_state)
     except Exception as e:
-        logger.warning(f"Failed to save simulation result: {e}")
+        db.rollback()
+        logger.warning(f"Failed to extend simulation run={run.run_id}: {e}")
+        return None
 
-    return result, request_hash, False, current_engine_version
+    if result is not None:
+        logger.info(f"Extended simulation run={run.run_id} {run.end_date} → {end_date}")
+    return result
 
 
 def _reconstruct_result(
     db: Session,
     run: SimulationRun,
-    summary: SimulationSummary
+    summary: SimulationSummary,
+    include_path: bool = True
 ) -> Dict[str, Any]:
     """
     DB에 저장된 결과를 API 응답 형식으로 재구성
 
     시나리오 시뮬레이션인 경우 path 형식으로,
     기존 백테스트인 경우 daily_values 형식으로 반환
+    include_path=False 면 경로 대신 run_id 포함
     """
 
     # 경로 데이터 조회
-    paths = db.query(SimulationPath).filter(
-        SimulationPath.run_id == run.run_id
-    ).order_by(SimulationPath.path_date).all()
+    if include_path:
+        paths = load_simulation_path(db, run)
+        path_count = len(paths)
+    else:
+        paths = []
+        path_count = summary.trading_days or run.path_points or db.query(
+            func.count(SimulationPath.path_date)
+        ).filter(SimulationPath.run_id == run.run_id).scalar()
 
     # 시나리오 시뮬레이션 여부 확인
     is_scenario_simulation = run.scenario_id is not None
@@ -361,7 +594,7 @@ def _reconstruct_result(
         "initial_investment": initial_amount,  # 레거시 키
         "initial_amount": initial_amount,  # 시나리오 시뮬레이션 키
         "final_value": float(summary.final_value) if summary.final_value else 0,
-        "trading_days": summary.trading_days or len(paths),
+        "trading_days": summary.trading_days or path_count,
         # B-1: 손실/회복 지표 (최상위)
         "risk_metrics": summary.to_risk_metrics(),
         # 과거 관측치
@@ -377,34 +610,108 @@ def _reconstruct_result(
     }
 
     if is_scenario_simulation:
-        # 시나리오 시뮬레이션: path 형식
         result["scenario_id"] = run.scenario_id
-        result["path"] = [
-            {
-                "path_date": p.path_date,
-                "nav": float(p.nav) if p.nav else 0,
-                "daily_return": float(p.daily_return) if p.daily_return else 0,
-                "cumulative_return": float(p.cumulative_return) if p.cumulative_return else 0,
-                "drawdown": float(p.drawdown) if p.drawdown else 0,
-                "high_water_mark": float(p.high_water_mark) if p.high_water_mark else 0
-            }
-            for p in paths
-        ]
         result["allocations"] = []  # 구성비는 별도 조회 필요
+
+    if not include_path:
+        result["run_id"] = run.run_id
+    elif is_scenario_simulation:
+        # 시나리오 시뮬레이션: path 형식
+        result["path"] = [_scenario_path_row(p) for p in paths]
     else:
         # 기존 백테스트: daily_values 형식
-        result["daily_values"] = [
-            {
-                "date": p.path_date.isoformat() if p.path_date else None,
-                "value": float(p.nav) if p.nav else 0,
-                "return": float(p.cumulative_return * 100) if p.cumulative_return else 0
-            }
-            for p in paths
-        ]
+        result["daily_values"] = [_daily_value_row(p) for p in paths]
 
     return result
 
 
+def _scenario_path_row(p: Any) -> Dict[str, Any]:
+    """경로 점 (SimulationPath / PathPoint) → 시나리오 path 항목"""
+    return {
+        "path_date": p.path_date,
+        "nav": float(p.nav) if p.nav else 0,
+        "daily_return": float(p.daily_return) if p.daily_return else 0,
+        "cumulative_return": float(p.cumulative_return) if p.cumulative_return else 0,
+        "drawdown": float(p.drawdown) if p.drawdown else 0,
+        "high_water_mark": float(p.high_water_mark) if p.high_water_mark else 0
+    }
+
+
+def _daily_value_row(p: Any) -> Dict[str, Any]:
+    """경로 점 (SimulationPath / PathPoint) → 백테스트 daily_values 항목"""
+    return {
+        "date": p.path_date.isoformat() if p.path_date else None,
+        "value": float(p.nav) if p.nav else 0,
+        "return": float(p.cumulative_return * 100) if p.cumulative_return else 0
+    }
+
+
+def iter_simulation_path(
+    db: Session,
+    run_id: int,
+    scenario: bool,
+    chunk_size: int = 500,
+    start: Optional[date] = None,
+    end: Optional[date] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    저장된 경로를 chunk_size 행 단위로 지연 조회 (스트리밍 응답용)
+
+    - 요청 세션과 같은 엔진의 별도 세션 사용 (응답 전송 중 요청 세션 종료와 무관)
+    - scenario=True 면 path 형식, False 면 daily_values 형식
+    - start / end 지정 시 해당 구간만 (path_blob 은 디코딩 후 일자 슬라이스)
+    """
+    to_row = _scenario_path_row if scenario else _daily_value_row
+    session = Session(bind=db.get_bind())
+    try:
+        run = session.get(SimulationRun, run_id)
+        if run is not None and run.path_points is not None:
+            points = load_simulation_path(session, run, start, end)
+            for i in range(0, len(points), chunk_size):
+                yield [to_row(p) for p in points[i:i + chunk_size]]
+            return
+
+        query = session.query(SimulationPath).filter(SimulationPath.run_id == run_id)
+        if start is not None:
+            query = query.filter(SimulationPath.path_date >= start)
+        if end is not None:
+            query = query.filter(SimulationPath.path_date <= end)
+        query = query.order_by(SimulationPath.path_date).yield_per(chunk_size)
+
+        chunk: List[Dict[str, Any]] = []
+        for p in query:
+            chunk.append(to_row(p))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        session.close()
+
+
+def summarize_simulation_path(db: Session, run_id: int) -> Dict[str, Any]:
+    """저장된 경로의 개수 / 첫·마지막 NAV 요약 (행 저장 형식은 경로 전체를 읽지 않음)"""
+    run = db.get(SimulationRun, run_id)
+    if run is not None and run.path_points is not None:
+        points = load_simulation_path(db, run)
+        first = points[0] if points else None
+        last = points[-1] if points else None
+        total = len(points)
+    else:
+        base = db.query(SimulationPath).filter(SimulationPath.run_id == run_id)
+        first = base.order_by(SimulationPath.path_date.asc()).first()
+        last = base.order_by(SimulationPath.path_date.desc()).first()
+        total = base.count()
+    return {
+        "total_points": total,
+        "first_date": first.path_date.isoformat() if first else None,
+        "last_date": last.path_date.isoformat() if last else None,
+        "first_nav": float(first.nav) if first and first.nav else None,
+        "last_nav": float(last.nav) if last and last.nav else None,
+    }
+
+
 def _parse_date(date_str: Any) -> Optional[date]:
     """날짜 문자열을 date 객체로 변환"""
     if date_str is None:
@@ -443,6 +750,7 @@ def cleanup_expired_simulations(db: Session) -> int:
         SimulationRun.expires_at < datetime.utcnow()
     ).delete()
     db.commit()
+    simulation_memory.invalidate()
 
     if deleted > 0:
         logger.info(f"Cleaned up {deleted} expired simulation runs")
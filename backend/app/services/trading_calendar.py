@@ -0,0 +1,216 @@
+# backend/app/services/trading_calendar.py
+
+"""
+프로세스 공용 거래일 캘린더
+
+- 원천 테이블(daily_return / stock_price_daily)의 거래일을 1회 적재해 메모리에 보관
+- 구간 / 직전·다음 거래일 / 월·분기 첫·마지막 거래일을 bisect 로 조회
+- 일별 적재 후 refresh_trading_calendars 로 재적재
+- 외부 배치(scripts/generate_daily_returns.py 등)가 적재한 거래일은
+  조회 구간이 캘린더 끝을 넘을 때 MAX(trade_date) 확인 후 재적재 (확인 주기 제한)
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 캘린더 원천 테이블 (trade_date 컬럼 보유)
+CALENDAR_SOURCES = ("daily_return", "stock_price_daily")
+DEFAULT_SOURCE = "daily_return"
+
+# 캘린더 끝 이후 구간 요청 시 원천 최신일 재확인 최소 간격 (초)
+STALE_CHECK_SECONDS = 300
+
+
+class TradingCalendar:
+    """정렬된 거래일 목록 + bisect 조회"""
+
+    def __init__(self, dates: Iterable[date]):
+        self.dates: List[date] = sorted(set(dates))
+        self.checked_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, day: date) -> bool:
+        i = bisect_left(self.dates, day)
+        return i < len(self.dates) and self.dates[i] == day
+
+    @property
+    def first(self) -> Optional[date]:
+        return self.dates[0] if self.dates else None
+
+    @property
+    def last(self) -> Optional[date]:
+        return self.dates[-1] if self.dates else None
+
+    def between(self, start: date, end: date) -> List[date]:
+        """start ~ end (양끝 포함) 거래일"""
+        return self.dates[bisect_left(self.dates, start):bisect_right(self.dates, end)]
+
+    def previous(self, day: date) -> Optional[date]:
+        """day 직전 거래일 (day 제외)"""
+        i = bisect_left(self.dates, day)
+        return self.dates[i - 1] if i > 0 else None
+
+    def next(self, day: date) -> Optional[date]:
+        """day 다음 거래일 (day 제외)"""
+        i = bisect_right(self.dates, day)
+        return self.dates[i] if i < len(self.dates) else None
+
+    def on_or_before(self, day: date) -> Optional[date]:
+        """day 이전 가장 최근 거래일 (day 포함)"""
+        i = bisect_right(self.dates, day)
+        return self.dates[i - 1] if i > 0 else None
+
+    # ------------------------------------------------------------------
+    # 월/분기 경계
+    # ------------------------------------------------------------------
+
+    def _first_in(self, start: date, end: date) -> Optional[date]:
+        i = bisect_left(self.dates, start)
+        return self.dates[i] if i < len(self.dates) and self.dates[i] < end else None
+
+    def _last_in(self, start: date, end: date) -> Optional[date]:
+        i = bisect_left(self.dates, end)
+        return self.dates[i - 1] if i > 0 and self.dates[i - 1] >= start else None
+
+    def month_first(self, day: date) -> Optional[date]:
+        """day 가 속한 월의 첫 거래일"""
+        return self._first_in(*_month_bounds(day))
+
+    def month_last(self, day: date) -> Optional[date]:
+        """day 가 속한 월의 마지막 거래일"""
+        return self._last_in(*_month_bounds(day))
+
+    def quarter_first(self, day: date) -> Optional[date]:
+        """day 가 속한 분기의 첫 거래일"""
+        return self._first_in(*_quarter_bounds(day))
+
+    def quarter_last(self, day: date) -> Optional[date]:
+        """day 가 속한 분기의 마지막 거래일"""
+        return self._last_in(*_quarter_bounds(day))
+
+    def is_month_start(self, day: date) -> bool:
+        return self.month_first(day) == day
+
+    def is_month_end(self, day: date) -> bool:
+        return self.month_last(day) == day
+
+    def is_quarter_start(self, day: date) -> bool:
+        return self.quarter_first(day) == day
+
+    def is_quarter_end(self, day: date) -> bool:
+        return self.quarter_last(day) == day
+
+
+def _month_bounds(day: date) -> Tuple[date, date]:
+    """[월 시작일, 다음 월 시작일)"""
+    start = date(day.year, day.month, 1)
+    end = date(day.year + 1, 1, 1) if day.month == 12 else date(day.year, day.month + 1, 1)
+    return start, end
+
+
+def _quarter_bounds(day: date) -> Tuple[date, date]:
+    """[분기 시작일, 다음 분기 시작일)"""
+    month = ((day.month - 1) // 3) * 3 + 1
+    start = date(day.year, month, 1)
+    end = date(day.year + 1, 1, 1) if month == 10 else date(day.year, month + 3, 1)
+    return start, end
+
+
+# ============================================================================
+# 프로세스 공용 레지스트리 (DB URL × 원천 테이블)
+# ============================================================================
+
+_calendars: Dict[Tuple[str, str], TradingCalendar] = {}
+_lock = threading.Lock()
+
+
+def _key(db: Session, source: str) -> Tuple[str, str]:
+    if source not in CALENDAR_SOURCES:
+        raise ValueError(f"지원하지 않는 캘린더 원천: {source}")
+    return str(db.get_bind().url), source
+
+
+def refresh_trading_calendar(db: Session, source: str = DEFAULT_SOURCE) -> TradingCalendar:
+    """원천 테이블에서 거래일 전체 재적재"""
+    key = _key(db, source)
+    rows = db.execute(text(f"SELECT DISTINCT trade_date FROM {source}")).fetchall()
+    calendar = TradingCalendar(row[0] for row in rows)
+    with _lock:
+        previous = _calendars.get(key)
+        _calendars[key] = calendar
+    logger.info("[trading_calendar] %s 적재 — %d일 (%s ~ %s)", source, len(calendar), calendar.first, calendar.last)
+
+    # 거래일이 늘면 해당 원천의 시계열 캐시 무효화 (외부 배치 적재분 반영)
+    if previous is not None and (len(previous), previous.last) != (len(calendar), calendar.last):
+        from app.services.returns_cache import invalidate_returns_cache
+        invalidate_returns_cache(source, db=db)
+    return calendar
+
+
+def get_trading_calendar(db: Session, source: str = DEFAULT_SOURCE) -> TradingCalendar:
+    """캐시된 캘린더 (미적재 시 적재)"""
+    calendar = _calendars.get(_key(db, source))
+    if calendar is None:
+        calendar = refresh_trading_calendar(db, source)
+    return calendar
+
+
+def refresh_trading_calendars(db: Session) -> None:
+    """일별 적재 후 호출 — 이 DB 에 대해 적재된 캘린더 전부 재적재"""
+    url = str(db.get_bind().url)
+    for loaded_url, source in list(_calendars):
+        if loaded_url != url:
+            continue
+        try:
+            refresh_trading_calendar(db, source)
+        except Exception as e:
+            db.rollback()
+            logger.warning("[trading_calendar] %s 재적재 실패: %s", source, e)
+
+
+def clear_trading_calendars() -> None:
+    """레지스트리 초기화 (테스트용)"""
+    with _lock:
+        _calendars.clear()
+
+
+def check_latest(db: Session, source: str = DEFAULT_SOURCE) -> TradingCalendar:
+    """
+    확인 주기(STALE_CHECK_SECONDS)가 지났으면 원천 MAX(trade_date) 확인 후 필요 시 재적재
+    - 다른 프로세스/외부 배치가 적재한 신규 거래일 반영용
+    """
+    calendar = get_trading_calendar(db, source)
+    if time.monotonic() - calendar.checked_at >= STALE_CHECK_SECONDS:
+        latest = db.execute(text(f"SELECT MAX(trade_date) FROM {source}")).scalar()
+        if latest != calendar.last:
+            calendar = refresh_trading_calendar(db, source)
+        else:
+            calendar.checked_at = time.monotonic()
+    return calendar
+
+
+def trade_dates_between(
+    db: Session,
+    start: date,
+    end: date,
+    source: str = DEFAULT_SOURCE,
+) -> List[date]:
+    """
+    start ~ end 거래일 (캘린더 기반, DISTINCT 스캔 없음)
+    - 요청 구간이 캘린더 끝 이후까지면 원천 최신일을 확인해 필요 시 재적재
+    """
+    calendar = get_trading_calendar(db, source)
+    if calendar.last is None or end > calendar.last:
+        calendar = check_latest(db, source)
+    return calendar.between(start, end)
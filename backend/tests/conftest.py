@@ -132,6 +132,14 @@ def db(setup_tables):
                 conn.commit()
         _seed_reference_data()
 
+        # 데이터 정리에 맞춰 프로세스 캐시 초기화
+        from app.services.returns_cache import returns_cache
+        from app.services.simulation_memory import simulation_memory
+        from app.services.trading_calendar import clear_trading_calendars
+        returns_cache.clear()
+        simulation_memory.clear()
+        clear_trading_calendars()
+
 
 @pytest.fixture(scope="function")
 def client(db):
@@ -139,3 +139,42 @@ def test_phase7_evaluation_missing_portfolio(client, auth_headers):
         headers=auth_headers,
     )
     assert response.status_code == 404
+
+
+def test_phase7_sector_evaluation_averages_active_members(db, test_user):
+    from app.models.securities import Stock
+    from app.services.phase7_evaluation import evaluate_phase7_portfolio
+
+    for ticker, active in (("000011", True), ("000012", True), ("000013", False)):
+        db.add(Stock(ticker=ticker, name=ticker, sector="테스트섹터", is_active=active))
+        _seed_timeseries(db, ticker)
+    # 비활성 종목 시세는 평균에서 제외
+    db.query(StockPriceDaily).filter(StockPriceDaily.ticker == "000013").update(
+        {StockPriceDaily.close_price: Decimal("500.00")}
+    )
+    db.commit()
+
+    portfolio = Phase7Portfolio(
+        owner_user_id=test_user.id,
+        portfolio_type="SECTOR",
+        portfolio_name="섹터 포트폴리오",
+    )
+    db.add(portfolio)
+    db.flush()
+    db.add(
+        Phase7PortfolioItem(
+            portfolio_id=portfolio.portfolio_id,
+            item_key="테스트섹터",
+            item_name="테스트섹터",
+            weight=1.0,
+        )
+    )
+    db.commit()
+    db.refresh(portfolio)
+
+    result = evaluate_phase7_portfolio(
+        db, portfolio, date(2024, 1, 2), date(2024, 1, 4), "NONE"
+    )
+    assert result["period"] == {"start": "2024-01-02", "end": "2024-01-04"}
+    assert result["metrics"]["cumulative_return"] == round(103 / 101 - 1, 6)
+    assert result["extensions"]["contributions"][0]["value"] == round(103 / 101 - 1, 6)
@@ -403,3 +403,54 @@ class TestCachingBehavior:
         )
         assert response.status_code == 200
         assert response.json()["engine_version"] == "2.1.0"
+
+
+class TestBacktestStreaming:
+    """format=ndjson 스트리밍 응답"""
+
+    @patch("app.routes.backtesting.get_or_compute")
+    def test_backtest_run_ndjson(
+        self, mock_get_or_compute, client: TestClient, auth_headers: dict
+    ):
+        """요약 헤더 → daily_values 청크 → 종료 행"""
+        import json
+
+        daily_values = [
+            {"date": f"2024-01-{i % 28 + 1:02d}", "value": 10000000 + i, "return": 0.0}
+            for i in range(1200)
+        ]
+        mock_get_or_compute.return_value = (
+            {**MOCK_BACKTEST_RESULT, "daily_values": daily_values},
+            "c" * 64,
+            False,
+            "1.0.0"
+        )
+
+        response = client.post(
+            "/backtest/run?format=ndjson",
+            json={
+                "investment_type": "moderate",
+                "investment_amount": 10000000,
+                "period_years": 1
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        header, chunks, end = records[0], records[1:-1], records[-1]
+        assert header["type"] == "summary"
+        assert header["request_hash"] == "c" * 64
+        assert "daily_values" not in header["data"]
+        assert header["data"]["risk_metrics"]["max_drawdown"] == 8.5
+        assert [r for c in chunks for r in c["rows"]] == daily_values
+        assert end == {"type": "end", "total_points": 1200}
+
+    def test_invalid_format_returns_422(self, client: TestClient, auth_headers: dict):
+        response = client.post(
+            "/backtest/run?format=xml",
+            json={"investment_type": "moderate", "investment_amount": 10000000},
+            headers=auth_headers
+        )
+        assert response.status_code == 422
@@ -6,13 +6,20 @@ BacktestingEngine 단위 테스트
 - _should_rebalance 각 주기별
 - _calculate_metrics 수익률/변동성/샤프/MDD 정확성
 - _initialize_portfolio 구조 파싱
+- 거래일 캘린더 순회 / as-of 가격 조회 / 배열 평가
+- 보유 종목 시세가 늦게 시작하는 기간의 캘린더 (stock_price_daily 기준)
 """
 import pytest
 import math
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from unittest.mock import MagicMock
 
+import numpy as np
+
+from app.models.real_data import StockPriceDaily
 from app.services.backtesting import BacktestingEngine
+from app.services.price_matrix import PriceMatrix
 
 
 # ============================================================================
@@ -263,3 +270,199 @@ class TestCalculateMetrics:
         metrics = engine._calculate_metrics(daily_values, 100, 1)
         assert metrics["total_return"] == 0.0
         assert metrics["volatility"] == 0.0
+
+
+# ============================================================================
+# 거래일 캘린더 순회 / as-of 조회
+# ============================================================================
+
+def _weekday_matrix(tickers, start, end, seed=0):
+    """평일 종가만 있는 가격 행렬 (일부 결측 포함)"""
+    rng = np.random.default_rng(seed)
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    days = [d for d in days if d.weekday() < 5]
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, (len(days), len(tickers))), axis=0)
+    close[rng.random(close.shape) < 0.05] = np.nan
+    values = np.repeat(close[:, :, None], 5, axis=2)
+    return PriceMatrix(days, list(tickers), values)
+
+
+def _reference_daily_values(matrix, portfolio, start, end, initial, frequency):
+    """기존 달력일 순회 방식으로 matrix 거래일만 추출한 기준값"""
+    engine = BacktestingEngine(MagicMock(), price_matrix=matrix)
+    engine._backtest_start_date = start
+    holdings = engine._initialize_portfolio(portfolio, initial)
+    engine._preload_prices(holdings, start, end)
+    trading_days = set(matrix.dates)
+
+    values = []
+    current, last_rebalance = start, start
+    while current <= end:
+        value = engine._calculate_portfolio_value(holdings, current)
+        if current.date() in trading_days:
+            values.append((current.isoformat(), value))
+        if engine._should_rebalance(current, last_rebalance, frequency) and current.date() in trading_days:
+            holdings = engine._rebalance_portfolio(portfolio, value, current)
+            last_rebalance = current
+        current += timedelta(days=1)
+    return values
+
+
+@pytest.mark.unit
+class TestTradingDayIteration:
+    """거래일 캘린더 기반 시뮬레이션"""
+
+    @pytest.fixture
+    def portfolio(self):
+        return {
+            "stocks": [
+                {"ticker": f"{i:06d}", "shares": 10 + i, "current_price": 100}
+                for i in range(1, 21)
+            ],
+            "deposits": [
+                {"id": "dep_1", "invested_amount": 1_000_000, "interest_rate": 3.0},
+            ],
+        }
+
+    def test_iterates_trading_days_only(self, portfolio):
+        start, end = datetime(2024, 1, 1), datetime(2024, 6, 30)
+        tickers = [s["ticker"] for s in portfolio["stocks"]]
+        matrix = _weekday_matrix(tickers, start.date(), end.date())
+        engine = BacktestingEngine(MagicMock(), price_matrix=matrix)
+
+        result = engine.run_backtest(portfolio, start, end, 10_000_000, "monthly")
+
+        dates = [v["date"] for v in result["daily_values"]]
+        assert len(dates) == len(matrix.dates)
+        assert all(datetime.fromisoformat(d).weekday() < 5 for d in dates)
+
+        expected = _reference_daily_values(matrix, portfolio, start, end, 10_000_000, "monthly")
+        assert dates == [d for d, _ in expected]
+        np.testing.assert_allclose(
+            [v["value"] for v in result["daily_values"]], [v for _, v in expected], rtol=1e-12
+        )
+
+    def test_as_of_lookup_uses_previous_trading_day(self):
+        matrix = _weekday_matrix(["005930"], date(2024, 1, 1), date(2024, 1, 31))
+        engine = BacktestingEngine(MagicMock(), price_matrix=matrix)
+        engine._preload_prices(
+            {"s": {"type": "stock", "ticker": "005930"}}, datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+        dates, closes = matrix.ohlcv("005930")
+        friday = max(i for i, d in enumerate(dates) if d <= date(2024, 1, 14))
+
+        price = engine._get_historical_price("005930", "stock", datetime(2024, 1, 14), 1.0)
+        assert price == closes[friday, 3]
+
+    def test_no_price_data_uses_weekdays(self, engine):
+        portfolio = {"deposits": [{"id": "d", "invested_amount": 1_000_000, "interest_rate": 3.65}]}
+        result = engine.run_backtest(portfolio, datetime(2024, 1, 1), datetime(2024, 3, 31), 1_000_000, "none")
+
+        dates = [datetime.fromisoformat(v["date"]) for v in result["daily_values"]]
+        assert all(d.weekday() < 5 for d in dates)
+        last = result["daily_values"][-1]
+        assert last["value"] == pytest.approx(1_000_000 * (1 + 0.0001 * (dates[-1] - dates[0]).days))
+
+
+def _seed_daily_prices(db, ticker, start, end, close=10000):
+    """start ~ end 평일 종가를 stock_price_daily 에 저장"""
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            price = Decimal(close)
+            db.add(StockPriceDaily(
+                ticker=ticker, trade_date=day,
+                open_price=price, high_price=price, low_price=price, close_price=price,
+                volume=1000, source_id="PYKRX", as_of_date=day,
+            ))
+        day += timedelta(days=1)
+    db.commit()
+
+
+@pytest.mark.unit
+class TestPartialHistoryCalendar:
+    """보유 종목 시세가 기간 중간부터 있어도 기간 전체를 평가"""
+
+    def test_calendar_covers_full_span(self, db):
+        start, end = datetime(2023, 1, 2), datetime(2023, 12, 29)
+        # 시장 캘린더는 연중 전체, 보유 종목 시세는 11월부터
+        _seed_daily_prices(db, "000660", start.date(), end.date())
+        _seed_daily_prices(db, "005930", date(2023, 11, 1), end.date(), close=20000)
+        portfolio = {"stocks": [{"ticker": "005930", "shares": 10, "current_price": 20000}]}
+
+        result = BacktestingEngine(db).run_backtest(portfolio, start, end, 1_000_000, "none")
+
+        dates = [datetime.fromisoformat(v["date"]).date() for v in result["daily_values"]]
+        weekdays = [
+            start.date() + timedelta(days=i) for i in range((end - start).days + 1)
+            if (start.date() + timedelta(days=i)).weekday() < 5
+        ]
+        assert dates == weekdays
+        # 11월 이후는 실제 종가, 그 이전은 시뮬레이션 가격
+        by_date = {d: v["value"] for d, v in zip(dates, result["daily_values"])}
+        assert by_date[date(2023, 11, 1)] == pytest.approx(10 * 20000)
+        assert by_date[date(2023, 1, 2)] != pytest.approx(10 * 20000)
+
+
+@pytest.mark.unit
+class TestComparePortfolios:
+    """공유 프리로드 비교 실행"""
+
+    @pytest.fixture
+    def portfolios(self):
+        def make(name, tickers, deposit):
+            return {
+                "name": name,
+                "stocks": [{"ticker": t, "shares": 10, "current_price": 100} for t in tickers],
+                "etfs": [{"ticker": "999999", "shares": 5, "current_price": 50}],
+                "deposits": [{"id": "d", "invested_amount": deposit, "interest_rate": 2.5}],
+            }
+        return [
+            make("안정형", ["000001", "000002"], 5_000_000),
+            make("중립형", ["000002", "000003"], 2_000_000),
+            make("공격형", ["000003", "000004", "000005"], 0),
+        ]
+
+    def test_shared_preload_matches_sequential(self, portfolios, monkeypatch):
+        start, end = datetime(2023, 1, 1), datetime(2024, 12, 31)
+        matrix = _weekday_matrix(["000001", "000002", "000003", "000004", "000005"], start.date(), end.date())
+        calls = []
+
+        def fake_load(db, tickers, start=None, end=None, use_cache=False):
+            calls.append(sorted(tickers))
+            return matrix
+
+        monkeypatch.setattr("app.services.backtesting.load_price_matrix", fake_load)
+
+        sequential = BacktestingEngine(MagicMock()).compare_portfolios(
+            portfolios, start, end, 10_000_000, shared_preload=False
+        )
+        assert len(calls) == 3
+
+        calls.clear()
+        shared = BacktestingEngine(MagicMock()).compare_portfolios(portfolios, start, end, 10_000_000)
+        assert calls == [["000001", "000002", "000003", "000004", "000005", "999999"]]
+
+        assert shared == sequential
+        assert [r["portfolio_name"] for r in shared["comparison"]] == ["안정형", "중립형", "공격형"]
+
+    def test_shared_run_queries_calendar_once_on_caller_thread(self, portfolios, monkeypatch):
+        """세션은 스레드 안전하지 않음 — 거래일 캘린더는 호출 스레드에서 1회만 조회"""
+        import threading
+
+        start, end = datetime(2023, 1, 1), datetime(2023, 12, 31)
+        matrix = _weekday_matrix(["000001", "000002", "000003", "000004", "000005"], start.date(), end.date())
+        monkeypatch.setattr("app.services.backtesting.load_price_matrix", lambda *a, **k: matrix)
+
+        threads = []
+
+        def fake_trade_dates(db, start_d, end_d, source=None):
+            threads.append(threading.current_thread())
+            return [d for d in matrix.dates if start_d <= d <= end_d]
+
+        monkeypatch.setattr("app.services.backtesting.trade_dates_between", fake_trade_dates)
+
+        result = BacktestingEngine(MagicMock()).compare_portfolios(portfolios, start, end, 10_000_000)
+
+        assert threads == [threading.current_thread()]
+        assert len(result["comparison"]) == 3
@@ -0,0 +1,184 @@
+"""
+compass_batch 단위 테스트 — 파티션 분할 / 결과 매핑 / 일괄 반영
+"""
+import asyncio
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models.real_data import StockPriceDaily
+from app.models.securities import CompassDirty, Stock
+from app.services import scheduled_data_collection
+from app.services.compass_batch import (
+    compass_columns,
+    partition_tickers,
+    resolve_workers,
+    run_compass_batch,
+)
+from app.services.compass_dirty import mark_compass_dirty
+
+
+def _result(ticker, score):
+    return {
+        "ticker": ticker,
+        "compass_score": score,
+        "grade": "A",
+        "summary": "요약" * 200,
+        "commentary": "해설",
+        "categories": {
+            "financial": {"score": 70.0},
+            "valuation": None,
+            "technical": {"score": 65.5},
+            "risk": {"score": 80.0},
+        },
+    }
+
+
+@pytest.mark.unit
+class TestPartition:
+    def test_round_robin(self):
+        assert partition_tickers(["a", "b", "c", "d", "e"], 2) == [["a", "c", "e"], ["b", "d"]]
+
+    def test_parts_capped_by_tickers(self):
+        assert partition_tickers(["a", "b"], 8) == [["a"], ["b"]]
+
+
+@pytest.mark.unit
+class TestResolveWorkers:
+    def test_default_is_small_cap(self, monkeypatch):
+        monkeypatch.setattr(settings, "compass_batch_workers", 2)
+        assert resolve_workers() == 2
+        assert resolve_workers(0) == 2
+
+    def test_clamped_to_pool_size(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_pool_size", 3)
+        assert resolve_workers(16) == 3
+        monkeypatch.setattr(settings, "compass_batch_workers", 0)
+        assert resolve_workers() == 1
+
+
+@pytest.mark.unit
+class TestCompassColumns:
+    def test_maps_categories(self):
+        cols = compass_columns(_result("005930", 72.5))
+        assert cols["compass_score"] == 72.5
+        assert cols["compass_grade"] == "A"
+        assert len(cols["compass_summary"]) == 200
+        assert cols["compass_valuation_score"] is None
+        assert cols["compass_technical_score"] == 65.5
+
+
+@pytest.mark.unit
+class TestRunCompassBatch:
+    """단일 프로세스 모드 — 호출 세션으로 계산 후 일괄 UPDATE"""
+
+    def test_bulk_update(self, db):
+        for ticker in ("900001", "900002", "900003"):
+            db.add(Stock(ticker=ticker, name=f"테스트{ticker}", market="KOSPI", is_active=True))
+        db.commit()
+
+        def fake_score(_db, ticker, **kwargs):
+            assert "price_matrix" in kwargs
+            if ticker == "900002":
+                return {"error": "분석 가능한 데이터가 없습니다"}
+            return _result(ticker, 60.0)
+
+        with patch(
+            "app.services.compass_batch.ScoringEngine.calculate_compass_score",
+            side_effect=fake_score,
+        ):
+            done = []
+            stats = run_compass_batch(
+                db, ["900001", "900002", "900003"], workers=1, on_partition_done=done.append
+            )
+
+        assert stats["success"] == 2
+        assert stats["failed"] == 1
+        assert stats["total"] == 3
+        assert stats["workers"][0]["count"] == 3
+        assert stats["written"] == ["900001", "900003"]
+        assert done[0]["failed"] == [("900002", "분석 가능한 데이터가 없습니다")]
+
+        db.expire_all()
+        scored = db.query(Stock).filter(Stock.ticker == "900001").one()
+        assert scored.compass_score == 60.0
+        assert scored.compass_risk_score == 80.0
+        assert scored.compass_updated_at is not None
+        assert db.query(Stock).filter(Stock.ticker == "900002").one().compass_score is None
+
+    def test_scheduled_job_keeps_failed_dirty(self, db, monkeypatch):
+        """정기 일괄 계산 — 반영된 종목만 변경 표시 삭제, 실패 종목은 다음 실행에서 재시도"""
+        for ticker in ("900001", "900002"):
+            db.add(Stock(ticker=ticker, name=f"테스트{ticker}", market="KOSPI", is_active=True))
+        db.commit()
+        mark_compass_dirty(db, ["900001", "900002"], "prices")
+        db.commit()
+
+        monkeypatch.setattr(settings, "compass_batch_workers", 1)
+        monkeypatch.setattr(
+            scheduled_data_collection, "SessionLocal", sessionmaker(bind=db.get_bind())
+        )
+
+        def fake_score(_db, ticker, **kwargs):
+            if ticker == "900002":
+                raise RuntimeError("boom")
+            return _result(ticker, 60.0)
+
+        with patch(
+            "app.services.compass_batch.ScoringEngine.calculate_compass_score",
+            side_effect=fake_score,
+        ):
+            # with_retry 재시도 대기 없이 1회 실행
+            asyncio.run(scheduled_data_collection.scheduled_compass_batch_compute.__wrapped__())
+
+        db.expire_all()
+        assert [row.ticker for row in db.query(CompassDirty).all()] == ["900002"]
+        assert db.query(Stock).filter(Stock.ticker == "900001").one().compass_score == 60.0
+
+    def test_empty_universe(self, db):
+        assert run_compass_batch(db, [], workers=1) == {
+            "success": 0, "failed": 0, "total": 0, "workers": [], "written": [],
+        }
+
+
+def _seed_prices(db, ticker, days=300):
+    today = date.today()
+    for i in range(days):
+        td = today - timedelta(days=days - i)
+        close = Decimal(10000 + (i % 17) * 50 + i * 5)
+        db.add(StockPriceDaily(
+            ticker=ticker, trade_date=td,
+            open_price=close, high_price=close + 100, low_price=close - 100, close_price=close,
+            volume=100000 + i, source_id="PYKRX", as_of_date=td,
+        ))
+    db.commit()
+
+
+@pytest.mark.unit
+class TestRunCompassBatchMultiprocess:
+    """spawn 프로세스 풀 모드 — 워커가 자체 세션으로 테스트 DB 조회"""
+
+    def test_two_workers(self, db, monkeypatch):
+        # spawn 워커는 환경변수로 DB URL 을 다시 읽음
+        monkeypatch.setenv("DATABASE_URL", db.get_bind().url.render_as_string(hide_password=False))
+        for ticker in ("900011", "900012", "900013"):
+            db.add(Stock(ticker=ticker, name=f"테스트{ticker}", market="KOSPI", is_active=True))
+        db.commit()
+        _seed_prices(db, "900011")
+
+        done = []
+        stats = run_compass_batch(
+            db, ["900011", "900012", "900013"], workers=2, on_partition_done=done.append
+        )
+
+        assert [(w["worker"], w["count"]) for w in stats["workers"]] == [(0, 2), (1, 1)]
+        assert len(done) == 2
+        assert (stats["success"], stats["failed"], stats["total"]) == (1, 2, 3)
+
+        db.expire_all()
+        assert db.query(Stock).filter(Stock.ticker == "900011").one().compass_score is not None
+        assert db.query(Stock).filter(Stock.ticker == "900012").one().compass_score is None
@@ -0,0 +1,105 @@
+"""
+compass_dirty 단위 테스트 — 변경 표시 / 재계산 대상 선별 / 표시 정리
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models.ops import DataCollectionLog
+from app.models.real_data import StockPriceDaily
+from app.models.securities import CompassDirty, Stock
+from app.services.compass_dirty import (
+    MAX_SCORE_AGE_DAYS,
+    clear_compass_dirty,
+    mark_compass_dirty,
+    requires_full_recompute,
+    select_dirty_tickers,
+)
+from app.services.scoring_engine import ScoringEngine
+from app.utils.kst_now import kst_now
+
+
+def _stock(db, ticker, scored_days_ago=None):
+    scored_at = kst_now() - timedelta(days=scored_days_ago) if scored_days_ago is not None else None
+    db.add(Stock(ticker=ticker, name=ticker, market="KOSPI", is_active=True, compass_updated_at=scored_at))
+
+
+def _prices(db, ticker, closes):
+    """오늘로 끝나는 일별 종가"""
+    today = date.today()
+    for i, close in enumerate(closes):
+        td = today - timedelta(days=len(closes) - 1 - i)
+        db.add(StockPriceDaily(
+            ticker=ticker, trade_date=td,
+            open_price=Decimal(str(close)), high_price=Decimal(str(close)),
+            low_price=Decimal(str(close)), close_price=Decimal(str(close)),
+            volume=1000, source_id="PYKRX", as_of_date=td,
+        ))
+
+
+@pytest.mark.unit
+class TestMarkCompassDirty:
+    def test_flags_accumulate(self, db):
+        mark_compass_dirty(db, ["900001", "900001"], "prices")
+        mark_compass_dirty(db, ["900001"], "financials")
+        db.commit()
+
+        row = db.query(CompassDirty).filter_by(ticker="900001").one()
+        assert row.prices_changed is True
+        assert row.financials_changed is True
+        assert row.valuation_changed is False
+
+
+@pytest.mark.unit
+class TestSelectDirtyTickers:
+    def test_selection_rules(self, db):
+        _stock(db, "900001")                      # 미계산
+        _stock(db, "900002", scored_days_ago=1)   # 재무 변경
+        _stock(db, "900003", scored_days_ago=1)   # 시세 소폭 변동
+        _stock(db, "900004", scored_days_ago=1)   # 시세 급변
+        _stock(db, "900005", scored_days_ago=MAX_SCORE_AGE_DAYS + 1)  # 오래된 점수
+        _stock(db, "900006", scored_days_ago=1)   # 변경 없음
+        _prices(db, "900003", [10_000, 10_000, 10_050])
+        _prices(db, "900004", [10_000, 10_000, 11_000])
+        db.commit()
+
+        mark_compass_dirty(db, ["900002"], "financials")
+        mark_compass_dirty(db, ["900003", "900004", "900005"], "prices")
+        db.commit()
+
+        candidates = ["900001", "900002", "900003", "900004", "900005", "900006"]
+        assert select_dirty_tickers(db, candidates) == ["900001", "900002", "900004", "900005"]
+
+    def test_clear_keeps_later_marks(self, db):
+        mark_compass_dirty(db, ["900001", "900002"], "prices")
+        db.commit()
+        cutoff = kst_now()
+        db.query(CompassDirty).filter_by(ticker="900002").update(
+            {"marked_at": cutoff.replace(tzinfo=None) + timedelta(seconds=5)}
+        )
+        db.commit()
+
+        assert clear_compass_dirty(db, ["900001", "900002"], cutoff) == 1
+        assert [r.ticker for r in db.query(CompassDirty).all()] == ["900002"]
+
+
+@pytest.mark.unit
+class TestRequiresFullRecompute:
+    def _log(self, db, version):
+        db.add(DataCollectionLog(
+            job_name="compass_batch", job_label="Compass", status="completed",
+            started_at=kst_now(), detail={"engine_version": version},
+        ))
+        db.commit()
+
+    def test_first_run_is_full(self, db):
+        assert requires_full_recompute(db) is True
+
+    def test_same_version_is_incremental(self, db):
+        self._log(db, ScoringEngine.ENGINE_VERSION)
+        assert requires_full_recompute(db) is False
+
+    def test_version_bump_is_full(self, db):
+        self._log(db, "0")
+        assert requires_full_recompute(db) is True
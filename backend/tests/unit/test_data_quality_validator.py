@@ -226,6 +226,17 @@ class TestDataQualityValidator:
         assert metrics["outlier_ratio"] == Decimal("0.1000")
         assert metrics["quality_score"] < Decimal("100")
 
+    def test_calculate_quality_metrics_without_null_counts(self, validator):
+        """NULL 집계 필드 없음 (시세 적재) → NULL 비율 0"""
+        metrics = validator.calculate_quality_metrics(
+            total_records=50,
+            null_counts={},
+            outlier_count=5,
+        )
+
+        assert metrics["null_ratio"] == Decimal("0.0000")
+        assert metrics["outlier_ratio"] == Decimal("0.1000")
+
     def test_calculate_quality_metrics_empty(self, validator):
         """빈 데이터 품질 메트릭"""
         metrics = validator.calculate_quality_metrics(
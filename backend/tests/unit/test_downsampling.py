@@ -0,0 +1,93 @@
+"""
+downsampling 단위 테스트 — LTTB 선택 / 낙폭 저점 / 유지 일자
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.downsampling import (
+    downsample_indices,
+    downsample_rows,
+    drawdown_trough_indices,
+    lttb_indices,
+)
+
+
+def _random_walk(n=2500, seed=1):
+    rng = np.random.default_rng(seed)
+    return 100 * np.cumprod(1 + rng.normal(0.0003, 0.01, n))
+
+
+@pytest.mark.unit
+class TestLttb:
+    def test_size_and_endpoints(self):
+        nav = _random_walk()
+        idx = lttb_indices(nav, 250)
+        assert len(idx) == 250
+        assert idx[0] == 0 and idx[-1] == len(nav) - 1
+        assert np.all(np.diff(idx) > 0)
+
+    def test_short_series_unchanged(self):
+        assert lttb_indices(np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+
+    def test_spike_selected(self):
+        y = np.zeros(1000)
+        y[537] = 10.0
+        assert 537 in lttb_indices(y, 50)
+
+
+@pytest.mark.unit
+class TestForcedPoints:
+    def test_deepest_troughs(self):
+        nav = np.array([100, 90, 95, 101, 70, 80, 102, 99, 103], dtype=float)
+        assert drawdown_trough_indices(nav, 2) == [4, 1]
+        assert drawdown_trough_indices(np.arange(1.0, 10.0), 3) == []
+
+    def test_max_drawdown_trough_and_keep_survive(self):
+        nav = _random_walk()
+        trough = int(np.argmin(nav / np.maximum.accumulate(nav)))
+        idx = downsample_indices(nav, 100, keep=[1234])
+        assert trough in idx and 1234 in idx
+        assert len(idx) <= 100
+
+    def test_rows_keep_dates(self):
+        start = date(2020, 1, 1)
+        rows = [
+            {"date": (start + timedelta(days=i)).isoformat(), "value": v}
+            for i, v in enumerate(_random_walk(1000).tolist())
+        ]
+        keep = start + timedelta(days=321)
+        out = downsample_rows(rows, 80, "value", "date", keep_dates=[keep])
+        assert len(out) <= 80
+        assert keep.isoformat() in {r["date"] for r in out}
+        assert out[0] is rows[0] and out[-1] is rows[-1]
+        assert downsample_rows(rows, None, "value", "date") == rows
+
+
+@pytest.mark.unit
+class TestPhase7Downsample:
+    def test_nav_series_keeps_rebalance_dates(self):
+        from app.services.phase7_evaluation import downsample_result
+
+        start = date(2020, 1, 1)
+        days = [start + timedelta(days=i) for i in range(730)]
+        nav = _random_walk(730).tolist()
+        result = {
+            "metrics": {"cagr": 0.1},
+            "extensions": {
+                "nav_series": [{"date": d.isoformat(), "nav": v} for d, v in zip(days, nav)],
+                "yearly_returns": [],
+            },
+        }
+
+        out = downsample_result(result, 60, "QUARTERLY")
+        kept = {p["date"] for p in out["extensions"]["nav_series"]}
+        quarter_starts = {
+            d.isoformat() for d in days[1:] if d.day == 1 and d.month in (1, 4, 7, 10)
+        }
+        assert quarter_starts <= kept
+        assert len(kept) <= 60
+        assert len(result["extensions"]["nav_series"]) == 730
+        assert out["metrics"] is result["metrics"]
+        assert downsample_result(result, None, "QUARTERLY") is result
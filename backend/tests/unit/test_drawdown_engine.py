@@ -0,0 +1,79 @@
+"""
+drawdown_engine 단위 테스트 — 구간 / 회복 / 최악 N일 수익률과 호출측 일관성
+"""
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.analytics_engine_v3 import _calculate_drawdown_segments
+from app.services.drawdown_engine import (
+    drawdown_episodes,
+    drawdown_series,
+    max_drawdown_episode,
+    running_peak,
+    worst_period_return,
+)
+from app.services.performance_analyzer import NAVPoint, calculate_drawdown
+from app.services.quant_analyzer import QuantAnalyzer
+from app.services.scenario_simulation import (
+    calculate_max_recovery_days,
+    calculate_worst_period_return,
+)
+
+NAV = [100, 110, 110, 99, 105, 120, 90, 80, 100, 115]
+
+
+def _random_nav(n=2000, seed=11):
+    rng = np.random.default_rng(seed)
+    return 100 * np.cumprod(1 + rng.normal(0.0003, 0.015, n))
+
+
+@pytest.mark.unit
+class TestDrawdownEngine:
+    def test_episodes(self):
+        episodes = drawdown_episodes(NAV)
+        assert [(e.peak, e.start, e.trough, e.recovery) for e in episodes] == [
+            (2, 3, 3, 5),
+            (5, 6, 7, None),
+        ]
+        assert episodes[0].depth == pytest.approx(99 / 110 - 1)
+        assert episodes[0].duration == 2
+        assert episodes[1].duration is None
+        assert max_drawdown_episode(episodes) is episodes[1]
+
+    def test_series_and_peak(self):
+        assert running_peak(NAV).tolist() == [100, 110, 110, 110, 110, 120, 120, 120, 120, 120]
+        assert drawdown_series(NAV).min() == pytest.approx(80 / 120 - 1)
+        assert drawdown_episodes([1, 2, 3]) == []
+
+    def test_worst_period_matches_loop(self):
+        nav = _random_nav()
+        for period in (1, 22, 66):
+            expected = min(nav[i] / nav[i - period] - 1 for i in range(period, len(nav)))
+            assert worst_period_return(nav, period) == pytest.approx(expected, rel=1e-12)
+        assert worst_period_return(nav[:22], 22) is None
+
+    def test_call_sites_agree(self):
+        nav = _random_nav()
+        start = date(2015, 1, 1)
+        dates = [start + timedelta(days=i) for i in range(len(nav))]
+        worst = max_drawdown_episode(drawdown_episodes(nav))
+
+        info = calculate_drawdown([NAVPoint(d, v) for d, v in zip(dates, nav.tolist())])
+        assert info.mdd == pytest.approx(worst.depth)
+        assert info.trough_date == dates[worst.trough]
+
+        quant = QuantAnalyzer.calculate_max_drawdown(
+            [(datetime.combine(d, datetime.min.time()), v) for d, v in zip(dates, nav.tolist())]
+        )
+        assert quant["max_drawdown"] == round(worst.depth * 100, 2)
+
+        segments = _calculate_drawdown_segments(dates, nav)
+        assert min(s["drawdown"] for s in segments) == round(worst.depth, 6)
+
+    def test_scenario_helpers(self):
+        path = [{"nav": v} for v in NAV]
+        assert calculate_max_recovery_days(path) == 2
+        assert calculate_worst_period_return(path, 2) == pytest.approx((80 / 120 - 1) * 100)
+        assert calculate_worst_period_return([{"nav": v} for v in (1, 2, 3)], 1) is None
@@ -0,0 +1,144 @@
+"""
+indicator_kernel 단위 테스트 — 벡터 커널과 QuantAnalyzer 리스트 구현 일치 검증
+"""
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.indicator_kernel import (
+    closes_to_array,
+    compute_indicator_series,
+    compute_technical_indicators,
+    ohlcv_to_array,
+    to_columnar,
+)
+from app.services.quant_analyzer import QuantAnalyzer
+
+
+def _ohlcv(n, seed=7, base_close=50_000, volatility=800):
+    rng = random.Random(seed)
+    data = []
+    close = base_close
+    for i in range(n):
+        change = rng.uniform(-volatility, volatility)
+        close = max(close + change, 100)
+        data.append({
+            "date": date(2024, 1, 1) + timedelta(days=i),
+            "open": round(close - change / 2, 2),
+            "high": round(close + rng.uniform(0, volatility), 2),
+            "low": round(max(close - rng.uniform(0, volatility), 50), 2),
+            "close": round(close, 2),
+            "volume": 1_000_000 + rng.randint(-300_000, 300_000),
+        })
+    return data
+
+
+def _reference(ohlcv):
+    prices = [(d["date"], d["close"]) for d in ohlcv]
+    return {
+        "moving_averages": QuantAnalyzer.calculate_moving_averages(prices),
+        "rsi": QuantAnalyzer.calculate_rsi(prices),
+        "bollinger_bands": QuantAnalyzer.calculate_bollinger_bands(prices),
+        "macd": QuantAnalyzer.calculate_macd(prices),
+        "stochastic": QuantAnalyzer.calculate_stochastic(ohlcv),
+        "atr": QuantAnalyzer.calculate_atr(ohlcv),
+        "adx": QuantAnalyzer.calculate_adx(ohlcv),
+        "obv": QuantAnalyzer.calculate_obv(ohlcv),
+        "ma_alignment": QuantAnalyzer.calculate_ma_alignment(prices),
+        "week52_position": QuantAnalyzer.calculate_52week_position(prices),
+    }
+
+
+def _assert_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            _assert_close(actual[key], value)
+        elif isinstance(value, float):
+            assert actual[key] == pytest.approx(value, abs=0.011), key
+        else:
+            assert actual[key] == value, key
+
+
+@pytest.mark.unit
+class TestIndicatorKernel:
+    """벡터 커널 ↔ 기존 계산 일치"""
+
+    @pytest.mark.parametrize("n", [252, 500])
+    def test_matches_reference(self, n):
+        ohlcv = _ohlcv(n)
+        result = compute_technical_indicators(ohlcv_to_array(ohlcv))
+        _assert_close(result, _reference(ohlcv))
+
+    @pytest.mark.parametrize("n", [5, 16, 30, 36])
+    def test_insufficient_data_matches_reference(self, n):
+        ohlcv = _ohlcv(n)
+        result = compute_technical_indicators(ohlcv_to_array(ohlcv))
+        expected = _reference(ohlcv)
+        for key, value in expected.items():
+            assert ("error" in result[key]) == ("error" in value), key
+
+    def test_close_only_mode(self):
+        """종가 전용 입력 → OHLCV 지표 제외"""
+        ohlcv = _ohlcv(252)
+        prices = [(d["date"], d["close"]) for d in ohlcv]
+        result = compute_technical_indicators(closes_to_array(prices), ohlc=False)
+        assert "stochastic" not in result
+        assert "obv" not in result
+        assert result["macd"] == QuantAnalyzer.calculate_macd(prices)
+
+    def test_series_aligned_with_input(self):
+        """전체 시계열은 입력 길이와 같고 마지막 값이 요약값과 일치"""
+        ohlcv = _ohlcv(252)
+        data = ohlcv_to_array(ohlcv)
+        series = compute_indicator_series(data)
+        for values in series.values():
+            assert len(values) == len(data)
+        assert np.isnan(series["rsi"][0])
+        assert round(float(series["rsi"][-1]), 2) == compute_technical_indicators(data)["rsi"]["rsi"]
+
+
+@pytest.mark.unit
+class TestIndicatorSeries:
+    """차트용 전체 시계열 (컬럼 배열)"""
+
+    def test_to_columnar_nan_to_none(self):
+        series = compute_indicator_series(ohlcv_to_array(_ohlcv(60)))
+        columns = to_columnar(series, keys=["close", "rsi"])
+        assert set(columns) == {"close", "rsi"}
+        assert columns["rsi"][:14] == [None] * 14
+        assert all(isinstance(v, float) for v in columns["rsi"][14:])
+
+    def test_calculate_indicator_series_from_db(self, db):
+        from decimal import Decimal
+        from app.models.real_data import StockPriceDaily
+
+        ohlcv = _ohlcv(60)
+        start = date.today() - timedelta(days=59)
+        for i, row in enumerate(ohlcv):
+            td = start + timedelta(days=i)
+            db.add(StockPriceDaily(
+                ticker="005930",
+                trade_date=td,
+                open_price=Decimal(str(row["open"])),
+                high_price=Decimal(str(row["high"])),
+                low_price=Decimal(str(row["low"])),
+                close_price=Decimal(str(row["close"])),
+                volume=row["volume"],
+                source_id="PYKRX",
+                as_of_date=td,
+            ))
+        db.commit()
+
+        result = QuantAnalyzer.calculate_indicator_series(db, "005930", days=90)
+        assert result["data_points"] == 60
+        assert len(result["dates"]) == 60
+        for key in ("close", "rsi", "macd", "bb_upper", "stoch_k", "atr", "adx", "obv"):
+            assert len(result["series"][key]) == 60
+        assert result["series"]["close"][-1] == ohlcv[-1]["close"]
+
+    def test_calculate_indicator_series_no_data(self, db):
+        result = QuantAnalyzer.calculate_indicator_series(db, "999999")
+        assert "error" in result
@@ -0,0 +1,205 @@
+"""
+indicator_state 단위 테스트 — 증분 상태 전진 / 전체 재계산 폴백
+"""
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models.real_data import CorporateAction, IndicatorState, StockPriceDaily
+from app.services.indicator_kernel import compute_technical_indicators
+from app.services.indicator_state import (
+    REBUILD_HISTORY_DAYS,
+    IndicatorStateService,
+    advance_state,
+    build_state,
+    summarize_state,
+)
+
+
+def _bars(n, seed=11, start=None):
+    rng = random.Random(seed)
+    start = start or date(2024, 1, 1)
+    bars = []
+    close = 30_000.0
+    for i in range(n):
+        change = rng.uniform(-600, 600)
+        close = max(close + change, 100)
+        bars.append((
+            start + timedelta(days=i),
+            round(close - change / 2, 2),
+            round(close + rng.uniform(0, 600), 2),
+            round(max(close - rng.uniform(0, 600), 50), 2),
+            round(close, 2),
+            1_000_000 + rng.randint(-200_000, 200_000),
+        ))
+    return bars
+
+
+def _assert_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            _assert_close(actual[key], value)
+        elif isinstance(value, float):
+            assert actual[key] == pytest.approx(value, abs=0.011), key
+        else:
+            assert actual[key] == value, key
+
+
+@pytest.mark.unit
+class TestAdvanceState:
+    """상태 전진 ↔ 벡터 커널 일치"""
+
+    @pytest.mark.parametrize("n", [10, 20, 30, 40, 120, 252])
+    def test_matches_kernel(self, n):
+        import numpy as np
+        bars = _bars(n)
+        data = np.array([b[1:] for b in bars], dtype=np.float64)
+        _assert_close(summarize_state(build_state(bars)), compute_technical_indicators(data))
+
+    def test_incremental_equals_full(self):
+        """부분 구축 후 증분 전진 = 한 번에 구축"""
+        bars = _bars(200)
+        state = build_state(bars[:150])
+        for b in bars[150:]:
+            advance_state(state, b[0], *[float(x) for x in b[1:]])
+        assert summarize_state(state) == summarize_state(build_state(bars))
+
+
+def _insert(db, ticker, bars):
+    for td, o, h, l, c, v in bars:
+        db.add(StockPriceDaily(
+            ticker=ticker, trade_date=td,
+            open_price=Decimal(str(o)), high_price=Decimal(str(h)),
+            low_price=Decimal(str(l)), close_price=Decimal(str(c)),
+            volume=v, source_id="PYKRX", as_of_date=td,
+        ))
+    db.commit()
+
+
+@pytest.mark.unit
+class TestIndicatorStateService:
+    """indicator_state 저장/갱신"""
+
+    def test_refresh_builds_then_advances(self, db):
+        bars = _bars(80, start=date.today() - timedelta(days=80))
+        _insert(db, "005930", bars[:79])
+
+        stats = IndicatorStateService.refresh_all(db, ["005930"])
+        assert stats["rebuilt"] == 1
+
+        _insert(db, "005930", bars[79:])
+        stats = IndicatorStateService.refresh_all(db, ["005930"])
+        assert stats["advanced"] == 1
+
+        row = db.query(IndicatorState).filter_by(ticker="005930").first()
+        assert row.last_trade_date == bars[-1][0]
+        assert row.bar_count == 80
+        assert IndicatorStateService.get_technical_indicators(db, "005930") == summarize_state(build_state(bars))
+
+        stats = IndicatorStateService.refresh_all(db, ["005930"])
+        assert stats["unchanged"] == 1
+
+    def test_corporate_action_forces_rebuild(self, db):
+        bars = _bars(60, start=date.today() - timedelta(days=60))
+        _insert(db, "000660", bars)
+        IndicatorStateService.refresh_all(db, ["000660"])
+
+        db.add(CorporateAction(
+            ticker="000660", action_type="SPLIT", ratio=Decimal("2.0"),
+            effective_date=date.today(), source_id="DART", as_of_date=date.today(),
+        ))
+        db.commit()
+
+        stats = IndicatorStateService.refresh_all(db, ["000660"])
+        assert stats["rebuilt"] == 1
+        assert stats["advanced"] == 0
+
+    def test_refresh_groups_by_own_last_date(self, db):
+        """갱신 시점이 다른 종목 — 각자 마지막 거래일 이후 봉만 반영"""
+        start = date.today() - timedelta(days=90)
+        stale, fresh = _bars(90, seed=3, start=start), _bars(90, seed=4, start=start)
+        _insert(db, "000001", stale[:40])
+        _insert(db, "000002", fresh[:85])
+        IndicatorStateService.refresh_all(db, ["000001", "000002"])
+
+        _insert(db, "000001", stale[40:])
+        _insert(db, "000002", fresh[85:])
+        stats = IndicatorStateService.refresh_all(db, ["000001", "000002"])
+
+        assert stats["advanced"] == 2
+        for ticker, bars in (("000001", stale), ("000002", fresh)):
+            assert IndicatorStateService.get_technical_indicators(db, ticker) == summarize_state(build_state(bars))
+
+
+@pytest.mark.unit
+class TestQuantAnalysisUsesState:
+    """comprehensive_quant_analysis 기술 지표 — 저장 상태 우선, 없거나 뒤처지면 커널"""
+
+    @pytest.fixture
+    def kernel_calls(self, monkeypatch):
+        from app.services import quant_analyzer
+
+        calls = []
+
+        def compute(data, ohlc=True):
+            calls.append(len(data))
+            return compute_technical_indicators(data, ohlc=ohlc)
+
+        monkeypatch.setattr(quant_analyzer, "compute_technical_indicators", compute)
+        return calls
+
+    def test_state_then_fallbacks(self, db, kernel_calls):
+        from app.services.quant_analyzer import QuantAnalyzer
+
+        bars = _bars(150, start=date.today() - timedelta(days=150))
+        _insert(db, "035420", bars[:149])
+
+        # 상태 없음 → 커널
+        QuantAnalyzer.comprehensive_quant_analysis(db, "035420")
+        assert len(kernel_calls) == 1
+
+        # 최신 상태 → 저장 상태 사용
+        IndicatorStateService.refresh_all(db, ["035420"])
+        result = QuantAnalyzer.comprehensive_quant_analysis(db, "035420")
+        assert len(kernel_calls) == 1
+        assert result["technical_indicators"] == summarize_state(build_state(bars[:149]))
+
+        # 새 봉 적재 후 상태 미갱신 → 커널
+        _insert(db, "035420", bars[149:])
+        QuantAnalyzer.comprehensive_quant_analysis(db, "035420")
+        assert len(kernel_calls) == 2
+
+        # 기본 기간이 아니면 항상 커널
+        IndicatorStateService.refresh_all(db, ["035420"])
+        QuantAnalyzer.comprehensive_quant_analysis(db, "035420", days=120)
+        assert len(kernel_calls) == 3
+
+        # 기업 액션 등록 (무효화) → 커널
+        db.add(CorporateAction(
+            ticker="035420", action_type="SPLIT", ratio=Decimal("2.0"),
+            effective_date=date.today(), source_id="DART", as_of_date=date.today(),
+        ))
+        db.commit()
+        QuantAnalyzer.comprehensive_quant_analysis(db, "035420")
+        assert len(kernel_calls) == 4
+
+    def test_fallback_matches_state_on_same_bars(self, db, kernel_calls):
+        """상태 없음(커널) ↔ 재계산 상태 — 같은 봉 구간, 같은 결과 (MA200·52주·OBV 포함)"""
+        from app.services.quant_analyzer import QuantAnalyzer
+
+        start = date.today() - timedelta(days=REBUILD_HISTORY_DAYS + 100)
+        bars = [b for b in _bars(REBUILD_HISTORY_DAYS + 101, seed=5, start=start) if b[0].weekday() < 5]
+        _insert(db, "068270", bars)
+
+        fallback = QuantAnalyzer.comprehensive_quant_analysis(db, "068270")["technical_indicators"]
+        window = [b for b in bars if b[0] >= date.today() - timedelta(days=REBUILD_HISTORY_DAYS)]
+        assert kernel_calls == [len(window)]
+        assert "alignment" in fallback["ma_alignment"]
+
+        IndicatorStateService.refresh_all(db, ["068270"])
+        stored = QuantAnalyzer.comprehensive_quant_analysis(db, "068270")["technical_indicators"]
+        assert len(kernel_calls) == 1
+        _assert_close(stored, fallback)
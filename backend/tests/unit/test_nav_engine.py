@@ -0,0 +1,86 @@
+"""
+nav_engine 단위 테스트 — 수익률 행렬 구성 / NAV 배열 계산 / 경로 형식
+"""
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.nav_engine import build_return_matrix, compute_portfolio_nav
+from app.services.scenario_simulation import calculate_portfolio_nav
+
+
+def _reference_nav(allocations, returns_by_instrument, trade_dates, initial_amount):
+    """종전 일자 × 종목 루프 구현 (비교 기준)"""
+    lookup = {
+        inst_id: {r["trade_date"]: r["daily_return"] for r in returns}
+        for inst_id, returns in returns_by_instrument.items()
+    }
+    path, prev_nav, hwm = [], initial_amount, initial_amount
+    for d in trade_dates:
+        ret = sum(a["weight"] * lookup.get(a["instrument_id"], {}).get(d, 0.0) for a in allocations)
+        total = sum(a["weight"] for a in allocations)
+        if total > 0 and abs(total - 1.0) > 0.001:
+            ret /= total
+        nav = prev_nav * (1 + ret)
+        hwm = max(hwm, nav)
+        path.append({
+            "path_date": d,
+            "nav": round(nav, 4),
+            "daily_return": round(ret, 8),
+            "cumulative_return": round((nav - initial_amount) / initial_amount, 8),
+            "drawdown": round((nav - hwm) / hwm, 8),
+            "high_water_mark": round(hwm, 4),
+        })
+        prev_nav = nav
+    return path
+
+
+@pytest.mark.unit
+class TestBuildReturnMatrix:
+    def test_alignment_and_missing(self):
+        dates = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+        returns = {
+            1: [{"trade_date": date(2024, 1, 3), "daily_return": 0.01}],
+            2: [
+                {"trade_date": date(2024, 1, 2), "daily_return": -0.02},
+                {"trade_date": date(2024, 1, 5), "daily_return": 0.5},  # 거래일 밖
+            ],
+        }
+        matrix = build_return_matrix(returns, [2, 1, 3], dates)
+        assert matrix.tolist() == [[-0.02, 0.0, 0.0], [0.0, 0.01, 0.0], [0.0, 0.0, 0.0]]
+
+
+@pytest.mark.unit
+class TestComputePortfolioNav:
+    def test_drawdown_and_high_water_mark(self):
+        dates = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+        series = compute_portfolio_nav(
+            np.array([1.0]), np.array([[0.1], [-0.5], [0.2]]), dates, 100.0
+        )
+        assert series.nav.tolist() == pytest.approx([110.0, 55.0, 66.0])
+        assert series.high_water_mark.tolist() == pytest.approx([110.0, 110.0, 110.0])
+        assert series.drawdown.tolist() == pytest.approx([0.0, -0.5, -0.4])
+
+    def test_weights_normalized(self):
+        series = compute_portfolio_nav(
+            np.array([1.0, 1.0]), np.array([[0.02, 0.04]]), [date(2024, 1, 2)], 100.0
+        )
+        assert series.daily_return[0] == pytest.approx(0.03)
+
+    @pytest.mark.parametrize("weights", [[0.6, 0.3, 0.1], [0.5, 0.5, 0.5]])
+    def test_matches_reference_path(self, weights):
+        rng = random.Random(7)
+        dates = [date(2020, 1, 1) + timedelta(days=i) for i in range(300)]
+        allocations = [{"instrument_id": i, "weight": w} for i, w in enumerate(weights)]
+        returns = {
+            i: [
+                {"trade_date": d, "daily_return": rng.gauss(0, 0.01)}
+                for d in dates if rng.random() > 0.1
+            ]
+            for i in range(2)  # 마지막 종목은 수익률 없음
+        }
+        assert calculate_portfolio_nav(allocations, returns, dates) == _reference_nav(
+            allocations, returns, dates, 1000000.0
+        )
@@ -0,0 +1,118 @@
+"""
+시뮬레이션 경로 열 기반 압축 형식 단위 테스트
+- 인코딩 / 디코딩 왕복, 구간 슬라이스, 결측값
+- path_blob 저장 ↔ simulation_path 행 저장 결과 동일성, 기존 행 변환
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.models.simulation import SimulationPath, SimulationRun
+from app.services.path_codec import decode_path, encode_path, path_length
+from app.services.scenario_simulation import run_scenario_simulation_fallback
+from app.services.simulation_store import (
+    convert_path_to_columnar,
+    get_simulation_by_hash,
+    iter_simulation_path,
+    load_simulation_path,
+    save_simulation_result,
+)
+
+
+def _sample(n=300):
+    dates = [date(2024, 1, 1) + timedelta(days=i + i // 5 * 2) for i in range(n)]
+    nav = 1_000_000 * np.cumprod(1 + np.sin(np.arange(n)) * 0.01)
+    return dates, nav
+
+
+@pytest.mark.unit
+class TestPathCodec:
+    def test_round_trip(self):
+        dates, nav = _sample()
+        blob = encode_path(dates, {"nav": nav.tolist(), "drawdown": [None] + [-0.01] * (len(dates) - 1)})
+
+        decoded = decode_path(blob)
+        assert path_length(blob) == len(decoded) == len(dates)
+        assert decoded.dates == dates
+        np.testing.assert_allclose(decoded.columns["nav"], np.round(nav, 4))
+        assert np.isnan(decoded.columns["drawdown"][0])
+        assert np.isnan(decoded.columns["high_water_mark"]).all()
+
+    def test_range_slice(self):
+        dates, nav = _sample()
+        blob = encode_path(dates, {"nav": nav.tolist()})
+
+        # 주말(오프셋 공백) 경계도 포함 구간으로 처리
+        decoded = decode_path(blob, start=dates[10] - timedelta(days=1), end=dates[20])
+        assert decoded.dates == dates[10:21]
+        np.testing.assert_allclose(decoded.columns["nav"], np.round(nav[10:21], 4))
+        assert len(decode_path(blob, start=dates[-1] + timedelta(days=1))) == 0
+
+    def test_empty_and_invalid(self):
+        assert len(decode_path(encode_path([], {}))) == 0
+        with pytest.raises(ValueError):
+            decode_path(b"XXXX" + bytes(8))
+
+
+def _scenario_result():
+    return run_scenario_simulation_fallback(
+        scenario_id="GROWTH",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 6, 30),
+        initial_amount=1_000_000,
+    )
+
+
+def _save(db, request_hash, result):
+    return save_simulation_result(
+        db, request_hash, "scenario_simulation", {}, result, "test", scenario_id="GROWTH"
+    )
+
+
+@pytest.mark.unit
+class TestColumnarStore:
+    def test_columnar_matches_rows(self, db, monkeypatch):
+        result = _scenario_result()
+
+        monkeypatch.setattr(settings, "simulation_path_storage", "rows")
+        _save(db, "a" * 64, result)
+        monkeypatch.setattr(settings, "simulation_path_storage", "columnar")
+        run = _save(db, "b" * 64, result)
+
+        assert run.path_points == len(result["path"])
+        assert db.query(SimulationPath).filter(SimulationPath.run_id == run.run_id).count() == 0
+
+        rows = get_simulation_by_hash(db, "a" * 64)["path"]
+        columnar = get_simulation_by_hash(db, "b" * 64)["path"]
+        assert [r["path_date"] for r in columnar] == [r["path_date"] for r in rows]
+        for key in ("nav", "daily_return", "drawdown", "high_water_mark"):
+            np.testing.assert_allclose([r[key] for r in columnar], [r[key] for r in rows], atol=1e-8)
+
+    def test_range_read(self, db):
+        result = _scenario_result()
+        run = _save(db, "c" * 64, result)
+        start, end = date(2024, 3, 1), date(2024, 3, 31)
+
+        points = load_simulation_path(db, run, start, end)
+        expected = [p for p in result["path"] if start <= p["path_date"] <= end]
+        assert [p.path_date for p in points] == [p["path_date"] for p in expected]
+
+        chunks = list(iter_simulation_path(db, run.run_id, scenario=True, chunk_size=7, start=start, end=end))
+        assert sum(len(c) for c in chunks) == len(expected)
+
+    def test_convert_existing_rows(self, db, monkeypatch):
+        result = _scenario_result()
+        monkeypatch.setattr(settings, "simulation_path_storage", "rows")
+        run = _save(db, "d" * 64, result)
+        before = get_simulation_by_hash(db, "d" * 64)["path"]
+
+        assert convert_path_to_columnar(db, run) == len(result["path"])
+        db.commit()
+        assert convert_path_to_columnar(db, run) == 0
+
+        stored = db.get(SimulationRun, run.run_id)
+        assert stored.path_points == len(before)
+        assert db.query(SimulationPath).filter(SimulationPath.run_id == run.run_id).count() == 0
+        assert get_simulation_by_hash(db, "d" * 64)["path"] == before
@@ -0,0 +1,72 @@
+"""
+경로 NDJSON 스트리밍 단위 테스트
+- 청크 분할 / 헤더·종료 행
+- 저장된 SimulationPath 지연 조회 (include_path=False → iter_simulation_path)
+"""
+import json
+from datetime import date
+
+import pytest
+
+from app.services.path_stream import list_chunks, ndjson_lines
+from app.services.scenario_simulation import run_scenario_simulation_fallback
+from app.services.simulation_store import (
+    get_or_compute_simulation,
+    iter_simulation_path,
+    summarize_simulation_path,
+)
+
+
+def _parse(lines):
+    return [json.loads(line) for line in b"".join(lines).decode("utf-8").splitlines()]
+
+
+@pytest.mark.unit
+class TestNdjsonLines:
+    def test_header_chunks_and_end(self):
+        rows = [{"path_date": date(2024, 1, 1), "nav": float(i)} for i in range(1201)]
+        records = _parse(ndjson_lines({"scenario_id": "GROWTH"}, list_chunks(rows, chunk_size=500)))
+
+        assert records[0] == {"type": "summary", "scenario_id": "GROWTH"}
+        assert [len(r["rows"]) for r in records[1:-1]] == [500, 500, 201]
+        assert records[1]["rows"][0] == {"path_date": "2024-01-01", "nav": 0.0}
+        assert records[-1] == {"type": "end", "total_points": 1201}
+
+    def test_transform_and_empty_path(self):
+        records = _parse(ndjson_lines({}, list_chunks([{"a": 1}], transform=lambda r: {"b": r["a"]})))
+        assert records[1]["rows"] == [{"b": 1}]
+
+        records = _parse(ndjson_lines({}, list_chunks([])))
+        assert [r["type"] for r in records] == ["summary", "end"]
+
+
+@pytest.mark.unit
+class TestStoredPathStreaming:
+    def test_lazy_path_matches_reconstructed(self, db):
+        params = {"scenario_id": "GROWTH", "start_date": "2024-01-01", "end_date": "2024-06-30"}
+
+        def compute():
+            return run_scenario_simulation_fallback(
+                scenario_id="GROWTH",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 6, 30),
+                initial_amount=1_000_000,
+            )
+
+        get_or_compute_simulation(db, "scenario_simulation", params, compute, scenario_id="GROWTH")
+        full, _, hit, _ = get_or_compute_simulation(db, "scenario_simulation", params, compute)
+        lazy, _, hit_lazy, _ = get_or_compute_simulation(
+            db, "scenario_simulation", params, compute, include_path=False
+        )
+        assert hit and hit_lazy
+        assert "path" not in lazy and "run_id" in lazy
+        assert lazy["trading_days"] == full["trading_days"]
+
+        chunks = list(iter_simulation_path(db, lazy["run_id"], scenario=True, chunk_size=50))
+        assert all(len(c) <= 50 for c in chunks)
+        assert [row for c in chunks for row in c] == full["path"]
+
+        summary = summarize_simulation_path(db, lazy["run_id"])
+        assert summary["total_points"] == len(full["path"])
+        assert summary["first_date"] == full["path"][0]["path_date"].isoformat()
+        assert summary["last_nav"] == full["path"][-1]["nav"]
@@ -9,6 +9,7 @@ import math
 from datetime import date
 
 from app.services.performance_analyzer import (
+    NAVColumns,
     NAVPoint,
     DrawdownInfo,
     PerformanceMetrics,
@@ -439,3 +440,38 @@ class TestDoDChecklist:
         # 변동성이 거의 0이면 Sharpe는 None
         if metrics.volatility < 1e-10:
             assert metrics.sharpe is None
+
+
+# ============================================================================
+# 열 기반 NAV 시계열 테스트
+# ============================================================================
+
+class TestNAVColumns:
+    """NAVColumns 어댑터 / 슬라이싱 / 분석 결과 일치"""
+
+    def _points(self):
+        from datetime import timedelta
+        start = date(2023, 12, 25)
+        navs = [1000, 1020, 990, 950, 1010, 1040, 1000, 1060]
+        return [NAVPoint(start + timedelta(days=i * 3), v) for i, v in enumerate(navs)]
+
+    def test_round_trip(self):
+        points = self._points()
+        columns = NAVColumns.from_points(points)
+        assert len(columns) == len(points)
+        assert columns.date_at(-1) == points[-1].nav_date
+        assert columns.to_points() == points
+
+    def test_slice_is_view(self):
+        columns = NAVColumns.from_points(self._points())
+        window = columns[2:5]
+        assert len(window) == 3
+        assert window.date_at(0) == columns.date_at(2)
+        assert window.nav.base is columns.nav
+
+    def test_analysis_matches_point_list(self):
+        points = self._points()
+        columns = NAVColumns.from_points(points)
+        assert analyze_performance(columns).to_dict() == analyze_performance(points).to_dict()
+        assert calculate_daily_returns(columns) == calculate_daily_returns(points)
+        assert calculate_drawdown(columns) == calculate_drawdown(points)
@@ -0,0 +1,68 @@
+"""
+Phase 7 NAV 구성 단위 테스트 — 벡터화 결과와 일자 × 항목 순차 계산 비교
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.phase7_errors import Phase7EvaluationError
+from app.services.phase7_evaluation import (
+    _build_nav_series,
+    _common_rows,
+    _rebalance_starts,
+    _should_rebalance,
+)
+
+
+def _sequential_nav(dates, prices, weights, rebalance):
+    """기존 순차 구현 (일자마다 항목 합산, 경계일 재배분)"""
+    total_value = 1.0
+    units = [weights[i] * total_value / prices[0][i] for i in range(len(weights))]
+    navs = []
+    for idx, current in enumerate(dates):
+        if idx > 0 and _should_rebalance(dates[idx - 1], current, rebalance):
+            total_value = sum(units[i] * prices[idx][i] for i in range(len(weights)))
+            units = [weights[i] * total_value / prices[idx][i] for i in range(len(weights))]
+        navs.append(sum(units[i] * prices[idx][i] for i in range(len(weights))))
+    return navs
+
+
+def _inputs(n=400, items=5, seed=5):
+    rng = np.random.default_rng(seed)
+    days, d = [], date(2022, 11, 1)
+    while len(days) < n:
+        if d.weekday() < 5:
+            days.append(d)
+        d += timedelta(days=1)
+    prices = 50 * np.cumprod(1 + rng.normal(0.0003, 0.02, (n, items)), axis=0)
+    weights = rng.dirichlet(np.ones(items)).tolist()
+    return days, prices, weights
+
+
+@pytest.mark.unit
+class TestPhase7NavBuilder:
+    @pytest.mark.parametrize("rebalance", ["NONE", "MONTHLY", "QUARTERLY"])
+    def test_matches_sequential(self, rebalance):
+        days, prices, weights = _inputs()
+        nav = _build_nav_series(np.array(days, dtype="datetime64[D]"), prices, weights, rebalance)
+
+        expected = _sequential_nav(days, prices.tolist(), weights, rebalance)
+        assert nav.date_list() == days
+        np.testing.assert_allclose(nav.nav, expected, rtol=1e-12)
+
+    @pytest.mark.parametrize("rebalance", ["MONTHLY", "QUARTERLY"])
+    def test_rebalance_starts(self, rebalance):
+        days, _, _ = _inputs()
+        expected = [0] + [
+            i for i in range(1, len(days)) if _should_rebalance(days[i - 1], days[i], rebalance)
+        ]
+        assert _rebalance_starts(np.array(days, dtype="datetime64[D]"), rebalance).tolist() == expected
+
+    def test_common_rows_and_invalid_price(self):
+        prices = np.array([[1.0, np.nan], [1.0, 2.0], [np.nan, 2.0], [1.5, 2.5]])
+        assert _common_rows(prices).tolist() == [1, 3]
+
+        days = np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[D]")
+        with pytest.raises(Phase7EvaluationError):
+            _build_nav_series(days, np.array([[0.0, 1.0], [1.0, 1.0]]), [0.5, 0.5], "NONE")
@@ -0,0 +1,90 @@
+"""
+price_matrix 단위 테스트 — 유니버스 가격 행렬 적재 / 슬라이스
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.models.real_data import StockPriceDaily
+from app.services.price_matrix import PriceMatrix, load_price_matrix
+
+
+BASE = date(2024, 3, 4)
+
+
+def _insert(db, ticker, days, base_close):
+    for i in days:
+        td = BASE + timedelta(days=i)
+        c = base_close + i * 10
+        db.add(StockPriceDaily(
+            ticker=ticker, trade_date=td,
+            open_price=Decimal(str(c - 5)), high_price=Decimal(str(c + 20)),
+            low_price=Decimal(str(c - 20)), close_price=Decimal(str(c)),
+            volume=1_000 + i, source_id="PYKRX", as_of_date=td,
+        ))
+    db.commit()
+
+
+@pytest.fixture
+def universe(db):
+    _insert(db, "005930", range(5), 70_000)
+    _insert(db, "000660", [0, 2, 4], 150_000)
+    return db
+
+
+@pytest.mark.unit
+class TestLoadPriceMatrix:
+    """stock_price_daily → 거래일 × 종목 행렬"""
+
+    def test_union_index_with_gaps(self, universe):
+        matrix = load_price_matrix(universe, ["005930", "000660"])
+
+        assert matrix.dates == [BASE + timedelta(days=i) for i in range(5)]
+        assert sorted(matrix.tickers) == ["000660", "005930"]
+        assert matrix.values.shape == (5, 2, 5)
+
+        col = matrix.tickers.index("000660")
+        assert np.isnan(matrix.close[1, col])
+        assert matrix.close[2, col] == 150_020.0
+
+    def test_ohlcv_skips_missing_days(self, universe):
+        matrix = load_price_matrix(universe, ["005930", "000660"])
+
+        dates, data = matrix.ohlcv("000660")
+        assert dates == [BASE, BASE + timedelta(days=2), BASE + timedelta(days=4)]
+        assert data[:, 3].tolist() == [150_000.0, 150_020.0, 150_040.0]
+        assert data[0].tolist() == [149_995.0, 150_020.0, 149_980.0, 150_000.0, 1_000.0]
+
+        # 빈칸 없는 종목은 원본 행렬의 뷰
+        _, full = matrix.ohlcv("005930")
+        assert np.shares_memory(full, matrix.values)
+
+    def test_date_range_filter(self, universe):
+        matrix = load_price_matrix(
+            universe, start=BASE + timedelta(days=1), end=BASE + timedelta(days=3)
+        )
+        assert len(matrix) == 3
+        assert matrix.close_series("005930") == {
+            BASE + timedelta(days=i): 70_000.0 + i * 10 for i in (1, 2, 3)
+        }
+
+    def test_window_slices(self, universe):
+        matrix = load_price_matrix(universe, ["005930", "000660"])
+        sub = matrix.window(BASE + timedelta(days=3), None, tickers=["000660"])
+
+        assert sub.dates == [BASE + timedelta(days=3), BASE + timedelta(days=4)]
+        assert sub.tickers == ["000660"]
+        assert sub.close_series("000660") == {BASE + timedelta(days=4): 150_040.0}
+
+    def test_empty(self, db):
+        matrix = load_price_matrix(db, ["999999"])
+        assert len(matrix) == 0
+        assert matrix.ohlcv("999999")[1].shape == (0, 5)
+        assert load_price_matrix(db, []).values.shape == (0, 0, 5)
+
+    def test_unknown_ticker(self):
+        matrix = PriceMatrix.empty(["005930"])
+        assert "005930" in matrix
+        assert matrix.close_series("000000") == {}
@@ -0,0 +1,105 @@
+"""
+RealDataLoader 시세 청크 적재 단위 테스트
+- 검증 통과 레코드를 PRICE_CHUNK_SIZE 단위 INSERT ... ON CONFLICT 로 적재, 청크당 commit 1회
+- 기존 행 중복 스킵, 품질 이슈 로그 유지, 새 행이 들어간 종목만 compass_dirty 표시
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.securities import CompassDirty
+from app.models.real_data import DataQualityLog, IndexPriceDaily, StockPriceDaily
+from app.services.pykrx_fetcher import IndexOHLCVRecord, OHLCVRecord
+from app.services.real_data_loader import RealDataLoader
+
+START = date(2025, 1, 6)
+END = START + timedelta(days=10)
+
+
+def _stock_records(ticker, days, bad_day=None):
+    records = []
+    for i in range(days):
+        close = Decimal(10000 + i * 10)
+        records.append(OHLCVRecord(
+            ticker=ticker,
+            trade_date=START + timedelta(days=i),
+            open_price=close,
+            high_price=close + 50,
+            # 고가 < 저가 → 검증 ERROR
+            low_price=close + 100 if i == bad_day else close - 50,
+            close_price=close,
+            volume=1000 + i,
+        ))
+    return records
+
+
+def _index_records(index_code, days):
+    return [
+        IndexOHLCVRecord(
+            index_code=index_code,
+            trade_date=START + timedelta(days=i),
+            open_price=Decimal("2500"),
+            high_price=Decimal("2520"),
+            low_price=Decimal("2480"),
+            close_price=Decimal("2510"),
+            volume=100000,
+        )
+        for i in range(days)
+    ]
+
+
+@pytest.fixture
+def loader(db, monkeypatch):
+    loader = RealDataLoader(db)
+    loader.fetcher = MagicMock()
+    monkeypatch.setattr(RealDataLoader, "PRICE_CHUNK_SIZE", 4)
+    return loader
+
+
+@pytest.mark.unit
+class TestStockPriceChunks:
+    def test_chunked_insert_and_duplicates(self, db, loader, monkeypatch):
+        by_ticker = {"005930": _stock_records("005930", 7, bad_day=2), "000660": _stock_records("000660", 3)}
+        loader.fetcher.fetch_stock_ohlcv.side_effect = lambda t, s, e, a: by_ticker[t]
+        chunks = []
+        insert_ignore = loader._insert_ignore
+        monkeypatch.setattr(
+            loader, "_insert_ignore",
+            lambda model, keys, rows, key: (chunks.append(len(rows)), insert_ignore(model, keys, rows, key))[1],
+        )
+
+        result = loader.load_stock_prices(["005930", "000660"], START, END, END)
+
+        assert (result.total_records, result.success_records, result.failed_records) == (10, 9, 1)
+        assert db.query(StockPriceDaily).count() == 9
+        assert db.query(DataQualityLog).filter(DataQualityLog.table_name == "stock_price_daily").count() >= 1
+        assert {row.ticker for row in db.query(CompassDirty).all()} == {"005930", "000660"}
+        row = db.query(StockPriceDaily).filter(StockPriceDaily.ticker == "000660").first()
+        assert row.adj_close_price == row.close_price
+
+        # 검증 통과 9행 / 청크 4 → 종목 경계와 무관하게 4 + 4 + 나머지 1
+        assert chunks == [4, 4, 1]
+
+        # 재적재: 기존 행은 스킵, 새 거래일만 추가
+        db.query(CompassDirty).delete()
+        db.commit()
+        by_ticker = {"005930": _stock_records("005930", 7, bad_day=2), "000660": _stock_records("000660", 5)}
+        loader.load_stock_prices(["005930", "000660"], START, END, END)
+
+        assert db.query(StockPriceDaily).count() == 11
+        assert {row.ticker for row in db.query(CompassDirty).all()} == {"000660"}
+
+
+@pytest.mark.unit
+class TestIndexPriceChunks:
+    def test_chunked_insert(self, db, loader):
+        loader.fetcher.fetch_index_ohlcv.side_effect = lambda c, s, e, a: _index_records(c, 6)
+
+        result = loader.load_index_prices(["KOSPI", "KOSDAQ"], START, END, END)
+        assert result.success_records == 12
+        assert db.query(IndexPriceDaily).count() == 12
+
+        loader.load_index_prices(["KOSPI"], START, END, END)
+        assert db.query(IndexPriceDaily).count() == 12
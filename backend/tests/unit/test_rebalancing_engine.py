@@ -17,6 +17,7 @@ from app.services.rebalancing_engine import (
     is_first_trading_day_of_quarter,
     is_last_trading_day_of_month,
     is_last_trading_day_of_quarter,
+    periodic_trigger_mask,
 )
 
 
@@ -426,6 +427,120 @@ class TestCalculateNavWithRebalancing:
             assert total_cost > 0
 
 
+def _reference_nav_with_rebalancing(allocations, returns_by_instrument, trade_dates,
+                                   initial_amount, config):
+    """종전 일자별 dict 루프 구현 (배열 시뮬레이터 비교 기준)"""
+    lookup = {
+        inst_id: {r["trade_date"]: r["daily_return"] for r in returns}
+        for inst_id, returns in returns_by_instrument.items()
+    }
+    by_class, target = {}, {}
+    for a in allocations:
+        ac = a.get("asset_class") or "OTHER"
+        by_class.setdefault(ac, []).append(a)
+        target[ac] = target.get(ac, 0.0) + a["weight"]
+
+    position = PositionState(values={ac: initial_amount * w for ac, w in target.items()},
+                             target_weights=target)
+    engine = RebalancingEngine(config)
+    date_set = set(trade_dates)
+    path, hwm = [], initial_amount
+    for idx, d in enumerate(trade_dates):
+        for ac, insts in by_class.items():
+            total_w = sum(a["weight"] for a in insts)
+            ret = 0.0
+            for a in insts:
+                w = a["weight"] / total_w if total_w > 0 else 0.0
+                ret += w * lookup.get(a["instrument_id"], {}).get(d, 0.0)
+            position.values[ac] *= (1 + ret)
+
+        trigger = engine.check_trigger(d, idx, trade_dates, date_set, position)
+        if trigger:
+            engine.execute_rebalance(d, trigger[0], trigger[1], position)
+
+        nav = position.get_total_value()
+        prev = path[-1]["nav"] if path else initial_amount
+        hwm = max(hwm, nav)
+        path.append({
+            "path_date": d,
+            "nav": round(nav, 4),
+            "daily_return": round((nav - prev) / prev, 8),
+            "cumulative_return": round((nav - initial_amount) / initial_amount, 8),
+            "drawdown": round((nav - hwm) / hwm, 8),
+            "high_water_mark": round(hwm, 4),
+        })
+    return path, engine.get_events()
+
+
+class TestArraySimulator:
+    """거래일 마스크 / 배열 시뮬레이터 — 종전 루프 구현과 동일 결과"""
+
+    @pytest.fixture
+    def business_days(self):
+        start = date(2022, 12, 20)
+        days = [start + timedelta(days=i) for i in range(500)]
+        return [d for d in days if d.weekday() < 5 and d.day != 1]  # 1일 휴장 가정
+
+    @pytest.mark.parametrize("frequency", ["MONTHLY", "QUARTERLY"])
+    @pytest.mark.parametrize("timing", ["START", "END"])
+    def test_mask_matches_calendar_utils(self, business_days, frequency, timing):
+        engine = RebalancingEngine(RebalancingConfig(
+            rebalance_type="PERIODIC", frequency=frequency, periodic_timing=timing,
+        ))
+        date_set = set(business_days)
+        expected = [
+            engine._check_periodic_trigger(d, i, business_days, date_set) is not None
+            for i, d in enumerate(business_days)
+        ]
+        mask = periodic_trigger_mask(business_days, frequency, timing)
+        assert mask.tolist() == expected
+
+    @pytest.mark.parametrize("config", [
+        RebalancingConfig.none(),
+        RebalancingConfig(rebalance_type="PERIODIC", frequency="MONTHLY", cost_rate=0.001),
+        RebalancingConfig(rebalance_type="PERIODIC", frequency="QUARTERLY",
+                          periodic_timing="END", cost_rate=0.002),
+        RebalancingConfig(rebalance_type="DRIFT", drift_threshold=0.01, cost_rate=0.001),
+        RebalancingConfig(rebalance_type="HYBRID", frequency="QUARTERLY",
+                          drift_threshold=0.03, cost_rate=0.001),
+    ])
+    def test_matches_reference_loop(self, business_days, config):
+        import random
+
+        rng = random.Random(11)
+        allocations = [
+            {"instrument_id": 1, "ticker": "A", "weight": 0.4, "asset_class": "EQUITY"},
+            {"instrument_id": 2, "ticker": "B", "weight": 0.2, "asset_class": "EQUITY"},
+            {"instrument_id": 3, "ticker": "C", "weight": 0.3, "asset_class": "BOND"},
+            {"instrument_id": 4, "ticker": "D", "weight": 0.1, "asset_class": None},
+        ]
+        returns_by_instrument = {
+            inst_id: [
+                {"trade_date": d, "daily_return": rng.gauss(0.0003, vol)}
+                for d in business_days if rng.random() > 0.05
+            ]
+            for inst_id, vol in [(1, 0.015), (2, 0.02), (3, 0.004)]
+        }
+
+        path, events = calculate_nav_with_rebalancing(
+            allocations, returns_by_instrument, business_days, 1000000, config
+        )
+        ref_path, ref_events = _reference_nav_with_rebalancing(
+            allocations, returns_by_instrument, business_days, 1000000, config
+        )
+
+        assert path == ref_path
+        assert [(e.event_date, e.event_order, e.trigger_type, e.trigger_detail) for e in events] == \
+            [(e.event_date, e.event_order, e.trigger_type, e.trigger_detail) for e in ref_events]
+        for event, ref in zip(events, ref_events):
+            assert event.turnover == pytest.approx(ref.turnover, abs=1e-15)
+            assert event.nav_after == pytest.approx(ref.nav_after, rel=1e-15)
+            assert event.before_weights == ref.before_weights
+            assert event.after_weights == ref.after_weights
+        if config.is_enabled():
+            assert events
+
+
 # ============================================================================
 # DoD 테스트 (Definition of Done)
 # ============================================================================
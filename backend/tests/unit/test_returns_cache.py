@@ -0,0 +1,93 @@
+"""
+returns_cache 단위 테스트 — 구간 슬라이스 / 바이트 상한 LRU / 무효화 / 가격 행렬 연동
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.models.real_data import StockPriceDaily
+from app.services.price_matrix import load_price_matrix
+from app.services.returns_cache import ReturnsCache, invalidate_returns_cache, returns_cache
+
+D = [date(2024, 1, 2) + timedelta(days=i) for i in range(10)]
+
+
+def _series(n=10):
+    return D[:n], np.arange(n, dtype=np.float64)
+
+
+@pytest.mark.unit
+class TestReturnsCache:
+    def test_covered_range_is_sliced(self):
+        cache = ReturnsCache(1 << 20)
+        cache.put("db", "daily_return", 1, D[0], D[-1], _series(), version=0)
+
+        dates, values = cache.get("db", "daily_return", 1, D[2], D[4])
+        assert dates == D[2:5]
+        assert values.tolist() == [2.0, 3.0, 4.0]
+        assert cache.get("db", "daily_return", 1, D[0], D[-1] + timedelta(days=1)) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction_by_bytes(self):
+        one = 10 * 8 + 10 * 40
+        cache = ReturnsCache(2 * one)
+        for inst in (1, 2):
+            cache.put("db", "daily_return", inst, D[0], D[-1], _series(), version=0)
+        cache.get("db", "daily_return", 1, D[0], D[-1])  # 1 최근 사용
+        cache.put("db", "daily_return", 3, D[0], D[-1], _series(), version=0)
+
+        assert cache.get("db", "daily_return", 2, D[0], D[-1]) is None
+        assert cache.get("db", "daily_return", 1, D[0], D[-1]) is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == 2 * one
+
+    def test_invalidation_drops_entries_and_stale_puts(self):
+        cache = ReturnsCache(1 << 20)
+        cache.put("db", "stock_price_daily", "A", D[0], D[-1], _series(), version=0)
+        cache.put("db", "daily_return", 1, D[0], D[-1], _series(), version=0)
+
+        stale_version = cache.version("db", "stock_price_daily")
+        assert cache.invalidate("stock_price_daily") == 1
+        cache.put("db", "stock_price_daily", "B", D[0], D[-1], _series(), version=stale_version)
+
+        assert cache.stats()["entries_by_source"] == {"daily_return": 1}
+
+
+def _price(db, ticker, td, close):
+    db.add(StockPriceDaily(
+        ticker=ticker, trade_date=td,
+        open_price=Decimal(close), high_price=Decimal(close), low_price=Decimal(close),
+        close_price=Decimal(close), volume=100, source_id="PYKRX", as_of_date=td,
+    ))
+    db.commit()
+
+
+@pytest.mark.unit
+class TestCachedPriceMatrix:
+    def test_matches_query_path_and_reuses_cache(self, db):
+        _price(db, "005930", D[0], "100")
+        _price(db, "005930", D[1], "101")
+        _price(db, "000660", D[1], "50")
+
+        direct = load_price_matrix(db, ["005930", "000660", "999999"], D[0], D[5])
+        cached = load_price_matrix(db, ["005930", "000660", "999999"], D[0], D[5], use_cache=True)
+        assert cached.dates == direct.dates
+        assert cached.tickers == direct.tickers
+        np.testing.assert_array_equal(cached.values, direct.values)
+
+        misses = returns_cache.misses
+        again = load_price_matrix(db, ["005930"], D[1], D[3], use_cache=True)
+        assert returns_cache.misses == misses
+        assert again.close_series("005930") == {D[1]: 101.0}
+
+    def test_loader_hook_invalidates(self, db):
+        _price(db, "005930", D[0], "100")
+        load_price_matrix(db, ["005930"], D[0], D[5], use_cache=True)
+
+        _price(db, "005930", D[1], "102")
+        invalidate_returns_cache("stock_price_daily", ["005930"], db=db)
+        matrix = load_price_matrix(db, ["005930"], D[0], D[5], use_cache=True)
+        assert matrix.close_series("005930") == {D[0]: 100.0, D[1]: 102.0}
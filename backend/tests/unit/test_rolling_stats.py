@@ -0,0 +1,91 @@
+"""
+rolling_stats 단위 테스트 — 창별 직접 계산(performance_analyzer 정의)과 비교
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.analytics_engine_v3 import build_extensions
+from app.services.performance_analyzer import (
+    NAVPoint,
+    calculate_daily_returns,
+    calculate_sharpe_ratio,
+    calculate_volatility,
+    calculate_cagr,
+)
+from app.services.rolling_stats import (
+    rolling_drawdown,
+    rolling_return,
+    rolling_sharpe,
+    rolling_volatility,
+    window_starts,
+)
+
+
+def _series(n=900, seed=3):
+    rng = np.random.default_rng(seed)
+    days, d = [], date(2015, 1, 1)
+    while len(days) < n:
+        if d.weekday() < 5:
+            days.append(d)
+        d += timedelta(days=1)
+    nav = 100 * np.cumprod(1 + rng.normal(0.0004, 0.012, n))
+    return days, nav
+
+
+def _naive(days, nav, window_days):
+    """창마다 슬라이스 후 performance_analyzer 로 계산"""
+    points = [NAVPoint(nav_date=d, nav=v) for d, v in zip(days, nav.tolist())]
+    out = {"return": {}, "volatility": {}, "sharpe": {}, "drawdown": {}}
+    for i, point in enumerate(points):
+        target = point.nav_date - timedelta(days=window_days)
+        start = next(j for j, p in enumerate(points) if p.nav_date >= target)
+        if start >= i:
+            continue
+        window = points[start:i + 1]
+        out["return"][i] = window[-1].nav / window[0].nav - 1
+        out["drawdown"][i] = window[-1].nav / max(p.nav for p in window) - 1
+        returns = calculate_daily_returns(window)
+        if len(returns) >= 2:
+            vol = calculate_volatility(returns)
+            out["volatility"][i] = vol
+            sharpe = calculate_sharpe_ratio(calculate_cagr(window), vol)
+            if sharpe is not None:
+                out["sharpe"][i] = sharpe
+    return out
+
+
+@pytest.mark.unit
+class TestRollingStats:
+    @pytest.mark.parametrize("window_days", [30, 365])
+    def test_matches_per_window_calculation(self, window_days):
+        days, nav = _series()
+        starts = window_starts(days, window_days)
+        expected = _naive(days, nav, window_days)
+
+        for name, fn in (
+            ("return", rolling_return),
+            ("volatility", rolling_volatility),
+            ("sharpe", rolling_sharpe),
+            ("drawdown", rolling_drawdown),
+        ):
+            actual = fn(nav, starts)
+            defined = {i for i in range(len(nav)) if not np.isnan(actual[i])}
+            assert defined == set(expected[name]), name
+            for i, value in expected[name].items():
+                assert actual[i] == pytest.approx(value, rel=1e-9, abs=1e-12), (name, i)
+
+    def test_window_starts_bisect(self):
+        days = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 5), date(2024, 1, 9)]
+        assert window_starts(days, 3).tolist() == [0, 0, 1, 3]
+
+    def test_extensions_payload(self):
+        days, nav = _series(1000)
+        ext = build_extensions(
+            [NAVPoint(nav_date=d, nav=v) for d, v in zip(days, nav.tolist())], [], [], []
+        ).to_dict()
+        vol = ext["rolling_volatility"]["window_3y"]
+        assert vol[0]["end_date"] > days[0].isoformat()
+        assert len(ext["rolling_sharpe"]["window_3y"]) == len(vol)
+        assert all(p["value"] <= 0 for p in ext["rolling_drawdown"]["window_3y"])
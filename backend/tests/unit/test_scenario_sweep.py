@@ -0,0 +1,144 @@
+"""
+scenario_sweep 단위 테스트 — 공유 수익률 행렬 / 단건 결과 일치 / 결과 저장 / 저장 조합 제외
+"""
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.config import settings
+from app.models.simulation import SimulationRun
+from app.routes import backtesting as backtesting_routes
+from app.services import scenario_simulation, scenario_sweep
+from app.services.scenario_simulation import run_scenario_simulation
+from app.services.scenario_sweep import run_scenario_sweep
+
+START, END = date(2023, 1, 1), date(2023, 12, 31)
+TRADE_DATES = [
+    START + timedelta(days=i) for i in range(365)
+    if (START + timedelta(days=i)).weekday() < 5
+]
+ALLOCATIONS = {
+    "MIN_VOL": [
+        {"instrument_id": 1, "ticker": "A", "weight": 0.3, "asset_class": "EQUITY"},
+        {"instrument_id": 2, "ticker": "B", "weight": 0.7, "asset_class": "BOND"},
+    ],
+    "GROWTH": [
+        {"instrument_id": 1, "ticker": "A", "weight": 0.5, "asset_class": "EQUITY"},
+        {"instrument_id": 3, "ticker": "C", "weight": 0.3, "asset_class": "EQUITY"},
+        {"instrument_id": 2, "ticker": "B", "weight": 0.2, "asset_class": "BOND"},
+    ],
+}
+RULES = [
+    None,
+    {"rebalance_type": "PERIODIC", "frequency": "MONTHLY", "periodic_timing": "START",
+     "drift_threshold": None, "cost_rate": 0.001, "rule_id": None},
+    {"rebalance_type": "DRIFT", "frequency": None, "periodic_timing": "START",
+     "drift_threshold": 0.02, "cost_rate": 0.002, "rule_id": None},
+]
+
+
+@pytest.fixture
+def loaders(monkeypatch):
+    """DB 조회 함수 대체 — get_daily_returns 호출 인자 기록"""
+    rng = random.Random(3)
+    returns = {
+        inst_id: [{"trade_date": d, "daily_return": rng.gauss(0.0003, vol)} for d in TRADE_DATES]
+        for inst_id, vol in [(1, 0.015), (2, 0.004), (3, 0.02)]
+    }
+    calls = []
+
+    def get_daily_returns(db, instrument_ids, start_date, end_date):
+        calls.append(list(instrument_ids))
+        return {i: returns[i] for i in instrument_ids}
+
+    for module in (scenario_simulation, scenario_sweep):
+        monkeypatch.setattr(module, "get_trade_dates", lambda db, s, e: TRADE_DATES)
+        monkeypatch.setattr(module, "get_portfolio_allocation", lambda db, sid, d: ALLOCATIONS.get(sid, []))
+        monkeypatch.setattr(module, "get_daily_returns", get_daily_returns)
+    monkeypatch.setattr(settings, "use_rebalancing", True)
+    return calls
+
+
+@pytest.mark.unit
+class TestRunScenarioSweep:
+    def test_matches_single_runs_with_one_returns_query(self, db, loaders):
+        sweep = run_scenario_sweep(db, ["MIN_VOL", "GROWTH"], RULES, START, END, workers=1)
+
+        assert loaders == [[1, 2, 3]]
+        assert len(sweep["results"]) == 6
+        for entry in sweep["results"]:
+            single = run_scenario_simulation(
+                db, entry["scenario_id"], START, END, rebalancing_rule=entry["rebalancing_rule"]
+            )
+            assert entry["final_value"] == single["final_value"]
+            assert entry["risk_metrics"] == single["risk_metrics"]
+            assert entry["rebalancing_events_count"] == single["rebalancing_events_count"]
+
+    def test_results_stored_and_reused(self, db, loaders):
+        first = run_scenario_sweep(db, ["MIN_VOL"], RULES, START, END, workers=1)
+        hashes = {r["request_hash"] for r in first["results"]}
+
+        stored = db.query(SimulationRun).filter(SimulationRun.request_hash.in_(hashes)).all()
+        assert len(stored) == 3
+        assert not any(r["cache_hit"] for r in first["results"])
+
+        second = run_scenario_sweep(db, ["MIN_VOL"], RULES, START, END, workers=1)
+        assert all(r["cache_hit"] for r in second["results"])
+
+    def test_stored_combinations_skipped_without_hits(self, db, loaders):
+        first = run_scenario_sweep(db, ["MIN_VOL"], RULES, START, END, workers=1)
+        loaders.clear()
+
+        second = run_scenario_sweep(db, ["MIN_VOL", "GROWTH"], RULES, START, END, workers=1)
+
+        # 저장된 MIN_VOL 조합은 계산하지 않음 → GROWTH 종목만 조회
+        assert loaders == [[1, 3, 2]]
+        assert second["instruments"] == 3
+        cached = [r for r in second["results"] if r["cache_hit"]]
+        assert [r["scenario_id"] for r in cached] == ["MIN_VOL"] * 3
+        for before, after in zip(first["results"], cached):
+            assert after["request_hash"] == before["request_hash"]
+            assert after["final_value"] == pytest.approx(before["final_value"])
+            assert after["rebalancing_enabled"] == before["rebalancing_enabled"]
+            assert after["rebalancing_events_count"] == before["rebalancing_events_count"]
+
+        # 사전 조회는 적중 통계를 올리지 않음
+        assert {run.hit_count for run in db.query(SimulationRun).all()} == {0}
+
+        loaders.clear()
+        third = run_scenario_sweep(db, ["MIN_VOL", "GROWTH"], RULES, START, END, workers=1)
+        assert loaders == []
+        assert third["workers"] == 0
+        assert all(r["cache_hit"] for r in third["results"])
+
+    def test_missing_allocation_reported_per_combination(self, db, loaders):
+        sweep = run_scenario_sweep(db, ["MIN_VOL", "DEFENSIVE"], [None], START, END, workers=1)
+        errors = {r["scenario_id"]: r.get("error") for r in sweep["results"]}
+        assert errors["MIN_VOL"] is None
+        assert "구성비가 없습니다" in errors["DEFENSIVE"]
+
+    def test_rules_require_rebalancing_flag(self, db, loaders, monkeypatch):
+        monkeypatch.setattr(settings, "use_rebalancing", False)
+        with pytest.raises(ValueError, match="리밸런싱 기능이 비활성화"):
+            run_scenario_sweep(db, ["MIN_VOL"], RULES, START, END, workers=1)
+
+
+@pytest.mark.unit
+class TestScenarioRequestHash:
+    def test_single_request_shares_sweep_hash(self, client, db, loaders, auth_headers, monkeypatch):
+        """단건 API 는 날짜 문자열 표기와 무관하게 스윕 저장 결과를 재사용"""
+        monkeypatch.setattr(backtesting_routes, "USE_SIM_STORE", True)
+        monkeypatch.setattr(backtesting_routes, "USE_SCENARIO_DB", True)
+        sweep = run_scenario_sweep(db, ["MIN_VOL"], [None], START, END, workers=1)
+
+        response = client.post(
+            "/backtest/scenario",
+            json={"scenario_id": "min_vol", "start_date": "2023-1-1", "end_date": "2023-12-31"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["cache_hit"] is True
+        assert body["request_hash"] == sweep["results"][0]["request_hash"]
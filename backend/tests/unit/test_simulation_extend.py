@@ -0,0 +1,152 @@
+"""
+시뮬레이션 연장(extend) 모드 단위 테스트
+- 캐시 run 에 새 거래일만 추가한 결과 = 전체 재계산 결과 (고정 비중 / 정기 / Drift 리밸런싱)
+- 새 거래일 구간만 수익률 조회, 이어 계산 불가 규칙은 전체 계산
+"""
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services import scenario_simulation
+from app.services.scenario_simulation import extend_scenario_simulation, run_scenario_simulation
+from app.services.simulation_store import (
+    find_extendable_run,
+    generate_series_hash,
+    get_engine_version,
+    get_or_compute_simulation,
+)
+
+START = date(2023, 1, 1)
+TRADE_DATES = [
+    START + timedelta(days=i) for i in range(365)
+    if (START + timedelta(days=i)).weekday() < 5
+]
+ALLOCATIONS = [
+    {"instrument_id": 1, "ticker": "A", "weight": 0.5, "asset_class": "EQUITY"},
+    {"instrument_id": 3, "ticker": "C", "weight": 0.3, "asset_class": "EQUITY"},
+    {"instrument_id": 2, "ticker": "B", "weight": 0.2, "asset_class": "BOND"},
+]
+PERIODIC = {"rebalance_type": "PERIODIC", "frequency": "MONTHLY", "periodic_timing": "START",
+            "drift_threshold": None, "cost_rate": 0.001, "rule_id": None}
+DRIFT = {"rebalance_type": "DRIFT", "frequency": None, "periodic_timing": "START",
+         "drift_threshold": 0.02, "cost_rate": 0.002, "rule_id": None}
+
+
+@pytest.fixture
+def loaders(monkeypatch):
+    """DB 조회 함수 대체 — get_daily_returns 조회 구간 기록"""
+    rng = random.Random(5)
+    returns = {
+        inst_id: [{"trade_date": d, "daily_return": rng.gauss(0.0003, vol)} for d in TRADE_DATES]
+        for inst_id, vol in [(1, 0.015), (2, 0.004), (3, 0.02)]
+    }
+    ranges = []
+
+    def get_daily_returns(db, instrument_ids, start_date, end_date):
+        ranges.append((start_date, end_date))
+        return {
+            i: [r for r in returns[i] if start_date <= r["trade_date"] <= end_date]
+            for i in instrument_ids
+        }
+
+    monkeypatch.setattr(
+        scenario_simulation, "get_trade_dates",
+        lambda db, s, e: [d for d in TRADE_DATES if s <= d <= e],
+    )
+    monkeypatch.setattr(scenario_simulation, "get_portfolio_allocation", lambda db, sid, d: ALLOCATIONS)
+    monkeypatch.setattr(scenario_simulation, "get_daily_returns", get_daily_returns)
+    monkeypatch.setattr(settings, "use_rebalancing", True)
+    return ranges
+
+
+def _params(end_date, rule):
+    return {
+        "scenario_id": "GROWTH",
+        "start_date": START.isoformat(),
+        "end_date": end_date.isoformat(),
+        "initial_amount": 1000000.0,
+        "rebalancing_rule": rule,
+    }
+
+
+def _request(db, end_date, rule, compute_fn=None):
+    def compute():
+        return run_scenario_simulation(db, "GROWTH", START, end_date, rebalancing_rule=rule)
+
+    def extend(base_result, resume_state):
+        return extend_scenario_simulation(db, base_result, resume_state, end_date, rule)
+
+    return get_or_compute_simulation(
+        db, "scenario_simulation", _params(end_date, rule), compute_fn or compute,
+        scenario_id="GROWTH", extend_fn=extend,
+    )
+
+
+def _events(result):
+    """리밸런싱 이벤트 비교 키 (NAV 는 연장 / 재계산 간 부동소수 오차 허용)"""
+    return [
+        (e["event_date"], e["event_order"], e["trigger_type"], pytest.approx(e["nav_after"], rel=1e-9))
+        for e in result.get("rebalancing_events") or []
+    ]
+
+
+def _no_compute():
+    raise AssertionError("전체 재계산이 호출되면 안 됨")
+
+
+@pytest.mark.unit
+class TestExtendScenario:
+    @pytest.mark.parametrize("rule", [None, PERIODIC, DRIFT], ids=["fixed", "periodic", "drift"])
+    def test_extension_matches_full_recompute(self, db, loaders, rule):
+        first_end, new_end = date(2023, 6, 14), date(2023, 9, 20)
+        _request(db, first_end, rule)
+        loaders.clear()
+
+        extended, _, cache_hit, _ = _request(db, new_end, rule, compute_fn=_no_compute)
+        assert not cache_hit
+        assert loaders == [(first_end + timedelta(days=1), new_end)]
+
+        full = run_scenario_simulation(db, "GROWTH", START, new_end, rebalancing_rule=rule)
+        assert [p["path_date"] for p in extended["path"]] == [p["path_date"] for p in full["path"]]
+        for key in ("nav", "drawdown", "high_water_mark", "cumulative_return"):
+            np.testing.assert_allclose(
+                [p[key] for p in extended["path"]], [p[key] for p in full["path"]], rtol=1e-9, atol=1e-8
+            )
+        assert extended["final_value"] == full["final_value"]
+        assert extended["risk_metrics"]["max_drawdown"] == full["risk_metrics"]["max_drawdown"]
+        assert extended["rebalancing_events_count"] == full["rebalancing_events_count"]
+        assert _events(extended) == _events(full)
+        assert len(_events(extended)) == extended["rebalancing_events_count"]
+        assert extended["resume_state"]["nav"] == pytest.approx(full["resume_state"]["nav"], rel=1e-12)
+
+        # 연장 결과도 저장 → 같은 요청은 캐시 적중
+        _, _, hit, _ = _request(db, new_end, rule, compute_fn=_no_compute)
+        assert hit
+
+    def test_end_timing_recomputes(self, db, loaders):
+        rule = {**PERIODIC, "periodic_timing": "END"}
+        _request(db, date(2023, 6, 14), rule)
+        loaders.clear()
+
+        _request(db, date(2023, 9, 20), rule)
+        assert loaders == [(START, date(2023, 9, 20))]
+
+
+@pytest.mark.unit
+class TestFindExtendableRun:
+    def test_latest_earlier_run_with_same_params(self, db, loaders):
+        for end_date in (date(2023, 3, 15), date(2023, 5, 15), date(2023, 8, 15)):
+            _request(db, end_date, None)
+        _request(db, date(2023, 6, 15), DRIFT)
+
+        series_hash = generate_series_hash("scenario_simulation", _params(date(2023, 7, 1), None))
+        run, _ = find_extendable_run(db, series_hash, date(2023, 7, 1), get_engine_version())
+        assert run.end_date == date(2023, 5, 15)
+        assert run.resume_state["last_date"] == "2023-05-15"
+
+        assert find_extendable_run(db, series_hash, date(2023, 3, 1), get_engine_version()) is None
+        assert find_extendable_run(db, series_hash, date(2023, 7, 1), "other") is None
+        assert generate_series_hash("scenario_simulation", {"scenario_id": "GROWTH"}) is None
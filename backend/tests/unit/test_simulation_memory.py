@@ -0,0 +1,249 @@
+"""
+시뮬레이션 결과 프로세스 캐시 단위 테스트
+- LRU / 유효기간 / 경로 유무
+- single-flight: 동시 동일 요청은 계산 1회
+- simulation_store 통합: DB 적중 후 메모리 적중
+- 라우트: 동시 동일 요청이 이벤트 루프를 막지 않고 계산 1회를 공유
+"""
+import asyncio
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.auth import get_current_user
+from app.database import get_db
+from app.main import app
+from app.models.simulation import SimulationRun
+from app.rate_limiter import limiter
+from app.routes import backtesting as backtesting_routes
+from app.services.scenario_simulation import run_scenario_simulation_fallback
+from app.services.simulation_memory import SimulationMemoryCache, simulation_memory
+from app.services.simulation_store import get_or_compute_simulation
+
+KEY = ("db", "simulation_run", "h1")
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timeout")
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestSimulationMemoryCache:
+    def test_lru_and_stats(self):
+        cache = SimulationMemoryCache(max_entries=2, ttl_seconds=60)
+        for name in ("a", "b", "c"):
+            cache.put(("db", "s", name), {"name": name}, "v1")
+
+        assert cache.get(("db", "s", "a")) is None
+        assert cache.get(("db", "s", "c")) == ({"name": "c"}, "v1")
+        stats = cache.stats()
+        assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1, 1)
+
+    def test_expiry(self):
+        cache = SimulationMemoryCache(max_entries=4, ttl_seconds=0)
+        cache.put(KEY, {}, "v1")
+        assert cache.get(KEY) is None
+
+        cache = SimulationMemoryCache(max_entries=4, ttl_seconds=60)
+        cache.put(KEY, {}, "v1", expires_at=datetime.utcnow() - timedelta(seconds=1))
+        assert cache.get(KEY) is None
+
+    def test_path_variants(self):
+        cache = SimulationMemoryCache(max_entries=4, ttl_seconds=60)
+        cache.put(KEY, {"run_id": 7, "final_value": 1}, "v1", has_path=False, run_id=7)
+        assert cache.get(KEY, need_path=True) is None
+        assert cache.get(KEY, need_path=False)[0] == {"run_id": 7, "final_value": 1}
+
+        cache.put(KEY, {"final_value": 1, "path": [1, 2]}, "v1", has_path=True, run_id=7)
+        lazy, _ = cache.get(KEY, need_path=False)
+        assert lazy == {"final_value": 1, "run_id": 7}
+
+    def test_single_flight(self):
+        cache = SimulationMemoryCache(max_entries=4, ttl_seconds=60)
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.run_once(KEY, compute)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        _wait_for(lambda: cache.stats()["coalesced"] == 3)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert calls == [1]
+        assert sorted(coalesced for _, coalesced in results) == [False, True, True, True]
+        assert {value for value, _ in results} == {"result"}
+        assert cache.stats()["in_flight"] == 0
+
+    def test_single_flight_error_propagates(self):
+        cache = SimulationMemoryCache(max_entries=4, ttl_seconds=60)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.run_once(KEY, fail)
+        assert cache.run_once(KEY, lambda: 1) == (1, False)
+
+
+@pytest.mark.unit
+class TestStoreMemoryTier:
+    PARAMS = {"scenario_id": "GROWTH", "start_date": "2024-01-01", "end_date": "2024-03-31"}
+
+    def _compute(self, calls):
+        def compute():
+            calls.append(1)
+            return run_scenario_simulation_fallback(
+                scenario_id="GROWTH",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 3, 31),
+                initial_amount=1_000_000,
+            )
+        return compute
+
+    def test_db_hit_then_memory_hit(self, db):
+        calls = []
+        compute = self._compute(calls)
+        _, _, hit0, _ = get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)
+        from_db, _, hit1, _ = get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)
+
+        # DB 행을 지워도 메모리 계층에서 같은 결과
+        db.query(SimulationRun).delete()
+        db.commit()
+        from_memory, _, hit2, _ = get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)
+
+        assert (hit0, hit1, hit2) == (False, True, True)
+        assert calls == [1]
+        assert from_memory is from_db
+
+    def test_memory_hits_counted_on_next_write(self, db):
+        calls = []
+        compute = self._compute(calls)
+        get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)
+        get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)  # DB 적중
+        for _ in range(3):
+            get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)  # 메모리 적중
+
+        assert db.query(SimulationRun).one().hit_count == 1
+        assert simulation_memory.stats()["pending_hits"] == 3
+
+        # 다음 DB 쓰기(다른 요청 저장)에 버퍼된 적중 수가 함께 반영
+        other = {**self.PARAMS, "end_date": "2024-02-29"}
+        get_or_compute_simulation(db, "scenario_simulation", other, compute)
+
+        db.expire_all()
+        assert sorted(run.hit_count for run in db.query(SimulationRun).all()) == [0, 4]
+        assert simulation_memory.stats()["pending_hits"] == 0
+
+        # 같은 run 의 DB 적중 시에도 버퍼분 + 1
+        get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)  # 메모리 적중
+        simulation_memory.invalidate()
+        get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, compute)  # DB 적중
+        db.expire_all()
+        assert sorted(run.hit_count for run in db.query(SimulationRun).all()) == [0, 6]
+        assert calls == [1, 1]
+
+    def test_concurrent_requests_compute_once(self, db):
+        calls = []
+        compute = self._compute(calls)
+        release = threading.Event()
+
+        def slow_compute():
+            release.wait(5)
+            return compute()
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    get_or_compute_simulation(db, "scenario_simulation", self.PARAMS, slow_compute)
+                )
+            )
+            for _ in range(3)
+        ]
+        before = simulation_memory.stats()["coalesced"]
+        threads[0].start()
+        _wait_for(lambda: simulation_memory.stats()["in_flight"] == 1)
+        for t in threads[1:]:
+            t.start()
+        _wait_for(lambda: simulation_memory.stats()["coalesced"] - before == 2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert calls == [1]
+        assert sorted(hit for _, _, hit, _ in results) == [False, True, True]
+        assert len({id(result) for result, _, _, _ in results}) == 1
+
+
+def _simple_backtest_result():
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(60)]
+    return {
+        "start_date": days[0].isoformat(),
+        "end_date": days[-1].isoformat(),
+        "initial_investment": 1_000_000,
+        "final_value": 1_000_000 + 100 * (len(days) - 1),
+        "daily_values": [
+            {"date": d.isoformat(), "value": 1_000_000 + 100 * i, "return": i / 100}
+            for i, d in enumerate(days)
+        ],
+        "risk_metrics": {"max_drawdown": 0.0},
+        "historical_observation": {"total_return": 0.59},
+    }
+
+
+@pytest.mark.unit
+class TestRouteConcurrency:
+    """ASGI 앱에 동일 요청 2건 동시 전송"""
+
+    async def test_identical_requests_share_one_compute(self, db, test_user, monkeypatch):
+        calls = []
+        before = simulation_memory.stats()["coalesced"]
+
+        def slow_backtest(**kwargs):
+            calls.append(1)
+            # 두 번째 요청이 합류할 때까지 대기 — 이벤트 루프가 막혀 있으면 합류 불가
+            _wait_for(lambda: simulation_memory.stats()["coalesced"] - before == 1)
+            return _simple_backtest_result()
+
+        def override_get_db():
+            session = sessionmaker(bind=db.get_bind())()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        monkeypatch.setattr(backtesting_routes, "run_simple_backtest", slow_backtest)
+        monkeypatch.setattr(backtesting_routes, "USE_SIM_STORE", True)
+        monkeypatch.setattr(limiter, "enabled", False)
+        monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+        monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: test_user)
+
+        body = {"investment_type": "moderate", "investment_amount": 1_000_000, "period_years": 1}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            responses = await asyncio.gather(
+                client.post("/backtest/run", json=body),
+                client.post("/backtest/run", json=body),
+            )
+
+        assert [r.status_code for r in responses] == [200, 200]
+        assert calls == [1]
+        assert sorted(r.json()["cache_hit"] for r in responses) == [False, True]
@@ -0,0 +1,156 @@
+"""
+인기 시뮬레이션 선계산(prewarm) 단위 테스트
+- hit_count 상위 요청 선정, 당일 종료 시나리오의 종료일 이동
+- 실행 시점 기준 백테스트 교체(적중 통계 유지), 고정 기간 시나리오 건너뜀, 커버리지 / 실패 집계
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.config import settings
+from app.models.simulation import SimulationRun
+from app.services import simulation_prewarm
+from app.services.scenario_simulation import run_scenario_simulation_fallback
+from app.services.simulation_prewarm import (
+    PrewarmTarget,
+    popular_requests,
+    prewarm_popular_simulations,
+    replay_params,
+)
+from app.services.simulation_store import generate_request_hash, get_or_compute_simulation
+from app.utils.kst_now import kst_now
+
+TODAY = kst_now().date()
+
+
+def _fake_compute(db, params):
+    """재실행 함수 대체 — 요청 기간의 폴백 시나리오 결과"""
+    end_date = date.fromisoformat(params.get("end_date", TODAY.isoformat()))
+    return run_scenario_simulation_fallback(
+        scenario_id="GROWTH",
+        start_date=end_date - timedelta(days=120),
+        end_date=end_date,
+        initial_amount=1_000_000,
+    )
+
+
+@pytest.fixture
+def replayers(monkeypatch):
+    """요청 유형별 재실행 함수를 호출 기록용 가짜로 대체"""
+    calls = []
+
+    def replayer(request_type):
+        def compute(db, params):
+            calls.append((request_type, params))
+            if params.get("fail"):
+                raise RuntimeError("boom")
+            return _fake_compute(db, params)
+        return compute
+
+    for request_type in ("scenario_simulation", "backtest_simple", "backtest_portfolio"):
+        monkeypatch.setitem(simulation_prewarm._REPLAYERS, request_type, replayer(request_type))
+    monkeypatch.setattr(settings, "use_sim_store", True)
+    monkeypatch.setattr(settings, "use_scenario_db", False)
+    return calls
+
+
+def _seed(db, request_type, params, hits, created_at=None):
+    get_or_compute_simulation(
+        db, request_type, params, lambda: _fake_compute(db, params), include_path=False
+    )
+    run = db.query(SimulationRun).filter(
+        SimulationRun.request_hash == generate_request_hash(request_type, params)
+    ).one()
+    run.hit_count = hits
+    if created_at is not None:
+        run.created_at = created_at
+    db.commit()
+    return run
+
+
+def _scenario_params(end_date):
+    return {
+        "scenario_id": "GROWTH",
+        "start_date": (end_date - timedelta(days=120)).isoformat(),
+        "end_date": end_date.isoformat(),
+        "initial_amount": 1000000.0,
+        "rebalancing_rule": None,
+    }
+
+
+BACKTEST = {"investment_type": "moderate", "investment_amount": 1000000, "period_years": 1}
+
+
+@pytest.mark.unit
+class TestPopularRequests:
+    def test_ordered_by_hits_and_limited(self, db, replayers):
+        _seed(db, "backtest_simple", BACKTEST, hits=3)
+        _seed(db, "scenario_simulation", _scenario_params(date(2024, 6, 28)), hits=9)
+        _seed(db, "compare", {"x": 1}, hits=50)  # 재실행 함수 없는 유형은 제외
+        expired = _seed(db, "backtest_simple", {**BACKTEST, "period_years": 3}, hits=20)
+        expired.expires_at = datetime.utcnow() - timedelta(days=1)
+        db.commit()
+
+        targets = popular_requests(db, 10)
+        assert [(t.request_type, t.hit_count) for t in targets] == [
+            ("scenario_simulation", 9), ("backtest_simple", 3)
+        ]
+        assert len(popular_requests(db, 1)) == 1
+
+    def test_replay_rolls_open_ended_scenario(self):
+        created = datetime(2024, 7, 1, 9, 0)
+        open_ended = PrewarmTarget("scenario_simulation", _scenario_params(date(2024, 7, 1)), 1, created)
+        fixed = PrewarmTarget("scenario_simulation", _scenario_params(date(2024, 6, 28)), 1, created)
+
+        assert replay_params(open_ended, date(2024, 7, 5))["end_date"] == "2024-07-05"
+        assert replay_params(fixed, date(2024, 7, 5))["end_date"] == "2024-06-28"
+        assert replay_params(PrewarmTarget("backtest_simple", BACKTEST, 1, created), date(2024, 7, 5)) == BACKTEST
+
+
+@pytest.mark.unit
+class TestPrewarm:
+    def test_prewarm_outcomes(self, db, replayers):
+        backtest_run_id = _seed(db, "backtest_simple", BACKTEST, hits=7).run_id
+        _seed(db, "scenario_simulation", _scenario_params(date(2024, 6, 28)), hits=5)
+        yesterday = TODAY - timedelta(days=1)
+        _seed(
+            db, "scenario_simulation", _scenario_params(yesterday), hits=4,
+            created_at=datetime.combine(yesterday, datetime.min.time()),
+        )
+        _seed(db, "backtest_portfolio", {**BACKTEST, "fail": True}, hits=3)
+        _seed(db, "backtest_simple", {**BACKTEST, "period_years": 5}, hits=2)
+        replayers.clear()
+
+        stats = prewarm_popular_simulations(db, top_n=4, workers=2)
+
+        assert stats["targets"] == 4
+        assert (stats["warmed"], stats["refreshed"], stats["skipped"], stats["failed"]) == (1, 1, 1, 1)
+        assert stats["coverage"] == round(19 / 21, 4)
+        assert sorted(rt for rt, _ in replayers) == [
+            "backtest_portfolio", "backtest_simple", "scenario_simulation"
+        ]
+
+        db.expire_all()
+        # 백테스트: 새 run 으로 교체, 적중 통계 유지
+        refreshed = db.query(SimulationRun).filter(
+            SimulationRun.request_hash == generate_request_hash("backtest_simple", BACKTEST)
+        ).one()
+        assert refreshed.run_id != backtest_run_id
+        assert refreshed.hit_count == 7
+
+        # 당일 종료 시나리오: 오늘 종료일로 새 결과 저장
+        rolled = db.query(SimulationRun).filter(
+            SimulationRun.request_hash == generate_request_hash(
+                "scenario_simulation",
+                {**_scenario_params(yesterday), "end_date": TODAY.isoformat()},
+            )
+        ).one()
+        assert rolled.end_date == TODAY
+
+    def test_disabled(self, db, replayers):
+        _seed(db, "backtest_simple", BACKTEST, hits=1)
+        replayers.clear()
+
+        stats = prewarm_popular_simulations(db, top_n=0)
+        assert stats["targets"] == 0 and stats["coverage"] is None
+        assert replayers == []
@@ -0,0 +1,94 @@
+"""
+trading_calendar 단위 테스트 — bisect 조회 / 월·분기 경계 / 레지스트리 재적재
+"""
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models.real_data import StockPriceDaily
+from app.services import trading_calendar
+from app.services.trading_calendar import (
+    TradingCalendar,
+    clear_trading_calendars,
+    get_trading_calendar,
+    refresh_trading_calendars,
+    trade_dates_between,
+)
+
+# 2024-03-29(금) 휴장, 2024-04-01(월) 휴장 가정
+DATES = [
+    date(2024, 3, 26), date(2024, 3, 27), date(2024, 3, 28),
+    date(2024, 4, 2), date(2024, 4, 3), date(2024, 6, 28), date(2024, 7, 1),
+]
+
+
+@pytest.mark.unit
+class TestTradingCalendar:
+    def test_range_and_neighbours(self):
+        cal = TradingCalendar(reversed(DATES))
+        assert cal.between(date(2024, 3, 28), date(2024, 4, 2)) == [date(2024, 3, 28), date(2024, 4, 2)]
+        assert cal.between(date(2024, 5, 1), date(2024, 5, 31)) == []
+        assert cal.previous(date(2024, 4, 2)) == date(2024, 3, 28)
+        assert cal.next(date(2024, 3, 29)) == date(2024, 4, 2)
+        assert cal.on_or_before(date(2024, 4, 1)) == date(2024, 3, 28)
+        assert cal.previous(DATES[0]) is None and cal.next(DATES[-1]) is None
+        assert date(2024, 3, 29) not in cal and date(2024, 4, 3) in cal
+
+    def test_month_and_quarter_boundaries(self):
+        cal = TradingCalendar(DATES)
+        assert cal.month_last(date(2024, 3, 1)) == date(2024, 3, 28)
+        assert cal.month_first(date(2024, 4, 30)) == date(2024, 4, 2)
+        assert cal.quarter_first(date(2024, 5, 15)) == date(2024, 4, 2)
+        assert cal.quarter_last(date(2024, 5, 15)) == date(2024, 6, 28)
+        assert cal.is_quarter_end(date(2024, 3, 28))
+        assert cal.is_quarter_start(date(2024, 7, 1))
+        assert not cal.is_month_start(date(2024, 4, 3))
+        assert cal.month_first(date(2024, 5, 1)) is None
+
+
+def _price(db, td):
+    db.add(StockPriceDaily(
+        ticker="005930", trade_date=td,
+        open_price=Decimal("1"), high_price=Decimal("1"), low_price=Decimal("1"),
+        close_price=Decimal("1"), volume=1, source_id="PYKRX", as_of_date=td,
+    ))
+    db.commit()
+
+
+@pytest.mark.unit
+class TestCalendarRegistry:
+    @pytest.fixture(autouse=True)
+    def _fresh_registry(self):
+        clear_trading_calendars()
+        yield
+        clear_trading_calendars()
+
+    def test_loaded_once_and_refreshed_after_load(self, db):
+        _price(db, date(2024, 1, 2))
+        cal = get_trading_calendar(db, "stock_price_daily")
+        assert cal.dates == [date(2024, 1, 2)]
+        assert get_trading_calendar(db, "stock_price_daily") is cal
+
+        _price(db, date(2024, 1, 3))
+        assert get_trading_calendar(db, "stock_price_daily").last == date(2024, 1, 2)
+        refresh_trading_calendars(db)
+        assert get_trading_calendar(db, "stock_price_daily").last == date(2024, 1, 3)
+
+    def test_range_past_end_picks_up_new_dates(self, db, monkeypatch):
+        _price(db, date(2024, 1, 2))
+        end = date(2024, 1, 31)
+        assert trade_dates_between(db, date(2024, 1, 1), end, "stock_price_daily") == [date(2024, 1, 2)]
+
+        _price(db, date(2024, 1, 3))
+        # 확인 주기 이내 → 캐시 사용
+        assert trade_dates_between(db, date(2024, 1, 1), end, "stock_price_daily") == [date(2024, 1, 2)]
+
+        monkeypatch.setattr(trading_calendar, "STALE_CHECK_SECONDS", 0)
+        assert trade_dates_between(db, date(2024, 1, 1), end, "stock_price_daily") == [
+            date(2024, 1, 2), date(2024, 1, 3)
+        ]
+
+    def test_unknown_source_rejected(self, db):
+        with pytest.raises(ValueError):
+            get_trading_calendar(db, "stocks; DROP TABLE stocks")
@@ -0,0 +1,31 @@
+-- =====================================================================
+-- File: phase11_indicator_state_ddl.sql
+-- Project: ForestoCompass
+-- Phase: Phase 11 / Data Extension
+--
+-- 목적:
+--   종목별 기술 지표 증분 상태 저장 테이블 추가
+--   (EMA/Wilder 평활값, OBV 누적, 롤링 윈도우 버퍼)
+--   일별 증분 적재 후 새 봉만 O(1)로 반영, 기업 액션/백필 시 전체 재계산
+--
+-- 적용 DB: PostgreSQL
+-- 스키마: foresto
+-- =====================================================================
+
+BEGIN;
+
+SET search_path TO foresto;
+
+CREATE TABLE IF NOT EXISTS indicator_state (
+    ticker           VARCHAR(10) PRIMARY KEY,
+    last_trade_date  DATE NOT NULL,
+    bar_count        INTEGER NOT NULL DEFAULT 0,
+    state            JSONB NOT NULL,
+
+    rebuilt_at       TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+    updated_at       TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_indicator_state_date ON indicator_state(last_trade_date);
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- ============================================================================
+-- 시뮬레이션 연장(extend) 모드
+--
+-- - series_hash: end_date 를 제외한 요청 해시 (같은 조건에서 기간만 늘어난 요청 묶음)
+-- - resume_state: 마지막 거래일 이어 계산 상태 (NAV / 고점 / 리밸런싱 자산군 평가금액 / 이벤트 수)
+-- - 새 종료일 요청은 종료일이 가장 늦은 같은 series_hash run 에 새 거래일만 추가해 저장
+-- ============================================================================
+
+ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS series_hash VARCHAR(64);
+ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS resume_state JSONB;
+
+CREATE INDEX IF NOT EXISTS idx_simulation_run_series
+    ON simulation_run(series_hash, end_date DESC) WHERE series_hash IS NOT NULL;
+
+COMMENT ON COLUMN simulation_run.series_hash IS 'end_date 제외 요청 해시 (연장 기준 run 조회)';
+COMMENT ON COLUMN simulation_run.resume_state IS '마지막 거래일 이어 계산 상태 (NavResume)';
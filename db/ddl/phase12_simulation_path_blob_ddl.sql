@@ -0,0 +1,14 @@
+-- ============================================================================
+-- 시뮬레이션 경로 열 기반 압축 저장 (simulation_run.path_blob)
+--
+-- - path_blob: 일자 오프셋 int32 + nav / daily_return / cumulative_return /
+--   drawdown / high_water_mark float64 열을 zlib 압축한 blob (backend/app/services/path_codec.py)
+-- - path_points: blob 행 수 (NULL 이면 simulation_path 행 저장 run)
+-- - 기존 run 변환: python scripts/migrate_simulation_path_blob.py
+-- ============================================================================
+
+ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS path_blob BYTEA;
+ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS path_points INTEGER;
+
+COMMENT ON COLUMN simulation_run.path_blob IS '열 기반 압축 일별 경로 (path_codec SPC1)';
+COMMENT ON COLUMN simulation_run.path_points IS 'path_blob 행 수 (NULL = simulation_path 행 저장)';
@@ -0,0 +1,17 @@
+-- ============================================================================
+-- 인기 시뮬레이션 선계산 (prewarm)
+--
+-- - request_type: 요청 유형 (scenario_simulation / backtest_simple / backtest_portfolio) — 재실행 함수 선택
+-- - hit_count / last_accessed_at: 캐시 적중 통계 — 증분 적재 직후 상위 N개 요청 선계산
+-- ============================================================================
+
+ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS request_type VARCHAR(50);
+ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS hit_count INTEGER DEFAULT 0;
+ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS last_accessed_at TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_simulation_run_hits
+    ON simulation_run(hit_count DESC) WHERE request_type IS NOT NULL;
+
+COMMENT ON COLUMN simulation_run.request_type IS '요청 유형 (선계산 재실행 함수 선택)';
+COMMENT ON COLUMN simulation_run.hit_count IS '캐시 적중 횟수 (선계산 대상 선정)';
+COMMENT ON COLUMN simulation_run.last_accessed_at IS '마지막 캐시 적중 시각';
@@ -0,0 +1,10 @@
+-- Phase 3: Compass Score 재계산 대상 (dirty set)
+-- 적재기가 시세/재무/멀티플 변경 종목을 표시 → Compass 일괄 계산이 처리 후 삭제
+
+CREATE TABLE IF NOT EXISTS compass_dirty (
+    ticker VARCHAR(10) PRIMARY KEY,
+    prices_changed BOOLEAN NOT NULL DEFAULT FALSE,
+    financials_changed BOOLEAN NOT NULL DEFAULT FALSE,
+    valuation_changed BOOLEAN NOT NULL DEFAULT FALSE,
+    marked_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
@@ -16,6 +16,13 @@ P1-E2: 시뮬레이션 결과 TTL/보관 정책 스크립트
 - simulation_run.expires_at < 현재시간 인 레코드 삭제
 - CASCADE로 path, summary 자동 삭제
 
+## 정리 모드
+- row (기본): run 단위 아카이브 / 삭제
+- partition: 대량 정리용 (행 단위 DELETE 의 bloat / vacuum 부담 제거)
+  1. 만료 run 을 생성 월별로 묶어 배치당 COPY 1회로 아카이브 (jsonl.gz)
+  2. 만료 run 행만 남은 simulation_path 월 파티션은 DETACH 후 DROP
+  3. 남은 경로 / 요약 / run 은 배치 단위 집합 DELETE
+
 Usage:
     # 드라이런 (삭제 대상 확인만)
     python scripts/cleanup_simulations.py --dry-run
@@ -32,6 +39,9 @@ Usage:
     # 아카이브 후 삭제
     python scripts/cleanup_simulations.py --archive /path/to/archive
 
+    # 파티션 단위 정리 (생성 월별 COPY 아카이브 + 만료 파티션 DROP)
+    python scripts/cleanup_simulations.py --mode partition --archive /path/to/archive
+
 운영 절차:
     1. 매일 새벽 cron으로 드라이런 실행 (알림용)
     2. 주 1회 실제 삭제 실행
@@ -43,6 +53,8 @@ import sys
 import os
 import json
 import gzip
+import re
+import base64
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict
 
@@ -53,6 +65,8 @@ os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sqlalchemy import create_engine, text, func
 from sqlalchemy.orm import sessionmaker
 
+from create_partitions import get_existing_partitions
+
 
 # ============================================================================
 # TTL 정책 정의
@@ -107,7 +121,10 @@ def get_expired_runs(
                 end_date,
                 created_at,
                 expires_at,
-                (SELECT COUNT(*) FROM simulation_path WHERE run_id = simulation_run.run_id) as path_count
+                COALESCE(
+                    path_points,
+                    (SELECT COUNT(*) FROM simulation_path WHERE run_id = simulation_run.run_id)
+                ) as path_count
             FROM simulation_run
             WHERE expires_at IS NOT NULL AND expires_at < :before_date
             ORDER BY expires_at ASC
@@ -170,6 +187,9 @@ def archive_simulation_run(engine, run_id: int) -> Dict:
     def serialize(obj):
         if isinstance(obj, (datetime, date)):
             return obj.isoformat()
+        elif isinstance(obj, (bytes, memoryview)):
+            # path_blob (열 기반 압축 경로)
+            return base64.b64encode(bytes(obj)).decode("ascii")
         elif hasattr(obj, '__float__'):
             return float(obj)
         return obj
@@ -349,6 +369,275 @@ def run_cleanup(
     return result
 
 
+# ============================================================================
+# 파티션 단위 정리 (--mode partition)
+# ============================================================================
+
+# 파티션 범위 상한 (pg_get_expr: FOR VALUES FROM ('2024-01-01') TO ('2024-02-01'))
+_PARTITION_UPPER = re.compile(r"TO \('(\d{4}-\d{2}-\d{2})")
+
+# run 1건 = JSON 1줄 (row 모드 아카이브와 같은 run / summary / paths 구조, path_blob 은 bytea hex)
+_ARCHIVE_COPY_SQL = """
+    COPY (
+        SELECT json_build_object(
+            'run', to_jsonb(r),
+            'summary', (SELECT to_jsonb(s) FROM simulation_summary s WHERE s.run_id = r.run_id),
+            'paths', COALESCE((
+                SELECT jsonb_agg(to_jsonb(p) ORDER BY p.path_date)
+                FROM simulation_path p WHERE p.run_id = r.run_id
+            ), '[]'::jsonb),
+            'archived_at', now()
+        )
+        FROM simulation_run r
+        WHERE r.run_id = ANY(%(run_ids)s)
+        ORDER BY r.run_id
+    ) TO STDOUT WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')
+"""
+
+
+def get_expired_run_periods(engine, before_date: datetime) -> List[Dict]:
+    """만료 run 의 생성 월별 건수 (오래된 월부터)"""
+    with engine.connect() as conn:
+        result = conn.execute(text("""
+            SELECT date_trunc('month', created_at) AS period, COUNT(*)
+            FROM simulation_run
+            WHERE expires_at IS NOT NULL AND expires_at < :before_date
+            GROUP BY 1
+            ORDER BY 1
+        """), {"before_date": before_date})
+        return [{"period": row[0], "runs": row[1]} for row in result.fetchall()]
+
+
+def get_expired_run_batches(engine, before_date: datetime, period, batch_size: int):
+    """생성 월(period) 의 만료 run_id 를 batch_size 단위로 (run_id 키셋 페이지)"""
+    period_end = (period.replace(day=1) + timedelta(days=32)).replace(day=1)
+    last_id = 0
+    while True:
+        with engine.connect() as conn:
+            result = conn.execute(text("""
+                SELECT run_id FROM simulation_run
+                WHERE expires_at IS NOT NULL AND expires_at < :before_date
+                  AND created_at >= :period_start AND created_at < :period_end
+                  AND run_id > :last_id
+                ORDER BY run_id
+                LIMIT :limit
+            """), {"before_date": before_date, "period_start": period, "period_end": period_end,
+                   "last_id": last_id, "limit": batch_size})
+            run_ids = [row[0] for row in result.fetchall()]
+        if not run_ids:
+            return
+        last_id = run_ids[-1]
+        yield run_ids
+
+
+def archive_run_batch(engine, run_ids: List[int], archive_file: str) -> None:
+    """run 배치를 COPY 1회로 gzip JSON Lines 파일에 아카이브"""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        copy_sql = cursor.mogrify(_ARCHIVE_COPY_SQL, {"run_ids": run_ids}).decode()
+        with gzip.open(archive_file, "wb") as f:
+            cursor.copy_expert(copy_sql, f)
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def delete_run_batch(engine, run_ids: List[int]) -> int:
+    """run 배치 집합 DELETE (경로 → 요약 → run, 한 트랜잭션)"""
+    with engine.begin() as conn:
+        params = {"run_ids": run_ids}
+        conn.execute(text("DELETE FROM simulation_path WHERE run_id = ANY(:run_ids)"), params)
+        conn.execute(text("DELETE FROM simulation_summary WHERE run_id = ANY(:run_ids)"), params)
+        result = conn.execute(text("DELETE FROM simulation_run WHERE run_id = ANY(:run_ids)"), params)
+        return result.rowcount
+
+
+def _count_partition_rows(conn, partition: str, before_date: datetime) -> tuple:
+    """(전체 행 수, 만료 전 run 에 속한 행 수) — run 이 없는 고아 행은 만료로 취급"""
+    row = conn.execute(text(f"""
+        SELECT
+            COUNT(*),
+            COUNT(*) FILTER (
+                WHERE r.run_id IS NOT NULL AND (r.expires_at IS NULL OR r.expires_at >= :before_date)
+            )
+        FROM {partition} p
+        LEFT JOIN simulation_run r ON r.run_id = p.run_id
+    """), {"before_date": before_date}).fetchone()
+    return row[0], row[1]
+
+
+def get_droppable_path_partitions(engine, before_date: datetime) -> List[Dict]:
+    """
+    DROP 가능한 simulation_path 파티션 — 지난 달 이전 범위이고, 행이 있으며 모두 만료 run 의 행
+
+    이번 달 / 미래 파티션 (create_partitions.py 선생성분) 과 빈 파티션은 대상 아님
+    """
+    current_month = date.today().replace(day=1)
+    droppable = []
+
+    with engine.connect() as conn:
+        for name, range_expr in get_existing_partitions(engine, "simulation_path"):
+            match = _PARTITION_UPPER.search(range_expr or "")
+            if not match or date.fromisoformat(match.group(1)) > current_month:
+                continue
+            rows, live = _count_partition_rows(conn, name, before_date)
+            if rows and not live:
+                droppable.append({"partition": name, "range": range_expr, "rows": rows})
+
+    return droppable
+
+
+def drop_path_partition(engine, partition: str, before_date: datetime) -> bool:
+    """
+    파티션 DETACH → 재확인 → DROP (한 트랜잭션)
+
+    DETACH 로 쓰기를 막은 뒤 만료 전 행이 생겼으면 롤백 (DETACH 도 취소)
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+            conn.execute(text(f"ALTER TABLE simulation_path DETACH PARTITION {partition}"))
+            _, live = _count_partition_rows(conn, partition, before_date)
+            if live:
+                trans.rollback()
+                return False
+            conn.execute(text(f"DROP TABLE {partition}"))
+            trans.commit()
+            return True
+        except Exception:
+            trans.rollback()
+            raise
+
+
+def run_partition_cleanup(
+    before_date: datetime = None,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    archive_path: str = None,
+    verbose: bool = True
+) -> Dict:
+    """
+    파티션 단위 만료 시뮬레이션 정리
+
+    1. (archive_path 지정 시) 생성 월별 만료 run 을 배치당 COPY 1회로 아카이브
+       - 파일: sim_runs_{생성월}_{배치번호}_{실행일}.jsonl.gz
+    2. 만료 run 행만 남은 simulation_path 파티션 DETACH / DROP
+       - SIMULATION_PATH_STORAGE=rows 이면 건너뜀 (DROP 한 과거 일자 범위에 새 경로 행을 넣을 수 없으므로)
+    3. 남은 경로 / 요약 / run 을 배치 단위 집합 DELETE
+
+    Returns:
+        결과 통계 (row 모드 키 + periods, archive_files, dropped_partitions)
+    """
+    db_url = get_database_url()
+    engine = create_engine(db_url)
+
+    if before_date is None:
+        before_date = datetime.utcnow()
+
+    drop_partitions = os.getenv("SIMULATION_PATH_STORAGE", "columnar") == "columnar"
+
+    if verbose:
+        print("=" * 60)
+        print("🧹 Foresto - 시뮬레이션 결과 파티션 단위 정리")
+        print("=" * 60)
+        print(f"📅 기준 시간: {before_date.isoformat()}")
+        print(f"📦 배치 크기: {batch_size}")
+        print(f"🔍 모드: {'드라이런 (확인만)' if dry_run else '실행'}")
+        if archive_path:
+            print(f"📁 아카이브: {archive_path}")
+        print()
+
+    periods = get_expired_run_periods(engine, before_date)
+    total_expired = sum(p["runs"] for p in periods)
+    partitions = get_droppable_path_partitions(engine, before_date) if drop_partitions else []
+
+    if verbose:
+        print(f"📊 만료된 시뮬레이션: {total_expired}건")
+        for p in periods:
+            print(f"  - {p['period']:%Y-%m} 생성: {p['runs']}건")
+        if drop_partitions:
+            print(f"🗂️  DROP 대상 경로 파티션: {len(partitions)}개")
+            for part in partitions:
+                print(f"  - {part['partition']}: {part['rows']}행 {part['range']}")
+        else:
+            print("⚠️  SIMULATION_PATH_STORAGE=rows — 파티션 DROP 건너뜀")
+        print()
+
+    result = {
+        "total_expired": total_expired,
+        "deleted": 0,
+        "archived": 0,
+        "failed": 0,
+        "periods": [(p["period"].strftime("%Y-%m"), p["runs"]) for p in periods],
+        "archive_files": [],
+        "dropped_partitions": [],
+        "before_date": before_date.isoformat()
+    }
+
+    if dry_run:
+        if verbose:
+            print("💡 --dry-run 플래그를 제거하고 다시 실행하면 실제로 정리됩니다.")
+        return result
+
+    # 1. 생성 월별 배치 아카이브 (경로 행은 파티션 DROP 전에 run 과 함께 보관)
+    if archive_path:
+        os.makedirs(archive_path, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%d")
+        for p in periods:
+            for batch_no, run_ids in enumerate(
+                get_expired_run_batches(engine, before_date, p["period"], batch_size), start=1
+            ):
+                archive_file = os.path.join(
+                    archive_path, f"sim_runs_{p['period']:%Y%m}_{batch_no:04d}_{stamp}.jsonl.gz"
+                )
+                archive_run_batch(engine, run_ids, archive_file)
+                result["archived"] += len(run_ids)
+                result["archive_files"].append(archive_file)
+                if verbose:
+                    print(f"📁 {archive_file}: {len(run_ids)}건")
+
+    # 2. 만료 파티션 DROP
+    for part in partitions:
+        try:
+            if drop_path_partition(engine, part["partition"], before_date):
+                result["dropped_partitions"].append(part["partition"])
+                if verbose:
+                    print(f"🗑️  {part['partition']} DROP ({part['rows']}행)")
+            elif verbose:
+                print(f"  ⏭️  {part['partition']}: 만료 전 행이 생겨 건너뜀")
+        except Exception as e:
+            print(f"  ❌ {part['partition']} DROP 실패: {e}")
+            result["failed"] += 1
+
+    # 3. 남은 행 집합 DELETE
+    for p in periods:
+        for run_ids in get_expired_run_batches(engine, before_date, p["period"], batch_size):
+            try:
+                result["deleted"] += delete_run_batch(engine, run_ids)
+            except Exception as e:
+                print(f"  ❌ run_id {run_ids[0]}~{run_ids[-1]} 삭제 실패: {e}")
+                result["failed"] += len(run_ids)
+                break
+
+    if verbose:
+        print()
+        print("=" * 60)
+        print("📊 결과 요약")
+        print("=" * 60)
+        print(f"  총 만료: {total_expired}건")
+        print(f"  삭제됨: {result['deleted']}건")
+        if archive_path:
+            print(f"  아카이브됨: {result['archived']}건 ({len(result['archive_files'])}개 파일)")
+        print(f"  DROP 파티션: {len(result['dropped_partitions'])}개")
+        print(f"  실패: {result['failed']}건")
+        print()
+        print("✅ 정리 완료")
+
+    return result
+
+
 def show_retention_stats(verbose: bool = True) -> Dict:
     """현재 시뮬레이션 데이터 보관 현황 출력"""
     db_url = get_database_url()
@@ -432,6 +721,9 @@ TTL 정책:
   # 아카이브 후 삭제
   python scripts/cleanup_simulations.py --archive ./archive
 
+  # 파티션 단위 정리 (대량 만료분, 행 단위 DELETE 대신 파티션 DROP)
+  python scripts/cleanup_simulations.py --mode partition --archive ./archive
+
   # 현재 보관 현황 확인
   python scripts/cleanup_simulations.py --stats
 
@@ -446,11 +738,17 @@ TTL 정책:
         action="store_true",
         help="실제 삭제 없이 대상 확인만"
     )
+    parser.add_argument(
+        "--mode", "-m",
+        choices=["row", "partition"],
+        default="row",
+        help="정리 방식: row (run 단위) / partition (생성 월별 COPY 아카이브 + 파티션 DROP)"
+    )
     parser.add_argument(
         "--batch-size", "-b",
         type=int,
-        default=100,
-        help="배치 당 처리 건수 (기본: 100)"
+        default=None,
+        help="배치 당 처리 건수 (기본: row 100, partition 1000)"
     )
     parser.add_argument(
         "--before",
@@ -489,9 +787,12 @@ TTL 정책:
             print("   YYYY-MM-DD 형식을 사용하세요.")
             sys.exit(1)
 
-    result = run_cleanup(
+    cleanup = run_partition_cleanup if args.mode == "partition" else run_cleanup
+    batch_size = args.batch_size or (1000 if args.mode == "partition" else 100)
+
+    result = cleanup(
         before_date=before_date,
-        batch_size=args.batch_size,
+        batch_size=batch_size,
         dry_run=args.dry_run,
         archive_path=args.archive,
         verbose=not args.quiet
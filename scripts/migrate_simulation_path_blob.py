@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+시뮬레이션 경로 열 기반 압축 형식 마이그레이션
+
+simulation_path 행으로 저장된 기존 run 을 simulation_run.path_blob (path_codec) 으로 변환합니다.
+
+- simulation_run 에 path_blob / path_points 컬럼이 없으면 추가
+- path_points IS NULL 인 run 을 배치 단위로 변환 후 simulation_path 행 삭제
+- run 단위 커밋 — 중단 후 재실행하면 남은 run 만 처리
+
+Usage:
+    # 드라이런 (변환 대상 수 확인만)
+    python scripts/migrate_simulation_path_blob.py --dry-run
+
+    # 실제 변환
+    python scripts/migrate_simulation_path_blob.py --batch-size 200
+
+    # 행은 남겨 두고 blob 만 채우기 (검증 기간용)
+    python scripts/migrate_simulation_path_blob.py --keep-rows
+"""
+
+import argparse
+import os
+import sys
+
+# backend 를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+
+def get_database_url() -> str:
+    """환경변수에서 DATABASE_URL 가져오기"""
+    db_url = os.getenv("DATABASE_URL")
+    if not db_url:
+        print("❌ DATABASE_URL 환경변수가 설정되지 않았습니다.")
+        sys.exit(1)
+    return db_url
+
+
+def ensure_columns(engine) -> None:
+    """path_blob / path_points 컬럼 추가 (PostgreSQL)"""
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS path_blob BYTEA"))
+        conn.execute(text("ALTER TABLE simulation_run ADD COLUMN IF NOT EXISTS path_points INTEGER"))
+
+
+def pending_run_ids(engine, limit: int, after_id: int = 0):
+    """행 저장 형식 run_id (경로 행이 있는 것만, run_id 오름차순)"""
+    with engine.connect() as conn:
+        result = conn.execute(text("""
+            SELECT r.run_id FROM simulation_run r
+            WHERE r.path_points IS NULL AND r.run_id > :after_id
+              AND EXISTS (SELECT 1 FROM simulation_path p WHERE p.run_id = r.run_id)
+            ORDER BY r.run_id
+            LIMIT :limit
+        """), {"after_id": after_id, "limit": limit})
+        return [row[0] for row in result.fetchall()]
+
+
+def migrate(batch_size: int = 100, keep_rows: bool = False, dry_run: bool = False) -> dict:
+    from app.models.simulation import SimulationRun
+    from app.services.simulation_store import convert_path_to_columnar
+
+    engine = create_engine(get_database_url())
+    ensure_columns(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    converted_runs = 0
+    converted_rows = 0
+    failed = 0
+    last_id = 0
+
+    while True:
+        run_ids = pending_run_ids(engine, batch_size, last_id)
+        if not run_ids:
+            break
+        last_id = run_ids[-1]
+
+        if dry_run:
+            converted_runs += len(run_ids)
+            continue
+
+        db = SessionLocal()
+        try:
+            for run_id in run_ids:
+                try:
+                    run = db.get(SimulationRun, run_id)
+                    converted_rows += convert_path_to_columnar(db, run, delete_rows=not keep_rows)
+                    db.commit()
+                    converted_runs += 1
+                except Exception as e:
+                    db.rollback()
+                    print(f"  ❌ run_id={run_id} 변환 실패: {e}")
+                    failed += 1
+        finally:
+            db.close()
+
+        print(f"📋 run_id <= {last_id}: 누적 {converted_runs}건 / {converted_rows}행")
+
+    return {"runs": converted_runs, "rows": converted_rows, "failed": failed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="simulation_path 행 → simulation_run.path_blob 변환")
+    parser.add_argument("--batch-size", type=int, default=100, help="배치 당 run 수 (기본: 100)")
+    parser.add_argument("--keep-rows", action="store_true", help="변환 후 simulation_path 행 유지")
+    parser.add_argument("--dry-run", action="store_true", help="변환 없이 대상 수만 출력")
+    args = parser.parse_args()
+
+    result = migrate(args.batch_size, args.keep_rows, args.dry_run)
+
+    if args.dry_run:
+        print(f"🔍 변환 대상 run: {result['runs']}건")
+    else:
+        print(f"✅ 변환 완료: run {result['runs']}건, 경로 {result['rows']}행, 실패 {result['failed']}건")
+
+
+if __name__ == "__main__":
+    main()